@@ -7,7 +7,7 @@ import re
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from threading import Thread
+from threading import BoundedSemaphore, Thread
 from urllib.parse import urlparse
 
 from .audio import PromptPlayer
@@ -19,13 +19,18 @@ from .cloudflare_client import CloudflareServiceClient, CloudflareStatusReporter
 from .command_server import CommandServerWorker, DirectCommandExecutor
 from .control_plane import HeartbeatWorker
 from .hot_stream import HotStreamBuffer, load_hot_stream_config
+from .images import DEFAULT_RANKING_SCALE, RANKING_SCALES, OcrQualityGate
 from .media_capabilities import read_media_capabilities
-from .ocr import PlateRecognizerClient
+from .ocr import (
+    DEFAULT_CACHE_ENTRIES, DEFAULT_CACHE_TTL_SECONDS, OcrRegion, OcrResultCache,
+    PlateRecognizerClient,
+)
 from .outbox import (
-    CloudflareOutboxSender, HttpOutboxSender, OutboxWorker,
+    CloudflareOutboxSender, HttpOutboxSender, MAX_OUTBOX_BATCH_SIZE, OutboxWorker,
     TelemetryRetentionWorker,
 )
-from .processor import GateProcessor
+from .predictive import PredictiveRecognition
+from .processor import MAX_OCR_FRAMES, GateProcessor
 from .relay import PiRelayAdapter, RelayController
 from .reolink_events import (
     ReolinkEventCorrelator, ReolinkWebhookWorker,
@@ -43,6 +48,7 @@ from .runtime import require_python_version
 MIN_QUIET_WINDOW_SECONDS = 0.1
 MAX_QUIET_WINDOW_SECONDS = 2.0
 DEFAULT_QUIET_WINDOW_SECONDS = 0.2
+MAX_RANKING_WORKERS = 8
 MANAGED_RELEASES_ROOT = Path("/opt/gate-controller-deploy/releases")
 MANAGED_RELEASE_SHA_PATTERN = re.compile(r"[0-9a-f]{40}")
 
@@ -79,8 +85,17 @@ def main() -> None:
     max_image_age = float(os.environ.get("GATE_MAX_IMAGE_AGE_SECONDS", "8"))
     decision_timeout = float(os.environ.get("GATE_DECISION_TIMEOUT_SECONDS", "4"))
     max_burst_candidates, max_candidate_bytes = image_runtime_limits(os.environ)
+    speculative_frames = speculative_ocr_frames(os.environ)
+    early_flush = early_flush_sharpness(os.environ)
+    streaming_bursts = streaming_bursts_enabled(os.environ)
+    quality_gate = ocr_quality_gate(os.environ)
+    rank_workers = ranking_workers(os.environ)
+    rank_scale = ranking_scale(os.environ)
+    ocr_cache = build_ocr_cache(os.environ, store)
+    region = ocr_region(os.environ)
     hot_stream_config = load_hot_stream_config(os.environ, arguments.directory)
     hot_stream = HotStreamBuffer(hot_stream_config) if hot_stream_config.enabled else None
+    predictive_ocr = predictive_ocr_enabled(os.environ)
     authorisation_staleness = timedelta(
         seconds=float(os.environ.get("GATE_AUTHORISATION_MAX_STALENESS_SECONDS", "300"))
     )
@@ -92,28 +107,57 @@ def main() -> None:
     background_workers, _, _ = build_background_workers(
         store, relay, latest_image=latest_image, coordinator=coordinator,
         authorised=authorised, camera_directory=arguments.directory,
-        hot_stream=hot_stream,
+        hot_stream=hot_stream, ocr_cache=ocr_cache,
+    )
+    recognizer = PlateRecognizerClient(token, region=region)
+    ocr_slot = None
+    prediction = None
+    if hot_stream is not None and predictive_ocr:
+        # Only a prediction shares the OCR slot; otherwise the processor keeps
+        # its private slot and a busy burst fails fast with ocr_busy.
+        ocr_slot = BoundedSemaphore(speculative_frames)
+        # Predictions keep their own session: a burst abandoning its OCR
+        # requests closes the processor's session, not this one.
+        prediction_recognizer = PlateRecognizerClient(token, region=region)
+        prediction = PredictiveRecognition(
+            hot_stream,
+            lambda path: prediction_recognizer.recognise(path, timeout=(1.0, 2.0)),
+            authorised=authorised.index,
+            ocr_slot=ocr_slot,
+            ocr_cache=ocr_cache,
+            close=prediction_recognizer.close,
+        )
+    hot_frame_provider = prediction or hot_stream
+    trigger_correlator, trigger_workers = build_reolink_trigger_pipeline(
+        os.environ,
+        on_accepted=hot_frame_provider.trigger if hot_frame_provider is not None else None,
     )
-    trigger_correlator, trigger_workers = build_reolink_trigger_pipeline(os.environ)
     background_workers = tuple(background_workers) + tuple(trigger_workers)
     if hot_stream is not None:
         background_workers += (hot_stream,)
+    if prediction is not None:
+        background_workers += (prediction,)
     outbox = next((worker for worker in background_workers if isinstance(worker, OutboxWorker)), None)
     processor = GateProcessor(
-        recognizer=PlateRecognizerClient(token),
+        recognizer=recognizer,
         store=store,
         relay=relay,
-        authorised=authorised.get,
+        authorised=authorised.index,
         cooldown=timedelta(seconds=20),
         outbox=outbox,
         coordinator=coordinator,
         max_image_age=timedelta(seconds=max_image_age),
         decision_timeout=decision_timeout,
+        speculative_ocr_frames=speculative_frames,
+        ocr_cache=ocr_cache,
+        predicted_observation=prediction.observation if prediction is not None else None,
+        ocr_quality_gate=quality_gate,
+        ocr_slot=ocr_slot,
     )
 
     def process(paths, received_at=None, decision_started_at=None,
                 processing_started_at=None, *, trigger=None,
-                idempotency_key=None):
+                idempotency_key=None, follows=None):
         latest_image["path"] = str(paths[0]) if paths else None
         latest_image["received_at"] = (received_at or datetime.now(timezone.utc)).isoformat()
         return processor.process(
@@ -123,6 +167,7 @@ def main() -> None:
             processing_started_at=processing_started_at,
             trigger=trigger,
             idempotency_key=idempotency_key,
+            follows=follows,
         )
 
     def record_skipped(paths, reason, received_at, decision_started_at=None,
@@ -153,24 +198,31 @@ def main() -> None:
     def shutdown():
         return _shutdown_controller_with_hot_stream(hot_stream, processor, relay)
 
-    run_worker(
-        arguments.directory, process, quiet_window=arguments.quiet_window,
-        background_workers=background_workers,
-        max_image_age=max_image_age,
-        on_skipped=record_skipped,
-        on_timed_skipped=record_skipped,
-        on_error=record_error,
-        shutdown=shutdown,
-        max_burst_candidates=max_burst_candidates,
-        max_candidate_bytes=max_candidate_bytes,
-        trigger_resolver=trigger_correlator.correlate,
-        hot_frame_provider=hot_stream,
-    )
+    try:
+        run_worker(
+            arguments.directory, process, quiet_window=arguments.quiet_window,
+            background_workers=background_workers,
+            max_image_age=max_image_age,
+            on_skipped=record_skipped,
+            on_timed_skipped=record_skipped,
+            on_error=record_error,
+            shutdown=shutdown,
+            max_burst_candidates=max_burst_candidates,
+            max_candidate_bytes=max_candidate_bytes,
+            trigger_resolver=trigger_correlator.correlate,
+            hot_frame_provider=hot_frame_provider,
+            early_flush_sharpness=early_flush,
+            streaming_bursts=streaming_bursts,
+            ranking_workers=rank_workers,
+            ranking_scale=rank_scale,
+        )
+    finally:
+        store.close_all()
 
 
-def build_reolink_trigger_pipeline(environment=None):
+def build_reolink_trigger_pipeline(environment=None, *, on_accepted=None):
     environment = os.environ if environment is None else environment
-    correlator = ReolinkEventCorrelator()
+    correlator = ReolinkEventCorrelator(on_accepted=on_accepted)
     config = load_reolink_webhook_config(environment)
     workers = (
         (ReolinkWebhookWorker(config, correlator),)
@@ -263,7 +315,7 @@ def _quiet_window(value: str) -> float:
 
 def build_background_workers(store, relay, *, environment=None, latest_image=None,
                              coordinator=None, authorised=None, camera_directory=None,
-                             hot_stream=None):
+                             hot_stream=None, ocr_cache=None):
     environment = os.environ if environment is None else environment
     latest_image = latest_image if latest_image is not None else {}
     prompt_player = PromptPlayer(_configured_prompts(environment))
@@ -271,6 +323,7 @@ def build_background_workers(store, relay, *, environment=None, latest_image=Non
     if camera_stale_seconds <= 0:
         raise ValueError("GATE_CAMERA_STALE_SECONDS must be greater than zero")
     telemetry_retention_days = _telemetry_retention_days(environment)
+    outbox_batch_size = _outbox_batch_size(environment)
     workers = []
     controller_id = environment.get("GATE_CONTROLLER_ID") or "primary"
     if coordinator is not None:
@@ -289,6 +342,7 @@ def build_background_workers(store, relay, *, environment=None, latest_image=Non
             CloudflareOutboxSender(cloudflare_client, controller_id),
             controller_id=controller_id,
             telemetry_retention_days=telemetry_retention_days,
+            batch_size=outbox_batch_size,
         ))
         if authorised is not None:
             workers.append(AuthorisationRefreshWorker(
@@ -299,7 +353,7 @@ def build_background_workers(store, relay, *, environment=None, latest_image=Non
             store, prompt_player, latest_image, authorised, relay=relay,
             camera_directory=camera_directory,
             camera_stale_seconds=camera_stale_seconds,
-            hot_stream=hot_stream,
+            hot_stream=hot_stream, ocr_cache=ocr_cache,
         )
         workers.append(HeartbeatWorker(
             CloudflareStatusReporter(cloudflare_client, controller_id), status,
@@ -317,6 +371,7 @@ def build_background_workers(store, relay, *, environment=None, latest_image=Non
             ),
             controller_id=controller_id,
             telemetry_retention_days=telemetry_retention_days,
+            batch_size=outbox_batch_size,
         ))
     else:
         workers.append(TelemetryRetentionWorker(
@@ -326,7 +381,7 @@ def build_background_workers(store, relay, *, environment=None, latest_image=Non
         store, prompt_player, latest_image, relay=relay,
         camera_directory=camera_directory,
         camera_stale_seconds=camera_stale_seconds,
-        hot_stream=hot_stream,
+        hot_stream=hot_stream, ocr_cache=ocr_cache,
     )
 
 
@@ -345,6 +400,21 @@ def _telemetry_retention_days(environment) -> int:
     return days
 
 
+def _outbox_batch_size(environment) -> int:
+    configured = environment.get("GATE_OUTBOX_BATCH_SIZE", "1")
+    message = (
+        "GATE_OUTBOX_BATCH_SIZE must be an integer between 1 and "
+        f"{MAX_OUTBOX_BATCH_SIZE}"
+    )
+    try:
+        batch_size = int(configured)
+    except (TypeError, ValueError) as error:
+        raise ValueError(message) from error
+    if not 1 <= batch_size <= MAX_OUTBOX_BATCH_SIZE:
+        raise ValueError(message)
+    return batch_size
+
+
 def _configured_prompts(environment) -> dict[str, Path]:
     prompt_environment = {
         "arrival": "GATE_PROMPT_ARRIVAL",
@@ -374,9 +444,111 @@ def image_runtime_limits(environment) -> tuple[int, int]:
     return max_candidates, max_bytes
 
 
+def speculative_ocr_frames(environment) -> int:
+    try:
+        frames = int(environment.get("GATE_SPECULATIVE_OCR_FRAMES", "1"))
+    except (TypeError, ValueError) as error:
+        raise ValueError("speculative OCR frames must be an integer") from error
+    if not 1 <= frames <= MAX_OCR_FRAMES:
+        raise ValueError(
+            f"speculative OCR frames must be between 1 and {MAX_OCR_FRAMES}"
+        )
+    return frames
+
+
+def early_flush_sharpness(environment) -> float:
+    try:
+        sharpness = float(environment.get("GATE_EARLY_FLUSH_MIN_SHARPNESS", "0"))
+    except (TypeError, ValueError) as error:
+        raise ValueError("GATE_EARLY_FLUSH_MIN_SHARPNESS must be a number") from error
+    if not 0 <= sharpness <= 1:
+        raise ValueError("GATE_EARLY_FLUSH_MIN_SHARPNESS must be between 0 and 1")
+    return sharpness
+
+
+def ranking_workers(environment, cpu_count: int | None = None) -> int:
+    try:
+        workers = int(environment.get("GATE_RANKING_WORKERS", "4"))
+    except (TypeError, ValueError) as error:
+        raise ValueError("GATE_RANKING_WORKERS must be an integer") from error
+    if not 1 <= workers <= MAX_RANKING_WORKERS:
+        raise ValueError(f"GATE_RANKING_WORKERS must be between 1 and {MAX_RANKING_WORKERS}")
+    return min(workers, cpu_count or os.cpu_count() or 1)
+
+
+def ranking_scale(environment) -> int:
+    try:
+        scale = int(environment.get("GATE_RANKING_SCALE", str(DEFAULT_RANKING_SCALE)))
+    except (TypeError, ValueError) as error:
+        raise ValueError("GATE_RANKING_SCALE must be an integer") from error
+    if scale not in RANKING_SCALES:
+        raise ValueError(
+            f"GATE_RANKING_SCALE must be one of {', '.join(map(str, RANKING_SCALES))}"
+        )
+    return scale
+
+
+def ocr_quality_gate(environment) -> OcrQualityGate | None:
+    limits = {}
+    for name, field, default in (
+        ("GATE_OCR_MIN_SHARPNESS", "min_sharpness", "0"),
+        ("GATE_OCR_MAX_DARKNESS", "max_darkness", "1"),
+        ("GATE_OCR_MAX_HIGHLIGHT_CLIPPING", "max_highlight_clipping", "1"),
+    ):
+        try:
+            value = float(environment.get(name, default))
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"{name} must be a number") from error
+        if not 0 <= value <= 1:
+            raise ValueError(f"{name} must be between 0 and 1")
+        limits[field] = value
+    gate = OcrQualityGate(**limits)
+    return None if gate == OcrQualityGate() else gate
+
+
+def streaming_bursts_enabled(environment) -> bool:
+    value = environment.get("GATE_STREAMING_BURSTS", "false")
+    if value not in {"true", "false"}:
+        raise ValueError("GATE_STREAMING_BURSTS must be true or false")
+    return value == "true"
+
+
+def predictive_ocr_enabled(environment) -> bool:
+    value = environment.get("GATE_PREDICTIVE_OCR", "false")
+    if value not in {"true", "false"}:
+        raise ValueError("GATE_PREDICTIVE_OCR must be true or false")
+    return value == "true"
+
+
+def build_ocr_cache(environment, store=None) -> OcrResultCache | None:
+    try:
+        entries = int(environment.get(
+            "GATE_OCR_CACHE_ENTRIES", str(DEFAULT_CACHE_ENTRIES)
+        ))
+        ttl_seconds = float(environment.get(
+            "GATE_OCR_CACHE_TTL_SECONDS", str(DEFAULT_CACHE_TTL_SECONDS)
+        ))
+    except (TypeError, ValueError) as error:
+        raise ValueError("OCR cache settings must be numbers") from error
+    persistent = environment.get("GATE_OCR_CACHE_PERSISTENT", "false")
+    if persistent not in {"true", "false"}:
+        raise ValueError("GATE_OCR_CACHE_PERSISTENT must be true or false")
+    if entries == 0:
+        return None
+    return OcrResultCache(
+        max_entries=entries, ttl_seconds=ttl_seconds,
+        store=store if persistent == "true" else None,
+    )
+
+
+def ocr_region(environment) -> OcrRegion | None:
+    value = environment.get("GATE_OCR_REGION", "").strip()
+    return OcrRegion.parse(value) if value else None
+
+
 def _controller_status(store, prompt_player, latest_image, authorised=None, *, relay=None,
                        camera_directory=None, camera_stale_seconds: float = 60.0,
-                       hot_stream=None,
+                       hot_stream=None, ocr_cache=None,
                        media_capabilities_path=Path("/run/gate-media/capabilities.json"),
                        module_path=Path(__file__),
                        managed_releases_root=MANAGED_RELEASES_ROOT, clock=None) -> dict:
@@ -401,6 +573,7 @@ def _controller_status(store, prompt_player, latest_image, authorised=None, *, r
         "media": read_media_capabilities(media_capabilities_path),
         "recognition": {
             "hot_stream": _hot_stream_status(hot_stream),
+            "ocr_cache": _ocr_cache_status(ocr_cache),
             "local_shadow": {"mode": "disabled", "ready": False},
         },
     }
@@ -420,12 +593,21 @@ def _hot_stream_status(hot_stream) -> dict:
         "ready": False,
         "stream": "fluent",
         "sample_fps": 5.0,
+        "admitted_fps": 5.0,
+        "mode": "continuous",
         "source_profile": {
             "codec": "h264", "width": 640, "height": 360, "fps": 10,
         },
         "latest_frame_age_ms": None,
         "buffered_frames": 0,
         "restart_count": 0,
+        "record_seconds": 0,
+        "lock_hold_mean_us": None,
+        "lock_hold_max_us": None,
+        "frames_rejected": 0,
+        "frames_coalesced": 0,
+        "ingest_cpu_us_per_frame": None,
+        "selection_decode_cpu_us_per_frame": None,
     }
     if hot_stream is None:
         return default
@@ -438,6 +620,15 @@ def _hot_stream_status(hot_stream) -> dict:
     return {key: measured.get(key, value) for key, value in default.items()}
 
 
+def _ocr_cache_status(ocr_cache) -> dict:
+    if ocr_cache is None:
+        return {"enabled": False}
+    try:
+        return {"enabled": True, **ocr_cache.status()}
+    except Exception:
+        return {"enabled": False}
+
+
 def _managed_release_sha(
     module_path: Path, *, releases_root=MANAGED_RELEASES_ROOT
 ) -> str | None:
@@ -6,7 +6,8 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from threading import Event, Lock
 
-from .matching import normalise_plate
+from .cloudflare_client import NOT_MODIFIED
+from .matching import PlateIndex, normalise_plate
 
 
 MAX_PLATE_SNAPSHOT_BYTES = 256 * 1024
@@ -24,6 +25,8 @@ class AuthorisedPlateCache:
     def __init__(self, path: Path, *, max_staleness: timedelta | None = None, clock=None):
         self._path = Path(path)
         self._plates: tuple[str, ...] | None = None
+        self._index: PlateIndex | None = None
+        self._generation = 0
         self._version = None
         self._refreshed_at: datetime | None = None
         self._last_error: str | None = None
@@ -34,26 +37,40 @@ class AuthorisedPlateCache:
 
     def get(self) -> tuple[str, ...]:
         with self._lock:
-            if self._plates is None:
-                raise AuthorisationError("no valid authorised-plates snapshot")
-            if (self._max_staleness is not None and self._refreshed_at is not None
-                    and _snapshot_is_stale(
-                        self._clock(), self._refreshed_at, self._max_staleness
-                    )):
-                raise AuthorisationError("authorised-plates snapshot is stale")
+            self._require_current()
             return self._plates
 
+    def index(self) -> PlateIndex:
+        """Return the immutable, versioned match index of the current snapshot.
+
+        The index and its generation change only when a reload or replacement
+        changes the normalised plate set.
+        """
+        with self._lock:
+            self._require_current()
+            return self._index
+
     def reload_local(self) -> bool:
+        try:
+            version = self._file_version()
+            refreshed = self._read_complete_file()
+            if self._file_version() != version:
+                raise ValueError("authorised plates CSV changed during refresh")
+        except (OSError, csv.Error, ValueError) as error:
+            with self._lock:
+                self._last_error = str(error)
+            return False
+        index = PlateIndex(refreshed)
         with self._lock:
             try:
-                version = self._file_version()
-                refreshed = self._read_complete_file()
+                # A newer file was published while this one was being indexed.
                 if self._file_version() != version:
-                    raise ValueError("authorised plates CSV changed during refresh")
-            except (OSError, csv.Error, ValueError) as error:
+                    return False
+            except OSError as error:
                 self._last_error = str(error)
                 return False
             self._plates = refreshed
+            self._publish(index)
             self._version = version
             modified_at = datetime.fromtimestamp(self._path.stat().st_mtime, timezone.utc)
             if self._refreshed_at is None or modified_at > self._refreshed_at:
@@ -61,8 +78,18 @@ class AuthorisedPlateCache:
             self._last_error = None
             return True
 
-    def replace(self, plates) -> None:
+    def replace(self, plates) -> bool:
+        """Atomically publish ``plates``; return False when nothing changed.
+
+        An unchanged plate set only refreshes freshness, so the CSV is not
+        rewritten or fsynced.
+        """
         normalized = tuple(sorted(filter(None, (normalise_plate(value) for value in plates))))
+        with self._lock:
+            if self._is_current(normalized):
+                self._refreshed_at = self._clock()
+                self._last_error = None
+                return False
         self._path.parent.mkdir(parents=True, exist_ok=True)
         descriptor, temporary = tempfile.mkstemp(
             dir=self._path.parent, prefix=f".{self._path.name}.", text=True
@@ -81,11 +108,27 @@ class AuthorisedPlateCache:
                 os.unlink(temporary)
             except FileNotFoundError:
                 pass
+        index = PlateIndex(normalized)
         with self._lock:
             self._plates = normalized
+            self._publish(index)
             self._version = self._file_version()
             self._refreshed_at = self._clock()
             self._last_error = None
+        return True
+
+    def mark_refreshed(self) -> None:
+        """Record that the authority confirmed the current snapshot unchanged."""
+        with self._lock:
+            if self._plates is None:
+                raise AuthorisationError("no valid authorised-plates snapshot")
+            self._refreshed_at = self._clock()
+            self._last_error = None
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
 
     def mark_refresh_error(self, error: Exception) -> None:
         with self._lock:
@@ -104,8 +147,36 @@ class AuthorisedPlateCache:
                 "stale": stale,
                 "refreshed_at": self._refreshed_at.isoformat() if self._refreshed_at else None,
                 "last_error": self._last_error,
+                "generation": self._generation,
             }
 
+    def _is_current(self, normalized: tuple[str, ...]) -> bool:
+        if self._index is None or self._index.plates != frozenset(normalized):
+            return False
+        try:
+            return self._file_version() == self._version
+        except OSError:
+            return False
+
+    def _publish(self, index: PlateIndex) -> None:
+        """Number an index built outside the lock as the next generation.
+
+        Callers hold the lock; an unchanged plate set keeps the current index.
+        """
+        if self._index is not None and index.plates == self._index.plates:
+            return
+        self._generation += 1
+        self._index = index.with_generation(self._generation)
+
+    def _require_current(self) -> None:
+        if self._plates is None:
+            raise AuthorisationError("no valid authorised-plates snapshot")
+        if (self._max_staleness is not None and self._refreshed_at is not None
+                and _snapshot_is_stale(
+                    self._clock(), self._refreshed_at, self._max_staleness
+                )):
+            raise AuthorisationError("authorised-plates snapshot is stale")
+
     def _file_version(self):
         stat = self._path.stat()
         return stat.st_ino, stat.st_size, stat.st_mtime_ns
@@ -136,15 +207,33 @@ def _snapshot_is_stale(now: datetime, refreshed_at: datetime,
 
 
 class CloudflarePlateFetcher:
+    """Fetch the plate snapshot, revalidating the last one with its ETag.
+
+    Returns NOT_MODIFIED when the Worker confirms the previous snapshot.
+    """
+
     def __init__(self, client, controller_id):
         self.client = client
         self._controller_id = controller_id
+        self._etag: str | None = None
 
-    def __call__(self) -> list[dict]:
-        payload = self.client.get_json(
-            "/api/controller/plates?" + urlencode({"controller_id": self._controller_id}),
-            max_response_bytes=MAX_PLATE_SNAPSHOT_BYTES,
+    def reset(self) -> None:
+        """Forget the validator so the next fetch downloads the full snapshot."""
+        self._etag = None
+
+    def __call__(self) -> list[dict] | object:
+        path = "/api/controller/plates?" + urlencode({"controller_id": self._controller_id})
+        payload, etag = self.client.get_json_if_changed(
+            path, self._etag, max_response_bytes=MAX_PLATE_SNAPSHOT_BYTES,
         )
+        if payload is NOT_MODIFIED:
+            return NOT_MODIFIED
+        self._etag = None
+        rows = self._validated_rows(payload)
+        self._etag = etag
+        return rows
+
+    def _validated_rows(self, payload) -> list[dict]:
         if isinstance(payload, dict) and payload.get("controller_id") == self._controller_id:
             rows = payload.get("plates")
         else:
@@ -167,21 +256,35 @@ class AuthorisationRefreshWorker:
         self._cache = cache
         self._fetch = fetch
         self._poll_interval = poll_interval
+        self._applied_generation: int | None = None
 
     def run_once(self) -> bool:
         try:
+            if self._cache.generation != self._applied_generation:
+                # The snapshot changed locally; only a full fetch can confirm it.
+                self._reset_fetch()
             rows = self._fetch()
-            if not isinstance(rows, list) or any(
-                not isinstance(row, dict) or not isinstance(row.get("plate"), str)
-                for row in rows
-            ):
-                raise AuthorisationError("authorised plate refresh was malformed")
-            self._cache.replace(row["plate"] for row in rows)
+            if rows is NOT_MODIFIED:
+                self._cache.mark_refreshed()
+            else:
+                if not isinstance(rows, list) or any(
+                    not isinstance(row, dict) or not isinstance(row.get("plate"), str)
+                    for row in rows
+                ):
+                    raise AuthorisationError("authorised plate refresh was malformed")
+                self._cache.replace(row["plate"] for row in rows)
+            self._applied_generation = self._cache.generation
         except Exception as error:
+            self._reset_fetch()
             self._cache.mark_refresh_error(error)
             return False
         return True
 
+    def _reset_fetch(self) -> None:
+        reset = getattr(self._fetch, "reset", None)
+        if callable(reset):
+            reset()
+
     def run_forever(self, stop_event: Event) -> None:
         while not stop_event.is_set():
             self.run_once()
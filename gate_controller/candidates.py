@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from pathlib import Path
+from threading import Condition
+from time import monotonic
+
+from .images import ranking_sharpness
+
+
+class CandidateStream:
+    """A burst whose uploads may still arrive while it is being recognised.
+
+    The collector adds each completed upload and closes the stream when the
+    burst's quiet window ends. The processor takes the burst's first upload
+    at once, then the sharpest upload it has not yet tried, waiting for more
+    only while the stream is open. Reading the stream as a sequence gives
+    every accepted upload in arrival order, for evidence and cleanup.
+    """
+
+    def __init__(self, *, max_candidates: int, score=ranking_sharpness):
+        self._max_candidates = max_candidates
+        self._score = score
+        self._arrived: list[Path] = []
+        self._scores: dict[Path, float] = {}
+        self._taken: set[Path] = set()
+        self._closed = False
+        self._finished = False
+        self._changed = Condition()
+
+    def add(self, path: Path) -> bool:
+        """Accept a decodable upload, or return False for the caller to remove."""
+        path = Path(path)
+        with self._changed:
+            if self._finished or path in self._scores:
+                return False
+            if len(self._arrived) >= self._max_candidates:
+                return False
+        score = self._score(path)
+        if score is None:
+            return False
+        with self._changed:
+            if self._finished or len(self._arrived) >= self._max_candidates:
+                return False
+            self._arrived.append(path)
+            self._scores[path] = score
+            self._changed.notify_all()
+        return True
+
+    @property
+    def remaining_capacity(self) -> int:
+        with self._changed:
+            return max(0, self._max_candidates - len(self._arrived))
+
+    def take_available(self) -> tuple[Path, ...]:
+        """Take every upload that has arrived: the first one, then sharpest first."""
+        with self._changed:
+            untaken = [path for path in self._arrived if path not in self._taken]
+            if not self._taken and untaken:
+                ordered = untaken[:1] + self._sharpest_first(untaken[1:])
+            else:
+                ordered = self._sharpest_first(untaken)
+            self._taken.update(ordered)
+            return tuple(ordered)
+
+    def take(self, timeout: float) -> Path | None:
+        """Wait up to ``timeout`` for the sharpest upload not yet taken."""
+        deadline = monotonic() + max(timeout, 0)
+        with self._changed:
+            while True:
+                untaken = [path for path in self._arrived if path not in self._taken]
+                if untaken:
+                    path = self._sharpest_first(untaken)[0]
+                    self._taken.add(path)
+                    return path
+                remaining = deadline - monotonic()
+                if self._closed or self._finished or remaining <= 0:
+                    return None
+                self._changed.wait(remaining)
+
+    def close(self) -> None:
+        """Stop waiting for uploads; the quiet window has ended."""
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    def finish(self) -> tuple[Path, ...]:
+        """Refuse further uploads and return those accepted, for removal."""
+        with self._changed:
+            self._finished = True
+            self._changed.notify_all()
+            return tuple(self._arrived)
+
+    def _sharpest_first(self, paths: list[Path]) -> list[Path]:
+        return sorted(paths, key=lambda path: -self._scores[path])
+
+    def __len__(self) -> int:
+        with self._changed:
+            return len(self._arrived)
+
+    def __getitem__(self, index):
+        with self._changed:
+            return self._arrived[index]
+
+    def __iter__(self):
+        with self._changed:
+            return iter(tuple(self._arrived))
@@ -1,11 +1,16 @@
 import json
 import math
+import re
 
 import requests
 
 from .runtime import require_https_or_loopback_service_url
 
 
+NOT_MODIFIED = object()
+_ENTITY_TAG = re.compile(r'(W/)?"[\x21\x23-\x7e]{1,200}"')
+
+
 class CloudflareServiceClient:
     def __init__(
         self,
@@ -24,6 +29,19 @@ class CloudflareServiceClient:
         self.timeout = self._require_bounded_timeout(timeout)
 
     def get_json(self, path, *, max_response_bytes=None):
+        return self._get_json(path, {}, max_response_bytes)[0]
+
+    def get_json_if_changed(self, path, etag, *, max_response_bytes=None):
+        """Return ``(payload, etag)``, or ``(NOT_MODIFIED, etag)`` on HTTP 304.
+
+        ``etag`` is the validator from an earlier response, or None for an
+        unconditional request. The returned validator is None when the
+        service sent none or sent one that is not a well-formed entity tag.
+        """
+        headers = {} if etag is None else {"If-None-Match": etag}
+        return self._get_json(path, headers, max_response_bytes)
+
+    def _get_json(self, path, headers, max_response_bytes):
         if (
             max_response_bytes is not None
             and (isinstance(max_response_bytes, bool)
@@ -32,15 +50,20 @@ class CloudflareServiceClient:
         ):
             raise ValueError("Cloudflare response size limit must be a positive integer")
         response = self.session.get(
-            self._service_url(path), headers=self._headers(), timeout=self.timeout,
+            self._service_url(path), headers=self._headers(headers), timeout=self.timeout,
             allow_redirects=False, stream=max_response_bytes is not None,
         )
         try:
+            etag = getattr(response, "headers", {}).get("ETag")
+            if not isinstance(etag, str) or not _ENTITY_TAG.fullmatch(etag):
+                etag = None
+            if response.status_code == 304 and "If-None-Match" in headers:
+                return NOT_MODIFIED, etag or headers["If-None-Match"]
             self._raise_for_redirect(response)
             response.raise_for_status()
             if max_response_bytes is None:
-                return response.json()
-            return json.loads(self._read_bounded(response, max_response_bytes))
+                return response.json(), etag
+            return json.loads(self._read_bounded(response, max_response_bytes)), etag
         finally:
             if max_response_bytes is not None:
                 close = getattr(response, "close", None)
@@ -56,6 +79,28 @@ class CloudflareServiceClient:
         expect_json=False,
         max_response_bytes=64 * 1024,
     ):
+        return self._post(
+            path, {"json": payload}, headers, expect_json, max_response_bytes
+        )
+
+    def post_multipart(
+        self,
+        path,
+        files,
+        *,
+        headers=None,
+        max_response_bytes=64 * 1024,
+    ):
+        """POST ``multipart/form-data`` parts and return the bounded JSON reply.
+
+        ``files`` uses the requests ``files=`` form: a sequence of
+        ``(field, (filename, content, content_type))`` tuples.
+        """
+        return self._post(
+            path, {"files": files}, headers, True, max_response_bytes
+        )
+
+    def _post(self, path, body, headers, expect_json, max_response_bytes):
         if expect_json and (
             isinstance(max_response_bytes, bool)
             or not isinstance(max_response_bytes, int)
@@ -64,10 +109,10 @@ class CloudflareServiceClient:
             raise ValueError("Cloudflare response size limit must be a positive integer")
         response = self.session.post(
             self._service_url(path), headers=self._headers(headers),
-            json=payload,
             timeout=self.timeout,
             allow_redirects=False,
             stream=expect_json,
+            **body,
         )
         try:
             self._raise_for_redirect(response)
@@ -2,27 +2,38 @@
 
 import hashlib
 import logging
-import os
 import secrets
-import stat
 import subprocess
-import warnings
-from collections import deque
+from collections import OrderedDict
 from dataclasses import dataclass
-from io import BytesIO
 from pathlib import Path
 from threading import Lock
-from time import monotonic
+from time import monotonic, perf_counter_ns, thread_time_ns
 
 from PIL import Image
 
+from .images import (
+    MAX_IMAGE_PIXELS, LuminanceFingerprint, decode_frame, forget_frame, hold_frame,
+    luminance_fingerprint,
+)
+
 
 LOGGER = logging.getLogger(__name__)
 FFMPEG_BINARY = "/usr/bin/ffmpeg"
 LOOPBACK_FLUENT_STREAM = "rtsp://127.0.0.1:8554/camera"
-MAX_FRAMES = 16
+MAX_FRAMES = 64
 MAX_FRAME_BYTES = 16 * 1024 * 1024
 MAX_TOTAL_BYTES = 64 * 1024 * 1024
+RECORD_SEGMENT_SECONDS = 10
+MIN_LUMA_CHANGE = 1.0
+_START_OF_IMAGE = b"\xff\xd8\xff"
+_END_OF_IMAGE = b"\xff\xd9"
+_START_OF_FRAME_MARKERS = frozenset((
+    0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF,
+))
+_DECODE_ERRORS = (
+    OSError, ValueError, Image.DecompressionBombWarning, Image.DecompressionBombError,
+)
 
 
 @dataclass(frozen=True)
@@ -31,17 +42,25 @@ class HotStreamConfig:
     output_directory: Path
     source_url: str = LOOPBACK_FLUENT_STREAM
     sample_fps: float = 5.0
+    idle_fps: float = 5.0
+    burst_seconds: float = 10.0
     frame_count: int = 8
     selection_count: int = 2
     max_frame_bytes: int = 8 * 1024 * 1024
     max_total_bytes: int = 48 * 1024 * 1024
     max_age_seconds: float = 1.0
     restart_seconds: float = 1.0
+    record_seconds: int = 0
+    record_directory: Path | None = None
 
 
 def load_hot_stream_config(environment, upload_root: Path) -> HotStreamConfig:
     enabled = _boolean(environment.get("GATE_HOT_STREAM_ENABLED", "false"))
     sample_fps = _number(environment.get("GATE_HOT_STREAM_SAMPLE_FPS", "5"), 1, 10)
+    idle_fps = _number(
+        environment.get("GATE_HOT_STREAM_IDLE_FPS", f"{sample_fps:g}"), 0.5, sample_fps,
+    )
+    burst_seconds = _number(environment.get("GATE_HOT_STREAM_BURST_SECONDS", "10"), 1, 30)
     frame_count = _integer(environment.get("GATE_HOT_STREAM_FRAME_COUNT", "8"), 1, MAX_FRAMES)
     requested_selection_count = _integer(
         environment.get("GATE_HOT_STREAM_SELECTION_COUNT", "2"), 1, 3,
@@ -60,133 +79,255 @@ def load_hot_stream_config(environment, upload_root: Path) -> HotStreamConfig:
         max_frame_bytes, MAX_TOTAL_BYTES,
     )
     max_age = _number(environment.get("GATE_HOT_STREAM_MAX_AGE_SECONDS", "1"), 0.1, 2)
+    record_seconds = _integer(environment.get("GATE_HOT_STREAM_RECORD_SECONDS", "0"), 0, 600)
+    if 0 < record_seconds < 3 * RECORD_SEGMENT_SECONDS:
+        raise ValueError("hot stream record seconds must be 0 or at least 30")
     return HotStreamConfig(
         enabled=enabled,
         output_directory=Path(upload_root) / ".hot-stream",
         sample_fps=sample_fps,
+        idle_fps=idle_fps,
+        burst_seconds=burst_seconds,
         frame_count=frame_count,
         selection_count=selection_count,
         max_frame_bytes=max_frame_bytes,
         max_total_bytes=max_total_bytes,
         max_age_seconds=max_age,
+        record_seconds=record_seconds,
+        # Clips stay out of the FTP-writable upload root.
+        record_directory=Path(upload_root).parent / "clips",
     )
 
 
 class JpegStreamParser:
+    """Split an image2pipe MJPEG stream into frames in linear time.
+
+    Scan offsets persist across ``feed`` calls, so each byte is searched for
+    markers once. Consumed bytes are dropped only once they make up half of
+    the buffer, and each frame is copied out of the buffer exactly once.
+    """
+
     def __init__(self, max_frame_bytes: int):
         self._max_frame_bytes = max_frame_bytes
         self._buffer = bytearray()
+        self._start = -1
+        self._scan = 0
 
     def feed(self, chunk: bytes) -> list[bytes]:
         if not isinstance(chunk, bytes) or not chunk:
             return []
-        self._buffer.extend(chunk)
+        buffer = self._buffer
+        buffer.extend(chunk)
         frames = []
-        while self._buffer:
-            start = self._buffer.find(b"\xff\xd8\xff")
-            if start < 0:
-                self._buffer.clear()
-                break
-            if start:
-                del self._buffer[:start]
-            end = self._buffer.find(b"\xff\xd9", 3)
+        while True:
+            if self._start < 0:
+                start = buffer.find(_START_OF_IMAGE, self._scan)
+                if start < 0:
+                    self._scan = max(self._scan, len(buffer) - len(_START_OF_IMAGE) + 1)
+                    break
+                self._start = start
+                self._scan = start + len(_START_OF_IMAGE)
+            end = buffer.find(_END_OF_IMAGE, self._scan)
             if end < 0:
-                if len(self._buffer) > self._max_frame_bytes:
-                    self._buffer.clear()
+                if len(buffer) - self._start > self._max_frame_bytes:
+                    self._start = -1
+                    self._scan = len(buffer)
+                else:
+                    self._scan = max(self._scan, len(buffer) - len(_END_OF_IMAGE) + 1)
                 break
-            end += 2
-            frame = bytes(self._buffer[:end])
-            del self._buffer[:end]
-            if len(frame) <= self._max_frame_bytes:
-                frames.append(frame)
+            end += len(_END_OF_IMAGE)
+            if end - self._start <= self._max_frame_bytes:
+                frames.append(bytes(memoryview(buffer)[self._start:end]))
+            self._start = -1
+            self._scan = end
+        self._compact()
         return frames
 
+    def _compact(self) -> None:
+        consumed = self._scan if self._start < 0 else self._start
+        if consumed and consumed * 2 >= len(self._buffer):
+            del self._buffer[:consumed]
+            self._scan -= consumed
+            if self._start >= 0:
+                self._start -= consumed
+
+
+class _TimedLock:
+    """A mutex that records how long each holder kept it."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._acquired_at = 0
+        self.holds = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def __enter__(self):
+        self._lock.acquire()
+        self._acquired_at = perf_counter_ns()
+        return self
+
+    def __exit__(self, *_exc_info):
+        held_ns = perf_counter_ns() - self._acquired_at
+        self.holds += 1
+        self.total_ns += held_ns
+        self.max_ns = max(self.max_ns, held_ns)
+        self._lock.release()
+
 
 class HotFrameRing:
-    def __init__(self, *, max_frames: int, max_frame_bytes: int, max_total_bytes: int):
+    """Distinct recent frames indexed by digest in capture order.
+
+    Adding, refreshing a duplicate, and evicting the oldest frame are O(1)
+    and decode nothing. ``select`` walks the fresh frames newest first and
+    gives each frame it reaches a luminance fingerprint from a 1/8 draft
+    decode, cached for later selections. A frame that barely differs from
+    one already chosen is a near-copy: the sharper of the two is kept and
+    the other leaves the ring, so a static scene holds one frame. Capture
+    times come from one monotonic clock, so arrival order is capture order.
+    """
+
+    def __init__(self, *, max_frames: int, max_frame_bytes: int, max_total_bytes: int,
+                 min_change: float = MIN_LUMA_CHANGE):
         self._max_frames = max_frames
         self._max_frame_bytes = max_frame_bytes
         self._max_total_bytes = max_total_bytes
-        self._frames = deque()
+        self._min_change = min_change
+        self._frames: OrderedDict[
+            bytes, tuple[float, bytes, LuminanceFingerprint | None]
+        ] = OrderedDict()
         self._total_bytes = 0
-        self._lock = Lock()
+        self._lock = _TimedLock()
+        self._offered = 0
+        self._rejected = 0
+        self._coalesced = 0
+        self._ingest_cpu_ns = 0
 
     def add(self, frame: bytes, *, captured_at: float | None = None) -> bool:
-        if (
-            not isinstance(frame, bytes)
-            or not 0 < len(frame) <= self._max_frame_bytes
-            or not _is_decodable_jpeg(frame)
-        ):
-            return False
-        digest = hashlib.sha256(frame).digest()
+        """Admit a structurally valid JPEG; decoding waits for selection."""
+        cpu_started = thread_time_ns()
+        valid = (
+            isinstance(frame, bytes)
+            and 0 < len(frame) <= self._max_frame_bytes
+            and _has_jpeg_structure(frame)
+        )
+        digest = hashlib.sha256(frame).digest() if valid else None
+        cpu_ns = thread_time_ns() - cpu_started
         captured_at = monotonic() if captured_at is None else captured_at
         with self._lock:
-            for index, candidate in enumerate(self._frames):
-                if candidate[1] == digest:
-                    _old_timestamp, _digest, existing = candidate
-                    del self._frames[index]
-                    self._frames.append((captured_at, digest, existing))
-                    return False
-            self._frames.append((captured_at, digest, frame))
+            self._offered += 1
+            self._ingest_cpu_ns += cpu_ns
+            if not valid:
+                self._rejected += 1
+                return False
+            existing = self._frames.pop(digest, None)
+            if existing is not None:
+                self._frames[digest] = (captured_at, *existing[1:])
+                return False
+            self._frames[digest] = (captured_at, frame, None)
             self._total_bytes += len(frame)
             while (
                 len(self._frames) > self._max_frames
                 or self._total_bytes > self._max_total_bytes
             ):
-                _timestamp, _digest, removed = self._frames.popleft()
+                _digest, (_timestamp, removed, _fingerprint) = self._frames.popitem(last=False)
                 self._total_bytes -= len(removed)
         return True
 
     def select(self, count: int, *, now: float | None = None, max_age: float) -> list[bytes]:
+        return [
+            frame for _digest, frame
+            in self.select_digested(count, now=now, max_age=max_age)
+        ]
+
+    def select_digested(
+        self, count: int, *, now: float | None = None, max_age: float,
+    ) -> list[tuple[str, bytes]]:
+        """Return ``(sha256_hex, frame)`` for up to ``count`` distinct fresh frames.
+
+        Frames are visited newest first, once each, and the walk stops when
+        ``count`` frames are chosen. A near-copy of a chosen frame replaces
+        it only when sharper, so ties go to the newest frame. Near-copies
+        and frames whose draft decode fails are dropped from the ring.
+        """
         now = monotonic() if now is None else now
+        fresh = []
         with self._lock:
-            return [
-                frame for captured_at, _digest, frame in reversed(self._frames)
-                if 0 <= now - captured_at <= max_age
-            ][:count]
-
-    def materialise(
-        self, output_directory: Path, count: int, *,
-        now: float | None = None, max_age: float,
-    ) -> tuple[Path, ...]:
-        frames = self.select(count, now=now, max_age=max_age)
-        if not frames:
-            return ()
-        directory = _ensure_private_directory(output_directory)
-        paths = []
-        try:
-            for frame in frames:
-                target = directory / f"frame-{secrets.token_hex(12)}.jpg"
-                flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0)
-                flags |= getattr(os, "O_NOFOLLOW", 0)
-                descriptor = os.open(target, flags, 0o600)
+            for digest, (captured_at, frame, fingerprint) in reversed(self._frames.items()):
+                if now - captured_at > max_age:
+                    break
+                if captured_at <= now:
+                    fresh.append((digest, frame, fingerprint))
+        selected = []
+        computed = {}
+        coalesced = []
+        broken = []
+        for digest, frame, fingerprint in fresh:
+            if len(selected) == count:
+                break
+            if fingerprint is None:
                 try:
-                    os.fchmod(descriptor, 0o600)
-                    view = memoryview(frame)
-                    while view:
-                        written = os.write(descriptor, view)
-                        if written <= 0:
-                            raise OSError("hot frame write failed")
-                        view = view[written:]
-                finally:
-                    os.close(descriptor)
-                paths.append(target)
-            return tuple(paths)
-        except BaseException:
-            for path in paths:
-                path.unlink(missing_ok=True)
-            raise
+                    fingerprint = computed[digest] = luminance_fingerprint(frame)
+                except _DECODE_ERRORS:
+                    broken.append(digest)
+                    continue
+            twin = next((
+                position for position, (_digest, _frame, chosen) in enumerate(selected)
+                if fingerprint.distance(chosen) < self._min_change
+            ), None)
+            if twin is None:
+                selected.append((digest, frame, fingerprint))
+            elif fingerprint.sharpness > selected[twin][2].sharpness:
+                coalesced.append(selected[twin][0])
+                selected[twin] = (digest, frame, fingerprint)
+            else:
+                coalesced.append(digest)
+        if computed or coalesced or broken:
+            with self._lock:
+                for digest, fingerprint in computed.items():
+                    entry = self._frames.get(digest)
+                    if entry is not None:
+                        self._frames[digest] = (*entry[:2], fingerprint)
+                self._coalesced += self._remove(coalesced)
+                self._rejected += self._remove(broken)
+        return [(digest.hex(), frame) for digest, frame, _fingerprint in selected]
+
+    def _remove(self, digests) -> int:
+        removed = 0
+        for digest in digests:
+            entry = self._frames.pop(digest, None)
+            if entry is not None:
+                self._total_bytes -= len(entry[1])
+                removed += 1
+        return removed
+
+    def discard(self, digest: str) -> None:
+        """Drop a frame that failed its deferred decode."""
+        with self._lock:
+            self._rejected += self._remove((bytes.fromhex(digest),))
 
     def status(self, *, now: float | None = None, max_age: float = 1.0) -> dict:
         now = monotonic() if now is None else now
         with self._lock:
-            latest = self._frames[-1][0] if self._frames else None
+            latest = next(reversed(self._frames.values()))[0] if self._frames else None
             count = len(self._frames)
+            holds = self._lock.holds
+            total_ns = self._lock.total_ns
+            max_ns = self._lock.max_ns
+            offered = self._offered
+            rejected = self._rejected
+            coalesced = self._coalesced
+            ingest_cpu_ns = self._ingest_cpu_ns
         age_ms = None if latest is None else max(0, round((now - latest) * 1000))
         return {
             "ready": age_ms is not None and age_ms <= round(max_age * 1000),
             "buffered_frames": count,
             "latest_frame_age_ms": age_ms,
+            "lock_hold_mean_us": round(total_ns / holds / 1000, 1) if holds else None,
+            "lock_hold_max_us": round(max_ns / 1000, 1) if holds else None,
+            "frames_rejected": rejected,
+            "frames_coalesced": coalesced,
+            "ingest_cpu_us_per_frame": _per_frame_us(ingest_cpu_ns, offered),
         }
 
 
@@ -202,58 +343,152 @@ class HotStreamBuffer:
             max_total_bytes=config.max_total_bytes,
         )
         self._restart_count = 0
+        self._selection_lock = Lock()
+        self._selection_decodes = 0
+        self._selection_decode_cpu_ns = 0
+        self._idle_step = max(1, round(config.sample_fps / config.idle_fps))
+        self._adaptive = self._idle_step > 1
+        self._burst_until = None
+        self._rate_lock = Lock()
+        self._decoder_idle = False
         self._process = None
-        fps = f"{config.sample_fps:g}"
-        self.command = (
-            FFMPEG_BINARY, "-nostdin", "-hide_banner", "-loglevel", "error",
-            "-rtsp_transport", "tcp", "-i", config.source_url,
-            "-map", "0:v:0", "-an", "-vf", f"fps={fps}",
-            "-q:v", "3", "-c:v", "mjpeg", "-f", "image2pipe", "pipe:1",
-        )
+        self.command = _ffmpeg_command(config, idle_step=self._idle_step)
         self.child_environment = {"LANG": "C", "LC_ALL": "C"}
 
+    def trigger(self, _event=None) -> None:
+        """Sample at the full rate for the burst window after a camera event."""
+        if not self._adaptive:
+            return
+        burst_until = self._clock() + self.config.burst_seconds
+        self._burst_until = max(self._burst_until or burst_until, burst_until)
+        self._sync_decoder_rate()
+        LOGGER.info("gate_hot_stream mode=burst seconds=%g", self.config.burst_seconds)
+
+    def mode(self) -> str:
+        if not self._adaptive:
+            return "continuous"
+        burst_until = self._burst_until
+        return "burst" if burst_until is not None and self._clock() < burst_until else "idle"
+
+    def _sync_decoder_rate(self) -> None:
+        """Switch the running decoder's idle frame gate to the current mode.
+
+        The gate is a ``framestep`` filter ahead of the MJPEG encoder, toggled
+        through ffmpeg's command channel on stdin. The H.264 decode keeps
+        running at the camera's rate, so a burst never waits for a new stream
+        or keyframe, but idle frames are dropped before they are encoded,
+        piped, validated, and hashed.
+        """
+        with self._rate_lock:
+            process = self._process
+            idle = self.mode() == "idle"
+            if idle == self._decoder_idle or process is None:
+                return
+            try:
+                process.stdin.write(f"cframestep -1 enable {int(idle)}\n".encode("ascii"))
+                process.stdin.flush()
+            except (OSError, ValueError):
+                return
+            self._decoder_idle = idle
+
     def select(self, _received_at=None) -> tuple[Path, ...]:
-        selected = self._ring.materialise(
-            self.output_directory, self.config.selection_count,
-            now=self._clock(), max_age=self.config.max_age_seconds,
-        )
+        """Hand the newest fresh frames to the burst without writing them.
+
+        Each frame is held in memory under an unwritten path inside the
+        ignored output directory, so ranking, OCR, and evidence staging read
+        the ring's bytes and digest directly. The burst worker forgets the
+        paths once the burst is processed.
+
+        Ingest only checked each frame's structure, so a selected frame is
+        decoded here first. The shared decode is what ranking reuses. A frame
+        that fails to decode is discarded and the next newest takes its
+        place.
+        """
+        count = self.config.selection_count
+        selected = {}
+        while len(selected) < count:
+            rejected = False
+            for digest, frame in self._ring.select_digested(
+                count, now=self._clock(), max_age=self.config.max_age_seconds,
+            ):
+                if digest not in selected and len(selected) < count:
+                    path = self._decoded_hold(digest, frame)
+                    if path is None:
+                        rejected = True
+                    else:
+                        selected[digest] = path
+            if not rejected:
+                break
         LOGGER.info(
             "gate_hot_stream selection_count=%d ready=%s",
             len(selected), bool(selected),
         )
-        return selected
+        return tuple(selected.values())
+
+    def _decoded_hold(self, digest: str, frame: bytes) -> Path | None:
+        path = hold_frame(
+            self.output_directory / f"frame-{digest[:16]}-{secrets.token_hex(6)}.jpg",
+            frame, digest=digest,
+        )
+        cpu_started = thread_time_ns()
+        try:
+            decode_frame(path)
+        except _DECODE_ERRORS:
+            forget_frame(path)
+            self._ring.discard(digest)
+            return None
+        finally:
+            with self._selection_lock:
+                self._selection_decodes += 1
+                self._selection_decode_cpu_ns += thread_time_ns() - cpu_started
+        return path
 
     def status(self) -> dict:
         ring = self._ring.status(now=self._clock(), max_age=self.config.max_age_seconds)
+        with self._selection_lock:
+            decode_cpu_ns = self._selection_decode_cpu_ns
+            decodes = self._selection_decodes
+        mode = self.mode()
         return {
             "enabled": self.config.enabled,
             **ring,
             "stream": "fluent",
             "sample_fps": self.config.sample_fps,
+            "admitted_fps": (
+                self.config.sample_fps / self._idle_step
+                if mode == "idle" else self.config.sample_fps
+            ),
+            "mode": mode,
             "source_profile": {
                 "codec": "h264", "width": 640, "height": 360, "fps": 10,
             },
             "restart_count": self._restart_count,
+            "record_seconds": self.config.record_seconds,
+            "selection_decode_cpu_us_per_frame": _per_frame_us(decode_cpu_ns, decodes),
         }
 
     def run_forever(self, stop_event) -> None:
         if not self.config.enabled:
             stop_event.wait()
             return
-        _ensure_private_directory(self.output_directory)
         while not stop_event.is_set():
             parser = JpegStreamParser(self.config.max_frame_bytes)
             try:
+                if self.config.record_seconds:
+                    self.config.record_directory.mkdir(mode=0o700, exist_ok=True)
                 process = self._popen(
                     self.command,
-                    stdin=subprocess.DEVNULL,
+                    stdin=subprocess.PIPE if self._adaptive else subprocess.DEVNULL,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.DEVNULL,
                     env=self.child_environment,
                     close_fds=True,
                 )
-                self._process = process
+                with self._rate_lock:
+                    self._process = process
+                    self._decoder_idle = False
                 while not stop_event.is_set():
+                    self._sync_decoder_rate()
                     chunk = process.stdout.read(64 * 1024)
                     if not chunk:
                         break
@@ -271,9 +506,17 @@ class HotStreamBuffer:
         self._stop_child()
 
     def _stop_child(self) -> None:
-        process = self._process
-        self._process = None
-        if process is None or process.poll() is not None:
+        with self._rate_lock:
+            process = self._process
+            self._process = None
+        if process is None:
+            return
+        if self._adaptive:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        if process.poll() is not None:
             return
         process.terminate()
         try:
@@ -283,39 +526,93 @@ class HotStreamBuffer:
             process.wait(timeout=1)
 
 
-def _ensure_private_directory(path: Path) -> Path:
-    path = Path(path)
-    try:
-        path.mkdir(mode=0o700, parents=False, exist_ok=True)
-    except FileNotFoundError as error:
-        raise ValueError("hot stream output parent is missing") from error
-    metadata = path.stat(follow_symlinks=False)
-    if (
-        not stat.S_ISDIR(metadata.st_mode)
-        or path.is_symlink()
-        or metadata.st_uid != os.geteuid()
-        or stat.S_IMODE(metadata.st_mode) & 0o077
-    ):
-        raise ValueError("hot stream output directory must be owner-only")
-    return path
-
-
-def _is_decodable_jpeg(data: bytes) -> bool:
-    if data[:3] != b"\xff\xd8\xff":
-        return False
-    try:
-        with warnings.catch_warnings():
-            warnings.simplefilter("error", Image.DecompressionBombWarning)
-            with Image.open(BytesIO(data)) as image:
-                if image.format != "JPEG":
-                    return False
-                image.verify()
-        return True
-    except (
-        OSError, ValueError, Image.DecompressionBombWarning,
-        Image.DecompressionBombError,
-    ):
+def _ffmpeg_command(config: HotStreamConfig, *, idle_step: int = 1) -> tuple[str, ...]:
+    """Build the single loopback reader for the frame pipe and clip recorder.
+
+    With an idle rate below the sample rate, a ``framestep`` gate that keeps
+    every ``idle_step``-th frame sits ahead of the encoder, disabled until
+    the controller enables it over stdin. Without recording, the frame pipe is the only output and a slow reader
+    simply paces the decoder. With recording, one RTSP session and demuxer
+    feed both outputs, each behind its own bounded fifo that drops that
+    output's packets on overflow, so a slow SD card never stalls the frame
+    pipe and a stalled frame reader never stalls the recorder. The recorder
+    copies the H.264 stream into a fixed ring of segment files.
+    """
+    frame_filter = f"fps={config.sample_fps:g}"
+    if idle_step > 1:
+        frame_filter += f",framestep=step={idle_step}:enable=0"
+    command = (
+        FFMPEG_BINARY, *(() if idle_step > 1 else ("-nostdin",)),
+        "-hide_banner", "-loglevel", "error",
+        "-rtsp_transport", "tcp", "-i", config.source_url,
+        "-map", "0:v:0", "-an", "-vf", frame_filter,
+        "-q:v", "3", "-c:v", "mjpeg",
+    )
+    if not config.record_seconds:
+        return command + ("-f", "image2pipe", "pipe:1")
+    segments = config.record_seconds // RECORD_SEGMENT_SECONDS
+    return command + (
+        "-f", "fifo", "-fifo_format", "image2pipe",
+        "-queue_size", "16", "-drop_pkts_on_overflow", "1", "pipe:1",
+        "-map", "0:v:0", "-an", "-c:v", "copy",
+        "-f", "fifo", "-fifo_format", "segment",
+        "-format_opts", (
+            f"segment_time={RECORD_SEGMENT_SECONDS}:segment_wrap={segments}"
+            ":segment_format=matroska:reset_timestamps=1"
+        ),
+        "-queue_size", "256", "-drop_pkts_on_overflow", "1",
+        "-attempt_recovery", "1", "-recover_any_error", "1",
+        "-restart_with_keyframe", "1",
+        str(config.record_directory / "clip-%03d.mkv"),
+    )
+
+
+def _has_jpeg_structure(data: bytes) -> bool:
+    """Walk the marker segments from SOI to SOS without decoding pixels.
+
+    Requires a start-of-frame segment with non-zero dimensions inside the
+    decompression-bomb limit, a start-of-scan segment after it, and a final
+    EOI. Entropy-coded data is not inspected.
+    """
+    if data[:2] != b"\xff\xd8" or data[-2:] != _END_OF_IMAGE:
         return False
+    offset = 2
+    has_frame = False
+    while offset + 4 <= len(data):
+        if data[offset] != 0xFF:
+            return False
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            offset += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            offset += 2
+            continue
+        length = int.from_bytes(data[offset + 2:offset + 4], "big")
+        if length < 2 or offset + 2 + length > len(data):
+            return False
+        if marker in _START_OF_FRAME_MARKERS:
+            if has_frame or length < 8:
+                return False
+            height = int.from_bytes(data[offset + 5:offset + 7], "big")
+            width = int.from_bytes(data[offset + 7:offset + 9], "big")
+            components = data[offset + 9]
+            if (
+                not width or not height or width * height > MAX_IMAGE_PIXELS
+                or components not in (1, 3, 4) or length != 8 + 3 * components
+            ):
+                return False
+            has_frame = True
+        elif marker == 0xDA:
+            return has_frame
+        elif marker in (0xD8, 0xD9):
+            return False
+        offset += 2 + length
+    return False
+
+
+def _per_frame_us(total_ns: int, frames: int) -> float | None:
+    return round(total_ns / frames / 1000, 1) if frames else None
 
 
 def _boolean(value) -> bool:
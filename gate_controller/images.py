@@ -1,76 +1,471 @@
 import hashlib
+import os
 import warnings
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from io import BytesIO
 from pathlib import Path
+from threading import Lock
 from time import monotonic, sleep
 
-from PIL import Image, ImageFilter, ImageStat
+from PIL import Image, ImageFilter
 
 from .telemetry import FrameTelemetry
 
 
 MAX_IMAGE_PIXELS = 16_000_000
 QUALITY_SIZE = (320, 180)
+RANKING_SCALES = (1, 2, 4, 8)
+DEFAULT_RANKING_SCALE = 4
 QUALITY_UNAVAILABLE_DIGEST = hashlib.sha256(b"quality_unavailable").hexdigest()
+MAX_CACHED_FRAMES = 24
+MAX_CACHED_FRAME_BYTES = 48 * 1024 * 1024
+MAX_UPLOAD_IMAGE_BYTES = 512 * 1024
+MAX_UPLOAD_IMAGE_DIMENSION = 1280
+FINGERPRINT_SIZE = (16, 9)
+FINGERPRINT_SCALE = 8
+PERCEPTUAL_HASH_SIZE = (9, 8)
+NEAR_DUPLICATE_MAX_DISTANCE = 6
+NEAR_DUPLICATE_MAX_BRIGHTNESS_DELTA = 0.05
+DECISION_GRADE_BRIGHTNESS = (0.12, 0.88)
+DECISION_GRADE_MAX_DARKNESS = 0.4
+DECISION_GRADE_MAX_HIGHLIGHT_CLIPPING = 0.05
 Image.MAX_IMAGE_PIXELS = min(Image.MAX_IMAGE_PIXELS or MAX_IMAGE_PIXELS, MAX_IMAGE_PIXELS)
+_DECODE_ERRORS = (
+    OSError, ValueError, Image.DecompressionBombWarning, Image.DecompressionBombError,
+)
 
 
-def measure_frame_quality(path: Path, *, digest: str | None = None) -> FrameTelemetry:
-    """Return bounded, downsampled quality proxies without exposing image paths."""
-    path = Path(path)
-    if digest is None:
-        try:
-            digest = _content_digest(path)
-        except OSError:
-            digest = QUALITY_UNAVAILABLE_DIGEST
+@dataclass(frozen=True)
+class DecodedFrame:
+    """One read, hash, and draft decode of a JPEG shared by every pipeline stage."""
 
-    try:
-        if not _has_jpeg_signature(path):
+    path: Path
+    data: bytes
+    digest: str
+    width: int
+    height: int
+    sharpness: float
+    brightness: float
+    darkness: float
+    highlight_clipping: float
+    ranking_scale: int = DEFAULT_RANKING_SCALE
+    ranking_sharpness: float = 0.0
+    perceptual_hash: int = 0
+
+    @classmethod
+    def decode(cls, path: Path, data: bytes, *,
+               ranking_scale: int = DEFAULT_RANKING_SCALE,
+               digest: str | None = None) -> "DecodedFrame":
+        """Decode once at ``1/ranking_scale`` using JPEG DCT scaling.
+
+        The draft image provides the ranking sharpness; a thumbnail of it
+        provides the bounded quality metrics and the perceptual hash, so the
+        draft never drops below ``QUALITY_SIZE``. Pass ``digest`` when the
+        SHA-256 is already known.
+        """
+        if ranking_scale not in RANKING_SCALES:
+            raise ValueError(f"ranking scale must be one of {RANKING_SCALES}")
+        if data[:3] != b"\xff\xd8\xff":
             raise ValueError("invalid image signature")
         with warnings.catch_warnings():
             warnings.simplefilter("error", Image.DecompressionBombWarning)
-            with Image.open(path) as image:
+            with Image.open(BytesIO(data)) as image:
                 if image.format != "JPEG":
                     raise ValueError("invalid image format")
                 width, height = image.size
-                image.draft("L", QUALITY_SIZE)
+                image.draft("L", (
+                    max(-(-width // ranking_scale), min(width, QUALITY_SIZE[0])),
+                    max(-(-height // ranking_scale), min(height, QUALITY_SIZE[1])),
+                ))
                 image.load()
-                image.thumbnail(QUALITY_SIZE, Image.Resampling.BILINEAR)
                 grayscale = image.convert("L")
+        ranking_sharpness = _laplacian_variance(grayscale)
+        grayscale.thumbnail(QUALITY_SIZE, Image.Resampling.BILINEAR)
 
         histogram = grayscale.histogram()
         pixel_count = max(sum(histogram), 1)
-        brightness = sum(value * count for value, count in enumerate(histogram)) / (
-            255 * pixel_count
-        )
-        darkness = sum(histogram[:33]) / pixel_count
-        highlight_clipping = sum(histogram[240:]) / pixel_count
-        sharpness = _sharpness_proxy(grayscale)
-        return FrameTelemetry(
-            sequence=0,
-            digest=digest,
+        return cls(
+            path=Path(path),
+            data=data,
+            digest=digest or hashlib.sha256(data).hexdigest(),
             width=width,
             height=height,
-            sharpness=sharpness,
-            brightness=brightness,
-            darkness=darkness,
-            highlight_clipping=highlight_clipping,
+            sharpness=_sharpness_proxy(grayscale),
+            brightness=sum(value * count for value, count in enumerate(histogram)) / (
+                255 * pixel_count
+            ),
+            darkness=sum(histogram[:33]) / pixel_count,
+            highlight_clipping=sum(histogram[240:]) / pixel_count,
+            ranking_scale=ranking_scale,
+            ranking_sharpness=ranking_sharpness,
+            perceptual_hash=_difference_hash(grayscale),
         )
-    except (
-        OSError, ValueError, Image.DecompressionBombWarning, Image.DecompressionBombError,
-    ):
+
+    def quality(self, *, sequence: int = 0, digest: str | None = None) -> FrameTelemetry:
         return FrameTelemetry(
-            sequence=0,
-            digest=digest,
-            width=1,
-            height=1,
-            sharpness=0.0,
-            brightness=0.0,
-            darkness=0.0,
-            highlight_clipping=0.0,
-            status="quality_unavailable",
+            sequence=sequence,
+            digest=digest or self.digest,
+            width=self.width,
+            height=self.height,
+            sharpness=self.sharpness,
+            brightness=self.brightness,
+            darkness=self.darkness,
+            highlight_clipping=self.highlight_clipping,
+        )
+
+
+@dataclass(frozen=True)
+class LuminanceFingerprint:
+    """A coarse luminance grid and sharpness estimate from a 1/8 draft decode."""
+
+    luma: bytes
+    sharpness: float
+
+    def distance(self, other: "LuminanceFingerprint") -> float:
+        """Return the mean absolute luminance difference, from 0 to 255."""
+        return sum(
+            abs(left - right) for left, right in zip(self.luma, other.luma)
+        ) / len(self.luma)
+
+
+def luminance_fingerprint(data: bytes) -> LuminanceFingerprint:
+    """Fingerprint a JPEG from its DC coefficients without a full decode."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", Image.DecompressionBombWarning)
+        with Image.open(BytesIO(data)) as image:
+            if image.format != "JPEG":
+                raise ValueError("invalid image format")
+            width, height = image.size
+            image.draft("L", (
+                max(-(-width // FINGERPRINT_SCALE), FINGERPRINT_SIZE[0]),
+                max(-(-height // FINGERPRINT_SCALE), FINGERPRINT_SIZE[1]),
+            ))
+            image.load()
+            grayscale = image.convert("L")
+    return LuminanceFingerprint(
+        luma=grayscale.resize(FINGERPRINT_SIZE, Image.Resampling.BOX).tobytes(),
+        sharpness=_laplacian_variance(grayscale),
+    )
+
+
+class _FrameCache:
+    """Bounded LRU of decoded frames, valid only while the file is unchanged."""
+
+    def __init__(self, max_frames: int = MAX_CACHED_FRAMES,
+                 max_bytes: int = MAX_CACHED_FRAME_BYTES):
+        self._max_frames = max_frames
+        self._max_bytes = max_bytes
+        self._frames: OrderedDict[Path, tuple[tuple, DecodedFrame]] = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+
+    def get(self, path: Path, identity: tuple) -> DecodedFrame | None:
+        with self._lock:
+            entry = self._frames.get(path)
+            if entry is None:
+                return None
+            if entry[0] != identity:
+                self._discard(path)
+                return None
+            self._frames.move_to_end(path)
+            return entry[1]
+
+    def put(self, identity: tuple, frame: DecodedFrame) -> None:
+        if len(frame.data) > self._max_bytes:
+            return
+        with self._lock:
+            self._discard(frame.path)
+            self._frames[frame.path] = (identity, frame)
+            self._bytes += len(frame.data)
+            while len(self._frames) > self._max_frames or self._bytes > self._max_bytes:
+                self._discard(next(iter(self._frames)))
+
+    def forget(self, path: Path) -> None:
+        with self._lock:
+            self._discard(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._bytes = 0
+
+    def _discard(self, path: Path) -> None:
+        entry = self._frames.pop(path, None)
+        if entry is not None:
+            self._bytes -= len(entry[1].data)
+
+
+class _HeldFrames:
+    """Frames served from memory under paths that are never written to disk.
+
+    A held frame stays pinned until it is forgotten: the ring, predictions,
+    and in-flight bursts may all still be reading it, so nothing is evicted.
+    """
+
+    def __init__(self):
+        self._frames: OrderedDict[Path, DecodedFrame | tuple[bytes, str]] = OrderedDict()
+        self._lock = Lock()
+
+    def hold(self, path: Path, data: bytes, digest: str) -> None:
+        with self._lock:
+            self._frames.pop(path, None)
+            self._frames[path] = (data, digest)
+
+    def get(self, path: Path) -> DecodedFrame | tuple[bytes, str] | None:
+        with self._lock:
+            return self._frames.get(path)
+
+    def replace(self, path: Path, frame: DecodedFrame) -> None:
+        with self._lock:
+            if path in self._frames:
+                self._frames[path] = frame
+
+    def forget(self, path: Path) -> None:
+        with self._lock:
+            self._frames.pop(path, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+
+
+_FRAME_CACHE = _FrameCache()
+_HELD_FRAMES = _HeldFrames()
+_LAPLACIAN = ImageFilter.Kernel((3, 3), (0, 1, 0, 1, -4, 1, 0, 1, 0), scale=1)
+_NEGATED_LAPLACIAN = ImageFilter.Kernel((3, 3), (0, -1, 0, -1, 4, -1, 0, -1, 0), scale=1)
+
+
+def decode_frame(path: Path, *, max_bytes: int | None = None,
+                 ranking_scale: int | None = None) -> DecodedFrame:
+    """Return the shared decoded frame for ``path``, reading it at most once.
+
+    Raises OSError or ValueError (including Pillow decompression-bomb errors)
+    when the file is missing, over ``max_bytes``, or not a decodable JPEG.
+    Failures are not cached, so a still-growing upload is re-read next time.
+    A cached frame decoded at another ranking scale is decoded again; with
+    no ``ranking_scale`` any cached decode is reused, and a fresh one uses
+    ``DEFAULT_RANKING_SCALE``.
+    """
+    path = Path(path)
+    held = _HELD_FRAMES.get(path)
+    if held is not None:
+        return _decode_held_frame(path, held, max_bytes, ranking_scale)
+    try:
+        identity = _file_identity(os.stat(path))
+    except OSError:
+        _FRAME_CACHE.forget(path)
+        raise
+    if max_bytes is not None and identity[1] > max_bytes:
+        raise ValueError("image exceeds the byte limit")
+    cached = _FRAME_CACHE.get(path, identity)
+    if cached is not None and ranking_scale in (None, cached.ranking_scale):
+        return cached
+    if cached is not None:
+        data = cached.data
+    else:
+        data, identity = _read_frame_bytes(path, max_bytes)
+    frame = DecodedFrame.decode(
+        path, data, ranking_scale=ranking_scale or DEFAULT_RANKING_SCALE,
+    )
+    _FRAME_CACHE.put(identity, frame)
+    return frame
+
+
+def frame_bytes(path: Path, *, max_bytes: int | None = None) -> bytes:
+    """Return upload bytes, reusing a decoded frame when the file is unchanged.
+
+    Raises ValueError when the frame is over ``max_bytes``.
+    """
+    path = Path(path)
+    held = _HELD_FRAMES.get(path)
+    if held is not None:
+        data = held.data if isinstance(held, DecodedFrame) else held[0]
+    else:
+        cached = _FRAME_CACHE.get(path, _file_identity(os.stat(path)))
+        if cached is None:
+            return _read_frame_bytes(path, max_bytes)[0]
+        data = cached.data
+    if max_bytes is not None and len(data) > max_bytes:
+        raise ValueError("image exceeds the byte limit")
+    return data
+
+
+def hold_frame(path: Path, data: bytes, *, digest: str) -> Path:
+    """Serve ``data`` as ``path`` to every frame reader until it is forgotten.
+
+    Nothing is written to disk. ``digest`` is the SHA-256 hex digest of
+    ``data``, computed once by the producer. The frame is never evicted, so
+    every producer must pair this with ``forget_frame``.
+    """
+    path = Path(path)
+    _HELD_FRAMES.hold(path, data, digest)
+    return path
+
+
+def forget_frame(path: Path) -> None:
+    """Drop a cached decode or held frame once its upload has been removed."""
+    path = Path(path)
+    _HELD_FRAMES.forget(path)
+    _FRAME_CACHE.forget(path)
+
+
+def _decode_held_frame(path: Path, held, max_bytes: int | None,
+                       ranking_scale: int | None) -> DecodedFrame:
+    decoded = isinstance(held, DecodedFrame)
+    data, digest = (held.data, held.digest) if decoded else held
+    if max_bytes is not None and len(data) > max_bytes:
+        raise ValueError("image exceeds the byte limit")
+    if decoded and ranking_scale in (None, held.ranking_scale):
+        return held
+    frame = DecodedFrame.decode(
+        path, data, ranking_scale=ranking_scale or DEFAULT_RANKING_SCALE, digest=digest,
+    )
+    _HELD_FRAMES.replace(path, frame)
+    return frame
+
+
+def bounded_jpeg(image: Image.Image, max_bytes: int) -> bytes | None:
+    """Encode ``image`` within ``max_bytes``, lowering quality, then size."""
+    working = image
+    for _ in range(4):
+        for quality in (82, 70, 58, 46):
+            output = BytesIO()
+            working.save(output, format="JPEG", quality=quality, optimize=True)
+            encoded = output.getvalue()
+            if len(encoded) <= max_bytes:
+                return encoded
+        width = max(1, int(working.width * 0.8))
+        height = max(1, int(working.height * 0.8))
+        if (width, height) == working.size:
+            break
+        working = working.resize((width, height), Image.Resampling.LANCZOS)
+    return None
+
+
+def measure_frame_quality(path: Path, *, digest: str | None = None) -> FrameTelemetry:
+    """Return bounded, downsampled quality proxies without exposing image paths."""
+    path = Path(path)
+    try:
+        return decode_frame(path).quality(digest=digest)
+    except _DECODE_ERRORS:
+        pass
+    if digest is None:
+        try:
+            digest = _content_digest(path)
+        except OSError:
+            digest = QUALITY_UNAVAILABLE_DIGEST
+    return FrameTelemetry(
+        sequence=0,
+        digest=digest,
+        width=1,
+        height=1,
+        sharpness=0.0,
+        brightness=0.0,
+        darkness=0.0,
+        highlight_clipping=0.0,
+        status="quality_unavailable",
+    )
+
+
+def is_decision_grade(quality: FrameTelemetry, *, min_sharpness: float) -> bool:
+    """Return whether a frame's quality proxies are good enough to OCR it alone."""
+    minimum_brightness, maximum_brightness = DECISION_GRADE_BRIGHTNESS
+    return (
+        quality.status == "ok"
+        and quality.sharpness >= min_sharpness
+        and minimum_brightness <= quality.brightness <= maximum_brightness
+        and quality.darkness <= DECISION_GRADE_MAX_DARKNESS
+        and quality.highlight_clipping <= DECISION_GRADE_MAX_HIGHLIGHT_CLIPPING
+    )
+
+
+@dataclass(frozen=True)
+class OcrQualityGate:
+    """Quality proxy limits a frame must meet before it costs an OCR request.
+
+    The defaults admit every frame. Frames whose quality could not be
+    measured are never skipped.
+    """
+
+    min_sharpness: float = 0.0
+    max_darkness: float = 1.0
+    max_highlight_clipping: float = 1.0
+
+    def skip_reason(self, quality: FrameTelemetry | None) -> str | None:
+        if quality is None or quality.status != "ok":
+            return None
+        if quality.sharpness < self.min_sharpness:
+            return "skipped_blurred"
+        if quality.darkness > self.max_darkness:
+            return "skipped_dark"
+        if quality.highlight_clipping > self.max_highlight_clipping:
+            return "skipped_clipped"
+        return None
+
+    def partition(self, frames, measure, *, limit: int) -> tuple[list, list]:
+        """Split frames into those worth OCR and ``(frame, quality)`` skips.
+
+        Frames are measured in order only until ``limit`` have passed, so a
+        frame OCR would never reach is not counted as skipped. When none
+        pass, the first frame is kept so the burst still gets one attempt.
+        """
+        frames = list(frames)
+        kept, skipped = [], []
+        for index, frame in enumerate(frames):
+            if len(kept) >= limit:
+                kept.extend(frames[index:])
+                break
+            quality = measure(frame)
+            reason = self.skip_reason(quality)
+            if reason is None:
+                kept.append(frame)
+            else:
+                skipped.append((frame, replace(quality, status=reason)))
+        if not kept and skipped:
+            kept.append(skipped.pop(0)[0])
+        return kept, skipped
+
+
+@dataclass(frozen=True)
+class PerceptualSignature:
+    """A frame's difference hash and mean brightness, for near-duplicate checks.
+
+    The hash compares neighbouring cells of a 9x8 luminance grid, so the same
+    moment encoded at another resolution or JPEG quality hashes alike. It
+    ignores overall exposure, which the brightness comparison restores.
+    """
+
+    hash: int
+    brightness: float
+
+    def matches(self, other: "PerceptualSignature") -> bool:
+        return (
+            (self.hash ^ other.hash).bit_count() <= NEAR_DUPLICATE_MAX_DISTANCE
+            and abs(self.brightness - other.brightness) <= NEAR_DUPLICATE_MAX_BRIGHTNESS_DELTA
         )
 
 
+def perceptual_signature(path: Path) -> PerceptualSignature | None:
+    """Return the frame's perceptual signature, or None if undecodable."""
+    try:
+        frame = decode_frame(path)
+    except _DECODE_ERRORS:
+        return None
+    return PerceptualSignature(frame.perceptual_hash, frame.brightness)
+
+
+def _difference_hash(grayscale: Image.Image) -> int:
+    width, height = PERCEPTUAL_HASH_SIZE
+    cells = grayscale.resize(PERCEPTUAL_HASH_SIZE, Image.Resampling.BOX).tobytes()
+    bits = 0
+    for row in range(height):
+        for column in range(width - 1):
+            index = row * width + column
+            bits = bits << 1 | (cells[index] > cells[index + 1])
+    return bits
+
+
 def _sharpness_proxy(grayscale: Image.Image) -> float:
     if grayscale.width < 3 or grayscale.height < 3:
         return 0.0
@@ -89,6 +484,28 @@ def _sharpness_proxy(grayscale: Image.Image) -> float:
     return min(mean_deviation / 128, 1.0)
 
 
+def _laplacian_variance(grayscale: Image.Image) -> float:
+    """Return the variance of the 4-neighbour Laplacian over the interior.
+
+    Both filter passes and the histograms run in Pillow's C code. The positive
+    and negative halves of the response are filtered separately so that the
+    8-bit output does not clip at zero; only responses beyond 255 saturate.
+    """
+    if grayscale.width < 3 or grayscale.height < 3:
+        return 0.0
+    interior = (1, 1, grayscale.width - 1, grayscale.height - 1)
+    count = (grayscale.width - 2) * (grayscale.height - 2)
+    total = 0
+    squares = 0
+    for kernel in (_LAPLACIAN, _NEGATED_LAPLACIAN):
+        histogram = grayscale.filter(kernel).crop(interior).histogram()
+        signed = 1 if kernel is _LAPLACIAN else -1
+        total += signed * sum(value * seen for value, seen in enumerate(histogram))
+        squares += sum(value * value * seen for value, seen in enumerate(histogram))
+    mean = total / count
+    return max(squares / count - mean * mean, 0.0)
+
+
 def wait_until_readable(path: Path, timeout: float, poll_interval: float = 0.1) -> bool:
     """Wait for a complete, decodable image without treating partial uploads as valid."""
     path = Path(path)
@@ -101,40 +518,59 @@ def wait_until_readable(path: Path, timeout: float, poll_interval: float = 0.1)
         sleep(poll_interval)
 
 
-def rank_images(paths, *, max_bytes: int | None = None) -> list[Path]:
-    """Return valid images ordered from sharpest to least sharp."""
-    scored_paths = []
-    for path in paths:
-        path = Path(path)
+def rank_images(paths, *, max_bytes: int | None = None,
+                ranking_scale: int = DEFAULT_RANKING_SCALE, executor=None) -> list[Path]:
+    """Return valid images ordered from sharpest to least sharp.
+
+    Sharpness is the Laplacian variance of a JPEG draft decode at
+    ``1/ranking_scale``; a scale of 1 ranks at full resolution. With an
+    ``executor``, frames are decoded concurrently; Pillow releases the GIL
+    while decoding and filtering. Ties are broken by content digest, so the
+    order does not depend on which decode finishes first.
+    """
+    if ranking_scale not in RANKING_SCALES:
+        raise ValueError(f"ranking scale must be one of {RANKING_SCALES}")
+    paths = [Path(path) for path in paths]
+
+    def score(path: Path):
         try:
-            if max_bytes is not None and path.stat().st_size > max_bytes:
-                continue
-            if not _has_jpeg_signature(path):
-                continue
-            with warnings.catch_warnings():
-                warnings.simplefilter("error", Image.DecompressionBombWarning)
-                with Image.open(path) as image:
-                    if image.format != "JPEG":
-                        continue
-                    image.load()
-                    grayscale = image.convert("L")
-                    edges = grayscale.filter(ImageFilter.FIND_EDGES)
-                    sharpness = ImageStat.Stat(edges).var[0]
-            digest = _content_digest(path)
-        except (
-            OSError, ValueError, Image.DecompressionBombWarning, Image.DecompressionBombError,
-        ):
-            continue
-        scored_paths.append((sharpness, digest, path))
+            frame = decode_frame(path, max_bytes=max_bytes, ranking_scale=ranking_scale)
+        except _DECODE_ERRORS:
+            return None
+        return frame.ranking_sharpness, frame.digest, path
+
+    scores = (
+        executor.map(score, paths) if executor is not None and len(paths) > 1
+        else map(score, paths)
+    )
+    scored_paths = [scored for scored in scores if scored is not None]
     return [
         path for _sharpness, _digest, path
         in sorted(scored_paths, key=lambda item: (-item[0], item[1]))
     ]
 
 
+def ranking_sharpness(path: Path, *, max_bytes: int | None = None,
+                      ranking_scale: int = DEFAULT_RANKING_SCALE) -> float | None:
+    """Return the sharpness ``rank_images`` orders by, or None if undecodable."""
+    try:
+        return decode_frame(
+            path, max_bytes=max_bytes, ranking_scale=ranking_scale,
+        ).ranking_sharpness
+    except _DECODE_ERRORS:
+        return None
+
+
 def content_digest(path: Path) -> str:
     """Return the stable content identity for a readable image."""
-    return _content_digest(Path(path))
+    path = Path(path)
+    held = _HELD_FRAMES.get(path)
+    if held is not None:
+        return held.digest if isinstance(held, DecodedFrame) else held[1]
+    try:
+        return decode_frame(path).digest
+    except _DECODE_ERRORS:
+        return _content_digest(path)
 
 
 def _content_digest(path: Path) -> str:
@@ -146,25 +582,22 @@ def _content_digest(path: Path) -> str:
 
 
 def _is_valid_image(path: Path) -> bool:
-    if not _has_jpeg_signature(path):
-        return False
     try:
-        with warnings.catch_warnings():
-            warnings.simplefilter("error", Image.DecompressionBombWarning)
-            with Image.open(path) as image:
-                if image.format != "JPEG":
-                    return False
-                image.verify()
-        return True
-    except (
-        OSError, ValueError, Image.DecompressionBombWarning, Image.DecompressionBombError,
-    ):
+        decode_frame(path)
+    except _DECODE_ERRORS:
         return False
+    return True
 
 
-def _has_jpeg_signature(path: Path) -> bool:
-    try:
-        with Path(path).open("rb") as source:
-            return source.read(3) == b"\xff\xd8\xff"
-    except OSError:
-        return False
+def _read_frame_bytes(path: Path, max_bytes: int | None) -> tuple[bytes, tuple]:
+    with Path(path).open("rb") as source:
+        limit = -1 if max_bytes is None else max_bytes + 1
+        data = source.read(limit)
+        identity = _file_identity(os.fstat(source.fileno()))
+    if max_bytes is not None and len(data) > max_bytes:
+        raise ValueError("image exceeds the byte limit")
+    return data, identity
+
+
+def _file_identity(stat_result) -> tuple:
+    return (stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
@@ -8,6 +8,9 @@ MIN_FUZZY_CONFIDENCE = 0.90
 _CONFUSION_GROUPS = (frozenset(("0", "O")), frozenset(("1", "I", "L")),
                      frozenset(("2", "Z")), frozenset(("5", "S")),
                      frozenset(("8", "B")))
+_CANONICAL_CONFUSIONS = str.maketrans({
+    character: min(group) for group in _CONFUSION_GROUPS for character in group
+})
 
 
 def normalise_plate(value: str) -> str:
@@ -16,12 +19,75 @@ def normalise_plate(value: str) -> str:
                    if character.isascii() and character.isalnum())
 
 
+class PlateIndex:
+    """Authorised plates compiled once for exact and known-confusion lookups.
+
+    Plates are keyed by their confusion-canonical form (O to 0, I and L to 1,
+    and so on), so the plates one known confusion away from an observation
+    share its key and are found without scanning the authorised list.
+    ``generation`` numbers the snapshots published by AuthorisedPlateCache;
+    indexes compiled ad hoc have none.
+    """
+
+    __slots__ = ("_plates", "_canonical", "_generation")
+
+    def __init__(self, plates: Iterable[str] = (), *, generation: int | None = None):
+        self._plates = frozenset(filter(None, (normalise_plate(plate) for plate in plates)))
+        self._generation = generation
+        canonical: dict[str, list[str]] = {}
+        for plate in self._plates:
+            canonical.setdefault(_canonical_plate(plate), []).append(plate)
+        self._canonical = {key: tuple(values) for key, values in canonical.items()}
+
+    @property
+    def plates(self) -> frozenset[str]:
+        return self._plates
+
+    @property
+    def generation(self) -> int | None:
+        return self._generation
+
+    def with_generation(self, generation: int) -> "PlateIndex":
+        """Return this index numbered as ``generation``, sharing its compiled tables."""
+        numbered = object.__new__(PlateIndex)
+        numbered._plates = self._plates
+        numbered._canonical = self._canonical
+        numbered._generation = generation
+        return numbered
+
+    def same_snapshot(self, other: "PlateIndex") -> bool:
+        """Return whether ``other`` is this snapshot, without comparing plates."""
+        return other is self or (
+            self._generation is not None and other.generation == self._generation
+        )
+
+    def __contains__(self, plate: object) -> bool:
+        return plate in self._plates
+
+    def __iter__(self):
+        return iter(self._plates)
+
+    def __len__(self) -> int:
+        return len(self._plates)
+
+    def confusions(self, observed_plate: str) -> tuple[str, ...]:
+        """Return authorised plates exactly one known OCR confusion away."""
+        return tuple(
+            plate for plate in self._canonical.get(_canonical_plate(observed_plate), ())
+            if _is_one_known_confusion(observed_plate, plate)
+        )
+
+
+def plate_index(authorised: Iterable[str]) -> PlateIndex:
+    """Return ``authorised`` as a PlateIndex, compiling raw plate collections."""
+    return authorised if isinstance(authorised, PlateIndex) else PlateIndex(authorised)
+
+
 def decide_access(
     observations: Iterable[PlateObservation], authorised: Iterable[str]
 ) -> MatchDecision:
     """Apply exact-first, fail-closed plate matching to OCR observations."""
-    authorised_plates = {normalise_plate(plate) for plate in authorised}
-    authorised_plates.discard("")
+    authorised_plates = plate_index(authorised)
     normalised_observations = [
         (normalise_plate(observation.plate), observation)
         for observation in observations
@@ -45,8 +111,7 @@ def decide_access(
         if not observed_plate or observation.confidence < MIN_FUZZY_CONFIDENCE:
             continue
         candidates.setdefault(observed_plate, set()).update(
-            plate for plate in authorised_plates
-            if _is_one_known_confusion(observed_plate, plate)
+            authorised_plates.confusions(observed_plate)
         )
         confidences[observed_plate] = max(
             confidences.get(observed_plate, 0.0), observation.confidence
@@ -78,6 +143,10 @@ def decide_access(
     return MatchDecision(allowed=False, reason="no_match")
 
 
+def _canonical_plate(plate: str) -> str:
+    return plate.translate(_CANONICAL_CONFUSIONS)
+
+
 def _is_one_known_confusion(observed_plate: str, authorised_plate: str) -> bool:
     if len(observed_plate) != len(authorised_plate):
         return False
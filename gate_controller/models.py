@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -14,6 +14,7 @@ class PlateObservation:
     confidence: float
     make: str | None = None
     colour: str | None = None
+    upload_saved_ratio: float | None = field(default=None, compare=False)
 
 
 @dataclass(frozen=True)
@@ -1,24 +1,153 @@
+import logging
+import warnings
+from collections import OrderedDict
 from collections.abc import Mapping
-from math import isfinite
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from math import ceil, floor, isfinite
 from pathlib import Path
 from threading import Lock
+from time import monotonic
 
+from PIL import Image, ImageDraw
+
+from .images import (
+    MAX_UPLOAD_IMAGE_BYTES, MAX_UPLOAD_IMAGE_DIMENSION, bounded_jpeg, decode_frame, frame_bytes,
+)
 from .matching import normalise_plate
 from .models import PlateObservation
 
 
 DEFAULT_ENDPOINT = "https://api.platerecognizer.com/v1/plate-reader/"
 DEFAULT_TIMEOUT = (1, 2)
+DEFAULT_CACHE_ENTRIES = 256
+DEFAULT_CACHE_TTL_SECONDS = 3600.0
+MAX_CACHE_ENTRIES = 4096
+MAX_REGION_POINTS = 16
+MAX_PREPARED_UPLOADS = 8
+_REGION_FILL = (128, 128, 128)
+_CROP_ERRORS = (
+    OSError, ValueError, Image.DecompressionBombWarning, Image.DecompressionBombError,
+)
 
 
 class OcrResponseError(RuntimeError):
     """The OCR service returned a response that cannot be trusted."""
 
 
+class OcrRegion:
+    """Crop frames to a static gate-lane polygon and re-encode them for upload.
+
+    Points are fractions of the frame width and height, so one polygon serves
+    every camera resolution. Pixels outside the polygon are filled with grey.
+    Crops share the outbox evidence bounds. A frame that cannot be cropped, or
+    whose crop is not smaller, is uploaded unchanged. Uploads are remembered by
+    frame digest, so a frame is cropped at most once however often it is read.
+    """
+
+    def __init__(self, points, *, max_dimension: int = MAX_UPLOAD_IMAGE_DIMENSION,
+                 max_bytes: int = MAX_UPLOAD_IMAGE_BYTES):
+        points = tuple((float(x), float(y)) for x, y in points)
+        if not 3 <= len(points) <= MAX_REGION_POINTS:
+            raise ValueError(
+                f"OCR region must have between 3 and {MAX_REGION_POINTS} points"
+            )
+        if any(not (isfinite(value) and 0 <= value <= 1)
+               for point in points for value in point):
+            raise ValueError("OCR region points must be fractions from 0 to 1")
+        xs = [x for x, _y in points]
+        ys = [y for _x, y in points]
+        if max(xs) <= min(xs) or max(ys) <= min(ys):
+            raise ValueError("OCR region must enclose an area")
+        self.points = points
+        self._bounds = (min(xs), min(ys), max(xs), max(ys))
+        self._max_dimension = max_dimension
+        self._max_bytes = max_bytes
+        self._prepared: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._prepared_lock = Lock()
+
+    @classmethod
+    def parse(cls, value: str) -> "OcrRegion":
+        """Parse space-separated ``x,y`` pairs such as ``0.2,0.4 0.9,0.4 0.9,1``."""
+        try:
+            points = [
+                tuple(float(part) for part in pair.split(","))
+                for pair in value.split()
+            ]
+        except ValueError as error:
+            raise ValueError("OCR region points must be x,y fractions") from error
+        if any(len(point) != 2 for point in points):
+            raise ValueError("OCR region points must be x,y fractions")
+        return cls(points)
+
+    def prepare(self, path: Path) -> tuple[bytes, float]:
+        """Return the upload bytes for ``path`` and the fraction of bytes saved.
+
+        The bytes and digest come from the shared decoded frame; only the crop
+        itself decodes the colour pixels.
+        """
+        try:
+            frame = decode_frame(path)
+        except _CROP_ERRORS:
+            frame = None
+        if frame is not None:
+            with self._prepared_lock:
+                prepared = self._prepared.get(frame.digest)
+                if prepared is not None:
+                    self._prepared.move_to_end(frame.digest)
+                    return prepared
+        original = frame.data if frame is not None else frame_bytes(path)
+        try:
+            cropped = self._crop(original)
+        except _CROP_ERRORS:
+            logging.getLogger(__name__).warning("ocr_region status=crop_failed")
+            cropped = None
+        if cropped is None or len(cropped) >= len(original):
+            prepared = (original, 0.0)
+        else:
+            prepared = (cropped, 1 - len(cropped) / len(original))
+        if frame is not None:
+            with self._prepared_lock:
+                self._prepared[frame.digest] = prepared
+                while len(self._prepared) > MAX_PREPARED_UPLOADS:
+                    self._prepared.popitem(last=False)
+        return prepared
+
+    def _crop(self, data: bytes) -> bytes | None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", Image.DecompressionBombWarning)
+            with Image.open(BytesIO(data)) as image:
+                left, top, right, bottom = self._bounds
+                width, height = image.size
+                scale = min(1.0, self._max_dimension / max(
+                    (right - left) * width, (bottom - top) * height,
+                ))
+                image.draft("RGB", (ceil(width * scale), ceil(height * scale)))
+                width, height = image.size
+                box = (
+                    floor(left * width), floor(top * height),
+                    max(ceil(right * width), floor(left * width) + 1),
+                    max(ceil(bottom * height), floor(top * height) + 1),
+                )
+                crop = image.convert("RGB").crop(box)
+        mask = Image.new("L", crop.size, 0)
+        ImageDraw.Draw(mask).polygon(
+            [(x * width - box[0], y * height - box[1]) for x, y in self.points],
+            fill=255,
+        )
+        region = Image.composite(crop, Image.new("RGB", crop.size, _REGION_FILL), mask)
+        region.thumbnail(
+            (self._max_dimension, self._max_dimension), Image.Resampling.LANCZOS,
+        )
+        return bounded_jpeg(region, self._max_bytes)
+
+
 class PlateRecognizerClient:
     def __init__(self, token: str, session=None, endpoint: str = DEFAULT_ENDPOINT,
-                 timeout: tuple[int, int] = DEFAULT_TIMEOUT):
+                 timeout: tuple[int, int] = DEFAULT_TIMEOUT,
+                 region: OcrRegion | None = None):
         self._token = token
+        self._region = region
         self._session = session
         self._session_generation = 0
         self._session_lock = Lock()
@@ -58,14 +187,17 @@ class PlateRecognizerClient:
                 raise RuntimeError("OCR client is closed")
             if generation != self._session_generation:
                 raise OcrResponseError("OCR request was abandoned")
-        with path.open("rb") as image:
-            response = session.post(
-                self._endpoint,
-                data={"regions": "ie"},
-                files={"upload": (path.name, image, "image/jpeg")},
-                headers={"Authorization": f"Token {self._token}"},
-                timeout=timeout or self._timeout,
-            )
+        if self._region is None:
+            upload, saved_ratio = frame_bytes(path), None
+        else:
+            upload, saved_ratio = self._region.prepare(path)
+        response = session.post(
+            self._endpoint,
+            data={"regions": "ie"},
+            files={"upload": (path.name, upload, "image/jpeg")},
+            headers={"Authorization": f"Token {self._token}"},
+            timeout=timeout or self._timeout,
+        )
 
         if not 200 <= response.status_code < 300:
             raise OcrResponseError(f"OCR service returned HTTP {response.status_code}")
@@ -79,7 +211,9 @@ class PlateRecognizerClient:
         if not isinstance(results, list):
             raise OcrResponseError("OCR service response has invalid results")
         if not results:
-            return PlateObservation(plate=None, confidence=0.0)
+            return PlateObservation(
+                plate=None, confidence=0.0, upload_saved_ratio=saved_ratio,
+            )
         first_result = results[0]
         if not isinstance(first_result, Mapping):
             raise OcrResponseError("OCR service response has invalid result")
@@ -94,6 +228,7 @@ class PlateRecognizerClient:
             plate=normalise_plate(plate), confidence=float(score),
             make=_optional_string(first_result.get("vehicle", {}), "make"),
             colour=_optional_string(first_result.get("vehicle", {}), "color"),
+            upload_saved_ratio=saved_ratio,
         )
 
     def abandon_in_flight(self) -> bool:
@@ -133,6 +268,110 @@ class PlateRecognizerClient:
         return requests.Session()
 
 
+class OcrResultCache:
+    """Remember recent OCR observations by frame content digest.
+
+    Entries are bounded by count (least recently used first) and by age. An
+    optional store keeps them across restarts; store failures only cost a miss.
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_CACHE_ENTRIES,
+                 ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS, store=None,
+                 clock=None, wall_clock=None):
+        if (isinstance(max_entries, bool) or not isinstance(max_entries, int)
+                or not 1 <= max_entries <= MAX_CACHE_ENTRIES):
+            raise ValueError(
+                f"OCR cache entries must be an integer from 1 to {MAX_CACHE_ENTRIES}"
+            )
+        if not isfinite(ttl_seconds) or ttl_seconds <= 0:
+            raise ValueError("OCR cache TTL must be finite and greater than zero")
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._store = store
+        self._clock = clock or monotonic
+        self._wall_clock = wall_clock or (lambda: datetime.now(timezone.utc))
+        self._entries: OrderedDict[str, tuple[float, PlateObservation]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, digest: str) -> PlateObservation | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and now - entry[0] < self._ttl_seconds:
+                self._entries.move_to_end(digest)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[digest]
+                self._evictions += 1
+        observation = self._load(digest)
+        with self._lock:
+            if observation is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._insert(digest, now, observation)
+        return observation
+
+    def contains(self, digest: str) -> bool:
+        """Return whether a fresh entry is held in memory, without counting a lookup."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(digest)
+            return entry is not None and now - entry[0] < self._ttl_seconds
+
+    def put(self, digest: str, observation: PlateObservation) -> int:
+        """Remember ``observation`` and return how many entries were evicted."""
+        with self._lock:
+            evicted = self._insert(digest, self._clock(), observation)
+        if self._store is not None:
+            try:
+                self._store.remember_ocr_observation(
+                    digest, observation, self._wall_clock(),
+                    max_entries=self._max_entries,
+                    not_before=self._wall_clock() - timedelta(seconds=self._ttl_seconds),
+                )
+            except Exception:
+                logging.getLogger(__name__).warning("ocr_cache status=persist_failed")
+        return evicted
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "ttl_seconds": self._ttl_seconds,
+                "persistent": self._store is not None,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def _insert(self, digest: str, now: float, observation: PlateObservation) -> int:
+        self._entries[digest] = (now, observation)
+        self._entries.move_to_end(digest)
+        evicted = 0
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            evicted += 1
+        self._evictions += evicted
+        return evicted
+
+    def _load(self, digest: str) -> PlateObservation | None:
+        if self._store is None:
+            return None
+        try:
+            return self._store.cached_ocr_observation(
+                digest, self._wall_clock() - timedelta(seconds=self._ttl_seconds),
+            )
+        except Exception:
+            logging.getLogger(__name__).warning("ocr_cache status=load_failed")
+            return None
+
+
 def _optional_string(value, key: str) -> str | None:
     if not isinstance(value, Mapping):
         return None
@@ -1,5 +1,6 @@
 import base64
 import hashlib
+import json
 import logging
 import os
 import tempfile
@@ -13,13 +14,20 @@ from threading import Event
 import requests
 from PIL import Image, ImageOps
 
+from .images import (
+    MAX_UPLOAD_IMAGE_BYTES, MAX_UPLOAD_IMAGE_DIMENSION, bounded_jpeg, frame_bytes,
+)
+
 
 MAX_IMAGE_PIXELS = 16_000_000
 Image.MAX_IMAGE_PIXELS = min(Image.MAX_IMAGE_PIXELS or MAX_IMAGE_PIXELS, MAX_IMAGE_PIXELS)
 
 LOCAL_IMAGE_PATH_KEY = "_local_image_path"
-MAX_OUTBOX_IMAGE_BYTES = 512 * 1024
-MAX_OUTBOX_IMAGE_DIMENSION = 1280
+MAX_OUTBOX_IMAGE_BYTES = MAX_UPLOAD_IMAGE_BYTES
+MAX_OUTBOX_IMAGE_DIMENSION = MAX_UPLOAD_IMAGE_DIMENSION
+MAX_OUTBOX_BATCH_SIZE = 25
+MAX_EVIDENCE_SOURCE_BYTES = 16 * 1024 * 1024
+OUTBOX_PAGE_SIZE = 20
 LOGGER = logging.getLogger(__name__)
 
 
@@ -122,8 +130,10 @@ class HttpOutboxSender:
     """Deliver optional event notifications through an explicitly configured endpoint."""
 
     def __init__(self, url: str, *, session=None, timeout: tuple[float, float] = (2, 4),
-                 bearer_token: str | None = None, controller_id: str = "primary"):
+                 bearer_token: str | None = None, controller_id: str = "primary",
+                 batch_url: str | None = None):
         self._url = url
+        self._batch_url = batch_url or f"{url.rstrip('/')}/batch"
         self._controller_id = controller_id
         self._session = session or requests.Session()
         self._timeout = timeout
@@ -141,6 +151,21 @@ class HttpOutboxSender:
         if not 200 <= response.status_code < 300:
             raise OutboxSyncError(f"outbox endpoint returned HTTP {response.status_code}")
 
+    def send_batch(self, items: list[tuple[dict, bytes | None]]) -> list[bool]:
+        """Post several events in one multipart request; return per-item acks."""
+        files = _outbox_batch_parts(items, self._controller_id)
+        response = self._session.post(
+            self._batch_url, files=files, headers=dict(self._headers),
+            timeout=self._timeout,
+        )
+        if not 200 <= response.status_code < 300:
+            raise OutboxSyncError(f"outbox endpoint returned HTTP {response.status_code}")
+        try:
+            reply = response.json()
+        except ValueError as error:
+            raise OutboxSyncError("outbox endpoint did not confirm ingest") from error
+        return _batch_acknowledgements(reply, len(items))
+
 
 class CloudflareOutboxSender:
     def __init__(self, client, controller_id):
@@ -158,15 +183,67 @@ class CloudflareOutboxSender:
                 max_response_bytes=4096,
             )
         except requests.HTTPError as error:
-            status_code = getattr(getattr(error, "response", None), "status_code", None)
-            detail = status_code if isinstance(status_code, int) else "failure"
-            raise OutboxSyncError(f"outbox endpoint returned HTTP {detail}") from error
+            raise _http_sync_error(error) from error
         if not _is_ingest_acknowledgement(acknowledgement):
             raise OutboxSyncError("outbox endpoint did not confirm ingest")
 
+    def send_batch(self, items: list[tuple[dict, bytes | None]]) -> list[bool]:
+        files = _outbox_batch_parts(items, self._controller_id)
+        try:
+            reply = self.client.post_multipart(
+                "/api/controller/events/batch",
+                files,
+                max_response_bytes=4096 * len(items),
+            )
+        except requests.HTTPError as error:
+            raise _http_sync_error(error) from error
+        return _batch_acknowledgements(reply, len(items))
+
+
+def _http_sync_error(error: requests.HTTPError) -> OutboxSyncError:
+    status_code = getattr(getattr(error, "response", None), "status_code", None)
+    detail = status_code if isinstance(status_code, int) else "failure"
+    return OutboxSyncError(f"outbox endpoint returned HTTP {detail}")
+
+
+def _outbox_batch_parts(items: list[tuple[dict, bytes | None]],
+                        controller_id: str) -> list[tuple]:
+    """Build one JSON ``events`` part plus one JPEG part per distinct digest.
+
+    Each event carries its own ``idempotency_key`` and, when it has evidence,
+    an ``image`` object whose ``part`` names the multipart field holding the
+    bytes, so receivers apply the same per-event rules as the single endpoint.
+    """
+    events = []
+    evidence_parts = {}
+    for payload, evidence_bytes in items:
+        transmitted = _prepare_outbox_payload(
+            payload, controller_id, evidence_bytes, embed_evidence=False
+        )
+        transmitted["idempotency_key"] = _outbox_idempotency_key(transmitted)
+        events.append(transmitted)
+        if evidence_bytes is not None:
+            image = transmitted["image"]
+            evidence_parts.setdefault(image["part"], (
+                image["filename"], evidence_bytes, image["content_type"],
+            ))
+    return [(
+        "events",
+        (None, json.dumps({"events": events}, separators=(",", ":")),
+         "application/json"),
+    )] + list(evidence_parts.items())
+
+
+def _batch_acknowledgements(reply: object, expected: int) -> list[bool]:
+    results = reply.get("results") if isinstance(reply, dict) else None
+    if not isinstance(results, list) or len(results) != expected:
+        raise OutboxSyncError("outbox endpoint did not confirm ingest")
+    return [_is_ingest_acknowledgement(result) for result in results]
+
 
 def _prepare_outbox_payload(payload: dict, controller_id: str,
-                            evidence_bytes: bytes | None) -> dict:
+                            evidence_bytes: bytes | None, *,
+                            embed_evidence: bool = True) -> dict:
     transmitted = dict(payload)
     legacy_path = transmitted.pop(LOCAL_IMAGE_PATH_KEY, None)
     if legacy_path is not None and "image_sha256" not in transmitted:
@@ -182,9 +259,14 @@ def _prepare_outbox_payload(payload: dict, controller_id: str,
         transmitted["image"] = {
             "filename": f"{image_digest}.jpg",
             "content_type": "image/jpeg",
-            "data_base64": base64.b64encode(evidence_bytes).decode("ascii"),
             "sha256": image_digest,
         }
+        if embed_evidence:
+            transmitted["image"]["data_base64"] = base64.b64encode(
+                evidence_bytes
+            ).decode("ascii")
+        else:
+            transmitted["image"]["part"] = f"image-{image_digest}"
     elif image_digest is not None:
         raise OutboxSyncError("queued evidence bytes are unavailable")
     return transmitted
@@ -206,9 +288,10 @@ def _is_ingest_acknowledgement(value: object) -> bool:
 
 
 def _normalise_jpeg(path: Path) -> bytes | None:
-    if not path.is_file() or not _has_jpeg_signature(path):
+    data = frame_bytes(path, max_bytes=MAX_EVIDENCE_SOURCE_BYTES)
+    if data[:3] != b"\xff\xd8\xff":
         return None
-    with Image.open(path) as source:
+    with Image.open(BytesIO(data)) as source:
         if source.format != "JPEG":
             return None
         image = ImageOps.exif_transpose(source).convert("RGB")
@@ -220,28 +303,7 @@ def _normalise_jpeg(path: Path) -> bytes | None:
 
 
 def _bounded_jpeg(image: Image.Image) -> bytes | None:
-    working = image
-    for _ in range(4):
-        for quality in (82, 70, 58, 46):
-            output = BytesIO()
-            working.save(output, format="JPEG", quality=quality, optimize=True)
-            encoded = output.getvalue()
-            if len(encoded) <= MAX_OUTBOX_IMAGE_BYTES:
-                return encoded
-        width = max(1, int(working.width * 0.8))
-        height = max(1, int(working.height * 0.8))
-        if (width, height) == working.size:
-            break
-        working = working.resize((width, height), Image.Resampling.LANCZOS)
-    return None
-
-
-def _has_jpeg_signature(path: Path) -> bool:
-    try:
-        with Path(path).open("rb") as source:
-            return source.read(3) == b"\xff\xd8\xff"
-    except OSError:
-        return False
+    return bounded_jpeg(image, MAX_OUTBOX_IMAGE_BYTES)
 
 
 class TelemetryRetentionWorker:
@@ -291,13 +353,24 @@ class OutboxWorker:
                  evidence_spool: EvidenceSpool | None = None,
                  controller_id: str = "primary",
                  clock: Callable[[], datetime] | None = None,
-                 telemetry_retention_days: int = 30):
+                 telemetry_retention_days: int = 30,
+                 batch_size: int = 1):
         if (
             isinstance(telemetry_retention_days, bool)
             or not isinstance(telemetry_retention_days, int)
             or not 1 <= telemetry_retention_days <= 3650
         ):
             raise ValueError("telemetry_retention_days must be between 1 and 3650")
+        if (
+            isinstance(batch_size, bool)
+            or not isinstance(batch_size, int)
+            or not 1 <= batch_size <= MAX_OUTBOX_BATCH_SIZE
+        ):
+            raise ValueError(
+                f"batch_size must be between 1 and {MAX_OUTBOX_BATCH_SIZE}"
+            )
+        if batch_size > 1 and not callable(getattr(send, "send_batch", None)):
+            raise ValueError("batch_size above 1 requires a sender with send_batch")
         self._store = store
         self._send = send
         self._poll_interval = poll_interval
@@ -307,8 +380,11 @@ class OutboxWorker:
         self._controller_id = controller_id
         self._clock = clock or (lambda: datetime.now(timezone.utc))
         self._telemetry_retention_days = telemetry_retention_days
+        self._batch_size = batch_size
         self._last_retention_at: datetime | None = None
         self._last_item_id: int | None = None
+        self._page_full = False
+        self._send_failed = False
         try:
             self._store.bind_pending_outbox_controller(self._controller_id)
             self._evidence_spool.cleanup(self._store.pending_evidence_digests())
@@ -330,10 +406,15 @@ class OutboxWorker:
     def run_once(self) -> int:
         now = self._clock()
         self._run_retention(now)
+        self._send_failed = False
+        if self._batch_size > 1:
+            return self._run_batches()
         completed = 0
-        for item_id, _queued_payload in self._store.pending_outbox_items(
-            after_id=self._last_item_id
-        ):
+        pending = self._store.pending_outbox_items(
+            OUTBOX_PAGE_SIZE, after_id=self._last_item_id
+        )
+        self._page_full = len(pending) >= OUTBOX_PAGE_SIZE
+        for item_id, _queued_payload in pending:
             self._last_item_id = item_id
             trace_id = "unavailable"
             try:
@@ -364,6 +445,7 @@ class OutboxWorker:
                     "error_type=%s",
                     trace_id, item_id, type(error).__name__,
                 )
+                self._send_failed = True
                 try:
                     self._store.mark_outbox_retry(item_id)
                 except Exception:
@@ -380,6 +462,7 @@ class OutboxWorker:
                     "item_id=%d error_type=%s",
                     trace_id, item_id, type(error).__name__,
                 )
+                self._send_failed = True
                 continue
             LOGGER.info(
                 "gate_pipeline stage=cloud_acknowledged trace_id=%s item_id=%d "
@@ -397,6 +480,141 @@ class OutboxWorker:
             completed += 1
         return completed
 
+    def _run_batches(self) -> int:
+        page_size = max(OUTBOX_PAGE_SIZE, self._batch_size)
+        pending = [
+            item_id for item_id, _queued_payload in self._store.pending_outbox_items(
+                page_size, after_id=self._last_item_id
+            )
+        ]
+        self._page_full = len(pending) >= page_size
+        completed = 0
+        for start in range(0, len(pending), self._batch_size):
+            batch = pending[start:start + self._batch_size]
+            self._last_item_id = batch[-1]
+            completed += self._deliver_batch(batch)
+        return completed
+
+    def _deliver_batch(self, item_ids: list[int]) -> int:
+        """Send up to ``batch_size`` items in one request with per-item acks.
+
+        Send attempts are recorded in one store transaction before the request
+        and acknowledgements in one transaction after it. Items the receiver
+        did not acknowledge are left queued for retry.
+        """
+        try:
+            prepared = self._store.prepare_outbox_batch(item_ids, self._clock())
+        except Exception as error:
+            self._log_batch_failure("cloud_send_failed", item_ids, {}, error)
+            self._mark_batch_retry(item_ids)
+            return 0
+        entries = []
+        unsendable = []
+        for item_id, payload in prepared.items():
+            telemetry = payload.get("telemetry", {})
+            LOGGER.info(
+                "gate_pipeline stage=cloud_send_started trace_id=%s item_id=%d "
+                "observed_at=%s attempt=%s",
+                telemetry.get("trace_id", "unavailable"),
+                item_id,
+                telemetry.get("stage_timestamps", {}).get(
+                    "cloud_send_started_at", "unavailable"
+                ),
+                telemetry.get("delivery", {}).get("outbox_attempt", "unavailable"),
+            )
+            image_digest = payload.get("image_sha256")
+            try:
+                evidence = (
+                    None if image_digest is None
+                    else self._evidence_spool.load(image_digest)
+                )
+            except Exception as error:
+                self._log_batch_failure(
+                    "cloud_send_failed", [item_id], prepared, error
+                )
+                unsendable.append(item_id)
+                continue
+            entries.append((item_id, payload, evidence))
+        if not entries:
+            self._mark_batch_retry(unsendable)
+            return 0
+        try:
+            acknowledgements = self._send.send_batch([
+                (payload, evidence) for _item_id, payload, evidence in entries
+            ])
+        except Exception as error:
+            sent_ids = [item_id for item_id, _payload, _evidence in entries]
+            self._log_batch_failure("cloud_send_failed", sent_ids, prepared, error)
+            self._mark_batch_retry(unsendable + sent_ids)
+            return 0
+        acknowledged = []
+        for (item_id, payload, _evidence), accepted in zip(entries, acknowledgements):
+            if accepted:
+                acknowledged.append((item_id, payload))
+            else:
+                LOGGER.warning(
+                    "gate_pipeline stage=cloud_send_failed trace_id=%s item_id=%d "
+                    "error_type=%s",
+                    payload.get("telemetry", {}).get("trace_id", "unavailable"),
+                    item_id, "BatchItemRejected",
+                )
+                unsendable.append(item_id)
+        self._mark_batch_retry(unsendable)
+        if not acknowledged:
+            return 0
+        try:
+            acknowledged_at = self._clock()
+            self._store.complete_outbox_batch(acknowledged, acknowledged_at)
+        except Exception as error:
+            self._log_batch_failure(
+                "cloud_ack_persist_failed",
+                [item_id for item_id, _payload in acknowledged], prepared, error,
+            )
+            self._send_failed = True
+            return 0
+        observed_at = acknowledged_at.astimezone(timezone.utc).isoformat()
+        for item_id, payload in acknowledged:
+            LOGGER.info(
+                "gate_pipeline stage=cloud_acknowledged trace_id=%s item_id=%d "
+                "observed_at=%s",
+                payload.get("telemetry", {}).get("trace_id", "unavailable"),
+                item_id, observed_at,
+            )
+        delivered_digests = {
+            payload["image_sha256"] for _item_id, payload in acknowledged
+            if payload.get("image_sha256") is not None
+        }
+        if delivered_digests:
+            try:
+                still_pending = self._store.pending_evidence_digests()
+                for image_digest in delivered_digests - still_pending:
+                    self._evidence_spool.delete(image_digest)
+            except Exception:
+                pass
+        return len(acknowledged)
+
+    def _mark_batch_retry(self, item_ids: list[int]) -> None:
+        if not item_ids:
+            return
+        self._send_failed = True
+        try:
+            self._store.mark_outbox_batch_retry(item_ids)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _log_batch_failure(stage: str, item_ids: list[int], prepared: dict,
+                           error: Exception) -> None:
+        for item_id in item_ids:
+            LOGGER.warning(
+                "gate_pipeline stage=%s trace_id=%s item_id=%d error_type=%s",
+                stage,
+                prepared.get(item_id, {}).get("telemetry", {}).get(
+                    "trace_id", "unavailable"
+                ),
+                item_id, type(error).__name__,
+            )
+
     def _run_retention(self, now: datetime) -> None:
         if (
             self._last_retention_at is not None
@@ -412,8 +630,16 @@ class OutboxWorker:
             pass
 
     def run_forever(self, stop_event: Event) -> None:
+        """Drain the backlog page after page, then poll at ``poll_interval``.
+
+        The next page is fetched at once while deliveries succeed or a full
+        page went out without a send failure; a failing receiver is retried
+        only after the poll interval.
+        """
         while not stop_event.is_set():
-            self.run_once()
+            completed = self.run_once()
+            if completed or (self._page_full and not self._send_failed):
+                continue
             stop_event.wait(self._poll_interval)
 
 
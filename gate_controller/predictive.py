@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from threading import Event, Lock
+from time import monotonic
+
+from .images import content_digest, forget_frame
+from .matching import decide_access, plate_index
+
+
+LOGGER = logging.getLogger(__name__)
+MAX_PENDING_EVENTS = 2
+MAX_PREDICTIONS = 4
+MAX_PREDICTED_OBSERVATIONS = 8
+OCR_SLOT_WAIT_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class _Prediction:
+    received_at: datetime
+    expires_at: float
+    paths: tuple[Path, ...]
+
+
+class _InFlight:
+    """One frame's prediction OCR, awaited by a burst that holds the same frame."""
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.observation = None
+
+    def resolve(self, observation) -> None:
+        self.observation = observation
+        self.done.set()
+
+
+class PredictiveRecognition:
+    """Recognise hot-stream frames as soon as the camera reports an event.
+
+    Accepted webhook events queue a prediction: the newest hot-stream frames
+    are sent to OCR in the background while the camera is still uploading its
+    FTP image. The predicted frames are held under the event until the burst
+    that correlates with it selects them, and their observations are offered
+    to the processor so that burst decides without a second OCR request. The
+    processor still applies its own freshness, authorisation, and idempotency
+    checks to the reused observations.
+
+    Predictions share the processor's ``ocr_slot`` and ``ocr_cache``. A burst
+    that arrives while its prediction is still running claims those frames,
+    and the processor waits for their in-flight results rather than sending
+    them to OCR again. ``recognise`` should use its own session, so a burst
+    abandoning its requests does not cancel a prediction.
+    """
+
+    def __init__(self, hot_stream, recognise, *, authorised=None, ocr_slot=None,
+                 ocr_cache=None, close=None,
+                 correlation_window_seconds: float = 5.0, ttl_seconds: float = 15.0,
+                 clock=monotonic):
+        if not 0 < correlation_window_seconds <= ttl_seconds:
+            raise ValueError("prediction correlation window exceeds the safe range")
+        self._hot_stream = hot_stream
+        self._recognise = recognise
+        self._authorised = authorised
+        self._ocr_slot = ocr_slot
+        self._ocr_cache = ocr_cache
+        self._close = close
+        self._window = timedelta(seconds=correlation_window_seconds)
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._pending: deque = deque(maxlen=MAX_PENDING_EVENTS)
+        self._predictions: OrderedDict[str, _Prediction] = OrderedDict()
+        self._observations: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._in_flight: dict[str, _InFlight] = {}
+        self._running: _Prediction | None = None
+        self._running_claimed = False
+        self._wake = Event()
+        self._lock = Lock()
+
+    @property
+    def output_directory(self) -> Path:
+        return self._hot_stream.output_directory
+
+    def trigger(self, event) -> None:
+        self._hot_stream.trigger(event)
+        with self._lock:
+            self._pending.append(event)
+        self._wake.set()
+
+    def select(self, received_at: datetime | None = None) -> tuple[Path, ...]:
+        """Return the frames predicted for this burst's event, else fresh ones.
+
+        A correlated prediction that is still running is claimed: the burst
+        takes its frames, and their results arrive through ``observation``.
+        """
+        outcome, prediction = self._take_prediction(received_at)
+        if prediction is not None:
+            LOGGER.info(
+                "gate_prediction outcome=%s frame_count=%d", outcome, len(prediction.paths),
+            )
+            return prediction.paths
+        return self._hot_stream.select(received_at)
+
+    def observation(self, digest: str, *, wait: float = 0.0):
+        """Return a predicted OCR observation for a frame digest, if still fresh.
+
+        A frame whose prediction is still in flight is waited for, for at most
+        ``wait`` seconds.
+        """
+        with self._lock:
+            entry = self._observations.get(digest)
+            if entry is not None and entry[0] > self._clock():
+                return entry[1]
+            in_flight = self._in_flight.get(digest)
+        if in_flight is None or wait <= 0 or not in_flight.done.wait(wait):
+            return None
+        return in_flight.observation
+
+    def status(self) -> dict:
+        with self._lock:
+            return {"predictions_ready": len(self._predictions)}
+
+    def run_forever(self, stop_event) -> None:
+        try:
+            while not stop_event.is_set():
+                self._wake.wait(0.25)
+                self._wake.clear()
+                while not stop_event.is_set():
+                    with self._lock:
+                        event = self._pending.popleft() if self._pending else None
+                    if event is None:
+                        break
+                    self._predict(event)
+                self._forget_expired()
+        finally:
+            self._forget_expired(everything=True)
+            if self._close is not None:
+                try:
+                    self._close()
+                except Exception:
+                    LOGGER.warning("gate_prediction outcome=close_failed")
+
+    def _predict(self, event) -> None:
+        paths = tuple(self._hot_stream.select(event.received_at) or ())
+        if not paths:
+            LOGGER.info("gate_prediction outcome=no_frames")
+            return
+        try:
+            digests = tuple(content_digest(path) for path in paths)
+        except OSError:
+            LOGGER.warning("gate_prediction outcome=frames_unavailable")
+            _forget_frames(paths)
+            return
+        in_flight = {digest: _InFlight() for digest in digests}
+        with self._lock:
+            self._running = _Prediction(_utc(event.received_at), 0.0, paths)
+            self._running_claimed = False
+            for digest, pending in in_flight.items():
+                self._in_flight.setdefault(digest, pending)
+        observations = []
+        try:
+            for path, digest in zip(paths, digests):
+                observation = self._recognise_frame(path, digest)
+                if observation is None:
+                    break
+                observations.append(observation)
+                self._remember(digest, observation)
+                in_flight[digest].resolve(observation)
+                decision = self._decide(observations)
+                if decision is not None and decision.allowed:
+                    break
+        finally:
+            with self._lock:
+                claimed = self._running_claimed
+                self._running = None
+                for digest, pending in in_flight.items():
+                    if self._in_flight.get(digest) is pending:
+                        del self._in_flight[digest]
+            for pending in in_flight.values():
+                if not pending.done.is_set():
+                    pending.resolve(None)
+        decision = self._decide(observations)
+        LOGGER.info(
+            "gate_prediction outcome=%s frame_count=%d ocr_count=%d claimed=%s",
+            "unavailable" if decision is None else (
+                "allowed" if decision.allowed else "denied"
+            ),
+            len(paths), len(observations), claimed,
+        )
+        if claimed:
+            # The correlated burst owns these frames and forgets them itself.
+            return
+        if not observations or (decision is not None and not decision.allowed):
+            # A denied prediction is not worth holding: the burst is better
+            # served by the frames that are newest when its FTP image lands.
+            # Their observations stay, in case the burst selects them again.
+            _forget_frames(paths)
+            return
+        expires_at = self._clock() + self._ttl_seconds
+        with self._lock:
+            self._predictions[event.event_id] = _Prediction(
+                _utc(event.received_at), expires_at, paths,
+            )
+            evicted = []
+            while len(self._predictions) > MAX_PREDICTIONS:
+                evicted.append(self._predictions.popitem(last=False)[1])
+        for prediction in evicted:
+            _forget_frames(prediction.paths)
+
+    def _recognise_frame(self, path: Path, digest: str):
+        """OCR one frame within the shared slot limit, reusing a cached result."""
+        if self._ocr_cache is not None:
+            try:
+                observation = self._ocr_cache.get(digest)
+            except Exception:
+                observation = None
+            if observation is not None:
+                return observation
+        slot = self._ocr_slot
+        if slot is not None and not slot.acquire(timeout=OCR_SLOT_WAIT_SECONDS):
+            LOGGER.info("gate_prediction outcome=ocr_busy")
+            return None
+        try:
+            observation = self._recognise(path)
+        except Exception as error:
+            LOGGER.warning(
+                "gate_prediction outcome=ocr_failed error_type=%s", type(error).__name__,
+            )
+            return None
+        finally:
+            if slot is not None:
+                slot.release()
+        if self._ocr_cache is not None:
+            try:
+                self._ocr_cache.put(digest, observation)
+            except Exception:
+                pass
+        return observation
+
+    def _remember(self, digest: str, observation) -> None:
+        expires_at = self._clock() + self._ttl_seconds
+        with self._lock:
+            self._observations[digest] = (expires_at, observation)
+            self._observations.move_to_end(digest)
+            while len(self._observations) > MAX_PREDICTED_OBSERVATIONS:
+                self._observations.popitem(last=False)
+
+    def _decide(self, observations):
+        if self._authorised is None or not observations:
+            return None
+        try:
+            return decide_access(observations, plate_index(self._authorised()))
+        except Exception:
+            return None
+
+    def _take_prediction(
+        self, received_at: datetime | None,
+    ) -> tuple[str, _Prediction | None]:
+        """Take a finished or running prediction for the event at ``received_at``.
+
+        A correlated event still waiting to be predicted is dropped instead,
+        since the burst is about to select and recognise the same frames.
+        """
+        received_at = _utc(received_at or datetime.now(timezone.utc))
+        now = self._clock()
+        with self._lock:
+            candidates = [
+                (abs(prediction.received_at - received_at), event_id)
+                for event_id, prediction in self._predictions.items()
+                if prediction.expires_at > now
+                and abs(prediction.received_at - received_at) <= self._window
+            ]
+            if candidates:
+                return "reused", self._predictions.pop(min(candidates)[1])
+            running = self._running
+            if (running is not None and not self._running_claimed
+                    and abs(running.received_at - received_at) <= self._window):
+                self._running_claimed = True
+                return "claimed", running
+            unpredicted = [
+                event for event in self._pending
+                if abs(_utc(event.received_at) - received_at) <= self._window
+            ]
+            for event in unpredicted:
+                self._pending.remove(event)
+        return "fresh", None
+
+    def _forget_expired(self, *, everything: bool = False) -> None:
+        now = self._clock()
+        with self._lock:
+            expired = [
+                event_id for event_id, prediction in self._predictions.items()
+                if everything or prediction.expires_at <= now
+            ]
+            forgotten = [self._predictions.pop(event_id) for event_id in expired]
+            for digest in [
+                digest for digest, (expires_at, _observation) in self._observations.items()
+                if everything or expires_at <= now
+            ]:
+                del self._observations[digest]
+        for prediction in forgotten:
+            _forget_frames(prediction.paths)
+
+
+def _forget_frames(paths) -> None:
+    for path in paths:
+        forget_frame(path)
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
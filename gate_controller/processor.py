@@ -8,22 +8,28 @@ import math
 from collections.abc import Iterable
 from dataclasses import replace
 from datetime import datetime, timedelta, timezone
+from itertools import count
 from pathlib import Path
 from queue import Empty, Queue
 from threading import BoundedSemaphore, Lock, Thread
 from time import monotonic
 
 from .actuation import ActuationCoordinator
-from .images import measure_frame_quality
-from .matching import decide_access, normalise_plate
+from .candidates import CandidateStream
+from .images import (
+    OcrQualityGate, PerceptualSignature, content_digest, measure_frame_quality,
+    perceptual_signature,
+)
+from .matching import decide_access, normalise_plate, plate_index
 from .models import GateEvent, ProcessingResult
 from .telemetry import (
-    OcrAttemptTelemetry, ProcessingTrace, TriggerTelemetry,
+    FrameTelemetry, OcrAttemptTelemetry, ProcessingTrace, TriggerTelemetry,
     ftp_fallback_trigger,
 )
 
 
 MAX_OCR_FRAMES = 3
+PREDICTION_WAIT_SECONDS = 0.5
 DEFAULT_ACTIVATION_GUARD_SECONDS = 0.1
 FINAL_INHIBITION_REASONS = frozenset({
     "stale_burst", "authorisation_error", "authorisation_revoked",
@@ -45,7 +51,9 @@ class GateProcessor:
                  coordinator=None, max_image_age: timedelta = timedelta(seconds=8),
                  decision_timeout: float = 4.0,
                  activation_guard_seconds: float | None = None,
-                 decision_clock=None,
+                 speculative_ocr_frames: int = 1, ocr_cache=None,
+                 predicted_observation=None, ocr_quality_gate: OcrQualityGate | None = None,
+                 ocr_slot=None, decision_clock=None,
                  telemetry_clock=None, telemetry_wall_clock=None, trace_factory=None):
         if not math.isfinite(decision_timeout) or decision_timeout <= 0:
             raise ValueError("decision timeout must be finite and greater than zero")
@@ -58,9 +66,19 @@ class GateProcessor:
             raise ValueError(
                 "activation guard must be finite, non-negative, and below the decision timeout"
             )
+        if (isinstance(speculative_ocr_frames, bool)
+                or not isinstance(speculative_ocr_frames, int)
+                or not 1 <= speculative_ocr_frames <= MAX_OCR_FRAMES):
+            raise ValueError(
+                f"speculative OCR frames must be an integer from 1 to {MAX_OCR_FRAMES}"
+            )
         self._recognizer = recognizer
         self._store = store
-        self._authorised = authorised if callable(authorised) else lambda: tuple(authorised)
+        if callable(authorised):
+            self._authorised = authorised
+        else:
+            index = plate_index(authorised)
+            self._authorised = lambda: index
         self._outbox = outbox
         self._outbox_enabled = outbox is not None
         self._clock = clock or (lambda: datetime.now(timezone.utc))
@@ -74,10 +92,21 @@ class GateProcessor:
         )
         self._trace_factory = trace_factory or ProcessingTrace
         self._coordinator = coordinator or ActuationCoordinator(store, relay, cooldown, self._clock)
-        self._ocr_slot = BoundedSemaphore(1)
+        self._speculative_ocr_frames = speculative_ocr_frames
+        self._ocr_quality_gate = ocr_quality_gate
+        self._ocr_cache = ocr_cache
+        self._predicted_observation = predicted_observation
+        self._predicted_waits = (
+            predicted_observation is not None
+            and _accepts_keyword(predicted_observation, "wait")
+        )
+        # A slot shared with predictive OCR keeps both within one request limit;
+        # a burst then waits for it, up to its deadline, instead of failing busy.
+        self._ocr_slot_shared = ocr_slot is not None
+        self._ocr_slot = ocr_slot or BoundedSemaphore(speculative_ocr_frames)
         self._ocr_slot_lock = Lock()
         self._actuation_lock = Lock()
-        self._ocr_worker = None
+        self._ocr_workers: set[Thread] = set()
         self._closed = False
         self._recognise_call = self._recognizer.recognise
         self._recognizer_accepts_timeout = _accepts_keyword(self._recognise_call, "timeout")
@@ -86,22 +115,39 @@ class GateProcessor:
                 decision_started_at: float | None = None,
                 processing_started_at: datetime | None = None, *,
                 trigger: TriggerTelemetry | dict | None = None,
-                idempotency_key: str | None = None) -> ProcessingResult:
+                idempotency_key: str | None = None,
+                follows: str | None = None) -> ProcessingResult:
+        """Decide a burst and actuate the relay if it shows an authorised plate.
+
+        ``follows`` names the idempotency key of an early-flushed burst this
+        follow-up belongs to. The follow-up is a duplicate once that burst has
+        reached actuation; after a denial it decides under its own key.
+        """
         trigger = _trigger_telemetry(trigger)
         started = self._decision_clock() if decision_started_at is None else decision_started_at
         deadline = started + self._decision_timeout
         activation_deadline = deadline - self._activation_guard_seconds
-        candidates = _unique_content_candidates(tuple(Path(path) for path in paths))
+        # A streamed burst starts with the uploads that have arrived so far;
+        # _recognise_in_order takes later ones as OCR attempts finish.
+        stream = paths if isinstance(paths, CandidateStream) else None
+        candidates = _unique_content_candidates(
+            stream.take_available() if stream is not None
+            else tuple(Path(path) for path in paths)
+        )
         paths = tuple(path for path, _digest in candidates)
         digests = tuple(digest for _path, digest in candidates)
         idempotency_key = idempotency_key or _event_key_from_digests(digests)
-        if self._store.event_exists(idempotency_key):
+        duplicate_of = idempotency_key if self._store.event_exists(idempotency_key) else None
+        if (duplicate_of is None and follows is not None
+                and self._store.actuation_claim_status(follows) is not None):
+            duplicate_of = follows
+        if duplicate_of is not None:
             if self._outbox_enabled:
-                event_id = self._store.terminal_outcome(idempotency_key)
-                event_id = event_id.event_id if event_id else self._store.event_id(idempotency_key)
+                event_id = self._store.terminal_outcome(duplicate_of)
+                event_id = event_id.event_id if event_id else self._store.event_id(duplicate_of)
                 if event_id is not None:
                     self._store.ensure_outbox(event_id, self._outbox_payload(paths))
-            return ProcessingResult(False, self._store.actuation_claim_status(idempotency_key) or "duplicate_event")
+            return ProcessingResult(False, self._store.actuation_claim_status(duplicate_of) or "duplicate_event")
         trace = self._new_trace()
         trace.set_trigger(trigger)
         if (
@@ -127,81 +173,35 @@ class GateProcessor:
                 idempotency_key=idempotency_key,
             )
         try:
-            authorised = self._authorised()
+            authorised = plate_index(self._authorised())
         except Exception:
             return self.record_skipped(
                 paths, "authorisation_error", received_at, trace=trace,
                 idempotency_key=idempotency_key,
             )
-        observations = []
-        ocr_failure_reason = None
-        decision = None
-        timed_out = False
-        for sequence, path in enumerate(paths[:MAX_OCR_FRAMES]):
-            remaining = self._decision_timeout - (self._decision_clock() - started)
-            if remaining <= 0:
-                timed_out = True
-                break
-            try:
-                frame_quality = replace(
-                    measure_frame_quality(path, digest=digests[sequence]),
-                    sequence=sequence,
-                )
-            except Exception:
-                trace.disable()
-            else:
-                trace.add_frame(frame_quality)
-            remaining = self._decision_timeout - (self._decision_clock() - started)
-            if remaining <= 0:
-                timed_out = True
-                break
-            ocr_started = False
-
-            def mark_ocr_start():
-                nonlocal ocr_started
-                trace.mark_ocr_start()
-                ocr_started = True
-
-            try:
-                observation = self._recognise(path, deadline, mark_ocr_start)
-            except _OcrBusy:
-                trace.add_ocr_rejection(OcrAttemptTelemetry(
-                    frame_sequence=sequence,
-                    status="ocr_busy",
-                ))
-                ocr_failure_reason = "ocr_busy"
-                break
-            except _OcrDeadlineExceeded:
-                if ocr_started:
-                    trace.add_ocr_attempt(OcrAttemptTelemetry(
-                        frame_sequence=sequence,
-                        status="ocr_timeout",
-                    ))
-                timed_out = True
-                break
-            except Exception:
-                if ocr_started:
-                    trace.add_ocr_attempt(OcrAttemptTelemetry(
-                        frame_sequence=sequence,
-                        status="ocr_error",
-                    ))
-                ocr_failure_reason = "ocr_error"
-                continue
-            trace.add_ocr_attempt(OcrAttemptTelemetry(
-                frame_sequence=sequence,
-                status="recognized" if observation.plate else "no_plate",
-                plate=observation.plate,
-                confidence=observation.confidence,
-                make=observation.make,
-                colour=observation.colour,
-            ))
-            observations.append(observation)
-            decision = decide_access(observations, authorised)
-            if self._decision_clock() - started >= self._decision_timeout:
-                timed_out = True
-                break
-            if decision.allowed:
-                break
+        ocr = _OcrRound()
+        ocr_paths, ocr_digests = self._predicted_first(candidates)
+        ocr_paths, ocr_digests = self._near_duplicates_removed(ocr_paths, ocr_digests, ocr)
+        ocr_paths, ocr_digests = self._quality_gated(ocr_paths, ocr_digests, ocr)
+        if self._speculative_ocr_frames > 1:
+            self._recognise_speculatively(
+                ocr_paths, ocr_digests, trace, started, deadline, authorised, ocr,
+            )
+        if not ocr.finished:
+            self._recognise_in_order(
+                ocr_paths, ocr_digests, trace, started, deadline, authorised, ocr,
+                stream=stream,
+            )
+        # Skipped frames are numbered after every frame in the OCR order, so
+        # they never share a sequence with an attempted or rejected frame.
+        first_skipped = max(ocr.next_sequence, len(ocr_paths))
+        for offset, quality in enumerate(ocr.skipped_frames):
+            trace.add_frame(replace(quality, sequence=first_skipped + offset))
+        if stream is not None:
+            paths = tuple(path for path, _digest in _unique_content_candidates(tuple(stream)))
+        decision = ocr.decision
+        timed_out = ocr.timed_out
+        ocr_failure_reason = ocr.failure_reason
         if not (decision and decision.allowed) and self._decision_clock() - started >= self._decision_timeout:
             timed_out = True
         if decision is None:
@@ -262,12 +262,11 @@ class GateProcessor:
             if not _is_fresh(self._clock(), received_at, self._max_image_age):
                 return "failed", "stale_burst"
             try:
-                current_authorised = {
-                    normalise_plate(plate) for plate in self._authorised()
-                }
+                current_authorised = plate_index(self._authorised())
             except Exception:
                 return "failed", "authorisation_error"
-            if normalise_plate(decision.authorised_plate) not in current_authorised:
+            if (not current_authorised.same_snapshot(authorised)
+                    and normalise_plate(decision.authorised_plate) not in current_authorised):
                 return "failed", "authorisation_revoked"
             if self._decision_clock() >= activation_deadline:
                 return "failed", "decision_timeout"
@@ -390,28 +389,427 @@ class GateProcessor:
             payload["_awaiting_telemetry"] = True
         return payload
 
+    def _recognise_in_order(self, paths, digests, trace, started: float,
+                            deadline: float, authorised, ocr: _OcrRound,
+                            stream: CandidateStream | None = None) -> None:
+        paths, digests = list(paths), list(digests)
+        for sequence in count(ocr.next_sequence):
+            if sequence >= MAX_OCR_FRAMES:
+                break
+            if sequence >= len(paths) and not self._take_streamed(
+                stream, paths, digests, deadline, ocr,
+            ):
+                break
+            ocr.next_sequence = sequence + 1
+            path = paths[sequence]
+            remaining = self._decision_timeout - (self._decision_clock() - started)
+            if remaining <= 0:
+                ocr.timed_out = True
+                break
+            self._add_frame_quality(trace, path, digests[sequence], sequence, ocr)
+            remaining = self._decision_timeout - (self._decision_clock() - started)
+            if remaining <= 0:
+                ocr.timed_out = True
+                break
+            observation = self._cached_observation(digests[sequence], trace, deadline)
+            if observation is not None:
+                trace.add_cached_ocr_attempt(
+                    _recognised_attempt(sequence, observation, status="cached")
+                )
+            else:
+                ocr_started = False
+
+                def mark_ocr_start():
+                    nonlocal ocr_started
+                    trace.mark_ocr_start()
+                    ocr_started = True
+
+                try:
+                    observation = self._recognise(path, deadline, mark_ocr_start)
+                except _OcrBusy:
+                    trace.add_ocr_rejection(OcrAttemptTelemetry(
+                        frame_sequence=sequence,
+                        status="ocr_busy",
+                    ))
+                    ocr.failure_reason = "ocr_busy"
+                    break
+                except _OcrDeadlineExceeded:
+                    if ocr_started:
+                        trace.add_ocr_attempt(OcrAttemptTelemetry(
+                            frame_sequence=sequence,
+                            status="ocr_timeout",
+                        ))
+                    ocr.timed_out = True
+                    break
+                except Exception:
+                    if ocr_started:
+                        trace.add_ocr_attempt(OcrAttemptTelemetry(
+                            frame_sequence=sequence,
+                            status="ocr_error",
+                        ))
+                    ocr.failure_reason = "ocr_error"
+                    continue
+                trace.add_ocr_attempt(_recognised_attempt(sequence, observation))
+                self._remember_observation(digests[sequence], observation, trace)
+            ocr.add_observation(sequence, observation, authorised)
+            if self._decision_clock() - started >= self._decision_timeout:
+                ocr.timed_out = True
+                break
+            if ocr.decision.allowed:
+                break
+
+    def _take_streamed(self, stream, paths: list, digests: list, deadline: float,
+                       ocr: _OcrRound) -> bool:
+        """Append the sharpest new streamed upload, waiting until the deadline."""
+        if stream is None:
+            return False
+        while True:
+            path = stream.take(deadline - self._decision_clock())
+            if path is None:
+                return False
+            digest = _content_digest(path)
+            if digest in digests:
+                continue
+            if self._near_duplicate(path, digest, zip(paths, digests), ocr):
+                ocr.skipped_frames.append(self._skipped_frame(
+                    path, digest, "skipped_near_duplicate", ocr,
+                ))
+                continue
+            if paths and self._ocr_quality_gate is not None:
+                quality = self._gate_quality((path, digest), ocr)
+                reason = self._ocr_quality_gate.skip_reason(quality)
+                if reason is not None:
+                    ocr.skipped_frames.append(replace(quality, status=reason))
+                    continue
+            paths.append(path)
+            digests.append(digest)
+            return True
+
+    def _recognise_speculatively(self, paths, digests, trace, started: float,
+                                 deadline: float, authorised, ocr: _OcrRound) -> None:
+        """Race the top frames through OCR and abandon the rest at the first allow."""
+        results = Queue()
+        pending = {}
+        reached = 0
+        for sequence, path in enumerate(paths[:self._speculative_ocr_frames]):
+            if self._decision_clock() - started >= self._decision_timeout:
+                ocr.timed_out = True
+                break
+            observation = self._cached_observation(digests[sequence], trace, deadline)
+            if observation is not None:
+                reached = sequence + 1
+                trace.add_cached_ocr_attempt(
+                    _recognised_attempt(sequence, observation, status="cached")
+                )
+                ocr.add_observation(sequence, observation, authorised)
+                if ocr.decision.allowed:
+                    break
+                continue
+            ocr_started_at = self._telemetry_clock()
+            try:
+                worker = self._start_ocr_worker(
+                    self._ocr_operation(path, deadline),
+                    lambda outcome, sequence=sequence: results.put((sequence, *outcome)),
+                    wait=0.0 if pending else self._ocr_slot_wait(deadline),
+                )
+            except _OcrBusy:
+                if pending:
+                    # Slots still held by abandoned requests; later frames run in order.
+                    break
+                trace.add_ocr_rejection(OcrAttemptTelemetry(
+                    frame_sequence=sequence,
+                    status="ocr_busy",
+                ))
+                ocr.failure_reason = "ocr_busy"
+                break
+            except _OcrDeadlineExceeded:
+                ocr.timed_out = True
+                break
+            pending[sequence] = (worker, ocr_started_at)
+            reached = sequence + 1
+        ocr.next_sequence = reached
+        ocr.finished = (
+            ocr.timed_out or ocr.failure_reason == "ocr_busy"
+            or (ocr.decision is not None and ocr.decision.allowed)
+        )
+        for sequence in range(reached):
+            self._add_frame_quality(
+                trace, paths[sequence], digests[sequence], sequence, ocr,
+            )
+        while pending and not ocr.finished:
+            remaining = deadline - self._decision_clock()
+            try:
+                if remaining <= 0:
+                    raise Empty
+                sequence, succeeded, value = results.get(timeout=remaining)
+            except Empty:
+                for sequence, (_worker, ocr_started_at) in sorted(pending.items()):
+                    trace.add_ocr_attempt(OcrAttemptTelemetry(
+                        frame_sequence=sequence,
+                        status="ocr_timeout",
+                    ), started_at=ocr_started_at)
+                ocr.timed_out = ocr.finished = True
+                break
+            _worker, ocr_started_at = pending.pop(sequence)
+            if not succeeded:
+                trace.add_ocr_attempt(OcrAttemptTelemetry(
+                    frame_sequence=sequence,
+                    status="ocr_error",
+                ), started_at=ocr_started_at)
+                ocr.failure_reason = "ocr_error"
+                continue
+            trace.add_ocr_attempt(
+                _recognised_attempt(sequence, value), started_at=ocr_started_at,
+            )
+            self._remember_observation(digests[sequence], value, trace)
+            ocr.add_observation(sequence, value, authorised)
+            if self._decision_clock() - started >= self._decision_timeout:
+                ocr.timed_out = ocr.finished = True
+                break
+            if ocr.decision.allowed:
+                ocr.finished = True
+                break
+        if pending:
+            self._abandon_ocr_workers(worker for worker, _started in pending.values())
+
+    def _predicted_first(self, candidates) -> tuple[tuple[Path, ...], tuple[str, ...]]:
+        """Order frames already recognised at webhook time ahead of the rest.
+
+        Frames whose prediction is still in flight keep their place, so OCR
+        starts on the FTP frame without waiting for them. Evidence and
+        idempotency still follow the burst's own order.
+        """
+        if self._predicted_observation is not None:
+            candidates = sorted(
+                candidates, key=lambda candidate: self._predicted(candidate[1]) is None,
+            )
+        return (
+            tuple(path for path, _digest in candidates),
+            tuple(digest for _path, digest in candidates),
+        )
+
+    def _near_duplicates_removed(self, paths, digests,
+                                 ocr: _OcrRound) -> tuple[tuple[Path, ...], tuple[str, ...]]:
+        """Keep the best frame of each perceptual near-duplicate cluster for OCR.
+
+        A later frame takes its cluster's place in the OCR order when it
+        passes the quality gate and the kept frame does not, or is sharper.
+        Ties keep the earlier frame, and a frame that already has a
+        predicted or cached observation is never displaced. As with the
+        quality gate, frames OCR would not reach are left unexamined.
+        """
+        kept = []
+        for index, (path, digest) in enumerate(zip(paths, digests)):
+            if len(kept) >= MAX_OCR_FRAMES:
+                kept.extend(zip(paths[index:], digests[index:]))
+                break
+            twin = self._near_duplicate_index(path, digest, kept, ocr)
+            if twin is None:
+                kept.append((path, digest))
+                continue
+            skipped = (path, digest)
+            if (
+                not self._costs_no_ocr(kept[twin][1])
+                and self._cluster_rank(path, digest, ocr)
+                > self._cluster_rank(*kept[twin], ocr)
+            ):
+                skipped, kept[twin] = kept[twin], skipped
+            ocr.skipped_frames.append(self._skipped_frame(
+                *skipped, "skipped_near_duplicate", ocr,
+            ))
+        return (
+            tuple(path for path, _digest in kept),
+            tuple(digest for _path, digest in kept),
+        )
+
+    def _near_duplicate(self, path: Path, digest: str, earlier, ocr: _OcrRound) -> bool:
+        return self._near_duplicate_index(path, digest, earlier, ocr) is not None
+
+    def _near_duplicate_index(self, path: Path, digest: str, earlier,
+                              ocr: _OcrRound) -> int | None:
+        """Return the position of the first earlier frame this one nearly repeats."""
+        earlier = tuple(earlier)
+        if not earlier or self._costs_no_ocr(digest):
+            return None
+        signature = self._signature(path, digest, ocr)
+        if signature is None:
+            return None
+        for position, (earlier_path, earlier_digest) in enumerate(earlier):
+            earlier_signature = self._signature(earlier_path, earlier_digest, ocr)
+            if earlier_signature is not None and signature.matches(earlier_signature):
+                return position
+        return None
+
+    def _cluster_rank(self, path: Path, digest: str, ocr: _OcrRound) -> tuple[bool, float]:
+        quality = self._measured_quality(path, digest, ocr)
+        gate = self._ocr_quality_gate
+        return (
+            quality.status == "ok" and (gate is None or gate.skip_reason(quality) is None),
+            quality.sharpness,
+        )
+
+    @staticmethod
+    def _signature(path: Path, digest: str, ocr: _OcrRound):
+        """Compute a frame's perceptual signature once per burst."""
+        if digest not in ocr.signatures:
+            ocr.signatures[digest] = perceptual_signature(path)
+        return ocr.signatures[digest]
+
+    def _skipped_frame(self, path: Path, digest: str, status: str, ocr: _OcrRound):
+        return replace(self._measured_quality(path, digest, ocr), status=status)
+
+    @staticmethod
+    def _measured_quality(path: Path, digest: str, ocr: _OcrRound):
+        """Measure a frame once per burst; the gate, skips, and trace share it."""
+        quality = ocr.qualities.get(digest)
+        if quality is None:
+            quality = ocr.qualities[digest] = measure_frame_quality(path, digest=digest)
+        return quality
+
+    def _quality_gated(self, paths, digests,
+                       ocr: _OcrRound) -> tuple[tuple[Path, ...], tuple[str, ...]]:
+        """Leave frames the OCR quality gate rejects out of the OCR order."""
+        if self._ocr_quality_gate is None:
+            return paths, digests
+        kept, skipped = self._ocr_quality_gate.partition(
+            zip(paths, digests), lambda frame: self._gate_quality(frame, ocr),
+            limit=MAX_OCR_FRAMES,
+        )
+        ocr.skipped_frames.extend(quality for _frame, quality in skipped)
+        return (
+            tuple(path for path, _digest in kept),
+            tuple(digest for _path, digest in kept),
+        )
+
+    def _gate_quality(self, frame, ocr: _OcrRound):
+        """Measure a frame for the quality gate; ``None`` keeps it unconditionally.
+
+        Frames with a predicted or cached observation cost no OCR request.
+        """
+        path, digest = frame
+        if self._costs_no_ocr(digest):
+            return None
+        try:
+            return self._measured_quality(path, digest, ocr)
+        except Exception:
+            return None
+
+    def _costs_no_ocr(self, digest: str) -> bool:
+        """Return whether a predicted or cached observation already covers a frame."""
+        if self._predicted_observation is not None and self._predicted(digest) is not None:
+            return True
+        try:
+            return self._ocr_cache is not None and self._ocr_cache.contains(digest)
+        except Exception:
+            return False
+
+    def _predicted(self, digest: str, *, wait: float = 0.0):
+        try:
+            if wait > 0:
+                return self._predicted_observation(digest, wait=wait)
+            return self._predicted_observation(digest)
+        except Exception:
+            return None
+
+    def _cached_observation(self, digest: str, trace, deadline: float):
+        """Return a predicted or cached observation instead of a new OCR request.
+
+        A frame whose prediction is still in flight is waited for briefly,
+        then recognised normally if the prediction has not landed.
+        """
+        if self._predicted_observation is not None:
+            wait = 0.0
+            if self._predicted_waits:
+                wait = min(
+                    PREDICTION_WAIT_SECONDS, deadline - self._decision_clock(),
+                )
+            observation = self._predicted(digest, wait=wait)
+            if observation is not None:
+                return observation
+        if self._ocr_cache is None:
+            return None
+        try:
+            observation = self._ocr_cache.get(digest)
+        except Exception:
+            return None
+        if observation is None:
+            trace.count_ocr_cache(misses=1)
+        else:
+            trace.count_ocr_cache(hits=1)
+        return observation
+
+    def _remember_observation(self, digest: str, observation, trace) -> None:
+        if self._ocr_cache is None:
+            return
+        try:
+            evicted = self._ocr_cache.put(digest, observation)
+        except Exception:
+            return
+        if evicted:
+            trace.count_ocr_cache(evictions=evicted)
+
+    def _add_frame_quality(self, trace, path: Path, digest: str, sequence: int,
+                           ocr: _OcrRound) -> None:
+        try:
+            frame_quality = replace(
+                self._measured_quality(path, digest, ocr), sequence=sequence,
+            )
+        except Exception:
+            trace.disable()
+        else:
+            trace.add_frame(frame_quality)
+
     def _recognise(self, path: Path, deadline: float, on_start=None):
+        operation = self._ocr_operation(path, deadline)
+        return self._run_ocr_bounded(operation, deadline, on_start)
+
+    def _ocr_operation(self, path: Path, deadline: float):
         remaining = deadline - self._decision_clock()
         if remaining <= 0:
             raise _OcrDeadlineExceeded("OCR request exceeded the decision deadline")
-        operation = lambda: self._recognise_call(path)
         if not self._recognizer_accepts_timeout:
-            return self._run_ocr_bounded(operation, deadline, on_start)
+            return lambda: self._recognise_call(path)
         connect = min(1.0, max(0.1, remaining / 3))
         read = min(2.0, max(0.1, remaining - connect))
-        operation = lambda: self._recognise_call(path, timeout=(connect, read))
-        return self._run_ocr_bounded(operation, deadline, on_start)
+        return lambda: self._recognise_call(path, timeout=(connect, read))
 
     def _run_ocr_bounded(self, operation, deadline: float, on_start=None):
+        result = Queue(maxsize=1)
+        worker = self._start_ocr_worker(
+            operation, result.put, on_start, wait=self._ocr_slot_wait(deadline),
+        )
+        remaining = deadline - self._decision_clock()
+        if remaining <= 0:
+            self._abandon_ocr_workers((worker,))
+            raise _OcrDeadlineExceeded("OCR request exceeded the decision deadline")
+        try:
+            succeeded, value = result.get(timeout=max(remaining, 0.0))
+        except Empty as error:
+            self._abandon_ocr_workers((worker,))
+            raise _OcrDeadlineExceeded(
+                "OCR request exceeded the decision deadline"
+            ) from error
+        worker.join(0.5)
+        if succeeded:
+            return value
+        raise value
+
+    def _ocr_slot_wait(self, deadline: float) -> float:
+        if not self._ocr_slot_shared:
+            return 0.0
+        return max(0.0, deadline - self._decision_clock())
+
+    def _start_ocr_worker(self, operation, deliver, on_start=None, *,
+                          wait: float = 0.0) -> Thread:
         with self._ocr_slot_lock:
             if self._closed:
                 raise _OcrBusy("OCR processor is closed")
             slot = self._ocr_slot
-            if not slot.acquire(blocking=False):
-                raise _OcrBusy("previous OCR request is still running")
+        acquired = slot.acquire(timeout=wait) if wait > 0 else slot.acquire(blocking=False)
+        if not acquired:
+            raise _OcrBusy("previous OCR request is still running")
         if on_start is not None:
             on_start()
-        result = Queue(maxsize=1)
 
         def invoke():
             try:
@@ -420,41 +818,26 @@ class GateProcessor:
                 outcome = (False, error)
             finally:
                 slot.release()
-            result.put(outcome)
+                with self._ocr_slot_lock:
+                    self._ocr_workers.discard(worker)
+            deliver(outcome)
 
         worker = Thread(target=invoke, name="gate-ocr-request", daemon=True)
         with self._ocr_slot_lock:
             if self._closed:
                 slot.release()
                 raise _OcrBusy("OCR processor is closed")
-            self._ocr_worker = worker
+            self._ocr_workers.add(worker)
             try:
                 worker.start()
             except BaseException:
-                if self._ocr_worker is worker:
-                    self._ocr_worker = None
+                self._ocr_workers.discard(worker)
                 slot.release()
                 raise
-        remaining = deadline - self._decision_clock()
-        if remaining <= 0:
-            self._cancel_and_reap_ocr_worker(worker)
-            raise _OcrDeadlineExceeded("OCR request exceeded the decision deadline")
-        try:
-            succeeded, value = result.get(timeout=max(remaining, 0.0))
-        except Empty as error:
-            self._cancel_and_reap_ocr_worker(worker)
-            raise _OcrDeadlineExceeded(
-                "OCR request exceeded the decision deadline"
-            ) from error
-        worker.join(0.5)
-        with self._ocr_slot_lock:
-            if self._ocr_worker is worker and not worker.is_alive():
-                self._ocr_worker = None
-        if succeeded:
-            return value
-        raise value
+        return worker
 
-    def _cancel_and_reap_ocr_worker(self, worker) -> None:
+    def _abandon_ocr_workers(self, workers) -> None:
+        workers = tuple(workers)
         abandon = getattr(self._recognizer, "abandon_in_flight", None)
         if not callable(abandon):
             return
@@ -472,17 +855,14 @@ class GateProcessor:
         cleanup.start()
         cleanup.join(0.05)
         if not cleanup.is_alive() and outcome and outcome[0]:
-            worker.join(0.5)
-        with self._ocr_slot_lock:
-            if self._ocr_worker is worker and not worker.is_alive():
-                self._ocr_worker = None
+            _join_workers(workers, 0.5)
 
     def close(self) -> None:
         with self._ocr_slot_lock:
             if self._closed:
                 return
             self._closed = True
-            worker = self._ocr_worker
+            workers = tuple(self._ocr_workers)
         with self._actuation_lock:
             pass
         close = getattr(self._recognizer, "close", None)
@@ -498,11 +878,28 @@ class GateProcessor:
             )
             cleanup.start()
             cleanup.join(0.5)
-        if worker is not None:
-            worker.join(0.5)
-            with self._ocr_slot_lock:
-                if self._ocr_worker is worker and not worker.is_alive():
-                    self._ocr_worker = None
+        _join_workers(workers, 0.5)
+
+
+class _OcrRound:
+    """Observations and stop state shared by the OCR strategies of one burst."""
+
+    def __init__(self) -> None:
+        self.observations: dict[int, object] = {}
+        self.decision = None
+        self.failure_reason: str | None = None
+        self.timed_out = False
+        self.finished = False
+        self.next_sequence = 0
+        self.skipped_frames = []
+        self.qualities: dict[str, FrameTelemetry] = {}
+        self.signatures: dict[str, PerceptualSignature | None] = {}
+
+    def add_observation(self, sequence: int, observation, authorised) -> None:
+        self.observations[sequence] = observation
+        self.decision = decide_access(
+            (self.observations[key] for key in sorted(self.observations)), authorised,
+        )
 
 
 class _BestEffortTrace:
@@ -538,12 +935,13 @@ class _BestEffortTrace:
     def mark_burst(self) -> None:
         self._call("mark_burst")
 
+    def _call_optional(self, operation: str, *args, **kwargs):
+        if self._trace is None or not callable(getattr(self._trace, operation, None)):
+            return None
+        return self._call(operation, *args, **kwargs)
+
     def set_trigger(self, trigger) -> None:
-        if self._trace is None:
-            return
-        operation = getattr(self._trace, "set_trigger", None)
-        if callable(operation):
-            self._call("set_trigger", trigger)
+        self._call_optional("set_trigger", trigger)
 
     def seed_upstream(
         self, received_at: datetime | None, decision_started_at: float | None,
@@ -559,12 +957,26 @@ class _BestEffortTrace:
     def mark_ocr_start(self) -> None:
         self._call("mark_ocr_start")
 
-    def add_ocr_attempt(self, attempt) -> None:
-        self._call("add_ocr_attempt", attempt)
+    def add_ocr_attempt(self, attempt, *, started_at: float | None = None) -> None:
+        if started_at is None:
+            self._call("add_ocr_attempt", attempt)
+        elif self._trace is not None and _accepts_keyword(
+            self._trace.add_ocr_attempt, "started_at"
+        ):
+            self._call("add_ocr_attempt", attempt, started_at=started_at)
+        else:
+            self._call("mark_ocr_start")
+            self._call("add_ocr_attempt", attempt)
 
     def add_ocr_rejection(self, attempt) -> None:
         self._call("add_ocr_rejection", attempt)
 
+    def add_cached_ocr_attempt(self, attempt) -> None:
+        self._call_optional("add_cached_ocr_attempt", attempt)
+
+    def count_ocr_cache(self, **counts) -> None:
+        self._call_optional("count_ocr_cache", **counts)
+
     def mark_decision(self, outcome: str, reason: str) -> None:
         self._call("mark_decision", outcome, reason)
 
@@ -605,14 +1017,10 @@ def _event_key_from_digests(digests: tuple[str, ...]) -> str:
 
 
 def _content_digest(path: Path) -> str:
-    digest = hashlib.sha256()
     try:
-        with path.open("rb") as source:
-            for chunk in iter(lambda: source.read(1024 * 1024), b""):
-                digest.update(chunk)
+        return content_digest(path)
     except OSError:
-        digest.update(f"missing:{path.resolve()}".encode("utf-8"))
-    return digest.hexdigest()
+        return hashlib.sha256(f"missing:{path.resolve()}".encode("utf-8")).hexdigest()
 
 
 def _trigger_telemetry(value) -> TriggerTelemetry | None:
@@ -646,6 +1054,26 @@ def _unique_content_candidates(paths: tuple[Path, ...]) -> tuple[tuple[Path, str
     return tuple(unique)
 
 
+def _recognised_attempt(
+    sequence: int, observation, *, status: str | None = None,
+) -> OcrAttemptTelemetry:
+    return OcrAttemptTelemetry(
+        frame_sequence=sequence,
+        status=status or ("recognized" if observation.plate else "no_plate"),
+        plate=observation.plate,
+        confidence=observation.confidence,
+        make=observation.make,
+        colour=observation.colour,
+        upload_saved_ratio=None if status == "cached" else observation.upload_saved_ratio,
+    )
+
+
+def _join_workers(workers, timeout: float) -> None:
+    deadline = monotonic() + timeout
+    for worker in workers:
+        worker.join(max(0.0, deadline - monotonic()))
+
+
 def _denied_event(key, received_at, decision_at, reason, decision=None):
     return GateEvent(
         source="ocr", reason=reason, opened=False, idempotency_key=key,
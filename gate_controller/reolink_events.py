@@ -118,6 +118,7 @@ class ReolinkEventCorrelator:
         correlation_window_seconds: float = 5.0,
         max_events: int = MAX_REOLINK_EVENTS,
         clock: Callable[[], datetime] | None = None,
+        on_accepted: Callable[[SanitizedCameraEvent], None] | None = None,
     ) -> None:
         if not 0 < ttl_seconds <= MAX_REOLINK_EVENT_TTL_SECONDS:
             raise ValueError("event TTL exceeds the safe range")
@@ -135,6 +136,7 @@ class ReolinkEventCorrelator:
         self._events: deque[SanitizedCameraEvent] = deque()
         self._seen: OrderedDict[str, datetime] = OrderedDict()
         self._lock = Lock()
+        self._on_accepted = on_accepted
 
     @property
     def pending_count(self) -> int:
@@ -169,6 +171,11 @@ class ReolinkEventCorrelator:
             self._events.append(event)
             while len(self._events) > self._max_events:
                 self._events.popleft()
+        if self._on_accepted is not None:
+            try:
+                self._on_accepted(event)
+            except Exception:
+                LOGGER.warning("reolink_event_listener_failed", exc_info=True)
         return "accepted"
 
     def correlate(
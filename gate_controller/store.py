@@ -5,8 +5,9 @@ import time
 from contextlib import closing
 from datetime import datetime, timezone
 from pathlib import Path
+from threading import Lock, current_thread, local
 
-from .models import ActuationClaim, GateEvent, TerminalOutcome
+from .models import ActuationClaim, GateEvent, PlateObservation, TerminalOutcome
 from .telemetry import EventTelemetry, MAX_DELIVERY_ATTEMPT, MAX_DURATION_MS
 
 
@@ -16,7 +17,9 @@ _TELEMETRY_FRAME_KEYS = (
 )
 _TELEMETRY_OCR_KEYS = (
     "frame_sequence", "duration_ms", "status", "plate", "confidence", "make", "colour",
+    "upload_saved_ratio",
 )
+_TELEMETRY_OCR_CACHE_KEYS = ("hits", "misses", "evictions")
 _MAX_TELEMETRY_PAGE_SIZE = 100
 _SNAPSHOT_PAGES_PER_STEP = 16
 _SNAPSHOT_BUSY_TIMEOUT_SECONDS = 0.25
@@ -25,6 +28,8 @@ _OUTBOX_READY = "ready"
 _OUTBOX_AWAITING_TELEMETRY = "awaiting_telemetry"
 _OUTBOX_TELEMETRY_READY = "telemetry_ready"
 _OUTBOX_LOCAL_ONLY = "local_only"
+_BUSY_TIMEOUT_SECONDS = 5
+_STATEMENT_CACHE_SIZE = 256
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -32,14 +37,50 @@ class _MalformedTelemetry(ValueError):
     pass
 
 
+class _PooledConnection(sqlite3.Connection):
+    synchronous = "FULL"
+
+
 class LocalStore:
     def __init__(self, path: Path):
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = local()
+        self._pool_lock = Lock()
+        self._pool: dict = {}
+        self._pool_generation = 0
         self._migrate()
 
+    def close(self) -> None:
+        """Close this thread's pooled connection; later calls transparently reopen one.
+
+        Other threads may be mid-transaction, so their connections are only
+        retired when they next connect and see the bumped generation.
+        """
+        with self._pool_lock:
+            connection = self._pool.pop(current_thread(), None)
+            self._pool_generation += 1
+        self._local.connection = None
+        if connection is not None:
+            _close_quietly(connection)
+
+    def close_all(self) -> None:
+        """Close every thread's pooled connection at shutdown.
+
+        Call this only once the threads using the store have stopped; their
+        connections are closed from the calling thread, and any later call
+        transparently reopens one.
+        """
+        with self._pool_lock:
+            connections = tuple(self._pool.values())
+            self._pool.clear()
+            self._pool_generation += 1
+        self._local.connection = None
+        for connection in connections:
+            _close_quietly(connection)
+
     def was_opened_since(self, cutoff: datetime) -> bool:
-        with closing(self._connect()) as connection:
+        with self._connect() as connection:
             return self._was_opened_since(connection, cutoff)
 
     def claim_actuation(self, idempotency_key: str, claimed_at: datetime,
@@ -85,8 +126,6 @@ class LocalStore:
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
 
     def mark_actuation_attempt(self, claim: ActuationClaim, attempted_at: datetime, *,
                                event: GateEvent, outbox_payload: dict | None = None,
@@ -100,7 +139,7 @@ class LocalStore:
         pending_command_created_at = (
             _timestamp(command_ack[1]) if command_ack is not None else None
         )
-        with closing(self._connect()) as connection, connection:
+        with self._connect() as connection:
             cursor = connection.execute(
                 """
                 UPDATE actuation_claims
@@ -163,8 +202,6 @@ class LocalStore:
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
 
     def record_terminal_outcome(self, event: GateEvent, *, status: str, detail: str | None,
                                 outbox_payload: dict | None = None,
@@ -202,8 +239,6 @@ class LocalStore:
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
 
     def record_event_with_outbox(self, event: GateEvent,
                                  outbox_payload: dict | None = None) -> int:
@@ -227,8 +262,6 @@ class LocalStore:
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
 
     def record_event(self, event: GateEvent) -> int:
         return self.record_event_with_outbox(event)
@@ -243,11 +276,9 @@ class LocalStore:
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
 
     def terminal_outcome(self, idempotency_key: str) -> TerminalOutcome | None:
-        with closing(self._connect()) as connection:
+        with self._connect() as connection:
             row = connection.execute(
                 """
                 SELECT terminal_status, terminal_detail, event_id, state
@@ -266,7 +297,7 @@ class LocalStore:
         return self._event_id(idempotency_key)
 
     def actuation_claim_status(self, idempotency_key: str) -> str | None:
-        with closing(self._connect()) as connection:
+        with self._connect() as connection:
             row = connection.execute(
                 "SELECT state FROM actuation_claims WHERE idempotency_key = ?", (idempotency_key,)
             ).fetchone()
@@ -275,14 +306,14 @@ class LocalStore:
         return "indeterminate_claim" if row[0] == "claimed" else "duplicate_event"
 
     def ensure_outbox(self, event_id: int, payload: dict) -> int | None:
-        with closing(self._connect()) as connection, connection:
+        with self._connect() as connection:
             return self._ensure_outbox(connection, event_id, payload)
 
     def queue_outbox(self, event_id: int, payload: dict) -> int:
         return self.ensure_outbox(event_id, payload) or self._outbox_id(event_id)
 
     def pending_outbox_count(self) -> int:
-        with closing(self._connect()) as connection:
+        with self._connect() as connection:
             return connection.execute(
                 """
                 SELECT COUNT(*) FROM outbox
@@ -294,7 +325,7 @@ class LocalStore:
     def pending_outbox_items(
         self, limit: int = 20, *, after_id: int | None = None,
     ) -> list[tuple[int, dict]]:
-        with closing(self._connect()) as connection:
+        with self._connect() as connection:
             if after_id is None:
                 rows = connection.execute(
                     """
@@ -320,7 +351,7 @@ class LocalStore:
 
     def release_outbox_without_telemetry(self, event_id: int) -> None:
         """Make a processor outbox sendable when no trace could be attached."""
-        with closing(self._connect()) as connection, connection:
+        with self._connect(durable=False) as connection:
             connection.execute(
                 """
                 UPDATE outbox SET send_state = ?
@@ -333,7 +364,7 @@ class LocalStore:
         """Attach one trace after the terminal event transaction has committed."""
         payload = _telemetry_payload(telemetry)
         created_at = _timestamp(datetime.now(timezone.utc))
-        connection = self._connect()
+        connection = self._connect(durable=False)
         try:
             connection.execute("BEGIN IMMEDIATE")
             if connection.execute(
@@ -384,11 +415,9 @@ class LocalStore:
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
 
     def event_telemetry(self, event_id: int) -> dict | None:
-        with closing(self._connect()) as connection:
+        with self._connect() as connection:
             row = connection.execute(
                 "SELECT payload FROM event_telemetry WHERE event_id = ?", (event_id,)
             ).fetchone()
@@ -427,7 +456,7 @@ class LocalStore:
             parameters = (
                 _timestamp(since), received_at, received_at, int(event_id), bounded_limit,
             )
-        with closing(self._connect()) as connection:
+        with self._connect() as connection:
             rows = connection.execute(
                 f"""
                 SELECT e.id, e.received_at, e.decision_at, e.relay_activated_at,
@@ -475,85 +504,107 @@ class LocalStore:
 
     def prepare_outbox_attempt(self, item_id: int,
                                attempted_at: datetime | None = None) -> dict | None:
+        return self.prepare_outbox_batch([item_id], attempted_at).get(item_id)
+
+    def prepare_outbox_batch(self, item_ids, attempted_at: datetime | None = None
+                             ) -> dict[int, dict]:
+        """Record one send attempt for each sendable item in one transaction.
+
+        Returns the payload to transmit per item, in ``item_ids`` order. Items
+        that were completed or are not yet sendable are omitted. Telemetry that
+        cannot be rewritten falls back to the item's v2 payload.
+        """
         attempted_at = attempted_at or datetime.now(timezone.utc)
-        connection = self._connect()
-        fallback = None
+        connection = self._connect(durable=False)
+        prepared = {}
+        fallbacks = {}
         try:
             connection.execute("BEGIN IMMEDIATE")
-            row = connection.execute(
-                """
-                SELECT event_id, payload, created_at FROM outbox
-                WHERE id = ? AND completed_at IS NULL
-                  AND send_state IN (?, ?)
-                """,
-                (item_id, _OUTBOX_READY, _OUTBOX_TELEMETRY_READY),
-            ).fetchone()
-            if row is None:
-                connection.commit()
-                return None
-            event_id, payload_text, created_at = row
-            payload = json.loads(payload_text)
-            fallback = _v2_outbox_payload(payload)
-            telemetry_row = connection.execute(
-                "SELECT payload FROM event_telemetry WHERE event_id = ?", (event_id,)
-            ).fetchone()
-            if telemetry_row is None:
-                connection.commit()
-                return fallback
-            try:
-                telemetry = _decode_telemetry_payload(telemetry_row[0])
-                attempt = min(
-                    _telemetry_attempt(telemetry) + 1, MAX_DELIVERY_ATTEMPT
-                )
-                telemetry["delivery"] = {"outbox_attempt": attempt, "state": "sending"}
-                queued_at = _parse_timestamp(created_at)
-                stage_timestamps = dict(telemetry.get("stage_timestamps", {}))
-                stage_timestamps.setdefault("cloud_enqueued_at", _timestamp(queued_at))
-                stage_timestamps["cloud_send_started_at"] = _timestamp(attempted_at)
-                stage_timestamps.pop("cloud_acknowledged_at", None)
-                telemetry["stage_timestamps"] = stage_timestamps
-                lag_ms = max(
-                    0,
-                    int((_as_utc(attempted_at) - queued_at).total_seconds() * 1000),
-                )
-                telemetry["stage_durations"]["delivery_lag_ms"] = min(
-                    lag_ms, MAX_DURATION_MS
-                )
-                self._write_telemetry_payload(connection, event_id, telemetry)
-                payload = dict(fallback)
-                payload["schema_version"] = 3
-                payload["telemetry"] = telemetry
-                connection.execute(
-                    "UPDATE outbox SET payload = ? WHERE id = ? AND completed_at IS NULL",
-                    (_encode_json(payload), item_id),
+            for item_id in item_ids:
+                row = connection.execute(
+                    """
+                    SELECT event_id, payload, created_at FROM outbox
+                    WHERE id = ? AND completed_at IS NULL
+                      AND send_state IN (?, ?)
+                    """,
+                    (item_id, _OUTBOX_READY, _OUTBOX_TELEMETRY_READY),
+                ).fetchone()
+                if row is None:
+                    continue
+                event_id, payload_text, created_at = row
+                fallback = _v2_outbox_payload(json.loads(payload_text))
+                fallbacks[item_id] = fallback
+                prepared[item_id] = self._prepare_outbox_telemetry(
+                    connection, item_id, event_id, created_at, fallback,
+                    attempted_at,
                 )
-            except _MalformedTelemetry:
-                connection.rollback()
-                _log_telemetry_fallback("malformed")
-                return fallback
-            except Exception:
-                connection.rollback()
-                _log_telemetry_fallback("rewrite_failed")
-                return fallback
             connection.commit()
-            return payload
+            return prepared
         except Exception:
             try:
                 connection.rollback()
             except Exception:
                 pass
-            if fallback is not None:
+            if fallbacks:
                 _log_telemetry_fallback("rewrite_failed")
-                return fallback
+                return fallbacks
             raise
+
+    def _prepare_outbox_telemetry(self, connection: sqlite3.Connection,
+                                  item_id: int, event_id: int, created_at: str,
+                                  fallback: dict, attempted_at: datetime) -> dict:
+        telemetry_row = connection.execute(
+            "SELECT payload FROM event_telemetry WHERE event_id = ?", (event_id,)
+        ).fetchone()
+        if telemetry_row is None:
+            return fallback
+        connection.execute("SAVEPOINT telemetry_send_attempt")
+        try:
+            telemetry = _decode_telemetry_payload(telemetry_row[0])
+            attempt = min(_telemetry_attempt(telemetry) + 1, MAX_DELIVERY_ATTEMPT)
+            telemetry["delivery"] = {"outbox_attempt": attempt, "state": "sending"}
+            queued_at = _parse_timestamp(created_at)
+            stage_timestamps = dict(telemetry.get("stage_timestamps", {}))
+            stage_timestamps.setdefault("cloud_enqueued_at", _timestamp(queued_at))
+            stage_timestamps["cloud_send_started_at"] = _timestamp(attempted_at)
+            stage_timestamps.pop("cloud_acknowledged_at", None)
+            telemetry["stage_timestamps"] = stage_timestamps
+            lag_ms = max(
+                0, int((_as_utc(attempted_at) - queued_at).total_seconds() * 1000),
+            )
+            telemetry["stage_durations"]["delivery_lag_ms"] = min(
+                lag_ms, MAX_DURATION_MS
+            )
+            self._write_telemetry_payload(connection, event_id, telemetry)
+            payload = dict(fallback)
+            payload["schema_version"] = 3
+            payload["telemetry"] = telemetry
+            connection.execute(
+                "UPDATE outbox SET payload = ? WHERE id = ? AND completed_at IS NULL",
+                (_encode_json(payload), item_id),
+            )
+        except _MalformedTelemetry:
+            connection.execute("ROLLBACK TO telemetry_send_attempt")
+            _log_telemetry_fallback("malformed")
+            return fallback
+        except Exception:
+            connection.execute("ROLLBACK TO telemetry_send_attempt")
+            _log_telemetry_fallback("rewrite_failed")
+            return fallback
         finally:
-            connection.close()
+            connection.execute("RELEASE telemetry_send_attempt")
+        return payload
 
     def mark_outbox_retry(self, item_id: int) -> None:
-        self._set_outbox_delivery_state(item_id, "retry_pending")
+        self._set_outbox_delivery_states([(item_id, None)], "retry_pending")
+
+    def mark_outbox_batch_retry(self, item_ids) -> None:
+        self._set_outbox_delivery_states(
+            [(item_id, None) for item_id in item_ids], "retry_pending"
+        )
 
     def purge_delivered_telemetry(self, cutoff: datetime) -> int:
-        connection = self._connect()
+        connection = self._connect(durable=False)
         try:
             connection.execute("BEGIN IMMEDIATE")
             rows = connection.execute(
@@ -583,11 +634,9 @@ class LocalStore:
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
 
     def purge_unqueued_telemetry(self, cutoff: datetime) -> int:
-        connection = self._connect()
+        connection = self._connect(durable=False)
         try:
             connection.execute("BEGIN IMMEDIATE")
             removed = connection.execute(
@@ -606,11 +655,55 @@ class LocalStore:
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
+
+    def cached_ocr_observation(
+        self, digest: str, not_before: datetime
+    ) -> PlateObservation | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                """
+                SELECT plate, confidence, make, colour FROM ocr_results
+                WHERE digest = ? AND recognised_at >= ?
+                """,
+                (digest, _timestamp(not_before)),
+            ).fetchone()
+        if row is None:
+            return None
+        return PlateObservation(plate=row[0], confidence=row[1], make=row[2], colour=row[3])
+
+    def remember_ocr_observation(
+        self, digest: str, observation: PlateObservation, recognised_at: datetime, *,
+        max_entries: int, not_before: datetime,
+    ) -> None:
+        with self._connect(durable=False) as connection:
+            connection.execute(
+                """
+                INSERT INTO ocr_results (
+                    digest, plate, confidence, make, colour, recognised_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(digest) DO UPDATE SET
+                    plate = excluded.plate, confidence = excluded.confidence,
+                    make = excluded.make, colour = excluded.colour,
+                    recognised_at = excluded.recognised_at
+                """,
+                (
+                    digest, observation.plate, observation.confidence,
+                    observation.make, observation.colour, _timestamp(recognised_at),
+                ),
+            )
+            connection.execute(
+                """
+                DELETE FROM ocr_results
+                WHERE recognised_at < ? OR digest NOT IN (
+                    SELECT digest FROM ocr_results
+                    ORDER BY recognised_at DESC LIMIT ?
+                )
+                """,
+                (_timestamp(not_before), max_entries),
+            )
 
     def pending_evidence_digests(self) -> set[str]:
-        with closing(self._connect()) as connection:
+        with self._connect() as connection:
             rows = connection.execute(
                 "SELECT payload FROM outbox WHERE completed_at IS NULL"
             ).fetchall()
@@ -631,7 +724,7 @@ class LocalStore:
         return digests
 
     def bind_pending_outbox_controller(self, controller_id: str) -> None:
-        with closing(self._connect()) as connection, connection:
+        with self._connect() as connection:
             rows = connection.execute(
                 "SELECT id, payload FROM outbox WHERE completed_at IS NULL"
             ).fetchall()
@@ -657,7 +750,7 @@ class LocalStore:
                 )
 
     def event_payload(self, event_id: int) -> dict:
-        with closing(self._connect()) as connection:
+        with self._connect() as connection:
             payload = self._event_payload(connection, event_id)
         if payload is None:
             raise KeyError(f"unknown event {event_id}")
@@ -665,11 +758,11 @@ class LocalStore:
 
     def queue_command_ack(self, command_id: str, status: str, detail: str | None,
                           created_at: datetime) -> None:
-        with closing(self._connect()) as connection, connection:
+        with self._connect() as connection:
             self._ensure_command_ack(connection, (command_id, created_at), status, detail)
 
     def pending_command_acks(self, limit: int = 20) -> list[tuple[str, str, str | None]]:
-        with closing(self._connect()) as connection:
+        with self._connect() as connection:
             return connection.execute(
                 """
                 SELECT command_id, status, detail FROM command_ack_outbox
@@ -679,106 +772,117 @@ class LocalStore:
             ).fetchall()
 
     def complete_command_ack(self, command_id: str) -> None:
-        with closing(self._connect()) as connection, connection:
+        with self._connect() as connection:
             connection.execute("DELETE FROM command_ack_outbox WHERE command_id = ?", (command_id,))
 
     def complete_outbox_item(
         self, item_id: int, completed_at: datetime | None = None, *,
         prepared_payload: dict | None = None,
     ) -> None:
-        self._set_outbox_delivery_state(
-            item_id,
+        self._set_outbox_delivery_states(
+            [(item_id, prepared_payload)],
             "delivered",
             completed_at or datetime.now(timezone.utc),
-            prepared_payload=prepared_payload,
         )
 
-    def _set_outbox_delivery_state(self, item_id: int, state: str,
-                                   completed_at: datetime | None = None, *,
-                                   prepared_payload: dict | None = None) -> None:
-        connection = self._connect()
+    def complete_outbox_batch(self, items,
+                              completed_at: datetime | None = None) -> None:
+        """Mark ``(item_id, prepared_payload)`` pairs delivered in one commit."""
+        self._set_outbox_delivery_states(
+            list(items), "delivered", completed_at or datetime.now(timezone.utc)
+        )
+
+    def _set_outbox_delivery_states(self, items, state: str,
+                                    completed_at: datetime | None = None) -> None:
+        connection = self._connect(durable=state == "delivered")
         try:
             connection.execute("BEGIN IMMEDIATE")
-            row = connection.execute(
-                "SELECT event_id, payload FROM outbox WHERE id = ? AND completed_at IS NULL",
-                (item_id,),
-            ).fetchone()
-            if row is None:
-                connection.commit()
-                return
-            event_id, payload_text = row
-            payload = (
-                json.loads(payload_text)
-                if prepared_payload is None else dict(prepared_payload)
-            )
-            fallback = _v2_outbox_payload(payload)
-            if prepared_payload is None:
-                payload = fallback
-            telemetry_row = connection.execute(
-                "SELECT payload FROM event_telemetry WHERE event_id = ?", (event_id,)
-            ).fetchone()
-            prepared_telemetry = payload.get("telemetry")
-            if telemetry_row is not None and (
-                prepared_payload is None or prepared_telemetry is not None
-            ):
-                connection.execute("SAVEPOINT telemetry_delivery_state")
-                try:
-                    telemetry_source = (
-                        _encode_json(prepared_telemetry)
-                        if prepared_telemetry is not None else telemetry_row[0]
-                    )
-                    telemetry = _decode_telemetry_payload(telemetry_source)
-                    telemetry["delivery"] = {
-                        "outbox_attempt": _telemetry_attempt(telemetry),
-                        "state": state,
-                    }
-                    if state == "delivered" and completed_at is not None:
-                        stage_timestamps = dict(
-                            telemetry.get("stage_timestamps", {})
-                        )
-                        acknowledged_at = _timestamp(completed_at)
-                        stage_timestamps["cloud_acknowledged_at"] = acknowledged_at
-                        telemetry["stage_timestamps"] = stage_timestamps
-                        send_started_at = stage_timestamps.get(
-                            "cloud_send_started_at"
-                        )
-                        send_to_ack_ms = _bounded_interval_ms(
-                            send_started_at, acknowledged_at
-                        )
-                        if send_to_ack_ms is not None:
-                            telemetry["stage_durations"][
-                                "cloud_send_to_ack_ms"
-                            ] = send_to_ack_ms
-                    self._write_telemetry_payload(connection, event_id, telemetry)
-                    if prepared_payload is None:
-                        payload = dict(fallback)
-                        payload["schema_version"] = 3
-                        payload["telemetry"] = telemetry
-                except _MalformedTelemetry:
-                    connection.execute("ROLLBACK TO telemetry_delivery_state")
-                    _log_telemetry_fallback("malformed")
-                except Exception:
-                    connection.execute("ROLLBACK TO telemetry_delivery_state")
-                    _log_telemetry_fallback("rewrite_failed")
-                finally:
-                    connection.execute("RELEASE telemetry_delivery_state")
-            connection.execute(
-                """
-                UPDATE outbox SET payload = ?, completed_at = ?
-                WHERE id = ? AND completed_at IS NULL
-                """,
-                (
-                    _encode_json(payload),
-                    _timestamp(completed_at) if completed_at is not None else None,
-                    item_id,
-                ),
-            )
+            for item_id, prepared_payload in items:
+                self._write_outbox_delivery_state(
+                    connection, item_id, state, completed_at, prepared_payload
+                )
             connection.commit()
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
+
+    def _write_outbox_delivery_state(self, connection: sqlite3.Connection,
+                                     item_id: int, state: str,
+                                     completed_at: datetime | None,
+                                     prepared_payload: dict | None) -> None:
+        row = connection.execute(
+            "SELECT event_id, payload FROM outbox WHERE id = ? AND completed_at IS NULL",
+            (item_id,),
+        ).fetchone()
+        if row is None:
+            return
+        event_id, payload_text = row
+        payload = (
+            json.loads(payload_text)
+            if prepared_payload is None else dict(prepared_payload)
+        )
+        fallback = _v2_outbox_payload(payload)
+        if prepared_payload is None:
+            payload = fallback
+        telemetry_row = connection.execute(
+            "SELECT payload FROM event_telemetry WHERE event_id = ?", (event_id,)
+        ).fetchone()
+        prepared_telemetry = payload.get("telemetry")
+        if telemetry_row is not None and (
+            prepared_payload is None or prepared_telemetry is not None
+        ):
+            connection.execute("SAVEPOINT telemetry_delivery_state")
+            try:
+                telemetry_source = (
+                    _encode_json(prepared_telemetry)
+                    if prepared_telemetry is not None else telemetry_row[0]
+                )
+                telemetry = _decode_telemetry_payload(telemetry_source)
+                telemetry["delivery"] = {
+                    "outbox_attempt": _telemetry_attempt(telemetry),
+                    "state": state,
+                }
+                if state == "delivered" and completed_at is not None:
+                    stage_timestamps = dict(
+                        telemetry.get("stage_timestamps", {})
+                    )
+                    acknowledged_at = _timestamp(completed_at)
+                    stage_timestamps["cloud_acknowledged_at"] = acknowledged_at
+                    telemetry["stage_timestamps"] = stage_timestamps
+                    send_started_at = stage_timestamps.get(
+                        "cloud_send_started_at"
+                    )
+                    send_to_ack_ms = _bounded_interval_ms(
+                        send_started_at, acknowledged_at
+                    )
+                    if send_to_ack_ms is not None:
+                        telemetry["stage_durations"][
+                            "cloud_send_to_ack_ms"
+                        ] = send_to_ack_ms
+                self._write_telemetry_payload(connection, event_id, telemetry)
+                if prepared_payload is None:
+                    payload = dict(fallback)
+                    payload["schema_version"] = 3
+                    payload["telemetry"] = telemetry
+            except _MalformedTelemetry:
+                connection.execute("ROLLBACK TO telemetry_delivery_state")
+                _log_telemetry_fallback("malformed")
+            except Exception:
+                connection.execute("ROLLBACK TO telemetry_delivery_state")
+                _log_telemetry_fallback("rewrite_failed")
+            finally:
+                connection.execute("RELEASE telemetry_delivery_state")
+        connection.execute(
+            """
+            UPDATE outbox SET payload = ?, completed_at = ?
+            WHERE id = ? AND completed_at IS NULL
+            """,
+            (
+                _encode_json(payload),
+                _timestamp(completed_at) if completed_at is not None else None,
+                item_id,
+            ),
+        )
 
     @staticmethod
     def _write_telemetry_payload(connection: sqlite3.Connection, event_id: int,
@@ -809,12 +913,12 @@ class LocalStore:
         )
 
     def _event_id(self, idempotency_key: str) -> int | None:
-        with closing(self._connect()) as connection:
+        with self._connect() as connection:
             row = connection.execute("SELECT id FROM events WHERE idempotency_key = ?", (idempotency_key,)).fetchone()
         return row[0] if row else None
 
     def _outbox_id(self, event_id: int) -> int:
-        with closing(self._connect()) as connection:
+        with self._connect() as connection:
             return connection.execute("SELECT id FROM outbox WHERE event_id = ?", (event_id,)).fetchone()[0]
 
     @staticmethod
@@ -943,11 +1047,52 @@ class LocalStore:
         )
         return cursor.lastrowid
 
-    def _connect(self):
-        return sqlite3.connect(self.path, timeout=5)
+    def _connect(self, *, durable: bool = True) -> sqlite3.Connection:
+        """Return this thread's persistent WAL connection at the requested sync level.
+
+        Relaxed commits may be lost on power failure but never corrupt the file;
+        the next durable commit also syncs every earlier WAL frame.
+        """
+        with self._pool_lock:
+            generation = self._pool_generation
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.generation != generation:
+            connection = self._open_pooled_connection(generation)
+        if connection.in_transaction:
+            connection.rollback()
+        synchronous = "FULL" if durable else "NORMAL"
+        if connection.synchronous != synchronous:
+            connection.execute(f"PRAGMA synchronous = {synchronous}")
+            connection.synchronous = synchronous
+        return connection
+
+    def _open_pooled_connection(self, generation: int) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path, timeout=_BUSY_TIMEOUT_SECONDS, factory=_PooledConnection,
+            cached_statements=_STATEMENT_CACHE_SIZE, check_same_thread=False,
+        )
+        try:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = FULL")
+        except Exception:
+            connection.close()
+            raise
+        owner = current_thread()
+        with self._pool_lock:
+            retired = [
+                self._pool.pop(thread) for thread in tuple(self._pool)
+                if thread is owner or not thread.is_alive()
+            ]
+            if generation == self._pool_generation:
+                self._pool[owner] = connection
+        for stale in retired:
+            _close_quietly(stale)
+        self._local.connection = connection
+        self._local.generation = generation
+        return connection
 
     def _migrate(self) -> None:
-        with closing(self._connect()) as connection, connection:
+        with self._connect() as connection:
             connection.executescript("""
                 CREATE TABLE IF NOT EXISTS events (
                     id INTEGER PRIMARY KEY, received_at TEXT NOT NULL, decision_at TEXT,
@@ -986,6 +1131,12 @@ class LocalStore:
                 CREATE UNIQUE INDEX IF NOT EXISTS outbox_one_per_event ON outbox (event_id);
                 CREATE INDEX IF NOT EXISTS event_telemetry_created_at
                     ON event_telemetry (created_at);
+                CREATE TABLE IF NOT EXISTS ocr_results (
+                    digest TEXT PRIMARY KEY, plate TEXT, confidence REAL NOT NULL,
+                    make TEXT, colour TEXT, recognised_at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS ocr_results_recognised_at
+                    ON ocr_results (recognised_at);
             """)
             columns = {row[1] for row in connection.execute("PRAGMA table_info(actuation_claims)")}
             for name in (
@@ -1182,6 +1333,13 @@ class LocalStore:
             )
 
 
+def _close_quietly(connection: sqlite3.Connection) -> None:
+    try:
+        connection.close()
+    except sqlite3.Error:
+        pass
+
+
 def _legacy_true(value) -> bool:
     return value if isinstance(value, bool) else (value != 0 if isinstance(value, (int, float)) else isinstance(value, str) and value.strip().lower() in {"1", "true", "yes", "y", "on"})
 
@@ -1266,6 +1424,11 @@ def _telemetry_payload(telemetry: EventTelemetry) -> dict:
         payload["stage_timestamps"] = dict(raw["stage_timestamps"])
     if "trigger" in raw:
         payload["trigger"] = dict(raw["trigger"])
+    if "ocr_cache" in raw:
+        payload["ocr_cache"] = {
+            key: raw["ocr_cache"][key]
+            for key in _TELEMETRY_OCR_CACHE_KEYS if key in raw["ocr_cache"]
+        }
     return payload
 
 
@@ -127,9 +127,10 @@ class OcrAttemptTelemetry:
     confidence: float | None = None
     make: str | None = None
     colour: str | None = None
+    upload_saved_ratio: float | None = None
 
     def to_wire(self) -> dict[str, object]:
-        return {
+        payload: dict[str, object] = {
             "frame_sequence": _rounded_int(self.frame_sequence, 0, MAX_ITEMS - 1, 0),
             "duration_ms": _duration(self.duration_ms) or 0,
             "status": _token(self.status),
@@ -138,6 +139,23 @@ class OcrAttemptTelemetry:
             "make": _optional_string(self.make),
             "colour": _optional_string(self.colour),
         }
+        if self.upload_saved_ratio is not None:
+            payload["upload_saved_ratio"] = _ratio(self.upload_saved_ratio)
+        return payload
+
+
+@dataclass(frozen=True)
+class OcrCacheTelemetry:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def to_wire(self) -> dict[str, int]:
+        return {
+            "hits": _rounded_int(self.hits, 0, MAX_ITEMS, 0),
+            "misses": _rounded_int(self.misses, 0, MAX_ITEMS, 0),
+            "evictions": _rounded_int(self.evictions, 0, MAX_ITEMS, 0),
+        }
 
 
 @dataclass(frozen=True)
@@ -263,6 +281,7 @@ class EventTelemetry:
     delivery_state: str
     stage_timestamps: StageTimestamps = field(default_factory=StageTimestamps)
     trigger: TriggerTelemetry | None = None
+    ocr_cache: OcrCacheTelemetry | None = None
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "trace_id", _trace_id(self.trace_id))
@@ -313,6 +332,8 @@ class EventTelemetry:
             payload["stage_timestamps"] = timestamps
         if self.trigger is not None:
             payload["trigger"] = self.trigger.to_wire()
+        if self.ocr_cache is not None:
+            payload["ocr_cache"] = self.ocr_cache.to_wire()
         return payload
 
 
@@ -339,6 +360,7 @@ class ProcessingTrace:
         self._pending_ocr_start: float | None = None
         self._last_ocr_end: float | None = None
         self._ocr_work_ms = 0.0
+        self._ocr_intervals: list[tuple[float, float]] = []
         self._decision: float | None = None
         self._actuation: float | None = None
         self._relay_finished: float | None = None
@@ -352,6 +374,7 @@ class ProcessingTrace:
         self._actuation_attempted = False
         self._relay_outcome = "not_attempted"
         self._trigger: TriggerTelemetry | None = None
+        self._ocr_cache: OcrCacheTelemetry | None = None
         self._finished_telemetry: EventTelemetry | None = None
 
     def seed_upstream(
@@ -402,16 +425,28 @@ class ProcessingTrace:
         if self._first_ocr_start is None:
             self._first_ocr_start = self._pending_ocr_start
 
-    def add_ocr_attempt(self, attempt: OcrAttemptTelemetry) -> None:
+    def add_ocr_attempt(
+        self, attempt: OcrAttemptTelemetry, *, started_at: float | None = None
+    ) -> None:
+        """Record a finished attempt; pass ``started_at`` for overlapping attempts.
+
+        ``ocr_ms`` covers the union of attempt intervals, so concurrent requests
+        report the time spent waiting for OCR rather than their summed duration.
+        """
         if len(self._ocr_attempts) >= MAX_ITEMS:
             return
-        if self._pending_ocr_start is None:
-            raise RuntimeError("mark_ocr_start must be called before add_ocr_attempt")
+        if started_at is None:
+            if self._pending_ocr_start is None:
+                raise RuntimeError("mark_ocr_start must be called before add_ocr_attempt")
+            started_at = self._pending_ocr_start
+            self._pending_ocr_start = None
+        elif self._first_ocr_start is None or started_at < self._first_ocr_start:
+            self._first_ocr_start = started_at
         ended_at = self._monotonic_clock()
-        duration_ms = _elapsed(self._pending_ocr_start, ended_at) or 0.0
+        duration_ms = _elapsed(started_at, ended_at) or 0.0
         self._last_ocr_end = ended_at
-        self._pending_ocr_start = None
-        self._ocr_work_ms += duration_ms
+        self._ocr_intervals.append((started_at, ended_at))
+        self._ocr_work_ms = _covered_ms(self._ocr_intervals)
         self._ocr_attempts.append(replace(attempt, duration_ms=duration_ms))
 
     def add_ocr_rejection(self, attempt: OcrAttemptTelemetry) -> None:
@@ -419,6 +454,19 @@ class ProcessingTrace:
         if len(self._ocr_attempts) < MAX_ITEMS:
             self._ocr_attempts.append(replace(attempt, duration_ms=0.0))
 
+    def add_cached_ocr_attempt(self, attempt: OcrAttemptTelemetry) -> None:
+        """Record an observation served from the OCR cache without a request."""
+        if len(self._ocr_attempts) < MAX_ITEMS:
+            self._ocr_attempts.append(replace(attempt, duration_ms=0.0))
+
+    def count_ocr_cache(self, *, hits: int = 0, misses: int = 0, evictions: int = 0) -> None:
+        cache = self._ocr_cache or OcrCacheTelemetry()
+        self._ocr_cache = OcrCacheTelemetry(
+            hits=cache.hits + hits,
+            misses=cache.misses + misses,
+            evictions=cache.evictions + evictions,
+        )
+
     def mark_decision(self, outcome: str, reason: str) -> None:
         if self._decision is None:
             self._decision = self._monotonic_clock()
@@ -506,6 +554,7 @@ class ProcessingTrace:
                 processing_finished_at=self._wall_at(self._finished),
             ),
             trigger=self._trigger,
+            ocr_cache=self._ocr_cache,
         )
         return self._finished_telemetry
 
@@ -527,6 +576,18 @@ def _elapsed(start: float | None, end: float | None) -> float | None:
     return max(0.0, (end - start) * 1_000)
 
 
+def _covered_ms(intervals: list[tuple[float, float]]) -> float:
+    covered = 0.0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            covered += _elapsed(current_start, current_end) or 0.0
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    return covered + (_elapsed(current_start, current_end) or 0.0)
+
+
 def _wire_timestamp(value: datetime | None) -> str | None:
     if not isinstance(value, datetime) or value.tzinfo is None:
         return None
@@ -14,7 +14,7 @@ from .store import LocalStore
 
 _TOP_LEVEL_KEYS = (
     "trace_id", "taxonomy_version", "stage_durations", "frames", "ocr_attempts",
-    "decision", "actuation", "delivery",
+    "decision", "actuation", "delivery", "ocr_cache",
 )
 _NESTED_KEYS = {
     "stage_durations": (
@@ -27,11 +27,12 @@ _NESTED_KEYS = {
     ),
     "ocr_attempts": (
         "frame_sequence", "duration_ms", "status", "plate", "confidence", "make",
-        "colour",
+        "colour", "upload_saved_ratio",
     ),
     "decision": ("outcome", "reason"),
     "actuation": ("claim", "attempted", "relay_outcome"),
     "delivery": ("outbox_attempt", "state"),
+    "ocr_cache": ("hits", "misses", "evictions"),
 }
 _CSV_FIELDS = (
     "event_id", "received_at", "source", "reason", "opened", "observed_plate",
@@ -40,7 +41,8 @@ _CSV_FIELDS = (
     "decision_ms", "decision_to_relay_ms", "end_to_end_ms", "delivery_lag_ms",
     "frame_count", "ocr_attempt_count", "decision_outcome", "decision_reason",
     "actuation_claim", "actuation_attempted", "relay_outcome", "outbox_attempt",
-    "delivery_state",
+    "delivery_state", "ocr_cache_hits", "ocr_cache_misses", "ocr_cache_evictions",
+    "ocr_frames_skipped",
 )
 _EXPORT_PAGE_SIZE = 100
 _DATABASE_SIDECARS = ("", "-wal", "-shm", "-journal")
@@ -63,12 +65,15 @@ def export_telemetry(store, *, format: str, since: datetime,
         snapshot_path = Path(snapshot_directory) / "telemetry.db"
         store.create_telemetry_snapshot(snapshot_path)
         snapshot = LocalStore(snapshot_path)
-        rows = _snapshot_rows(snapshot, since)
-        return _atomic_write(
-            output,
-            lambda destination: _write(destination, format, rows),
-            protected_paths,
-        )
+        try:
+            rows = _snapshot_rows(snapshot, since)
+            return _atomic_write(
+                output,
+                lambda destination: _write(destination, format, rows),
+                protected_paths,
+            )
+        finally:
+            snapshot.close()
 
 
 def _snapshot_rows(store: LocalStore, since: datetime):
@@ -110,6 +115,10 @@ def _safe_telemetry(value: object) -> dict:
     for key in ("stage_durations", "decision", "actuation", "delivery"):
         nested = telemetry.get(key)
         safe[key] = _allowlisted_dict(nested, _NESTED_KEYS[key])
+    if isinstance(telemetry.get("ocr_cache"), dict):
+        safe["ocr_cache"] = _allowlisted_dict(
+            telemetry["ocr_cache"], _NESTED_KEYS["ocr_cache"]
+        )
     for key in ("frames", "ocr_attempts"):
         items = telemetry.get(key)
         safe[key] = [
@@ -156,6 +165,7 @@ def _csv_row(row: dict) -> dict:
     decision = telemetry.get("decision", {})
     actuation = telemetry.get("actuation", {})
     delivery = telemetry.get("delivery", {})
+    ocr_cache = telemetry.get("ocr_cache", {})
     flattened = {key: row.get(key) for key in _CSV_FIELDS if key in row}
     flattened.update({key: durations.get(key) for key in _NESTED_KEYS["stage_durations"]})
     flattened.update({
@@ -170,6 +180,13 @@ def _csv_row(row: dict) -> dict:
         "relay_outcome": actuation.get("relay_outcome"),
         "outbox_attempt": delivery.get("outbox_attempt"),
         "delivery_state": delivery.get("state"),
+        "ocr_cache_hits": ocr_cache.get("hits"),
+        "ocr_cache_misses": ocr_cache.get("misses"),
+        "ocr_cache_evictions": ocr_cache.get("evictions"),
+        "ocr_frames_skipped": sum(
+            1 for frame in telemetry.get("frames", [])
+            if str(frame.get("status", "")).startswith("skipped_")
+        ),
     })
     return flattened
 
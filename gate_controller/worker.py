@@ -1,17 +1,31 @@
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from queue import Empty, Queue
 import signal
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from threading import Event, Lock, Thread
-from time import monotonic, sleep, time
+from time import monotonic, time
 
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import (
+    DirCreatedEvent, DirMovedEvent, FileClosedEvent, FileCreatedEvent, FileMovedEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
-
-from .images import content_digest, rank_images, wait_until_readable
+from watchdog.utils import UnsupportedLibcError
+
+try:
+    from watchdog.observers.inotify import InotifyObserver
+except (ImportError, UnsupportedLibcError):  # pragma: no cover - non-Linux hosts
+    InotifyObserver = None
+
+from .candidates import CandidateStream
+from .images import (
+    DEFAULT_RANKING_SCALE, RANKING_SCALES, content_digest, forget_frame, is_decision_grade,
+    measure_frame_quality, rank_images, ranking_sharpness, wait_until_readable,
+)
 from .telemetry import ftp_fallback_trigger
 
 
@@ -21,6 +35,13 @@ MAX_BURST_CANDIDATES = 16
 MAX_CANDIDATE_BYTES = 16 * 1024 * 1024
 MAX_STARTUP_ENTRIES = 128
 _TRIGGER_UNSET = object()
+# Subscribing only to these leaves IN_MODIFY, IN_ATTRIB, IN_OPEN and
+# IN_CLOSE_NOWRITE out of the inotify mask, so a chunked FTP upload and the
+# readability probes no longer queue an event per write or read. Directory
+# creation and moves keep new camera date directories watched.
+_UPLOAD_EVENTS = [
+    FileCreatedEvent, FileClosedEvent, FileMovedEvent, DirCreatedEvent, DirMovedEvent,
+]
 
 
 LOGGER = logging.getLogger(__name__)
@@ -32,7 +53,8 @@ class WorkerFailure(RuntimeError):
 
 @dataclass(frozen=True)
 class BurstIdentity:
-    idempotency_key: str
+    idempotency_key: str | None
+    follows: str | None = None
 
 
 class BoundedBurstQueue:
@@ -84,7 +106,21 @@ class BurstCollector:
                  include_idempotency_key: bool = False,
                  prefer_first_candidate: bool = False,
                  max_candidates: int = DEFAULT_MAX_BURST_CANDIDATES,
-                 wall_clock=None):
+                 wall_clock=None, early_flush=None, stream_scorer=None):
+        """Collect uploads into bursts that flush after ``quiet_window``.
+
+        ``early_flush`` is an optional predicate for a burst's first upload.
+        When it passes, the burst flushes without waiting for the quiet
+        window, and uploads that arrive within one quiet window of the flush
+        form a follow-up burst under the same idempotency key. The processor
+        treats that follow-up as a duplicate once the first burst has
+        recorded an outcome, so it only decides if the first one could not.
+
+        With ``stream_scorer``, each burst is emitted as a ``CandidateStream``
+        on its first decodable upload, so OCR starts while later uploads are
+        still arriving. The stream is closed when the quiet window ends and
+        ``early_flush`` is not used.
+        """
         if not 1 <= max_candidates <= MAX_BURST_CANDIDATES:
             raise ValueError("max_candidates exceeds the safe range")
         self._emit = emit
@@ -102,18 +138,44 @@ class BurstCollector:
         self._pending: list[Path] = []
         self._received_at: datetime | None = None
         self._idempotency_key: str | None = None
+        self._follows: str | None = None
         self._first_seen: float | None = None
         self._deadline: float | None = None
+        self._early_flush = early_flush
+        self._flushing_early = False
+        self._follow_up: tuple[float, datetime, str | None] | None = None
+        self._stream_scorer = stream_scorer
+        self._stream: CandidateStream | None = None
         self._lock = Lock()
 
     def add(self, path: Path, received_at: datetime | None = None) -> bool:
+        """Add an upload and return whether it started a new burst.
+
+        A follow-up burst after an early flush is not reported as new, so
+        the hot-stream frames already sent with the early burst are not
+        selected again. It keeps its own idempotency key and names the early
+        burst's key as the one it follows.
+        """
         path = Path(path)
+        if self._stream_scorer is not None:
+            return self._add_streamed(path, received_at)
         dropped = None
+        early = self._early_flush is not None and not self._pending and self._is_early(path)
         with self._lock:
             first_candidate = not self._pending
+            follow_up = None
             if first_candidate:
+                now = self._clock()
+                if self._follow_up is not None and now < self._follow_up[0]:
+                    follow_up = self._follow_up
+                self._follow_up = None
                 self._received_at = received_at or self._arrival_clock()
-                self._first_seen = self._clock()
+                self._first_seen = now
+                self._flushing_early = early and follow_up is None
+                self._follows = None
+                if follow_up is not None:
+                    _until, follow_up_received_at, self._follows = follow_up
+                    self._received_at = min(self._received_at, follow_up_received_at)
                 if self._include_idempotency_key:
                     try:
                         self._idempotency_key = content_digest(path)
@@ -126,14 +188,61 @@ class BurstCollector:
             self._pending.append(path)
             if len(self._pending) > self._max_candidates:
                 dropped = self._pending.pop(0)
-            self._deadline = self._clock() + self._quiet_window
+            if not self._flushing_early:
+                self._deadline = self._clock() + self._quiet_window
+            elif first_candidate:
+                self._deadline = self._clock()
         if dropped is not None:
             _remove_upload(dropped)
-        return first_candidate
+        return first_candidate and follow_up is None
+
+    def _add_streamed(self, path: Path, received_at: datetime | None) -> bool:
+        with self._lock:
+            stream = self._stream
+            if stream is not None:
+                self._deadline = self._clock() + self._quiet_window
+        if stream is not None:
+            if not stream.add(path):
+                _remove_upload(path)
+            return False
+        stream = CandidateStream(max_candidates=self._max_candidates, score=self._stream_scorer)
+        if not stream.add(path):
+            _remove_upload(path)
+            return False
+        received_at = received_at or self._arrival_clock()
+        idempotency_key = None
+        if self._include_idempotency_key:
+            try:
+                idempotency_key = content_digest(path)
+            except OSError:
+                idempotency_key = None
+        with self._lock:
+            decision_started_at = self._clock()
+            self._stream = stream
+            self._deadline = decision_started_at + self._quiet_window
+        self._emit_burst(
+            stream, received_at, decision_started_at, self._wall_clock(),
+            idempotency_key, None, wait_ms=0, flushed_early=False,
+        )
+        return True
+
+    def _is_early(self, path: Path) -> bool:
+        try:
+            return bool(self._early_flush(path))
+        except Exception:
+            LOGGER.warning("gate_pipeline stage=early_flush outcome=quality_error")
+            return False
+
+    def next_due(self) -> float | None:
+        """Return the clock time at which the pending burst's quiet window ends."""
+        with self._lock:
+            return self._deadline
 
     @property
     def remaining_capacity(self) -> int:
         with self._lock:
+            if self._stream is not None:
+                return self._stream.remaining_capacity
             return max(0, self._max_candidates - len(self._pending))
 
     def flush_due(self) -> bool:
@@ -141,16 +250,32 @@ class BurstCollector:
             decision_started_at = self._clock()
             if self._deadline is None or decision_started_at < self._deadline:
                 return False
-            processing_started_at = self._wall_clock()
-            pending = tuple(self._pending)
-            received_at = self._received_at
-            idempotency_key = self._idempotency_key
-            first_seen = self._first_seen
+            stream = self._stream
+            self._stream = None
+            if stream is None:
+                processing_started_at = self._wall_clock()
+                pending = tuple(self._pending)
+                received_at = self._received_at
+                idempotency_key = self._idempotency_key
+                follows = self._follows
+                first_seen = self._first_seen
+                flushed_early = self._flushing_early
+                if flushed_early:
+                    self._follow_up = (
+                        decision_started_at + self._quiet_window, received_at,
+                        idempotency_key,
+                    )
+            self._flushing_early = False
             self._pending = []
             self._received_at = None
             self._idempotency_key = None
+            self._follows = None
             self._first_seen = None
             self._deadline = None
+        if stream is not None:
+            # A streamed burst was emitted with its first upload; stop its wait.
+            stream.close()
+            return False
         ranked = tuple(self._ranker(pending))
         if self._prefer_first_candidate and pending and pending[0] in ranked:
             primary = pending[0]
@@ -163,24 +288,34 @@ class BurstCollector:
             max(0, round((decision_started_at - first_seen) * 1_000))
             if first_seen is not None else None
         )
+        self._emit_burst(
+            ranked, received_at, decision_started_at, processing_started_at,
+            idempotency_key, follows, wait_ms=wait_ms, flushed_early=flushed_early,
+        )
+        return True
+
+    def _emit_burst(self, paths, received_at, decision_started_at, processing_started_at,
+                    idempotency_key, follows, *, wait_ms, flushed_early) -> None:
         LOGGER.info(
             "gate_pipeline stage=burst_processing_started observed_at=%s "
-            "candidate_count=%d ingress_wait_ms=%s",
+            "candidate_count=%d ingress_wait_ms=%s early_flush=%s",
             processing_started_at.astimezone(timezone.utc).isoformat(),
-            len(ranked),
+            len(paths),
             wait_ms if wait_ms is not None else "unavailable",
+            "true" if flushed_early else "false",
         )
-        details = [ranked]
+        details = [paths]
         if self._include_received_at:
             details.append(received_at)
         if self._include_decision_started_at:
             details.append(decision_started_at)
         if self._include_processing_started_at:
             details.append(processing_started_at)
-        if self._include_idempotency_key and idempotency_key is not None:
-            details.append(BurstIdentity(idempotency_key))
-        self._emit(tuple(details) if len(details) > 1 else ranked)
-        return True
+        if self._include_idempotency_key and (
+            idempotency_key is not None or follows is not None
+        ):
+            details.append(BurstIdentity(idempotency_key, follows))
+        self._emit(tuple(details) if len(details) > 1 else paths)
 
 
 class CompletedImageHandler(FileSystemEventHandler):
@@ -189,7 +324,8 @@ class CompletedImageHandler(FileSystemEventHandler):
                  on_rejected=None, arrival_clock=None,
                  max_candidate_bytes: int = DEFAULT_MAX_CANDIDATE_BYTES,
                  max_pending_candidates: int = DEFAULT_MAX_BURST_CANDIDATES,
-                 on_first_completed=None, ignored_roots=()):
+                 on_first_completed=None, ignored_roots=(), on_scheduled=None,
+                 close_events: bool = False):
         super().__init__()
         if not 1 <= max_candidate_bytes <= MAX_CANDIDATE_BYTES:
             raise ValueError("max_candidate_bytes exceeds the safe range")
@@ -206,29 +342,43 @@ class CompletedImageHandler(FileSystemEventHandler):
         self._max_pending_candidates = max_pending_candidates
         self._on_first_completed = on_first_completed
         self._ignored_roots = tuple(Path(root).resolve() for root in ignored_roots)
+        self._on_scheduled = on_scheduled
+        self._close_events = close_events
         self._retry_at: dict[Path, tuple[float, float, int, datetime]] = {}
         self._lock = Lock()
 
     def on_closed(self, event) -> None:
-        self.schedule_candidate(Path(event.src_path), event.is_directory)
+        self.schedule_candidate(Path(event.src_path), event.is_directory, completed=True)
 
     def on_moved(self, event) -> None:
-        self.schedule_candidate(Path(event.dest_path), event.is_directory)
+        self.schedule_candidate(Path(event.dest_path), event.is_directory, completed=True)
 
     def on_created(self, event) -> None:
         self.schedule_candidate(Path(event.src_path), event.is_directory)
 
-    def schedule_candidate(self, path: Path, is_directory: bool = False) -> None:
+    def schedule_candidate(self, path: Path, is_directory: bool = False, *,
+                           completed: bool = False) -> None:
+        """Track an upload until it reads as a complete image.
+
+        A close-after-write or move-into-place means the writer has finished,
+        so the candidate is checked at once. When the observer reports those
+        events, a bare creation is only checked after the retry interval, in
+        case its close is never seen, instead of probing a partial upload.
+        """
         if is_directory or self.ignores(path) or path.suffix.lower() not in {".jpg", ".jpeg"}:
             return
         dropped = []
         first_observation = None
         with self._lock:
             now = self._clock()
+            check_at = now if completed or not self._close_events else now + self._retry_interval
             candidate = self._retry_at.pop(path, None)
             if candidate is None:
                 first_observation = self._arrival_clock()
-            self._retry_at[path] = candidate or (now, now, 0, first_observation)
+                candidate = (now, check_at, 0, first_observation)
+            elif completed:
+                candidate = (candidate[0], now, *candidate[2:])
+            self._retry_at[path] = candidate
             while len(self._retry_at) > self._max_pending_candidates:
                 dropped_path = next(iter(self._retry_at))
                 self._retry_at.pop(dropped_path)
@@ -242,12 +392,22 @@ class CompletedImageHandler(FileSystemEventHandler):
             )
         for dropped_path in dropped:
             self._reject(dropped_path, "candidate_coalesced")
+        if self._on_scheduled is not None:
+            self._on_scheduled()
 
     @property
     def pending_count(self) -> int:
         with self._lock:
             return len(self._retry_at)
 
+    def next_due(self) -> float | None:
+        """Return the clock time of the earliest pending readability check."""
+        with self._lock:
+            return min(
+                (retry_at for _, retry_at, _, _ in self._retry_at.values()),
+                default=None,
+            )
+
     def ignores(self, path: Path) -> bool:
         candidate = Path(path).resolve()
         return any(
@@ -362,7 +522,7 @@ class StartupReconciler:
                 finally:
                     _remove_upload(path)
                 continue
-            self._handler.schedule_candidate(path, False)
+            self._handler.schedule_candidate(path, False, completed=True)
         return True
 
     def _next_entry(self):
@@ -402,14 +562,45 @@ def start_observer_then_reconcile(observer, directory: Path, handler: CompletedI
 
 
 def run_worker(directory: Path, emit, quiet_window: float = 0.5,
-               poll_interval: float = 0.05, background_workers=(), max_pending_bursts: int = 2,
+               poll_interval: float = 1.0, background_workers=(), max_pending_bursts: int = 2,
                max_image_age: float = 8.0, on_skipped=None, on_error=None,
                shutdown=None, max_burst_candidates: int = DEFAULT_MAX_BURST_CANDIDATES,
                max_candidate_bytes: int = DEFAULT_MAX_CANDIDATE_BYTES,
                on_timed_skipped=None, trigger_resolver=None,
-               hot_frame_provider=None) -> None:
-    """Watch completed JPEG uploads and process ranked bursts without blocking collection."""
+               hot_frame_provider=None, early_flush_sharpness: float = 0.0,
+               streaming_bursts: bool = False, ranking_workers: int = 1,
+               ranking_scale: int = DEFAULT_RANKING_SCALE) -> None:
+    """Watch completed JPEG uploads and process ranked bursts without blocking collection.
+
+    The loop sleeps until the earliest upload retry or burst quiet-window
+    deadline, and watchdog events wake it at once. ``poll_interval`` only
+    bounds an idle wait, which is how often the Observer's liveness is checked.
+    A positive ``early_flush_sharpness`` flushes a burst as soon as its first
+    upload is sharp and well exposed enough to be decided on its own.
+    ``streaming_bursts`` hands each burst to the processor on its first upload
+    instead, and later uploads join it while OCR runs. ``ranking_workers``
+    above 1 decodes a burst's frames concurrently on a pool shared by both
+    rankers, which is shut down once the processing thread has stopped.
+    ``ranking_scale`` is the JPEG draft scale both rankers decode at.
+    """
+    if ranking_scale not in RANKING_SCALES:
+        raise ValueError(f"ranking scale must be one of {RANKING_SCALES}")
+    if (isinstance(ranking_workers, bool) or not isinstance(ranking_workers, int)
+            or ranking_workers < 1):
+        raise ValueError("ranking workers must be a positive integer")
+    ranking_executor = ThreadPoolExecutor(
+        max_workers=ranking_workers, thread_name_prefix="GateRanking",
+    ) if ranking_workers > 1 else None
+
+    def ranker(paths):
+        return rank_images(
+            paths, max_bytes=max_candidate_bytes, ranking_scale=ranking_scale,
+            executor=ranking_executor,
+        )
+
     bursts = BoundedBurstQueue(max_pending_bursts)
+    wake = Event()
+    observer = Observer()
 
     def report_dropped(item, reason):
         paths, received_at, *timing = item
@@ -440,13 +631,23 @@ def run_worker(directory: Path, emit, quiet_window: float = 0.5,
                 _remove_uploads(dropped[0])
 
     collector = BurstCollector(
-        enqueue, quiet_window=quiet_window,
-        ranker=lambda paths: rank_images(paths, max_bytes=max_candidate_bytes),
+        enqueue, quiet_window=quiet_window, ranker=ranker,
         include_received_at=True, include_decision_started_at=True,
         include_processing_started_at=True,
         include_idempotency_key=True,
         prefer_first_candidate=True,
         max_candidates=max_burst_candidates,
+        early_flush=(
+            (lambda path: is_decision_grade(
+                measure_frame_quality(path), min_sharpness=early_flush_sharpness,
+            )) if early_flush_sharpness > 0 and not streaming_bursts else None
+        ),
+        stream_scorer=(
+            (lambda path: ranking_sharpness(
+                path, max_bytes=max_candidate_bytes, ranking_scale=ranking_scale,
+            ))
+            if streaming_bursts else None
+        ),
     )
     handler = CompletedImageHandler(
         collector,
@@ -462,35 +663,37 @@ def run_worker(directory: Path, emit, quiet_window: float = 0.5,
             (hot_frame_provider.output_directory,)
             if hot_frame_provider is not None else ()
         ),
+        on_scheduled=wake.set,
+        close_events=(
+            InotifyObserver is not None and isinstance(observer, InotifyObserver)
+        ),
+    )
+    observer.schedule(
+        handler, str(directory), recursive=True, event_filter=_UPLOAD_EVENTS,
     )
-    observer = Observer()
-    observer.schedule(handler, str(directory), recursive=True)
     stop_event = Event()
     failures = Queue()
-    processing_args = (
-        bursts, emit, on_error,
-        lambda paths: rank_images(paths, max_bytes=max_candidate_bytes),
-    )
+    processing_args = (bursts, emit, on_error, ranker)
     if trigger_resolver is not None:
         processing_args += (trigger_resolver,)
     processing_thread = Thread(
         target=_supervise_worker,
         args=("GateBurstProcessor", _process_bursts, processing_args,
-              stop_event, failures),
+              stop_event, failures, wake),
         daemon=True, name="GateBurstProcessor",
     )
     background_threads = [
         Thread(
             target=_supervise_worker,
             args=(worker.__class__.__name__, worker.run_forever, (stop_event,),
-                  stop_event, failures),
+                  stop_event, failures, wake),
             daemon=True, name=worker.__class__.__name__,
         )
         for worker in background_workers
     ]
     previous_sigterm = None
     if current_thread_is_main():
-        previous_sigterm = _install_sigterm_handler(stop_event)
+        previous_sigterm = _install_sigterm_handler(stop_event, wake)
     observer_started = False
     startup_reconciler = None
     startup_reconciliation_pending = False
@@ -519,7 +722,9 @@ def run_worker(directory: Path, emit, quiet_window: float = 0.5,
                 startup_reconciliation_pending = startup_reconciler.run_batch()
             handler.retry_pending()
             collector.flush_due()
-            sleep(poll_interval)
+            _wait_for_work(wake, 0 if startup_reconciliation_pending else _next_wait(
+                poll_interval, handler.next_due(), collector.next_due(),
+            ))
     except KeyboardInterrupt:
         pass
     finally:
@@ -546,6 +751,8 @@ def run_worker(directory: Path, emit, quiet_window: float = 0.5,
                 for thread in started_background_threads:
                     thread.join(timeout=1)
             finally:
+                if ranking_executor is not None:
+                    ranking_executor.shutdown(wait=True, cancel_futures=True)
                 if previous_sigterm is not None:
                     signal.signal(signal.SIGTERM, previous_sigterm)
     try:
@@ -570,7 +777,10 @@ def _process_bursts(
         try:
             options = {}
             if timing and isinstance(timing[-1], BurstIdentity):
-                options["idempotency_key"] = timing.pop().idempotency_key
+                identity = timing.pop()
+                options["idempotency_key"] = identity.idempotency_key
+                if identity.follows is not None:
+                    options["follows"] = identity.follows
             if trigger_resolver is not None:
                 trigger_summary = _resolve_trigger(
                     trigger_resolver, received_at,
@@ -605,18 +815,24 @@ def _report_processing_error(
             on_error(paths, error, received_at, trigger=trigger)
     except Exception:
         LOGGER.exception("gate_burst_error_handler_failed")
-def _supervise_worker(name, target, args, stop_event, failures) -> None:
+def _supervise_worker(name, target, args, stop_event, failures, *wakes: Event) -> None:
     try:
         target(*args)
     except BaseException as error:
         if stop_event.is_set():
             return
         failures.put((name, error))
-        stop_event.set()
+        _stop(stop_event, wakes)
         return
     if not stop_event.is_set():
         failures.put((name, None))
-        stop_event.set()
+        _stop(stop_event, wakes)
+
+
+def _stop(stop_event: Event, wakes) -> None:
+    stop_event.set()
+    for wake in wakes:
+        wake.set()
 
 
 def current_thread_is_main() -> bool:
@@ -624,18 +840,39 @@ def current_thread_is_main() -> bool:
     return current_thread() is main_thread()
 
 
-def _install_sigterm_handler(stop_event: Event):
+def _install_sigterm_handler(stop_event: Event, *wakes: Event):
     previous = signal.getsignal(signal.SIGTERM)
-    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+    def stop(*_):
+        _stop(stop_event, wakes)
+
+    signal.signal(signal.SIGTERM, stop)
     return previous
 
 
+def _next_wait(limit: float, *deadlines: float | None) -> float:
+    due = [deadline for deadline in deadlines if deadline is not None]
+    if not due:
+        return limit
+    return min(limit, max(0.0, min(due) - monotonic()))
+
+
+def _wait_for_work(wake: Event, timeout: float) -> None:
+    # Clearing after the wait cannot lose a wake-up: the caller re-reads all
+    # pending work before it waits again.
+    wake.wait(timeout)
+    wake.clear()
+
+
 def _remove_uploads(paths) -> None:
+    if isinstance(paths, CandidateStream):
+        paths = paths.finish()
     for path in paths:
         _remove_upload(path)
 
 
 def _remove_upload(path: Path) -> None:
+    forget_frame(path)
     try:
         Path(path).unlink(missing_ok=True)
     except OSError as error:
@@ -0,0 +1,1156 @@
+#!/usr/bin/env python3
+"""Measure local gate pipeline hot paths without a camera, relay, or network."""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.policy import HTTP as email_policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+from threading import Condition, Event, Thread
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
+if str(REPOSITORY_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPOSITORY_ROOT))
+
+from PIL import Image, ImageDraw, ImageFilter, ImageStat  # noqa: E402
+from watchdog.observers import Observer  # noqa: E402
+
+from gate_controller import images  # noqa: E402
+from gate_controller.actuation import ActuationCoordinator  # noqa: E402
+from gate_controller.hot_stream import (  # noqa: E402
+    MAX_FRAME_BYTES as MAX_HOT_FRAME_BYTES, JpegStreamParser,
+)
+from gate_controller.matching import (  # noqa: E402
+    MIN_EXACT_CONFIDENCE, MIN_FUZZY_CONFIDENCE, PlateIndex, _is_one_known_confusion,
+    decide_access, normalise_plate, plate_index,
+)
+from gate_controller.models import (  # noqa: E402
+    GateEvent, MatchDecision, PlateObservation, RelayResult,
+)
+from gate_controller.outbox import (  # noqa: E402
+    EvidenceSpool, HttpOutboxSender, MAX_OUTBOX_BATCH_SIZE, OutboxWorker,
+)
+from gate_controller.processor import (  # noqa: E402
+    MAX_OCR_FRAMES, GateProcessor, _unique_content_candidates,
+)
+from gate_controller.store import LocalStore  # noqa: E402
+from gate_controller.telemetry import FrameTelemetry, ProcessingTrace  # noqa: E402
+from gate_controller.worker import (  # noqa: E402
+    _UPLOAD_EVENTS, CompletedImageHandler, _next_wait, _wait_for_work,
+)
+
+
+class PerCallConnectionStore(LocalStore):
+    """Reproduce the previous open, rollback-journal, close cost of every call."""
+
+    def __init__(self, path: Path):
+        self._previous = None
+        super().__init__(path)
+
+    def _connect(self, *, durable: bool = True):
+        if self._previous is not None:
+            self._previous.close()
+        self._previous = sqlite3.connect(self.path, timeout=5)
+        return self._previous
+
+    def close(self) -> None:
+        if self._previous is not None:
+            self._previous.close()
+            self._previous = None
+
+
+class _BenchmarkRelay:
+    def trigger(self, source, idempotency_key=None, *, pre_activation_inhibit=None):
+        if pre_activation_inhibit is not None and pre_activation_inhibit() is not None:
+            return RelayResult(False, "inhibited", idempotency_key)
+        return RelayResult(
+            True, "activated", idempotency_key, datetime.now(timezone.utc),
+        )
+
+
+class _RecordingRelay(_BenchmarkRelay):
+    def __init__(self):
+        self.activated_at = None
+
+    def trigger(self, source, idempotency_key=None, *, pre_activation_inhibit=None):
+        result = super().trigger(
+            source, idempotency_key, pre_activation_inhibit=pre_activation_inhibit,
+        )
+        if result.activated:
+            self.activated_at = time.perf_counter()
+        return result
+
+
+class _SimulatedRecognizer:
+    """Answer each frame after a scripted delay; abandoned requests run to completion."""
+
+    def __init__(self):
+        self.script = {}
+        self.requests = 0
+        self._active = 0
+        self._idle = Condition()
+
+    def recognise(self, path, timeout=None):
+        with self._idle:
+            self.requests += 1
+            self._active += 1
+        try:
+            latency, observation = self.script[Path(path).name]
+            time.sleep(latency)
+            return observation
+        finally:
+            with self._idle:
+                self._active -= 1
+                self._idle.notify_all()
+
+    def abandon_in_flight(self):
+        return False
+
+    def wait_idle(self):
+        with self._idle:
+            self._idle.wait_for(lambda: self._active == 0, timeout=10)
+
+
+_AUTHORISED_PLATE = "12D3456"
+_OCR_SCENARIOS = (
+    ("exact_first", (_AUTHORISED_PLATE, None, None)),
+    ("exact_second", (None, _AUTHORISED_PLATE, None)),
+    ("exact_third", (None, None, _AUTHORISED_PLATE)),
+    ("two_frame_confusion", ("I2D3456", "I2D3456", None)),
+    ("unknown_vehicle", ("99D12345", "99D12345", "99D12345")),
+)
+
+
+def benchmark_ocr(*, bursts: int = 40, latency_ms: float = 150.0, seed: int = 7) -> dict:
+    """Compare burst-to-relay time for sequential and speculative OCR."""
+    plans = []
+    generator = random.Random(seed)
+    for sequence in range(bursts):
+        name, plates = _OCR_SCENARIOS[sequence % len(_OCR_SCENARIOS)]
+        latencies = tuple(
+            latency_ms * generator.uniform(0.6, 1.6) / 1_000 for _plate in plates
+        )
+        plans.append((name, plates, latencies))
+    results = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        frames = _benchmark_frames(Path(scratch), bursts)
+        for concurrency in range(1, MAX_OCR_FRAMES + 1):
+            mode = "sequential" if concurrency == 1 else f"speculative_{concurrency}"
+            recognizer = _SimulatedRecognizer()
+            relay = _RecordingRelay()
+            store = LocalStore(Path(scratch) / f"{mode}.db")
+            processor = GateProcessor(
+                recognizer, store, relay, (_AUTHORISED_PLATE,),
+                cooldown=timedelta(0), max_image_age=timedelta(minutes=5),
+                decision_timeout=4.0, speculative_ocr_frames=concurrency,
+            )
+            to_relay = []
+            to_decision = []
+            for sequence, (_name, plates, latencies) in enumerate(plans):
+                burst = frames[sequence]
+                for path, plate, latency in zip(burst, plates, latencies):
+                    recognizer.script[path.name] = (
+                        latency, PlateObservation(plate, 0.95 if plate else 0.0),
+                    )
+                relay.activated_at = None
+                started = time.perf_counter()
+                result = processor.process(burst)
+                finished = time.perf_counter()
+                to_decision.append((finished - started) * 1_000)
+                if result.opened:
+                    to_relay.append((relay.activated_at - started) * 1_000)
+                recognizer.wait_idle()
+            processor.close()
+            store.close()
+            results[mode] = {
+                "ocr_requests_per_burst": round(recognizer.requests / bursts, 3),
+                "opened": len(to_relay),
+                "burst_to_relay": _latency_summary(to_relay) if to_relay else None,
+                "burst_to_result": _latency_summary(to_decision),
+            }
+    return {
+        "benchmark": "ocr", "bursts": bursts, "latency_ms": latency_ms,
+        "seed": seed, "results": results,
+    }
+
+
+def _benchmark_frames(directory: Path, bursts: int):
+    frames = []
+    for sequence in range(bursts):
+        burst = []
+        for index in range(MAX_OCR_FRAMES):
+            path = directory / f"burst-{sequence:04d}-{index}.jpg"
+            # Distinct exposures keep the frames apart for near-duplicate
+            # suppression; the marker keeps every burst's digests unique.
+            image = Image.new("L", (64, 36), color=40 + index * 80)
+            image.paste(sequence % 256, (0, 0, 8, 8))
+            image.save(path, format="JPEG")
+            burst.append(path)
+        frames.append(tuple(burst))
+    return frames
+
+
+class _ConnectionCounter:
+    def __init__(self):
+        self.count = 0
+        self._original = sqlite3.connect
+
+    def __enter__(self):
+        def counted(*args, **kwargs):
+            self.count += 1
+            return self._original(*args, **kwargs)
+
+        sqlite3.connect = counted
+        return self
+
+    def __exit__(self, *_exc_info):
+        sqlite3.connect = self._original
+
+
+def _simulate_store_burst(store, coordinator, sequence: int, *, allowed: bool) -> None:
+    """Issue the store calls one processed burst makes, in processor order."""
+    key = f"benchmark-{sequence:08d}"
+    now = datetime.now(timezone.utc)
+    store.event_exists(key)
+    event = GateEvent(
+        source="ocr", reason="exact_match" if allowed else "no_match", opened=False,
+        idempotency_key=key, received_at=now, decision_at=now,
+        authorised_plate="ABC123" if allowed else None, observed_plate="ABC123",
+        ocr_confidence=0.95,
+    )
+    outbox_payload = {"event_id": None, "_awaiting_telemetry": True}
+    if allowed:
+        event_id = coordinator.actuate(
+            event, outbox_payload=outbox_payload,
+            pre_activation_inhibit=lambda: None,
+        ).event_id
+    else:
+        event_id = store.record_event_with_outbox(event, outbox_payload)
+    trace = ProcessingTrace()
+    trace.mark_burst()
+    trace.mark_decision("allowed" if allowed else "denied", event.reason)
+    store.attach_event_telemetry(event_id, trace.finish())
+
+
+def synthetic_frame(path: Path, size, *, blur: float, seed: int) -> Path:
+    """Write a camera-like JPEG: sensor noise, a lit plate, and optional blur."""
+    width, height = size
+    generator = random.Random(seed)
+    image = Image.effect_noise(size, 24).convert("RGB")
+    draw = ImageDraw.Draw(image)
+    for _ in range(12):
+        left = generator.randrange(0, width)
+        top = generator.randrange(0, height)
+        draw.rectangle(
+            (left, top, left + width // 8, top + height // 10),
+            fill=tuple(generator.randrange(40, 200) for _channel in range(3)),
+        )
+    plate = (width * 2 // 5, height * 3 // 5, width * 3 // 5, height * 2 // 3)
+    draw.rectangle(plate, fill=(235, 235, 235), outline=(0, 0, 0), width=max(1, width // 400))
+    stroke = max(1, width // 320)
+    for index in range(7):
+        x = plate[0] + (index + 1) * (plate[2] - plate[0]) // 9
+        draw.line((x, plate[1] + stroke * 3, x, plate[3] - stroke * 3), fill=(0, 0, 0), width=stroke)
+    if blur:
+        image = image.filter(ImageFilter.GaussianBlur(blur))
+    image.save(path, format="JPEG", quality=85)
+    return path
+
+
+def _legacy_frame_work(paths) -> None:
+    """Repeat the separate reads and decodes each frame paid before DecodedFrame."""
+
+    def digest(path):
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+    def has_signature(path):
+        with Path(path).open("rb") as source:
+            return source.read(3) == b"\xff\xd8\xff"
+
+    for path in paths:
+        has_signature(path)
+        with Image.open(path) as image:
+            image.verify()
+    digest(paths[0])
+    scored = []
+    for path in paths:
+        has_signature(path)
+        with Image.open(path) as image:
+            image.load()
+            edges = image.convert("L").filter(ImageFilter.FIND_EDGES)
+            scored.append((-ImageStat.Stat(edges).var[0], digest(path), path))
+    ranked = [path for _score, _digest, path in sorted(scored)]
+    for path in ranked:
+        digest(path)
+    for path in ranked[:MAX_OCR_FRAMES]:
+        has_signature(path)
+        with Image.open(path) as image:
+            image.draft("L", images.QUALITY_SIZE)
+            image.load()
+            image.thumbnail(images.QUALITY_SIZE, Image.Resampling.BILINEAR)
+            images._sharpness_proxy(image.convert("L"))
+        Path(path).read_bytes()
+
+
+def _decoded_frame_work(paths) -> None:
+    for path in paths:
+        images.wait_until_readable(path, timeout=0, poll_interval=0)
+    images.content_digest(paths[0])
+    ranked = images.rank_images(paths)
+    candidates = _unique_content_candidates(tuple(ranked))
+    for path, digest in candidates[:MAX_OCR_FRAMES]:
+        images.measure_frame_quality(path, digest=digest)
+        images.frame_bytes(path)
+
+
+def benchmark_frames(*, bursts: int = 5, frames: int = 3,
+                     width: int = 3840, height: int = 2160) -> dict:
+    """Compare CPU per burst for separate decodes and one shared DecodedFrame."""
+    results = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        burst = tuple(
+            synthetic_frame(
+                Path(scratch) / f"frame-{index}.jpg", (width, height),
+                blur=index * 1.5, seed=index,
+            )
+            for index in range(frames)
+        )
+        for mode, work in (
+            ("separate_decodes", _legacy_frame_work),
+            ("decoded_frame", _decoded_frame_work),
+        ):
+            cpu = []
+            wall = []
+            for _ in range(bursts):
+                images._FRAME_CACHE.clear()
+                cpu_started = time.process_time()
+                started = time.perf_counter()
+                work(burst)
+                wall.append((time.perf_counter() - started) * 1_000)
+                cpu.append((time.process_time() - cpu_started) * 1_000)
+            results[mode] = {"cpu": _latency_summary(cpu), "wall": _latency_summary(wall)}
+    images._FRAME_CACHE.clear()
+    return {
+        "benchmark": "frames", "bursts": bursts, "frames": frames,
+        "width": width, "height": height, "results": results,
+    }
+
+
+def benchmark_ranking(*, bursts: int = 3, frames: int = 5,
+                      width: int = 3840, height: int = 2160) -> dict:
+    """Compare draft-scale ranking cost and order with full-resolution ranking."""
+    timings = {scale: {"cpu": [], "wall": []} for scale in images.RANKING_SCALES}
+    matches = dict.fromkeys(images.RANKING_SCALES, 0)
+    with tempfile.TemporaryDirectory() as scratch:
+        for sequence in range(bursts):
+            burst = tuple(
+                synthetic_frame(
+                    Path(scratch) / f"burst-{sequence:04d}-{index}.jpg", (width, height),
+                    blur=(index * 7 % frames) * 0.8, seed=sequence,
+                )
+                for index in range(frames)
+            )
+            orders = {}
+            for scale in images.RANKING_SCALES:
+                images._FRAME_CACHE.clear()
+                cpu_started = time.process_time()
+                started = time.perf_counter()
+                orders[scale] = images.rank_images(burst, ranking_scale=scale)
+                timings[scale]["wall"].append((time.perf_counter() - started) * 1_000)
+                timings[scale]["cpu"].append((time.process_time() - cpu_started) * 1_000)
+            for scale, order in orders.items():
+                matches[scale] += order == orders[1]
+    images._FRAME_CACHE.clear()
+    return {
+        "benchmark": "ranking", "bursts": bursts, "frames": frames,
+        "width": width, "height": height,
+        "results": {
+            f"scale_1_{scale}": {
+                "cpu": _latency_summary(timings[scale]["cpu"]),
+                "wall": _latency_summary(timings[scale]["wall"]),
+                "matches_full_resolution": round(matches[scale] / bursts, 3),
+            }
+            for scale in images.RANKING_SCALES
+        },
+    }
+
+
+def benchmark_ranking_workers(*, sizes=(3, 5, 10), workers: int = 4, bursts: int = 3,
+                              width: int = 3840, height: int = 2160) -> dict:
+    """Compare ranking on one thread with ranking on a shared worker pool."""
+    results = {}
+    with tempfile.TemporaryDirectory() as scratch, ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="GateRanking",
+    ) as executor:
+        for size in sizes:
+            wall = {"sequential": [], "executor": []}
+            matches = 0
+            for sequence in range(bursts):
+                burst = tuple(
+                    synthetic_frame(
+                        Path(scratch) / f"burst-{size}-{sequence:04d}-{index}.jpg",
+                        (width, height), blur=(index * 7 % size) * 0.4, seed=sequence,
+                    )
+                    for index in range(size)
+                )
+                orders = {}
+                for mode, pool in (("sequential", None), ("executor", executor)):
+                    images._FRAME_CACHE.clear()
+                    started = time.perf_counter()
+                    orders[mode] = images.rank_images(burst, executor=pool)
+                    wall[mode].append((time.perf_counter() - started) * 1_000)
+                matches += orders["sequential"] == orders["executor"]
+                for path in burst:
+                    path.unlink()
+            summaries = {mode: _latency_summary(durations) for mode, durations in wall.items()}
+            results[f"frames_{size}"] = {
+                **summaries,
+                "speedup": round(
+                    summaries["sequential"]["median_ms"]
+                    / max(summaries["executor"]["median_ms"], 0.001), 2,
+                ),
+                "orders_match": matches == bursts,
+            }
+    images._FRAME_CACHE.clear()
+    return {
+        "benchmark": "ranking_workers", "workers": workers, "bursts": bursts,
+        "width": width, "height": height, "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+
+
+_COUNTIES = ("C", "CE", "CN", "CW", "D", "DL", "G", "KE", "KK", "KY", "L", "LD",
+             "LH", "LM", "LS", "MH", "MN", "MO", "OY", "RN", "SO", "T", "W", "WH",
+             "WW", "WX")
+
+
+FLUENT_MJPEG_FIXTURE = (
+    REPOSITORY_ROOT / "tests" / "fixtures" / "hot-stream" / "fluent-640x360.mjpeg"
+)
+
+
+class _HeadDeletingJpegStreamParser:
+    """The earlier parser: rescan from the buffer head and copy each frame twice."""
+
+    def __init__(self, max_frame_bytes: int):
+        self._max_frame_bytes = max_frame_bytes
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        self._buffer.extend(chunk)
+        frames = []
+        while self._buffer:
+            start = self._buffer.find(b"\xff\xd8\xff")
+            if start < 0:
+                self._buffer.clear()
+                break
+            if start:
+                del self._buffer[:start]
+            end = self._buffer.find(b"\xff\xd9", 3)
+            if end < 0:
+                if len(self._buffer) > self._max_frame_bytes:
+                    self._buffer.clear()
+                break
+            end += 2
+            frame = bytes(self._buffer[:end])
+            del self._buffer[:end]
+            if len(frame) <= self._max_frame_bytes:
+                frames.append(frame)
+        return frames
+
+
+def benchmark_stream(*, fixture: Path = FLUENT_MJPEG_FIXTURE, passes: int = 50,
+                     chunk_bytes: int = 64 * 1024) -> dict:
+    """Measure MJPEG splitting throughput over a recorded image2pipe stream."""
+    stream = Path(fixture).read_bytes() * passes
+    chunks = [
+        stream[offset:offset + chunk_bytes]
+        for offset in range(0, len(stream), chunk_bytes)
+    ]
+    results = {}
+    outputs = {}
+    for mode, parser_class in (
+        ("head_deletion", _HeadDeletingJpegStreamParser),
+        ("offset_scan", JpegStreamParser),
+    ):
+        parser = parser_class(MAX_HOT_FRAME_BYTES)
+        frames = []
+        cpu_started = time.process_time()
+        for chunk in chunks:
+            frames.extend(parser.feed(chunk))
+        cpu_seconds = max(time.process_time() - cpu_started, 1e-9)
+        outputs[mode] = frames
+        results[mode] = {
+            "frames": len(frames),
+            "mb_per_second": round(len(stream) / cpu_seconds / 1_000_000, 1),
+            "frames_per_second": round(len(frames) / cpu_seconds),
+        }
+    return {
+        "benchmark": "stream", "fixture": Path(fixture).name, "passes": passes,
+        "chunk_bytes": chunk_bytes, "stream_bytes": len(stream),
+        "frames_match": outputs["head_deletion"] == outputs["offset_scan"],
+        "results": results,
+    }
+
+
+class _CreationPollingHandler(CompletedImageHandler):
+    """Reproduce the earlier handler, whose close events kept the creation's retry time."""
+
+    def on_closed(self, event) -> None:
+        self.schedule_candidate(Path(event.src_path), event.is_directory)
+
+    def on_moved(self, event) -> None:
+        self.schedule_candidate(Path(event.dest_path), event.is_directory)
+
+
+class _IngressCollector:
+    def __init__(self):
+        self.completed = {}
+        self._changed = Condition()
+
+    def add(self, path, received_at=None):
+        with self._changed:
+            self.completed.setdefault(Path(path), time.perf_counter())
+            self._changed.notify_all()
+        return True
+
+    def wait_for(self, path: Path, timeout: float = 5.0):
+        with self._changed:
+            self._changed.wait_for(lambda: path in self.completed, timeout=timeout)
+            return self.completed.get(path)
+
+
+def _measure_ingress(directory: Path, frame: bytes, *, mode: str, uploads: int,
+                     chunks: int, chunk_interval: float) -> dict:
+    collector = _IngressCollector()
+    wake = Event()
+    stop = Event()
+    if mode == "creation_polling":
+        handler = _CreationPollingHandler(collector)
+    else:
+        handler = CompletedImageHandler(
+            collector, on_scheduled=wake.set, close_events=True,
+        )
+
+    def loop():
+        while not stop.is_set():
+            handler.retry_pending()
+            if mode == "creation_polling":
+                time.sleep(0.05)
+            else:
+                _wait_for_work(wake, _next_wait(1.0, handler.next_due()))
+
+    observer = Observer()
+    observer.schedule(
+        handler, str(directory), recursive=True,
+        event_filter=None if mode == "creation_polling" else _UPLOAD_EVENTS,
+    )
+    observer.start()
+    worker = Thread(target=loop, daemon=True)
+    worker.start()
+    durations = []
+    try:
+        step = -(-len(frame) // chunks)
+        for sequence in range(uploads):
+            path = directory / f"{mode}-{sequence:04d}.jpg"
+            with path.open("wb") as upload:
+                for offset in range(0, len(frame), step):
+                    upload.write(frame[offset:offset + step])
+                    upload.flush()
+                    time.sleep(chunk_interval)
+            closed_at = time.perf_counter()
+            completed_at = collector.wait_for(path)
+            if completed_at is not None:
+                durations.append((completed_at - closed_at) * 1_000)
+    finally:
+        stop.set()
+        wake.set()
+        worker.join(timeout=2)
+        observer.stop()
+        observer.join()
+    return {
+        "completed": len(durations),
+        **(_latency_summary(durations) if durations else {}),
+    }
+
+
+def benchmark_ingress(*, uploads: int = 20, chunks: int = 4,
+                      chunk_interval_ms: float = 20.0,
+                      directory: Path | None = None) -> dict:
+    """Measure milliseconds from an upload's close() to the burst collector."""
+    output = BytesIO()
+    Image.effect_noise((640, 360), 48).convert("RGB").save(output, format="JPEG")
+    frame = output.getvalue()
+    results = {}
+    with tempfile.TemporaryDirectory(dir=directory) as scratch:
+        for mode in ("creation_polling", "close_write"):
+            mode_directory = Path(scratch) / mode
+            mode_directory.mkdir()
+            results[mode] = _measure_ingress(
+                mode_directory, frame, mode=mode, uploads=uploads, chunks=chunks,
+                chunk_interval=chunk_interval_ms / 1_000,
+            )
+    return {
+        "benchmark": "ingress", "uploads": uploads, "chunks": chunks,
+        "chunk_interval_ms": chunk_interval_ms, "frame_bytes": len(frame),
+        "results": results,
+    }
+
+
+def _exported_frame(frame: dict, cached: set) -> FrameTelemetry | None:
+    """Rebuild an exported frame's quality; ``None`` keeps it, as the processor would."""
+    status = str(frame.get("status") or "ok")
+    if frame.get("sequence") in cached or status.startswith("skipped_"):
+        return None
+    try:
+        return FrameTelemetry(
+            sequence=int(frame["sequence"]), digest=frame.get("digest", ""),
+            width=frame.get("width", 1), height=frame.get("height", 1),
+            sharpness=float(frame["sharpness"]), brightness=float(frame["brightness"]),
+            darkness=float(frame["darkness"]),
+            highlight_clipping=float(frame["highlight_clipping"]), status=status,
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _replay_event(row: dict, gate: images.OcrQualityGate) -> tuple[int, float, int, bool]:
+    telemetry = row.get("telemetry") or {}
+    attempts = [
+        attempt for attempt in telemetry.get("ocr_attempts", [])
+        if isinstance(attempt.get("frame_sequence"), int)
+    ]
+    cached = {
+        attempt["frame_sequence"] for attempt in attempts if attempt.get("status") == "cached"
+    }
+    frames = sorted(
+        (frame for frame in telemetry.get("frames", [])
+         if isinstance(frame.get("sequence"), int)),
+        key=lambda frame: frame["sequence"],
+    )
+    _kept, skipped = gate.partition(
+        frames, lambda frame: _exported_frame(frame, cached), limit=MAX_OCR_FRAMES,
+    )
+    skipped = {frame["sequence"] for frame, _quality in skipped}
+    saved = [
+        attempt for attempt in attempts
+        if attempt["frame_sequence"] in skipped and attempt.get("status") != "cached"
+    ]
+    changed = False
+    if telemetry.get("decision", {}).get("outcome") == "allowed" and row.get("authorised_plate"):
+        remaining = [
+            PlateObservation(attempt["plate"], float(attempt.get("confidence") or 0.0))
+            for attempt in attempts
+            if attempt["frame_sequence"] not in skipped and attempt.get("plate")
+        ]
+        changed = not decide_access(
+            remaining, plate_index((row["authorised_plate"],)),
+        ).allowed
+    return (
+        len(saved), sum(float(attempt.get("duration_ms") or 0) for attempt in saved),
+        len(skipped), changed,
+    )
+
+
+def replay_quality_gate(*, telemetry: Path, min_sharpness=(0.0, 0.01, 0.02, 0.04),
+                        max_darkness=(1.0,), max_highlight_clipping=(1.0,)) -> dict:
+    """Replay exported telemetry through candidate OCR quality gate limits.
+
+    A frame the gate would skip saves its recorded OCR request. An allowed
+    event whose remaining observations no longer match its authorised plate
+    is a changed decision. Frames beyond the recorded OCR ceiling were never
+    measured, so the replay cannot credit the gate for promoting them.
+    """
+    rows = [
+        row for row in json.loads(Path(telemetry).read_text(encoding="utf-8"))
+        if isinstance(row, dict) and isinstance(row.get("telemetry"), dict)
+    ]
+    requests = sum(
+        1 for row in rows for attempt in row["telemetry"].get("ocr_attempts", [])
+        if attempt.get("status") != "cached"
+    )
+    results = []
+    for sharpness, darkness, clipping in itertools.product(
+        min_sharpness, max_darkness, max_highlight_clipping,
+    ):
+        gate = images.OcrQualityGate(
+            min_sharpness=sharpness, max_darkness=darkness,
+            max_highlight_clipping=clipping,
+        )
+        replayed = [_replay_event(row, gate) for row in rows]
+        results.append({
+            "min_sharpness": sharpness,
+            "max_darkness": darkness,
+            "max_highlight_clipping": clipping,
+            "frames_skipped": sum(event[2] for event in replayed),
+            "ocr_requests_saved": sum(event[0] for event in replayed),
+            "ocr_ms_saved": round(sum(event[1] for event in replayed), 3),
+            "decisions_changed": sum(1 for event in replayed if event[3]),
+        })
+    return {
+        "benchmark": "quality_gate", "events": len(rows), "ocr_requests": requests,
+        "allowed_events": sum(
+            1 for row in rows
+            if row["telemetry"].get("decision", {}).get("outcome") == "allowed"
+        ),
+        "results": results,
+    }
+
+
+def _synthetic_plates(count: int, generator: random.Random) -> list[str]:
+    plates = set()
+    while len(plates) < count:
+        plates.add(
+            f"{generator.randrange(87, 125) % 100:02d}{generator.choice(_COUNTIES)}"
+            f"{generator.randrange(1, 100_000)}"
+        )
+    return sorted(plates)
+
+
+def _confused_plate(plate: str, generator: random.Random) -> str:
+    swaps = {"0": "O", "1": "I", "2": "Z", "5": "S", "8": "B"}
+    positions = [index for index, character in enumerate(plate) if character in swaps]
+    if not positions:
+        return plate
+    index = generator.choice(positions)
+    return plate[:index] + swaps[plate[index]] + plate[index + 1:]
+
+
+def _linear_scan_decision(observations, authorised) -> MatchDecision:
+    """Repeat the per-call normalisation and full confusion scan of earlier releases."""
+    authorised_plates = {normalise_plate(plate) for plate in authorised}
+    authorised_plates.discard("")
+    normalised = [
+        (normalise_plate(observation.plate), observation)
+        for observation in observations if observation.plate
+    ]
+    for observed, observation in normalised:
+        if observed in authorised_plates and observation.confidence >= MIN_EXACT_CONFIDENCE:
+            return MatchDecision(True, "exact_match", observed, observed,
+                                 observation.confidence)
+    candidates = {}
+    confidences = {}
+    for observed, observation in normalised:
+        if observation.confidence < MIN_FUZZY_CONFIDENCE:
+            continue
+        candidates.setdefault(observed, set()).update(
+            plate for plate in authorised_plates if _is_one_known_confusion(observed, plate)
+        )
+        confidences[observed] = max(confidences.get(observed, 0.0), observation.confidence)
+    for observed, matched in candidates.items():
+        frames = sum(
+            1 for plate, observation in normalised
+            if plate == observed and observation.confidence >= MIN_FUZZY_CONFIDENCE
+        )
+        if frames < 2 or not matched:
+            continue
+        if len(matched) == 1:
+            return MatchDecision(True, "two_frame_ocr_confusion", next(iter(matched)),
+                                 observed, confidences[observed])
+        return MatchDecision(False, "ambiguous_fuzzy_match", None, observed,
+                             confidences[observed])
+    return MatchDecision(False, "no_match")
+
+
+def benchmark_matching(*, plates: int = 10_000, decisions: int = 500,
+                       seed: int = 11) -> dict:
+    """Compare per-decision cost of a full confusion scan and a PlateIndex."""
+    generator = random.Random(seed)
+    authorised = tuple(_synthetic_plates(plates, generator))
+    unknown = _synthetic_plates(plates + decisions, random.Random(seed + 1))
+    bursts = []
+    for sequence in range(decisions):
+        plate = generator.choice(authorised)
+        observed = (plate, _confused_plate(plate, generator), unknown[sequence])[sequence % 3]
+        bursts.append((
+            PlateObservation(unknown[-sequence - 1], 0.95),
+            PlateObservation(observed, 0.96),
+            PlateObservation(observed, 0.97),
+        ))
+
+    build_started = time.perf_counter()
+    index = PlateIndex(authorised)
+    build_ms = (time.perf_counter() - build_started) * 1_000
+    results = {}
+    outcomes = {}
+    for mode, decide, snapshot in (
+        ("linear_scan", _linear_scan_decision, authorised),
+        ("plate_index", decide_access, index),
+    ):
+        durations = []
+        outcomes[mode] = []
+        for observations in bursts:
+            started = time.perf_counter()
+            outcomes[mode].append(decide(observations, snapshot))
+            durations.append((time.perf_counter() - started) * 1_000)
+        results[mode] = _latency_summary(durations)
+    results["plate_index"]["build_ms"] = round(build_ms, 3)
+    return {
+        "benchmark": "matching", "plates": plates, "decisions": decisions,
+        "seed": seed,
+        "decisions_match": outcomes["linear_scan"] == outcomes["plate_index"],
+        "results": results,
+    }
+
+
+class _FakeIngestHandler(BaseHTTPRequestHandler):
+    """Acknowledge single and batched event posts after a fixed round trip."""
+
+    round_trip_seconds = 0.0
+    requests = 0
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", "0")))
+        time.sleep(self.round_trip_seconds)
+        type(self).requests += 1
+        if self.path.endswith("/batch"):
+            message = BytesParser(policy=email_policy).parsebytes(
+                f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode()
+                + body
+            )
+            events = next(
+                json.loads(part.get_content())["events"]
+                for part in message.iter_parts()
+                if part.get_param("name", header="content-disposition") == "events"
+            )
+            reply = {"results": [
+                {"eventId": event["event_id"], "inserted": True} for event in events
+            ]}
+        else:
+            reply = {"eventId": json.loads(body)["event_id"], "inserted": True}
+        encoded = json.dumps(reply).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _drain_outbox(directory: Path, backlog: int, batch_size: int, url: str) -> dict:
+    """Drain a backlog through ``run_forever`` at the shipped poll interval."""
+    store = LocalStore(directory / "gate.db")
+    spool = EvidenceSpool(directory / "event-evidence")
+    source = synthetic_frame(directory / "evidence.jpg", (640, 360), blur=0, seed=backlog)
+    worker = OutboxWorker(
+        store, HttpOutboxSender(url, controller_id="benchmark"),
+        evidence_spool=spool, controller_id="benchmark", batch_size=batch_size,
+    )
+    for sequence in range(backlog):
+        event_id = store.record_event(GateEvent(
+            source="ocr", reason="exact_match", opened=True,
+            idempotency_key=f"outbox-{sequence}",
+            received_at=datetime.now(timezone.utc),
+        ))
+        store.queue_outbox(event_id, worker.prepare_payload(
+            source if sequence % 2 == 0 else None
+        ))
+    _FakeIngestHandler.requests = 0
+    stop = Event()
+    draining = Thread(target=worker.run_forever, args=(stop,), daemon=True)
+    started = time.perf_counter()
+    draining.start()
+    try:
+        while store.pending_outbox_count():
+            if time.perf_counter() - started > 600:
+                raise RuntimeError("the loopback receiver did not acknowledge the backlog")
+            time.sleep(0.005)
+        elapsed = time.perf_counter() - started
+    finally:
+        stop.set()
+        draining.join(5)
+    store.close()
+    return {
+        "requests": _FakeIngestHandler.requests,
+        "drain_seconds": round(elapsed, 3),
+        "events_per_second": round(backlog / elapsed, 1),
+    }
+
+
+def benchmark_outbox(*, backlogs=(20, 100, 400), batch_size: int = 25,
+                     round_trip_ms: float = 40.0) -> dict:
+    """Drain queued events into a loopback receiver one-by-one and in batches."""
+    _FakeIngestHandler.round_trip_seconds = round_trip_ms / 1_000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeIngestHandler)
+    serving = Thread(target=server.serve_forever, daemon=True)
+    serving.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/controller/events"
+    results = {}
+    try:
+        with tempfile.TemporaryDirectory() as scratch:
+            for backlog in backlogs:
+                results[str(backlog)] = {}
+                for mode, size in (("per_event", 1), ("batched", batch_size)):
+                    directory = Path(scratch) / f"{backlog}-{mode}"
+                    directory.mkdir()
+                    results[str(backlog)][mode] = _drain_outbox(
+                        directory, backlog, size, url,
+                    )
+    finally:
+        server.shutdown()
+        server.server_close()
+    return {
+        "benchmark": "outbox", "batch_size": batch_size,
+        "round_trip_ms": round_trip_ms, "results": results,
+    }
+
+
+def benchmark_store(*, bursts: int = 200, directory: Path | None = None) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory(dir=directory) as scratch:
+        for mode, store_class in (
+            ("per_call_connection", PerCallConnectionStore),
+            ("pooled_wal", LocalStore),
+        ):
+            durations = []
+            with _ConnectionCounter() as connections:
+                store = store_class(Path(scratch) / f"{mode}.db")
+                coordinator = ActuationCoordinator(
+                    store, _BenchmarkRelay(), timedelta(0), boot_id="benchmark",
+                )
+                for sequence in range(bursts):
+                    started = time.perf_counter()
+                    _simulate_store_burst(
+                        store, coordinator, sequence, allowed=sequence % 2 == 0,
+                    )
+                    durations.append((time.perf_counter() - started) * 1_000)
+            store.close()
+            results[mode] = {
+                "connections_per_burst": round(connections.count / bursts, 3),
+                **_latency_summary(durations),
+            }
+    return {"benchmark": "store", "bursts": bursts, "results": results}
+
+
+def _latency_summary(durations_ms) -> dict:
+    ordered = sorted(durations_ms)
+    p95_index = max(0, min(len(ordered) - 1, round(0.95 * len(ordered)) - 1))
+    return {
+        "median_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[p95_index], 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+    }
+
+
+def parse_args(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path)
+    subcommands = parser.add_subparsers(dest="benchmark", required=True)
+    store = subcommands.add_parser(
+        "store", help="connections and milliseconds per burst of SQLite work",
+    )
+    store.add_argument("--bursts", type=_positive_integer, default=200)
+    store.add_argument(
+        "--directory", type=Path,
+        help="scratch parent directory; use the Pi state filesystem for SD-card numbers",
+    )
+    store.set_defaults(run=lambda args: benchmark_store(
+        bursts=args.bursts, directory=args.directory,
+    ))
+    ocr = subcommands.add_parser(
+        "ocr", help="burst-to-relay milliseconds for sequential and speculative OCR",
+    )
+    ocr.add_argument("--bursts", type=_positive_integer, default=40)
+    ocr.add_argument(
+        "--latency-ms", type=_positive_float, default=150.0,
+        help="median simulated Plate Recognizer round trip",
+    )
+    ocr.add_argument("--seed", type=int, default=7)
+    ocr.set_defaults(run=lambda args: benchmark_ocr(
+        bursts=args.bursts, latency_ms=args.latency_ms, seed=args.seed,
+    ))
+    frames = subcommands.add_parser(
+        "frames", help="CPU milliseconds per burst of frame reads and decodes",
+    )
+    frames.add_argument("--bursts", type=_positive_integer, default=5)
+    frames.add_argument("--frames", type=_positive_integer, default=3)
+    frames.add_argument("--width", type=_positive_integer, default=3840)
+    frames.add_argument("--height", type=_positive_integer, default=2160)
+    frames.set_defaults(run=lambda args: benchmark_frames(
+        bursts=args.bursts, frames=args.frames, width=args.width, height=args.height,
+    ))
+    ranking = subcommands.add_parser(
+        "ranking", help="CPU milliseconds and order agreement for each ranking scale",
+    )
+    ranking.add_argument("--bursts", type=_positive_integer, default=3)
+    ranking.add_argument("--frames", type=_positive_integer, default=5)
+    ranking.add_argument("--width", type=_positive_integer, default=3840)
+    ranking.add_argument("--height", type=_positive_integer, default=2160)
+    ranking.set_defaults(run=lambda args: benchmark_ranking(
+        bursts=args.bursts, frames=args.frames, width=args.width, height=args.height,
+    ))
+    ranking_workers = subcommands.add_parser(
+        "ranking-workers",
+        help="wall milliseconds ranking bursts of each size on one thread and on a pool",
+    )
+    ranking_workers.add_argument(
+        "--size", type=_positive_integer, action="append", dest="sizes",
+        help="frames per burst; repeat for several sizes (default 3, 5, 10)",
+    )
+    ranking_workers.add_argument("--workers", type=_positive_integer, default=4)
+    ranking_workers.add_argument("--bursts", type=_positive_integer, default=3)
+    ranking_workers.add_argument("--width", type=_positive_integer, default=3840)
+    ranking_workers.add_argument("--height", type=_positive_integer, default=2160)
+    ranking_workers.set_defaults(run=lambda args: benchmark_ranking_workers(
+        sizes=tuple(args.sizes or (3, 5, 10)), workers=args.workers,
+        bursts=args.bursts, width=args.width, height=args.height,
+    ))
+    stream = subcommands.add_parser(
+        "stream", help="MB/s splitting a recorded MJPEG stream into frames",
+    )
+    stream.add_argument("--fixture", type=Path, default=FLUENT_MJPEG_FIXTURE)
+    stream.add_argument("--passes", type=_positive_integer, default=50)
+    stream.add_argument("--chunk-bytes", type=_positive_integer, default=64 * 1024)
+    stream.set_defaults(run=lambda args: benchmark_stream(
+        fixture=args.fixture, passes=args.passes, chunk_bytes=args.chunk_bytes,
+    ))
+    ingress = subcommands.add_parser(
+        "ingress", help="milliseconds from an upload's close to the burst collector",
+    )
+    ingress.add_argument("--uploads", type=_positive_integer, default=20)
+    ingress.add_argument("--chunks", type=_positive_integer, default=4)
+    ingress.add_argument(
+        "--chunk-interval-ms", type=_positive_float, default=20.0,
+        help="pause between upload writes, as a slow FTP transfer would",
+    )
+    ingress.add_argument(
+        "--directory", type=Path,
+        help="scratch parent directory; use the upload filesystem for Pi numbers",
+    )
+    ingress.set_defaults(run=lambda args: benchmark_ingress(
+        uploads=args.uploads, chunks=args.chunks,
+        chunk_interval_ms=args.chunk_interval_ms, directory=args.directory,
+    ))
+    quality_gate = subcommands.add_parser(
+        "quality-gate",
+        help="OCR requests saved and decisions changed by pre-OCR quality limits",
+    )
+    quality_gate.add_argument(
+        "--telemetry", type=Path, required=True,
+        help="JSON from python -m gate_controller telemetry-export --format json",
+    )
+    quality_gate.add_argument(
+        "--min-sharpness", type=_unit_interval, action="append",
+        help="candidate GATE_OCR_MIN_SHARPNESS; repeat to sweep (default 0, 0.01, 0.02, 0.04)",
+    )
+    quality_gate.add_argument(
+        "--max-darkness", type=_unit_interval, action="append",
+        help="candidate GATE_OCR_MAX_DARKNESS; repeat to sweep (default 1)",
+    )
+    quality_gate.add_argument(
+        "--max-highlight-clipping", type=_unit_interval, action="append",
+        help="candidate GATE_OCR_MAX_HIGHLIGHT_CLIPPING; repeat to sweep (default 1)",
+    )
+    quality_gate.set_defaults(run=lambda args: replay_quality_gate(
+        telemetry=args.telemetry,
+        min_sharpness=tuple(args.min_sharpness or (0.0, 0.01, 0.02, 0.04)),
+        max_darkness=tuple(args.max_darkness or (1.0,)),
+        max_highlight_clipping=tuple(args.max_highlight_clipping or (1.0,)),
+    ))
+    matching = subcommands.add_parser(
+        "matching", help="milliseconds per access decision against a large plate list",
+    )
+    matching.add_argument("--plates", type=_positive_integer, default=10_000)
+    matching.add_argument("--decisions", type=_positive_integer, default=500)
+    matching.add_argument("--seed", type=int, default=11)
+    matching.set_defaults(run=lambda args: benchmark_matching(
+        plates=args.plates, decisions=args.decisions, seed=args.seed,
+    ))
+    outbox = subcommands.add_parser(
+        "outbox", help="events per second draining a backlog to a loopback receiver",
+    )
+    outbox.add_argument(
+        "--backlog", type=_positive_integer, action="append", dest="backlogs",
+        help="queued events to drain; repeat for several sizes (default 20, 100, 400)",
+    )
+    outbox.add_argument(
+        "--batch-size", type=_batch_size, default=MAX_OUTBOX_BATCH_SIZE,
+    )
+    outbox.add_argument(
+        "--round-trip-ms", type=_positive_float, default=40.0,
+        help="simulated receiver round trip per request",
+    )
+    outbox.set_defaults(run=lambda args: benchmark_outbox(
+        backlogs=tuple(args.backlogs or (20, 100, 400)),
+        batch_size=args.batch_size, round_trip_ms=args.round_trip_ms,
+    ))
+    return parser.parse_args(arguments)
+
+
+def _batch_size(value: str) -> int:
+    parsed = _positive_integer(value)
+    if parsed > MAX_OUTBOX_BATCH_SIZE:
+        raise argparse.ArgumentTypeError(
+            f"must be at most {MAX_OUTBOX_BATCH_SIZE}"
+        )
+    return parsed
+
+
+def _positive_integer(value: str) -> int:
+    try:
+        parsed = int(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError("must be a positive integer") from error
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return parsed
+
+
+def _positive_float(value: str) -> float:
+    try:
+        parsed = float(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError("must be a positive number") from error
+    if not parsed > 0 or parsed == float("inf"):
+        raise argparse.ArgumentTypeError("must be a positive number")
+    return parsed
+
+
+def _unit_interval(value: str) -> float:
+    try:
+        parsed = float(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError("must be a number from 0 to 1") from error
+    if not 0 <= parsed <= 1:
+        raise argparse.ArgumentTypeError("must be a number from 0 to 1")
+    return parsed
+
+
+def write_json(output, summary):
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=output.parent, prefix=f".{output.name}.", delete=False
+    ) as temporary:
+        json.dump(summary, temporary, indent=2, sort_keys=True)
+        temporary.write("\n")
+        temporary_path = Path(temporary.name)
+    os.replace(temporary_path, output)
+
+
+def main(arguments=None):
+    args = parse_args(arguments)
+    summary = args.run(args)
+    if args.output is None:
+        print(json.dumps(summary, indent=2, sort_keys=True))
+    else:
+        write_json(args.output, summary)
+    return summary
+
+
+if __name__ == "__main__":
+    main()
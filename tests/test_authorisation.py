@@ -11,18 +11,23 @@ from gate_controller.authorisation import (
     CloudflarePlateFetcher, MAX_NORMALISED_PLATE_LENGTH, MAX_PLATE_ROWS,
     MAX_PLATE_SNAPSHOT_BYTES,
 )
+from gate_controller.cloudflare_client import NOT_MODIFIED
+from gate_controller.matching import PlateIndex
 
 
 class FakeClient:
-    def __init__(self, *, json_response=None):
+    def __init__(self, *, json_response=None, etag=None):
         self.json_response = json_response
+        self.etag = etag
         self.requests = []
 
-    def get_json(self, path, *, max_response_bytes=None):
+    def get_json_if_changed(self, path, etag, *, max_response_bytes=None):
         self.requests.append(type("Request", (), {
-            "path": path, "max_response_bytes": max_response_bytes,
+            "path": path, "max_response_bytes": max_response_bytes, "etag": etag,
         })())
-        return self.json_response
+        if etag is not None and etag == self.etag:
+            return NOT_MODIFIED, etag
+        return self.json_response, self.etag
 
 
 class AuthorisedPlateCacheTests(unittest.TestCase):
@@ -103,6 +108,72 @@ class AuthorisedPlateCacheTests(unittest.TestCase):
 
         self.assertEqual(fsynced_directory, [False, True])
 
+    def test_unchanged_replacement_refreshes_freshness_without_rewriting(self):
+        now = [datetime(2026, 8, 14, 10, 0, tzinfo=timezone.utc)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "plates.csv"
+            path.write_text("plate,name\n12D 3456,Ada\n", encoding="utf-8")
+            cache = AuthorisedPlateCache(path, clock=lambda: now[0])
+            now[0] += timedelta(minutes=1)
+
+            with patch("gate_controller.authorisation.os.fsync") as fsync:
+                changed = cache.replace(("12d3456",))
+
+            self.assertFalse(changed)
+            fsync.assert_not_called()
+            self.assertEqual(path.read_text(encoding="utf-8"), "plate,name\n12D 3456,Ada\n")
+            self.assertEqual(cache.status()["refreshed_at"], now[0].isoformat())
+            self.assertTrue(cache.replace(("12E3456",)))
+
+    def test_not_modified_refresh_only_updates_freshness(self):
+        now = [datetime(2026, 8, 14, 10, 0, tzinfo=timezone.utc)]
+        client = FakeClient(
+            json_response={"controller_id": "primary", "plates": [{"plate": "12D3456"}]},
+            etag='"v1"',
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "plates.csv"
+            path.write_text("plate\n12A3456\n", encoding="utf-8")
+            cache = AuthorisedPlateCache(path, clock=lambda: now[0])
+            worker = AuthorisationRefreshWorker(cache, CloudflarePlateFetcher(client, "primary"))
+
+            self.assertTrue(worker.run_once())
+            written = path.stat().st_mtime_ns
+            now[0] += timedelta(minutes=1)
+            with patch.object(cache, "replace") as replace:
+                self.assertTrue(worker.run_once())
+
+            replace.assert_not_called()
+            self.assertEqual([request.etag for request in client.requests], [None, '"v1"'])
+            self.assertEqual(path.stat().st_mtime_ns, written)
+            self.assertEqual(cache.get(), ("12D3456",))
+            self.assertEqual(cache.status()["refreshed_at"], now[0].isoformat())
+
+    def test_local_snapshot_changes_or_failures_force_a_full_fetch(self):
+        client = FakeClient(
+            json_response={"controller_id": "primary", "plates": [{"plate": "12D3456"}]},
+            etag='"v1"',
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "plates.csv"
+            path.write_text("plate\n12A3456\n", encoding="utf-8")
+            cache = AuthorisedPlateCache(path)
+            worker = AuthorisationRefreshWorker(cache, CloudflarePlateFetcher(client, "primary"))
+
+            worker.run_once()
+            path.write_text("plate\n12B3456\n", encoding="utf-8")
+            cache.reload_local()
+            worker.run_once()
+            with patch.object(cache, "replace", side_effect=OSError("disk full")):
+                client.etag = '"v2"'
+                self.assertFalse(worker.run_once())
+            self.assertTrue(worker.run_once())
+
+        self.assertEqual(
+            [request.etag for request in client.requests], [None, None, '"v1"', None],
+        )
+        self.assertEqual(cache.get(), ("12D3456",))
+
     def test_keeps_last_known_good_plates_until_a_complete_refresh_arrives(self):
         with tempfile.TemporaryDirectory() as directory:
             path = Path(directory) / "plates.csv"
@@ -117,6 +188,65 @@ class AuthorisedPlateCacheTests(unittest.TestCase):
             cache.reload_local()
             self.assertEqual(cache.get(), ("12E3456",))
 
+    def test_match_index_is_compiled_once_per_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "plates.csv"
+            path.write_text("plate,name\n12D 3456,Ada\n", encoding="utf-8")
+            cache = AuthorisedPlateCache(path)
+
+            first = cache.index()
+            self.assertIs(cache.index(), first)
+            self.assertIn("12D3456", first)
+            cache.replace(["12E3456"])
+            replaced = cache.index()
+            path.write_text("plate,name\n12F3456,Cy\n", encoding="utf-8")
+            cache.reload_local()
+
+            self.assertIsNot(replaced, first)
+            self.assertEqual(list(replaced), ["12E3456"])
+            self.assertEqual(list(cache.index()), ["12F3456"])
+
+    def test_generation_advances_only_when_the_plate_set_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "plates.csv"
+            path.write_text("plate,name\n12D3456,Ada\n", encoding="utf-8")
+            cache = AuthorisedPlateCache(path)
+            first = cache.index()
+
+            path.write_text("plate,name,note\n12d 3456,Ada,renamed\n", encoding="utf-8")
+            cache.reload_local()
+            unchanged = cache.index()
+            cache.replace(["12E3456"])
+            changed = cache.index()
+
+        self.assertEqual(first.generation, 1)
+        self.assertIs(unchanged, first)
+        self.assertEqual(changed.generation, 2)
+        self.assertEqual(changed.plates, frozenset({"12E3456"}))
+        self.assertFalse(changed.same_snapshot(first))
+        self.assertEqual(cache.status()["generation"], 2)
+
+    def test_index_is_compiled_without_holding_the_snapshot_lock(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "plates.csv"
+            path.write_text("plate,name\n12D3456,Ada\n", encoding="utf-8")
+            cache = AuthorisedPlateCache(path)
+            held = []
+
+            def compile_index(plates):
+                held.append(cache._lock.locked())
+                return PlateIndex(plates)
+
+            with patch("gate_controller.authorisation.PlateIndex", side_effect=compile_index):
+                cache.replace(["12E3456"])
+                path.write_text("plate,name\n12F3456,Cy\n", encoding="utf-8")
+                cache.reload_local()
+
+        self.assertEqual([False, False], held)
+        self.assertEqual(3, cache.index().generation)
+        with self.assertRaises(AttributeError):
+            cache.index().generation = 4
+
     def test_background_refresh_applies_additions_and_revocations_atomically(self):
         responses = iter([
             [{"plate": "12D3456"}],
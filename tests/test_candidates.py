@@ -0,0 +1,68 @@
+import unittest
+from pathlib import Path
+from threading import Thread
+from time import monotonic
+
+from gate_controller.candidates import CandidateStream
+
+
+SCORES = {"first.jpg": 0.1, "blurred.jpg": 0.2, "sharp.jpg": 0.9}
+
+
+def score(path):
+    return SCORES.get(path.name)
+
+
+class CandidateStreamTests(unittest.TestCase):
+    def test_first_arrival_is_taken_first_then_the_sharpest(self):
+        stream = CandidateStream(max_candidates=4, score=score)
+        for name in ("first.jpg", "blurred.jpg", "sharp.jpg"):
+            self.assertTrue(stream.add(Path(name)))
+
+        self.assertEqual(
+            (Path("first.jpg"), Path("sharp.jpg"), Path("blurred.jpg")),
+            stream.take_available(),
+        )
+        self.assertIsNone(stream.take(0))
+        self.assertEqual(
+            [Path("first.jpg"), Path("blurred.jpg"), Path("sharp.jpg")], list(stream),
+        )
+
+    def test_take_waits_for_a_later_upload_until_the_stream_closes(self):
+        stream = CandidateStream(max_candidates=4, score=score)
+        stream.add(Path("first.jpg"))
+        stream.take_available()
+        arriving = Thread(target=stream.add, args=(Path("sharp.jpg"),))
+
+        arriving.start()
+        taken = stream.take(1)
+        arriving.join(timeout=1)
+        stream.close()
+        started = monotonic()
+
+        self.assertEqual(Path("sharp.jpg"), taken)
+        self.assertIsNone(stream.take(1))
+        self.assertLess(monotonic() - started, 0.5)
+
+    def test_undecodable_duplicate_and_excess_uploads_are_refused(self):
+        stream = CandidateStream(max_candidates=2, score=score)
+
+        self.assertFalse(stream.add(Path("corrupt.jpg")))
+        self.assertTrue(stream.add(Path("first.jpg")))
+        self.assertFalse(stream.add(Path("first.jpg")))
+        self.assertTrue(stream.add(Path("sharp.jpg")))
+        self.assertFalse(stream.add(Path("blurred.jpg")))
+        self.assertEqual(0, stream.remaining_capacity)
+
+    def test_finished_stream_refuses_uploads_and_returns_those_accepted(self):
+        stream = CandidateStream(max_candidates=4, score=score)
+        stream.add(Path("first.jpg"))
+        stream.take_available()
+
+        self.assertEqual((Path("first.jpg"),), stream.finish())
+        self.assertFalse(stream.add(Path("sharp.jpg")))
+        self.assertIsNone(stream.take(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
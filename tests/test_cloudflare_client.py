@@ -5,13 +5,14 @@ from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import requests
 
-from gate_controller.cloudflare_client import CloudflareServiceClient
+from gate_controller.cloudflare_client import NOT_MODIFIED, CloudflareServiceClient
 
 
 class RecordingResponse:
     def __init__(self, payload=None, status_error=None, json_error=None, status_code=200,
-                 content=None):
+                 content=None, headers=None):
         self.payload = payload
+        self.headers = headers or {}
         self.status_error = status_error
         self.json_error = json_error
         self.status_code = status_code
@@ -54,6 +55,7 @@ class Request:
         self.headers = kwargs["headers"]
         self.timeout = kwargs["timeout"]
         self.json = kwargs.get("json")
+        self.files = kwargs.get("files")
         self.allow_redirects = kwargs["allow_redirects"]
         self.stream = kwargs.get("stream", False)
 
@@ -100,6 +102,37 @@ class CloudflareServiceClientTests(unittest.TestCase):
                 with self.assertRaisesRegex(requests.HTTPError, "redirect"):
                     client.get_json("/api/controller/plates")
 
+    def test_conditional_get_revalidates_with_the_previous_entity_tag(self):
+        session = RecordingSession(RecordingResponse(status_code=304, content=b""))
+        client = CloudflareServiceClient(
+            "https://gate.example.com", "id", "secret", session=session,
+        )
+
+        payload, etag = client.get_json_if_changed(
+            "/api/controller/plates", '"v7"', max_response_bytes=64,
+        )
+
+        self.assertIs(payload, NOT_MODIFIED)
+        self.assertEqual(etag, '"v7"')
+        self.assertEqual(session.requests[0].headers["If-None-Match"], '"v7"')
+        self.assertEqual(session.requests[0].headers["CF-Access-Client-Id"], "id")
+
+    def test_conditional_get_returns_the_new_snapshot_and_a_well_formed_validator(self):
+        for header, expected in (('W/"v8"', 'W/"v8"'), ("v8", None), ('"' + "x" * 300 + '"', None)):
+            with self.subTest(header=header):
+                session = RecordingSession(RecordingResponse(
+                    {"plates": []}, headers={"ETag": header},
+                ))
+                client = CloudflareServiceClient(
+                    "https://gate.example.com", "id", "secret", session=session,
+                )
+
+                payload, etag = client.get_json_if_changed("/api/controller/plates", None)
+
+                self.assertEqual(payload, {"plates": []})
+                self.assertEqual(etag, expected)
+                self.assertNotIn("If-None-Match", session.requests[0].headers)
+
     def test_get_cross_origin_redirect_never_forwards_access_headers(self):
         self._assert_cross_origin_redirect_is_not_followed("GET")
 
@@ -135,6 +168,26 @@ class CloudflareServiceClientTests(unittest.TestCase):
         self.assertEqual(result, {"eventId": 42, "inserted": True})
         self.assertTrue(session.requests[0].stream)
 
+    def test_multipart_post_sends_parts_and_requires_a_bounded_json_reply(self):
+        response = RecordingResponse({"results": []})
+        session = RecordingSession(response)
+        client = CloudflareServiceClient(
+            "https://gate.example.com", "id", "secret", session=session,
+        )
+        files = [("events", (None, b'{"events":[]}', "application/json"))]
+
+        result = client.post_multipart(
+            "/api/controller/events/batch", files, max_response_bytes=1024,
+        )
+
+        self.assertEqual(result, {"results": []})
+        request = session.requests[0]
+        self.assertEqual(request.url, "https://gate.example.com/api/controller/events/batch")
+        self.assertEqual(request.files, files)
+        self.assertIsNone(request.json)
+        self.assertTrue(request.stream)
+        self.assertEqual(request.headers["CF-Access-Client-Id"], "id")
+
     def test_required_post_json_ack_is_bounded_before_decode(self):
         response = RecordingResponse(content=b'{"eventId":42,"inserted":true}' + b" " * 32)
         client = CloudflareServiceClient(
@@ -1,14 +1,24 @@
+import hashlib
 import os
+import subprocess
 import tempfile
 import unittest
 from io import BytesIO
 from pathlib import Path
+from threading import Event
+from unittest import mock
 
-from PIL import Image
+from PIL import Image, ImageFilter
 
 from gate_controller.hot_stream import (
     HotFrameRing, HotStreamBuffer, JpegStreamParser, load_hot_stream_config,
 )
+from gate_controller.images import (
+    content_digest, decode_frame, forget_frame, frame_bytes, luminance_fingerprint,
+)
+
+
+FLUENT_FIXTURE = Path(__file__).parent / "fixtures" / "hot-stream" / "fluent-640x360.mjpeg"
 
 
 def jpeg(colour, size=(64, 32)):
@@ -30,6 +40,38 @@ class JpegStreamParserTests(unittest.TestCase):
 
         self.assertEqual([first, second], frames)
 
+    def test_splits_the_recorded_fluent_fixture_identically_for_any_chunk_size(self):
+        stream = FLUENT_FIXTURE.read_bytes()
+        expected = [
+            part + b"\xff\xd9" for part in stream.split(b"\xff\xd9") if part
+        ]
+
+        for chunk_size in (7, 4093, 64 * 1024):
+            with self.subTest(chunk_size=chunk_size):
+                parser = JpegStreamParser(max_frame_bytes=256 * 1024)
+                frames = []
+                for offset in range(0, len(stream), chunk_size):
+                    frames.extend(parser.feed(stream[offset:offset + chunk_size]))
+
+                self.assertEqual(8, len(frames))
+                self.assertEqual(expected, frames)
+
+    def test_keeps_a_start_marker_split_across_chunks(self):
+        frame = jpeg("orange")
+        parser = JpegStreamParser(max_frame_bytes=4096)
+
+        self.assertEqual([], parser.feed(b"noise" + frame[:1]))
+        self.assertEqual([], parser.feed(frame[1:2]))
+        self.assertEqual([frame], parser.feed(frame[2:]))
+
+    def test_discards_scanned_bytes_of_a_stream_without_frames(self):
+        parser = JpegStreamParser(max_frame_bytes=4096)
+
+        for _ in range(64):
+            self.assertEqual([], parser.feed(b"\x00" * 4096))
+
+        self.assertLess(len(parser._buffer), 4096)
+
     def test_drops_an_oversized_partial_frame_and_recovers(self):
         valid = jpeg("green")
         parser = JpegStreamParser(max_frame_bytes=1024)
@@ -53,17 +95,118 @@ class HotFrameRingTests(unittest.TestCase):
         self.assertEqual([newest, middle], ring.select(2, now=3.1, max_age=2.0))
         self.assertEqual([], ring.select(2, now=10.0, max_age=2.0))
 
-    def test_materialises_owner_only_files_without_retaining_paths_in_the_ring(self):
-        ring = HotFrameRing(max_frames=3, max_frame_bytes=4096, max_total_bytes=12288)
+    def test_selection_hands_held_frames_to_the_burst_without_writing_files(self):
         frame = jpeg("purple")
-        ring.add(frame, captured_at=5.0)
-
         with tempfile.TemporaryDirectory() as directory:
-            paths = ring.materialise(Path(directory), 1, now=5.1, max_age=1.0)
+            config = load_hot_stream_config(
+                {"GATE_HOT_STREAM_ENABLED": "true"}, Path(directory),
+            )
+            buffer = HotStreamBuffer(config, clock=lambda: 5.1)
+            buffer._ring.add(frame, captured_at=5.0)
+
+            paths = buffer.select()
 
             self.assertEqual(1, len(paths))
-            self.assertEqual(frame, paths[0].read_bytes())
-            self.assertEqual(0o600, paths[0].stat().st_mode & 0o777)
+            self.assertEqual(config.output_directory, paths[0].parent)
+            self.assertFalse(config.output_directory.exists())
+            self.assertEqual(frame, frame_bytes(paths[0]))
+            self.assertEqual(
+                hashlib.sha256(frame).hexdigest(), content_digest(paths[0]),
+            )
+            with mock.patch.object(
+                hashlib, "sha256", side_effect=AssertionError("rehashed"),
+            ):
+                self.assertEqual((64, 32), (
+                    decode_frame(paths[0]).width, decode_frame(paths[0]).height,
+                ))
+
+            forget_frame(paths[0])
+
+            with self.assertRaises(OSError):
+                frame_bytes(paths[0])
+
+    def test_large_ring_selects_the_newest_frames_and_reports_lock_hold_time(self):
+        ring = HotFrameRing(max_frames=64, max_frame_bytes=4096, max_total_bytes=64 * 4096)
+        frames = [jpeg((index * 4, 0, 0)) for index in range(64)]
+        for index, frame in enumerate(frames):
+            self.assertTrue(ring.add(frame, captured_at=float(index)))
+        self.assertFalse(ring.add(frames[10], captured_at=64.0))
+
+        self.assertEqual(
+            [frames[10], frames[63], frames[62]],
+            ring.select(3, now=64.0, max_age=2.0),
+        )
+        self.assertEqual([frames[10]], ring.select(3, now=64.0, max_age=0.5))
+        status = ring.status(now=64.0)
+        self.assertEqual(64, status["buffered_frames"])
+        self.assertGreaterEqual(status["lock_hold_max_us"], status["lock_hold_mean_us"])
+        self.assertIsNone(
+            HotFrameRing(max_frames=1, max_frame_bytes=1, max_total_bytes=1)
+            .status(now=0.0)["lock_hold_max_us"]
+        )
+
+    def test_an_unchanged_scene_keeps_one_frame_once_selected(self):
+        ring = HotFrameRing(max_frames=8, max_frame_bytes=8192, max_total_bytes=65536)
+        scene = Image.new("L", (64, 32), color=90)
+        scene.paste(200, (8, 8, 24, 24))
+        samples = []
+        for quality in (90, 85, 80):
+            output = BytesIO()
+            scene.save(output, format="JPEG", quality=quality)
+            samples.append(output.getvalue())
+
+        for captured_at, sample in enumerate(samples):
+            self.assertTrue(ring.add(sample, captured_at=float(captured_at)))
+        self.assertTrue(ring.add(jpeg("white"), captured_at=3.0))
+        self.assertEqual(4, ring.status(now=3.0)["buffered_frames"])
+
+        selected = ring.select(3, now=3.0, max_age=5.0)
+
+        self.assertEqual(2, len(selected))
+        self.assertEqual(jpeg("white"), selected[0])
+        self.assertIn(selected[1], samples)
+        status = ring.status(now=3.0)
+        self.assertEqual(2, status["buffered_frames"])
+        self.assertEqual(2, status["frames_coalesced"])
+
+    def test_selection_keeps_the_sharper_near_copy_and_a_novel_frame(self):
+        def stripes(background, blur=0):
+            image = Image.new("L", (64, 32), color=background)
+            for x in range(0, 64, 4):
+                image.paste(0, (x, 0, x + 2, 32))
+            if blur:
+                image = image.filter(ImageFilter.GaussianBlur(blur))
+            output = BytesIO()
+            image.save(output, format="JPEG", quality=95)
+            return output.getvalue()
+
+        ring = HotFrameRing(
+            max_frames=8, max_frame_bytes=16384, max_total_bytes=65536, min_change=4.0,
+        )
+        different, sharp, blurred = stripes(120), stripes(200), stripes(200, blur=1)
+        for captured_at, frame in enumerate((different, sharp, blurred)):
+            self.assertTrue(ring.add(frame, captured_at=float(captured_at)))
+
+        self.assertEqual([sharp, different], ring.select(2, now=2.0, max_age=5.0))
+        self.assertEqual([sharp, different], ring.select(3, now=2.0, max_age=5.0))
+        self.assertEqual(1, ring.status(now=2.0)["frames_coalesced"])
+
+    def test_fingerprints_are_computed_once_and_only_for_frames_selection_reaches(self):
+        ring = HotFrameRing(max_frames=16, max_frame_bytes=4096, max_total_bytes=65536)
+        frames = [jpeg((index * 16, 0, 0)) for index in range(10)]
+        with mock.patch(
+            "gate_controller.hot_stream.luminance_fingerprint",
+            side_effect=luminance_fingerprint,
+        ) as fingerprint:
+            for index, frame in enumerate(frames):
+                self.assertTrue(ring.add(frame, captured_at=float(index)))
+            self.assertEqual(0, fingerprint.call_count)
+
+            self.assertEqual(frames[:-3:-1], ring.select(2, now=9.0, max_age=20.0))
+            self.assertEqual(2, fingerprint.call_count)
+
+            self.assertEqual(frames[:-4:-1], ring.select(3, now=9.0, max_age=20.0))
+            self.assertEqual(3, fingerprint.call_count)
 
     def test_identical_live_samples_refresh_freshness_without_duplicate_selection(self):
         ring = HotFrameRing(max_frames=3, max_frame_bytes=4096, max_total_bytes=12288)
@@ -76,6 +219,65 @@ class HotFrameRingTests(unittest.TestCase):
         self.assertTrue(ring.status(now=5.5, max_age=1.0)["ready"])
 
 
+    def test_rejects_structurally_broken_frames_before_decoding_pixels(self):
+        ring = HotFrameRing(max_frames=8, max_frame_bytes=4096, max_total_bytes=32768)
+        frame = jpeg("white")
+        start_of_frame = frame.index(b"\xff\xc0")
+        zero_width = bytearray(frame)
+        zero_width[start_of_frame + 7:start_of_frame + 9] = b"\x00\x00"
+        without_frame_header = (
+            frame[:start_of_frame] + frame[start_of_frame + 2 + int.from_bytes(
+                frame[start_of_frame + 2:start_of_frame + 4], "big",
+            ):]
+        )
+        broken = (
+            frame[:-40],
+            frame[:-2] + b"\x00\x00",
+            b"\xff\xd8" + b"\x00" * 64 + b"\xff\xd9",
+            bytes(zero_width),
+            without_frame_header,
+        )
+
+        with mock.patch.object(Image, "open", side_effect=AssertionError("decoded")):
+            for data in broken:
+                self.assertFalse(ring.add(data, captured_at=1.0))
+        self.assertTrue(ring.add(frame, captured_at=1.0))
+
+        status = ring.status(now=1.0)
+        self.assertEqual(1, status["buffered_frames"])
+        self.assertEqual(5, status["frames_rejected"])
+        self.assertIsNotNone(status["ingest_cpu_us_per_frame"])
+
+    def test_selection_discards_a_frame_that_fails_its_deferred_decode(self):
+        good = jpeg("teal")
+        corrupt = jpeg("navy")
+
+        def decode(path):
+            if frame_bytes(path) == corrupt:
+                raise OSError("broken data stream")
+            return decode_frame(path)
+
+        with tempfile.TemporaryDirectory() as directory, mock.patch(
+            "gate_controller.hot_stream.decode_frame", side_effect=decode,
+        ):
+            config = load_hot_stream_config(
+                {"GATE_HOT_STREAM_ENABLED": "true"}, Path(directory),
+            )
+            buffer = HotStreamBuffer(config, clock=lambda: 5.1)
+            self.assertTrue(buffer._ring.add(good, captured_at=4.9))
+            self.assertTrue(buffer._ring.add(corrupt, captured_at=5.0))
+
+            paths = buffer.select()
+
+            self.assertEqual([good], [frame_bytes(path) for path in paths])
+            status = buffer.status()
+            self.assertEqual(1, status["buffered_frames"])
+            self.assertEqual(1, status["frames_rejected"])
+            self.assertIsNotNone(status["selection_decode_cpu_us_per_frame"])
+            for path in paths:
+                forget_frame(path)
+
+
 class HotStreamConfigurationTests(unittest.TestCase):
     def test_is_disabled_by_default_and_uses_only_the_fixed_loopback_fluent_path(self):
         disabled = load_hot_stream_config({}, Path("/var/lib/gate-controller/uploads"))
@@ -100,8 +302,33 @@ class HotStreamConfigurationTests(unittest.TestCase):
         self.assertEqual("/usr/bin/ffmpeg", buffer.command[0])
         self.assertIn("rtsp://127.0.0.1:8554/camera", buffer.command)
         self.assertIn("fps=5", buffer.command)
+        self.assertIn("-nostdin", buffer.command)
+        self.assertNotIn("fifo", buffer.command)
         self.assertEqual({"LANG": "C", "LC_ALL": "C"}, buffer.child_environment)
 
+    def test_recording_shares_the_single_reader_behind_per_output_fifos(self):
+        config = load_hot_stream_config(
+            {"GATE_HOT_STREAM_ENABLED": "true", "GATE_HOT_STREAM_RECORD_SECONDS": "120"},
+            Path("/var/lib/gate-controller/uploads"),
+        )
+        command = HotStreamBuffer(config).command
+
+        self.assertEqual(1, command.count("-i"))
+        self.assertEqual(2, command.count("fifo"))
+        self.assertEqual(2, command.count("-drop_pkts_on_overflow"))
+        self.assertEqual(Path("/var/lib/gate-controller/clips"), config.record_directory)
+        self.assertEqual("/var/lib/gate-controller/clips/clip-%03d.mkv", command[-1])
+        self.assertIn("segment_wrap=12", command[command.index("-format_opts") + 1])
+        self.assertEqual("copy", command[command.index("-c:v", command.index("pipe:1")) + 1])
+        self.assertEqual(120, HotStreamBuffer(config).status()["record_seconds"])
+
+    def test_rejects_a_recording_window_shorter_than_three_segments(self):
+        with self.assertRaisesRegex(ValueError, "record seconds"):
+            load_hot_stream_config(
+                {"GATE_HOT_STREAM_RECORD_SECONDS": "20"},
+                Path("/var/lib/gate-controller/uploads"),
+            )
+
     def test_accepts_the_previous_three_frame_preset_but_caps_fallbacks_at_two(self):
         config = load_hot_stream_config(
             {
@@ -113,6 +340,115 @@ class HotStreamConfigurationTests(unittest.TestCase):
 
         self.assertEqual(2, config.selection_count)
 
+    def test_rejects_an_idle_rate_above_the_sample_rate(self):
+        with self.assertRaisesRegex(ValueError, "outside the safe range"):
+            load_hot_stream_config(
+                {
+                    "GATE_HOT_STREAM_SAMPLE_FPS": "5",
+                    "GATE_HOT_STREAM_IDLE_FPS": "6",
+                },
+                Path("/var/lib/gate-controller/uploads"),
+            )
+
+    def test_camera_events_lift_the_decoder_idle_gate_for_a_bounded_window(self):
+        now = [100.0]
+        config = load_hot_stream_config(
+            {
+                "GATE_HOT_STREAM_ENABLED": "true",
+                "GATE_HOT_STREAM_IDLE_FPS": "1",
+                "GATE_HOT_STREAM_BURST_SECONDS": "2",
+            },
+            Path("/var/lib/gate-controller/uploads"),
+        )
+        stop = Event()
+        burst_status = []
+
+        class Stdin:
+            def __init__(self):
+                self.commands = []
+                self.closed = False
+
+            def write(self, data):
+                self.commands.append(data)
+
+            def flush(self):
+                pass
+
+            def close(self):
+                self.closed = True
+
+        class Stdout:
+            def __init__(self):
+                self.reads = 0
+
+            def read(self, _size):
+                self.reads += 1
+                if self.reads == 2:
+                    buffer.trigger()
+                    burst_status.append(buffer.status())
+                elif self.reads == 3:
+                    now[0] += 3
+                elif self.reads == 4:
+                    stop.set()
+                    return b""
+                return jpeg((self.reads * 40, 0, 0))
+
+        class Process:
+            def __init__(self):
+                self.stdin = Stdin()
+                self.stdout = Stdout()
+
+            def poll(self):
+                return 0
+
+        process = Process()
+        spawned = []
+
+        def popen(*_args, **kwargs):
+            spawned.append(kwargs)
+            return process
+
+        buffer = HotStreamBuffer(config, popen=popen, clock=lambda: now[0])
+        self.assertIn("fps=5,framestep=step=5:enable=0", buffer.command)
+        self.assertNotIn("-nostdin", buffer.command)
+        self.assertEqual("idle", buffer.status()["mode"])
+        self.assertEqual(1.0, buffer.status()["admitted_fps"])
+        buffer.run_forever(stop)
+
+        self.assertEqual(subprocess.PIPE, spawned[0]["stdin"])
+        self.assertEqual([
+            b"cframestep -1 enable 1\n",
+            b"cframestep -1 enable 0\n",
+            b"cframestep -1 enable 1\n",
+        ], process.stdin.commands)
+        self.assertEqual("burst", burst_status[0]["mode"])
+        self.assertEqual(5.0, burst_status[0]["admitted_fps"])
+        self.assertEqual(5.0, burst_status[0]["sample_fps"])
+        self.assertEqual("idle", buffer.mode())
+        self.assertTrue(process.stdin.closed)
+        self.assertEqual(3, buffer.status()["buffered_frames"])
+
+    def test_idle_rate_is_a_whole_step_of_the_sample_rate(self):
+        config = load_hot_stream_config(
+            {"GATE_HOT_STREAM_ENABLED": "true", "GATE_HOT_STREAM_IDLE_FPS": "2"},
+            Path("/var/lib/gate-controller/uploads"),
+        )
+        buffer = HotStreamBuffer(config)
+
+        self.assertIn("fps=5,framestep=step=2:enable=0", buffer.command)
+        self.assertEqual(2.5, buffer.status()["admitted_fps"])
+
+    def test_continuous_sampling_ignores_camera_events(self):
+        config = load_hot_stream_config(
+            {"GATE_HOT_STREAM_ENABLED": "true"}, Path("/var/lib/gate-controller/uploads"),
+        )
+        buffer = HotStreamBuffer(config)
+
+        buffer.trigger()
+
+        self.assertEqual("continuous", buffer.status()["mode"])
+        self.assertEqual(5.0, buffer.status()["admitted_fps"])
+
     def test_capture_loop_keeps_a_local_process_reference_during_close(self):
         class Stdout:
             def read(self, _size):
@@ -1,6 +1,8 @@
 import hashlib
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import patch
 
@@ -8,6 +10,10 @@ from PIL import Image
 
 import gate_controller.images as image_tools
 from gate_controller.images import rank_images, wait_until_readable
+from gate_controller.telemetry import FrameTelemetry
+
+
+RANKING_FIXTURES = Path(__file__).parent / "fixtures" / "ranking"
 
 
 class ImageTests(unittest.TestCase):
@@ -68,7 +74,7 @@ class ImageTests(unittest.TestCase):
                 quality = self._measure_frame_quality(frame)
 
             self.assertEqual((quality.width, quality.height), (640, 360))
-            self.assertEqual(filtered_sizes, [(320, 180)])
+            self.assertEqual(filtered_sizes, [(320, 180)] * 3)
 
     def test_measure_frame_quality_returns_a_redacted_status_for_invalid_images(self):
         with tempfile.TemporaryDirectory() as directory:
@@ -82,6 +88,41 @@ class ImageTests(unittest.TestCase):
             self.assertNotIn(str(frame), quality.status)
             self.assertNotIn("sensitive", quality.status)
 
+    def test_decision_grade_needs_sharpness_and_usable_exposure(self):
+        sharp = image_tools.measure_frame_quality(RANKING_FIXTURES / "day-1-sharp.jpg")
+        blurred = image_tools.measure_frame_quality(RANKING_FIXTURES / "day-5-focus-3.jpg")
+        with tempfile.TemporaryDirectory() as directory:
+            dark = Path(directory) / "dark.jpg"
+            Image.new("RGB", (64, 32), color=(4, 4, 4)).save(dark, format="JPEG")
+            underexposed = image_tools.measure_frame_quality(dark)
+
+        self.assertTrue(image_tools.is_decision_grade(sharp, min_sharpness=0.04))
+        self.assertFalse(image_tools.is_decision_grade(blurred, min_sharpness=0.04))
+        self.assertFalse(image_tools.is_decision_grade(underexposed, min_sharpness=0))
+
+    def test_ocr_quality_gate_skips_failing_frames_only_until_the_ceiling_fills(self):
+        def quality(sharpness, darkness=0.0, status="ok"):
+            return FrameTelemetry(
+                sequence=0, digest="0" * 64, width=64, height=32, sharpness=sharpness,
+                brightness=0.5, darkness=darkness, highlight_clipping=0.0, status=status,
+            )
+
+        gate = image_tools.OcrQualityGate(min_sharpness=0.02, max_darkness=0.5)
+        frames = {
+            "blurred": quality(0.01), "sharp": quality(0.05), "dark": quality(0.05, 0.9),
+            "unmeasured": quality(0.0, status="quality_unavailable"), "late": quality(0.0),
+        }
+        kept, skipped = gate.partition(frames, frames.get, limit=2)
+        fallback, all_skipped = gate.partition(("dark", "blurred"), frames.get, limit=2)
+
+        self.assertEqual(["sharp", "unmeasured", "late"], kept)
+        self.assertEqual(
+            [("blurred", "skipped_blurred"), ("dark", "skipped_dark")],
+            [(frame, skip.status) for frame, skip in skipped],
+        )
+        self.assertEqual(["dark"], fallback)
+        self.assertEqual(["blurred"], [frame for frame, _quality in all_skipped])
+
     def test_rejects_non_jpeg_magic_without_invoking_pillow(self):
         with tempfile.TemporaryDirectory() as directory:
             disguised = Path(directory) / "disguised.jpg"
@@ -165,22 +206,223 @@ class ImageTests(unittest.TestCase):
 
             self.assertEqual(forward, reverse)
 
-    def test_rank_images_skips_a_candidate_removed_before_digest_tiebreak(self):
+    def test_rank_images_skips_a_candidate_removed_before_it_is_read(self):
         with tempfile.TemporaryDirectory() as directory:
             removed = Path(directory) / "removed.jpg"
             stable = Path(directory) / "stable.jpg"
             Image.new("L", (16, 16), color=100).save(removed)
             Image.new("L", (16, 16), color=100).save(stable)
-            real_digest = image_tools._content_digest
+            real_read = image_tools._read_frame_bytes
 
-            def digest(path):
+            def read(path, max_bytes):
                 if Path(path) == removed:
                     raise FileNotFoundError(path)
-                return real_digest(path)
+                return real_read(path, max_bytes)
 
-            with patch("gate_controller.images._content_digest", side_effect=digest):
+            with patch("gate_controller.images._read_frame_bytes", side_effect=read):
                 self.assertEqual([stable], rank_images((removed, stable)))
 
+    def test_one_read_and_decode_serves_readiness_ranking_quality_and_upload(self):
+        with tempfile.TemporaryDirectory() as directory:
+            frame = Path(directory) / "frame.jpg"
+            Image.new("L", (640, 360), color=90).save(frame, format="JPEG")
+            expected = hashlib.sha256(frame.read_bytes()).hexdigest()
+
+            with patch(
+                "gate_controller.images._read_frame_bytes",
+                wraps=image_tools._read_frame_bytes,
+            ) as read, patch.object(
+                image_tools.DecodedFrame,
+                "decode",
+                wraps=image_tools.DecodedFrame.decode,
+            ) as decode:
+                self.assertTrue(wait_until_readable(frame, timeout=0, poll_interval=0))
+                self.assertEqual(rank_images((frame,)), [frame])
+                self.assertEqual(image_tools.content_digest(frame), expected)
+                quality = image_tools.measure_frame_quality(frame)
+                upload = image_tools.frame_bytes(frame)
+
+            self.assertEqual(read.call_count, 1)
+            self.assertEqual(decode.call_count, 1)
+            self.assertEqual(quality.digest, expected)
+            self.assertEqual(upload, frame.read_bytes())
+
+    def test_rewritten_or_forgotten_frames_are_read_again(self):
+        with tempfile.TemporaryDirectory() as directory:
+            frame = Path(directory) / "frame.jpg"
+            Image.new("L", (16, 8), color=10).save(frame, format="JPEG")
+            first = image_tools.decode_frame(frame)
+            Image.new("L", (32, 8), color=240).save(frame, format="JPEG")
+
+            rewritten = image_tools.decode_frame(frame)
+            image_tools.forget_frame(frame)
+            with patch(
+                "gate_controller.images._read_frame_bytes",
+                wraps=image_tools._read_frame_bytes,
+            ) as read:
+                image_tools.decode_frame(frame)
+
+            self.assertNotEqual(first.digest, rewritten.digest)
+            self.assertEqual(rewritten.width, 32)
+            self.assertEqual(read.call_count, 1)
+
+    def test_held_frames_stay_pinned_until_forgotten(self):
+        encoded = BytesIO()
+        Image.new("L", (16, 8), color=40).save(encoded, format="JPEG")
+        data = encoded.getvalue()
+        digest = hashlib.sha256(data).hexdigest()
+        paths = [
+            image_tools.hold_frame(Path(f"/nonexistent/held-{index}.jpg"), data, digest=digest)
+            for index in range(64)
+        ]
+        for path in paths:
+            self.addCleanup(image_tools.forget_frame, path)
+
+        self.assertEqual(data, image_tools.frame_bytes(paths[0]))
+        self.assertEqual(digest, image_tools.content_digest(paths[0]))
+        with self.assertRaisesRegex(ValueError, "byte limit"):
+            image_tools.frame_bytes(paths[0], max_bytes=len(data) - 1)
+
+        image_tools.forget_frame(paths[0])
+        with self.assertRaises(OSError):
+            image_tools.frame_bytes(paths[0])
+
+    def test_frame_bytes_enforces_the_byte_limit_on_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            frame = Path(directory) / "frame.jpg"
+            Image.new("L", (16, 8), color=10).save(frame, format="JPEG")
+            size = frame.stat().st_size
+
+            with self.assertRaisesRegex(ValueError, "byte limit"):
+                image_tools.frame_bytes(frame, max_bytes=size - 1)
+            image_tools.decode_frame(frame)
+            with self.assertRaisesRegex(ValueError, "byte limit"):
+                image_tools.frame_bytes(frame, max_bytes=size - 1)
+            self.assertEqual(frame.read_bytes(), image_tools.frame_bytes(frame, max_bytes=size))
+            image_tools.forget_frame(frame)
+
+    def test_partial_uploads_are_not_cached_as_failures(self):
+        with tempfile.TemporaryDirectory() as directory:
+            frame = Path(directory) / "growing.jpg"
+            complete = Path(directory) / "complete.jpg"
+            Image.new("L", (64, 64), color=128).save(complete, format="JPEG")
+            frame.write_bytes(complete.read_bytes()[:20])
+
+            self.assertFalse(wait_until_readable(frame, timeout=0, poll_interval=0))
+            frame.write_bytes(complete.read_bytes())
+
+            self.assertTrue(wait_until_readable(frame, timeout=0, poll_interval=0))
+
+    def test_draft_ranking_matches_full_resolution_order_on_fixture_bursts(self):
+        for burst in ("day", "night"):
+            with self.subTest(burst=burst):
+                frames = sorted(RANKING_FIXTURES.glob(f"{burst}-*.jpg"))
+                self.assertEqual(len(frames), 5)
+                shuffled = frames[1::2] + frames[::2]
+
+                full = rank_images(shuffled, ranking_scale=1)
+                draft = rank_images(shuffled)
+
+                self.assertEqual(full, frames)
+                self.assertEqual(draft, full)
+
+    def test_parallel_ranking_keeps_the_sequential_order_and_skips_invalid_frames(self):
+        frames = sorted(RANKING_FIXTURES.glob("day-*.jpg"))
+        with tempfile.TemporaryDirectory() as directory:
+            duplicate = Path(directory) / "duplicate.jpg"
+            duplicate.write_bytes(frames[2].read_bytes())
+            invalid = Path(directory) / "invalid.jpg"
+            invalid.write_bytes(b"not a jpeg")
+            burst = [duplicate, invalid, *reversed(frames)]
+            image_tools._FRAME_CACHE.clear()
+            sequential = rank_images(burst)
+            image_tools._FRAME_CACHE.clear()
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                parallel = rank_images(burst, executor=executor)
+
+        self.assertEqual(sequential, parallel)
+        self.assertEqual(frames[:2], parallel[:2])
+        self.assertNotIn(invalid, parallel)
+        self.assertEqual(
+            {frames[2], duplicate}, set(parallel[2:4]),
+        )
+
+    def test_perceptual_signature_matches_the_same_moment_at_another_encoding(self):
+        sharp = RANKING_FIXTURES / "day-1-sharp.jpg"
+        with tempfile.TemporaryDirectory() as directory:
+            fluent = Path(directory) / "fluent.jpg"
+            with Image.open(sharp) as image:
+                image.resize((640, 360)).save(fluent, format="JPEG", quality=60)
+            darker = Path(directory) / "darker.jpg"
+            with Image.open(sharp) as image:
+                image.point(lambda value: value // 2).save(darker, format="JPEG")
+            original = image_tools.perceptual_signature(sharp)
+            reencoded = image_tools.perceptual_signature(fluent)
+            underexposed = image_tools.perceptual_signature(darker)
+        night = image_tools.perceptual_signature(RANKING_FIXTURES / "night-1-sharp.jpg")
+
+        self.assertTrue(original.matches(reencoded))
+        self.assertFalse(original.matches(night))
+        self.assertFalse(original.matches(underexposed))
+
+    def test_draft_ranking_decodes_at_reduced_scale(self):
+        with tempfile.TemporaryDirectory() as directory:
+            frame = Path(directory) / "frame.jpg"
+            Image.new("L", (2560, 1440), color=90).save(frame, format="JPEG")
+            filtered_sizes = []
+            original_filter = Image.Image.filter
+
+            def record_filter(image, image_filter):
+                filtered_sizes.append(image.size)
+                return original_filter(image, image_filter)
+
+            with patch.object(Image.Image, "filter", autospec=True, side_effect=record_filter):
+                rank_images((frame,))
+
+        self.assertEqual(set(filtered_sizes), {(640, 360), (320, 180)})
+
+    def test_luminance_fingerprint_decodes_at_one_eighth_scale(self):
+        output = BytesIO()
+        Image.new("L", (640, 360), color=90).save(output, format="JPEG")
+        filtered_sizes = []
+        original_filter = Image.Image.filter
+
+        def record_filter(image, image_filter):
+            filtered_sizes.append(image.size)
+            return original_filter(image, image_filter)
+
+        with patch.object(Image.Image, "filter", autospec=True, side_effect=record_filter):
+            fingerprint = image_tools.luminance_fingerprint(output.getvalue())
+        brighter = BytesIO()
+        Image.new("L", (640, 360), color=130).save(brighter, format="JPEG")
+
+        self.assertEqual(set(filtered_sizes), {(80, 45)})
+        self.assertEqual(16 * 9, len(fingerprint.luma))
+        self.assertEqual(0.0, fingerprint.sharpness)
+        self.assertAlmostEqual(
+            40, fingerprint.distance(image_tools.luminance_fingerprint(brighter.getvalue())),
+            delta=1,
+        )
+
+    def test_quality_reuses_a_decode_cached_at_another_ranking_scale(self):
+        with tempfile.TemporaryDirectory() as directory:
+            frame = Path(directory) / "frame.jpg"
+            Image.new("L", (1280, 720), color=90).save(frame, format="JPEG")
+            rank_images((frame,), ranking_scale=2)
+
+            with patch.object(
+                image_tools.DecodedFrame, "decode", wraps=image_tools.DecodedFrame.decode,
+            ) as decode:
+                quality = image_tools.measure_frame_quality(frame)
+                image_tools.forget_frame(frame)
+
+        self.assertEqual((1280, 720), (quality.width, quality.height))
+        decode.assert_not_called()
+
+    def test_rank_images_rejects_unsupported_ranking_scales(self):
+        with self.assertRaises(ValueError):
+            rank_images((), ranking_scale=3)
+
 
 if __name__ == "__main__":
     unittest.main()
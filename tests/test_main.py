@@ -15,7 +15,10 @@ from gate_controller.__main__ import (
 )
 from gate_controller.authorisation import AuthorisationRefreshWorker, AuthorisedPlateCache
 from gate_controller.control_plane import HeartbeatWorker
+from gate_controller.images import OcrQualityGate
 from gate_controller.command_server import CommandServerWorker
+from gate_controller.matching import PlateIndex
+from gate_controller.ocr import OcrResultCache
 from gate_controller.outbox import OutboxWorker
 from gate_controller.relay import RelayController
 from gate_controller.store import LocalStore
@@ -54,9 +57,10 @@ class MainConfigurationTests(unittest.TestCase):
         ])
 
     def test_main_starts_and_selects_from_one_shared_hot_stream_buffer(self):
-        hot_buffer = object()
+        hot_buffer = type("HotBuffer", (), {"trigger": lambda self, _event=None: None})()
         hot_config = type("Config", (), {"enabled": True})()
         base_worker = object()
+        correlator = type("Correlator", (), {"correlate": lambda self, _at: None})()
         with patch.dict(
             os.environ, {"PLATE_RECOGNIZER_API_TOKEN": "token"}, clear=True
         ), patch("sys.argv", ["gate-controller"]), patch.object(
@@ -74,6 +78,8 @@ class MainConfigurationTests(unittest.TestCase):
         ), patch.object(
             gate_main, "HotStreamBuffer", return_value=hot_buffer,
         ), patch.object(
+            gate_main, "build_reolink_trigger_pipeline", return_value=(correlator, ()),
+        ) as build_trigger_pipeline, patch.object(
             gate_main, "build_background_workers",
             return_value=((base_worker,), object(), object()),
         ), patch.object(
@@ -85,6 +91,9 @@ class MainConfigurationTests(unittest.TestCase):
 
         self.assertIn(hot_buffer, run_worker.call_args.kwargs["background_workers"])
         self.assertIs(hot_buffer, run_worker.call_args.kwargs["hot_frame_provider"])
+        self.assertEqual(
+            hot_buffer.trigger, build_trigger_pipeline.call_args.kwargs["on_accepted"],
+        )
 
     def test_status_exposes_only_nonsecret_effective_hot_stream_health(self):
         store = self.create_store()
@@ -96,12 +105,21 @@ class MainConfigurationTests(unittest.TestCase):
                     "ready": True,
                     "stream": "fluent",
                     "sample_fps": 5.0,
+                    "admitted_fps": 1.0,
+                    "mode": "idle",
                     "source_profile": {
                         "codec": "h264", "width": 640, "height": 360, "fps": 10,
                     },
                     "latest_frame_age_ms": 92,
                     "buffered_frames": 8,
                     "restart_count": 0,
+                    "record_seconds": 60,
+                    "lock_hold_mean_us": 3.5,
+                    "lock_hold_max_us": 41.0,
+                    "frames_rejected": 2,
+                    "frames_coalesced": 14,
+                    "ingest_cpu_us_per_frame": 12.5,
+                    "selection_decode_cpu_us_per_frame": 850.0,
                 }
 
         status = gate_main._controller_status(
@@ -111,6 +129,15 @@ class MainConfigurationTests(unittest.TestCase):
 
         self.assertTrue(status["recognition"]["hot_stream"]["ready"])
         self.assertEqual(640, status["recognition"]["hot_stream"]["source_profile"]["width"])
+        self.assertEqual(41.0, status["recognition"]["hot_stream"]["lock_hold_max_us"])
+        self.assertEqual(2, status["recognition"]["hot_stream"]["frames_rejected"])
+        self.assertEqual(14, status["recognition"]["hot_stream"]["frames_coalesced"])
+        self.assertEqual("idle", status["recognition"]["hot_stream"]["mode"])
+        self.assertEqual(1.0, status["recognition"]["hot_stream"]["admitted_fps"])
+        self.assertEqual(60, status["recognition"]["hot_stream"]["record_seconds"])
+        self.assertEqual(
+            850.0, status["recognition"]["hot_stream"]["selection_decode_cpu_us_per_frame"],
+        )
         self.assertNotIn("source_url", str(status))
 
     def test_reolink_trigger_pipeline_has_no_relay_or_authorisation_dependency(self):
@@ -149,7 +176,7 @@ class MainConfigurationTests(unittest.TestCase):
             gate_main, "PlateRecognizerClient", return_value=object()
         ), patch.object(
             gate_main, "GateProcessor", return_value=object()
-        ), patch.object(gate_main, "run_worker") as run_worker:
+        ) as processor_class, patch.object(gate_main, "run_worker") as run_worker:
             gate_main.main()
 
         self.assertEqual(
@@ -159,6 +186,8 @@ class MainConfigurationTests(unittest.TestCase):
         self.assertIs(
             run_worker.call_args.kwargs["trigger_resolver"], correlator.correlate,
         )
+        # Without predictive OCR the processor keeps its private, fail-fast slot.
+        self.assertIsNone(processor_class.call_args.kwargs["ocr_slot"])
 
     def create_store(self):
         directory = tempfile.TemporaryDirectory()
@@ -240,10 +269,16 @@ class MainConfigurationTests(unittest.TestCase):
             def recover_interrupted_actuations(self):
                 calls.append("recover")
 
+            def close_all(self):
+                calls.append("store_close_all")
+
         class Authorised:
             def get(self):
                 return ()
 
+            def index(self):
+                return PlateIndex()
+
         class Processor:
             def close(self):
                 calls.append("processor_close")
@@ -287,6 +322,7 @@ class MainConfigurationTests(unittest.TestCase):
         self.assertLess(calls.index("store"), calls.index("recover"))
         self.assertLess(calls.index("relay_begin_shutdown"), calls.index("processor_close"))
         self.assertLess(calls.index("processor_close"), calls.index("relay_shutdown"))
+        self.assertEqual("store_close_all", calls[-1])
 
     def test_shutdown_reaches_processor_close_when_relay_shutdown_hangs(self):
         release = Event()
@@ -438,6 +474,25 @@ class MainConfigurationTests(unittest.TestCase):
                         }, latest_image={},
                     )
 
+    def test_outbox_batch_size_is_configurable_and_bounded(self):
+        workers, _, _ = build_background_workers(
+            self.create_store(), relay=object(), environment={
+                "GATE_OUTBOX_URL": "https://sync.example/events",
+                "GATE_OUTBOX_BEARER_TOKEN": "event-secret",
+                "GATE_OUTBOX_BATCH_SIZE": "10",
+            },
+        )
+
+        self.assertEqual(workers[0]._batch_size, 10)
+        for configured in ("0", "26", "many"):
+            with self.subTest(configured=configured):
+                with self.assertRaisesRegex(ValueError, "GATE_OUTBOX_BATCH_SIZE"):
+                    build_background_workers(
+                        self.create_store(), relay=object(), environment={
+                            "GATE_OUTBOX_BATCH_SIZE": configured,
+                        },
+                    )
+
     def test_local_only_configuration_still_builds_a_telemetry_retention_worker(self):
         workers, _, _ = build_background_workers(
             self.create_store(), relay=object(), environment={
@@ -548,6 +603,23 @@ class MainConfigurationTests(unittest.TestCase):
             "last_outcome_at": "2026-08-14T10:00:00+00:00",
         })
 
+    def test_controller_status_reports_ocr_cache_counters(self):
+        store = self.create_store()
+        cache = OcrResultCache(max_entries=4)
+        cache.get("missing")
+
+        enabled = gate_main._controller_status(
+            store, type("Prompt", (), {"available": False})(), {}, ocr_cache=cache,
+        )
+        disabled = gate_main._controller_status(
+            store, type("Prompt", (), {"available": False})(), {},
+        )
+
+        self.assertTrue(enabled["recognition"]["ocr_cache"]["enabled"])
+        self.assertEqual(1, enabled["recognition"]["ocr_cache"]["misses"])
+        self.assertEqual(4, enabled["recognition"]["ocr_cache"]["max_entries"])
+        self.assertEqual({"enabled": False}, disabled["recognition"]["ocr_cache"])
+
     def test_media_capabilities_are_best_effort_and_cannot_break_the_status_heartbeat(self):
         store = self.create_store()
         malformed = store.path.parent / "capabilities.json"
@@ -680,6 +752,7 @@ class MainConfigurationTests(unittest.TestCase):
             example,
         )
         self.assertIn("GATE_TELEMETRY_RETENTION_DAYS=30", example)
+        self.assertIn("GATE_OUTBOX_BATCH_SIZE=1", example)
 
     def test_image_runtime_limits_are_configurable(self):
         self.assertEqual(gate_main.image_runtime_limits({
@@ -702,11 +775,123 @@ class MainConfigurationTests(unittest.TestCase):
             ):
                 gate_main.image_runtime_limits(environment)
 
+    def test_speculative_ocr_frames_default_to_sequential_ocr(self):
+        self.assertEqual(gate_main.speculative_ocr_frames({}), 1)
+        self.assertEqual(
+            gate_main.speculative_ocr_frames({"GATE_SPECULATIVE_OCR_FRAMES": "3"}), 3,
+        )
+        for value in ("0", "4", "two"):
+            with self.subTest(value=value), self.assertRaisesRegex(
+                ValueError, "speculative OCR frames"
+            ):
+                gate_main.speculative_ocr_frames({"GATE_SPECULATIVE_OCR_FRAMES": value})
+
+    def test_early_flush_is_off_unless_a_sharpness_threshold_is_set(self):
+        self.assertEqual(0.0, gate_main.early_flush_sharpness({}))
+        self.assertEqual(0.05, gate_main.early_flush_sharpness(
+            {"GATE_EARLY_FLUSH_MIN_SHARPNESS": "0.05"},
+        ))
+        for value in ("-0.1", "1.5", "sharp"):
+            with self.subTest(value=value), self.assertRaisesRegex(
+                ValueError, "GATE_EARLY_FLUSH_MIN_SHARPNESS"
+            ):
+                gate_main.early_flush_sharpness({"GATE_EARLY_FLUSH_MIN_SHARPNESS": value})
+
+    def test_ranking_workers_default_to_four_within_the_cpu_count(self):
+        self.assertEqual(4, gate_main.ranking_workers({}, cpu_count=4))
+        self.assertEqual(2, gate_main.ranking_workers({}, cpu_count=2))
+        self.assertEqual(1, gate_main.ranking_workers({"GATE_RANKING_WORKERS": "1"}, cpu_count=4))
+        for value in ("0", "9", "four"):
+            with self.subTest(value=value), self.assertRaisesRegex(
+                ValueError, "GATE_RANKING_WORKERS"
+            ):
+                gate_main.ranking_workers({"GATE_RANKING_WORKERS": value})
+
+    def test_ranking_scale_defaults_to_a_quarter_scale_draft(self):
+        self.assertEqual(4, gate_main.ranking_scale({}))
+        self.assertEqual(1, gate_main.ranking_scale({"GATE_RANKING_SCALE": "1"}))
+        for value in ("0", "3", "16", "quarter"):
+            with self.subTest(value=value), self.assertRaisesRegex(
+                ValueError, "GATE_RANKING_SCALE"
+            ):
+                gate_main.ranking_scale({"GATE_RANKING_SCALE": value})
+
+    def test_ocr_quality_gate_is_off_until_a_limit_is_tightened(self):
+        self.assertIsNone(gate_main.ocr_quality_gate({}))
+        self.assertIsNone(gate_main.ocr_quality_gate({"GATE_OCR_MAX_DARKNESS": "1"}))
+        self.assertEqual(
+            OcrQualityGate(min_sharpness=0.02, max_darkness=0.9),
+            gate_main.ocr_quality_gate({
+                "GATE_OCR_MIN_SHARPNESS": "0.02", "GATE_OCR_MAX_DARKNESS": "0.9",
+            }),
+        )
+        for name in (
+            "GATE_OCR_MIN_SHARPNESS", "GATE_OCR_MAX_DARKNESS",
+            "GATE_OCR_MAX_HIGHLIGHT_CLIPPING",
+        ):
+            for value in ("-0.1", "1.5", "dark"):
+                with self.subTest(name=name, value=value), self.assertRaisesRegex(
+                    ValueError, name
+                ):
+                    gate_main.ocr_quality_gate({name: value})
+
+    def test_streaming_bursts_are_opt_in(self):
+        self.assertFalse(gate_main.streaming_bursts_enabled({}))
+        self.assertTrue(gate_main.streaming_bursts_enabled({"GATE_STREAMING_BURSTS": "true"}))
+        with self.assertRaisesRegex(ValueError, "GATE_STREAMING_BURSTS"):
+            gate_main.streaming_bursts_enabled({"GATE_STREAMING_BURSTS": "1"})
+
+    def test_predictive_ocr_is_opt_in(self):
+        self.assertFalse(gate_main.predictive_ocr_enabled({}))
+        self.assertTrue(gate_main.predictive_ocr_enabled({"GATE_PREDICTIVE_OCR": "true"}))
+        with self.assertRaisesRegex(ValueError, "GATE_PREDICTIVE_OCR"):
+            gate_main.predictive_ocr_enabled({"GATE_PREDICTIVE_OCR": "yes"})
+
+    def test_ocr_cache_is_in_memory_by_default_and_can_be_disabled(self):
+        store = object()
+        default = gate_main.build_ocr_cache({}, store)
+        persistent = gate_main.build_ocr_cache(
+            {"GATE_OCR_CACHE_PERSISTENT": "true", "GATE_OCR_CACHE_ENTRIES": "32"}, store,
+        )
+
+        self.assertEqual(default.status()["max_entries"], 256)
+        self.assertFalse(default.status()["persistent"])
+        self.assertTrue(persistent.status()["persistent"])
+        self.assertIsNone(gate_main.build_ocr_cache({"GATE_OCR_CACHE_ENTRIES": "0"}))
+        for environment in (
+            {"GATE_OCR_CACHE_ENTRIES": "many"},
+            {"GATE_OCR_CACHE_TTL_SECONDS": "0"},
+            {"GATE_OCR_CACHE_PERSISTENT": "yes"},
+        ):
+            with self.subTest(environment=environment), self.assertRaises(ValueError):
+                gate_main.build_ocr_cache(environment)
+
+    def test_ocr_region_is_optional_and_parsed_from_the_environment(self):
+        region = gate_main.ocr_region({"GATE_OCR_REGION": " 0.1,0.4 0.9,0.4 1,1 0,1 "})
+
+        self.assertIsNone(gate_main.ocr_region({}))
+        self.assertIsNone(gate_main.ocr_region({"GATE_OCR_REGION": ""}))
+        self.assertEqual(region.points, ((0.1, 0.4), (0.9, 0.4), (1.0, 1.0), (0.0, 1.0)))
+        with self.assertRaises(ValueError):
+            gate_main.ocr_region({"GATE_OCR_REGION": "0,0 1,1"})
+
     def test_example_environment_documents_candidate_limits(self):
         example = Path(".env.example").read_text(encoding="utf-8")
 
         self.assertIn("GATE_MAX_BURST_CANDIDATES=8", example)
         self.assertIn("GATE_MAX_CANDIDATE_IMAGE_BYTES=8388608", example)
+        self.assertIn("GATE_SPECULATIVE_OCR_FRAMES=1", example)
+        self.assertIn("GATE_OCR_CACHE_ENTRIES=256", example)
+        self.assertIn("GATE_OCR_REGION=", example)
+        self.assertIn("GATE_HOT_STREAM_IDLE_FPS=5", example)
+        self.assertIn("GATE_PREDICTIVE_OCR=false", example)
+        self.assertIn("GATE_EARLY_FLUSH_MIN_SHARPNESS=0", example)
+        self.assertIn("GATE_STREAMING_BURSTS=false", example)
+        self.assertIn("GATE_OCR_MIN_SHARPNESS=0", example)
+        self.assertIn("GATE_OCR_MAX_DARKNESS=1", example)
+        self.assertIn("GATE_OCR_MAX_HIGHLIGHT_CLIPPING=1", example)
+        self.assertIn("GATE_RANKING_WORKERS=4", example)
+        self.assertIn("GATE_RANKING_SCALE=4", example)
 
 
 if __name__ == "__main__":
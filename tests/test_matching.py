@@ -1,6 +1,9 @@
+import random
 import unittest
 
-from gate_controller.matching import decide_access, normalise_plate
+from gate_controller.matching import (
+    PlateIndex, _is_one_known_confusion, decide_access, normalise_plate,
+)
 from gate_controller.models import PlateObservation
 
 
@@ -59,5 +62,39 @@ class MatchingTests(unittest.TestCase):
         self.assertEqual(decision.authorised_plate, "1203456")
 
 
+    def test_plate_index_finds_the_same_confusions_as_a_full_scan(self):
+        generator = random.Random(5)
+        alphabet = "0O1IL2Z5S8BDKW3"
+        plates = {
+            "".join(generator.choice(alphabet) for _ in range(generator.randint(4, 6)))
+            for _ in range(400)
+        }
+        index = PlateIndex(plates)
+
+        for observed in sorted(plates)[:200] + ["12O3456", "BOS", ""]:
+            with self.subTest(observed=observed):
+                self.assertEqual(
+                    set(index.confusions(observed)),
+                    {plate for plate in plates if _is_one_known_confusion(observed, plate)},
+                )
+
+    def test_plate_index_normalises_and_drops_empty_plates(self):
+        index = PlateIndex(["12-d 3456", " ", "12D3456"])
+
+        self.assertEqual(len(index), 1)
+        self.assertIn("12D3456", index)
+        self.assertNotIn("12-d 3456", index)
+
+    def test_decide_access_accepts_a_precompiled_index(self):
+        index = PlateIndex({"1203456"})
+
+        decision = decide_access(
+            [PlateObservation("12O3456", 0.96), PlateObservation("12O3456", 0.97)], index,
+        )
+
+        self.assertEqual(decision.reason, "two_frame_ocr_confusion")
+        self.assertEqual(decision.authorised_plate, "1203456")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,19 @@
 import tempfile
 import unittest
+from datetime import datetime, timedelta, timezone
 from math import inf, nan
 from pathlib import Path
 from threading import Event, Thread
+from io import BytesIO
 from unittest.mock import patch
 
-from gate_controller.ocr import OcrResponseError, PlateRecognizerClient
+from PIL import Image
+
+from gate_controller.models import PlateObservation
+from gate_controller.ocr import (
+    OcrRegion, OcrResponseError, OcrResultCache, PlateRecognizerClient,
+)
+from gate_controller.store import LocalStore
 
 
 class FakeResponse:
@@ -231,5 +239,154 @@ class OcrClientTests(unittest.TestCase):
                     client.recognise(self.path)
 
 
+class OcrRegionTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "frame.jpg"
+        Image.effect_noise((1600, 900), 40).convert("RGB").save(
+            self.path, format="JPEG", quality=90,
+        )
+
+    def test_uploads_the_masked_lane_crop_and_reports_the_bytes_saved(self):
+        session = FakeSession(response=FakeResponse(payload={"results": []}))
+        client = PlateRecognizerClient(
+            "token", session=session,
+            region=OcrRegion.parse("0.5,0.5 1,0.5 1,1 0.75,1"),
+        )
+
+        observation = client.recognise(self.path)
+
+        upload = session.calls[0][1]["files"]["upload"][1]
+        with Image.open(BytesIO(upload)) as image:
+            self.assertEqual(image.size, (800, 450))
+            corner = image.convert("RGB").getpixel((10, 440))
+        self.assertTrue(all(abs(channel - 128) <= 8 for channel in corner))
+        saved = 1 - len(upload) / self.path.stat().st_size
+        self.assertAlmostEqual(observation.upload_saved_ratio, saved)
+        self.assertGreater(observation.upload_saved_ratio, 0.5)
+
+    def test_crops_are_bounded_in_size_and_bytes(self):
+        region = OcrRegion(
+            ((0, 0), (1, 0), (1, 1), (0, 1)), max_dimension=400, max_bytes=20_000,
+        )
+
+        upload, saved = region.prepare(self.path)
+
+        with Image.open(BytesIO(upload)) as image:
+            self.assertLessEqual(max(image.size), 400)
+        self.assertLessEqual(len(upload), 20_000)
+        self.assertGreater(saved, 0)
+
+    def test_a_frame_is_cropped_once_however_often_it_is_uploaded(self):
+        region = OcrRegion.parse("0.5,0.5 1,0.5 1,1 0.75,1")
+
+        with patch.object(OcrRegion, "_crop", autospec=True, wraps=OcrRegion._crop) as crop:
+            first = region.prepare(self.path)
+            second = region.prepare(self.path)
+
+        self.assertEqual(first, second)
+        self.assertEqual(1, crop.call_count)
+
+    def test_undecodable_frames_upload_unchanged(self):
+        self.path.write_bytes(b"not a jpeg")
+
+        with self.assertLogs("gate_controller.ocr", "WARNING"):
+            upload, saved = OcrRegion.parse("0,0 1,0 1,1").prepare(self.path)
+
+        self.assertEqual((upload, saved), (b"not a jpeg", 0.0))
+
+    def test_clients_without_a_region_upload_the_original_bytes(self):
+        session = FakeSession(response=FakeResponse(payload={"results": []}))
+
+        observation = PlateRecognizerClient("token", session=session).recognise(self.path)
+
+        self.assertEqual(session.calls[0][1]["files"]["upload"][1], self.path.read_bytes())
+        self.assertIsNone(observation.upload_saved_ratio)
+
+    def test_rejects_malformed_polygons(self):
+        for value in ("", "0,0 1,1", "0,0 1,0 1,x", "0,0 1,0 1,1,1",
+                      "0,0 1.5,0 1,1", "0,0.5 1,0.5 0.5,0.5", "0,0 nan,0 1,1"):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                OcrRegion.parse(value)
+
+
+class OcrResultCacheTests(unittest.TestCase):
+    def test_least_recently_used_digest_is_evicted_first(self):
+        cache = OcrResultCache(max_entries=2)
+        cache.put("a", PlateObservation("12D3456", 0.95))
+        cache.put("b", PlateObservation(None, 0.0))
+        cache.get("a")
+
+        evicted = cache.put("c", PlateObservation("99D123", 0.91))
+
+        self.assertEqual(evicted, 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), PlateObservation("12D3456", 0.95))
+        self.assertEqual(cache.status()["evictions"], 1)
+        self.assertEqual((cache.status()["hits"], cache.status()["misses"]), (2, 1))
+
+    def test_contains_checks_memory_without_counting_a_lookup(self):
+        now = [100.0]
+        cache = OcrResultCache(ttl_seconds=30, clock=lambda: now[0])
+        cache.put("a", PlateObservation("12D3456", 0.95))
+
+        held = (cache.contains("a"), cache.contains("b"))
+        now[0] += 30
+
+        self.assertEqual((True, False), held)
+        self.assertFalse(cache.contains("a"))
+        self.assertEqual((0, 0), (cache.status()["hits"], cache.status()["misses"]))
+
+    def test_expired_observation_is_a_miss(self):
+        now = [100.0]
+        cache = OcrResultCache(ttl_seconds=30, clock=lambda: now[0])
+        cache.put("a", PlateObservation("12D3456", 0.95))
+        now[0] += 30
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.status()["entries"], 0)
+
+    def test_persistent_cache_survives_a_restart_within_its_ttl(self):
+        wall = [datetime(2026, 8, 13, 10, 0, tzinfo=timezone.utc)]
+        with tempfile.TemporaryDirectory() as directory:
+            store = LocalStore(Path(directory) / "gate.db")
+            OcrResultCache(store=store, wall_clock=lambda: wall[0]).put(
+                "a", PlateObservation("12D3456", 0.95, make="Ford", colour="Blue"),
+            )
+
+            restarted = OcrResultCache(
+                ttl_seconds=600, store=store, wall_clock=lambda: wall[0],
+            )
+            cached = restarted.get("a")
+            wall[0] += timedelta(minutes=10, seconds=1)
+            expired = OcrResultCache(
+                ttl_seconds=600, store=store, wall_clock=lambda: wall[0],
+            ).get("a")
+
+        self.assertEqual(cached, PlateObservation("12D3456", 0.95, "Ford", "Blue"))
+        self.assertIsNone(expired)
+
+    def test_store_failures_degrade_to_cache_misses(self):
+        class BrokenStore:
+            def cached_ocr_observation(self, *args):
+                raise OSError("disk")
+
+            def remember_ocr_observation(self, *args, **kwargs):
+                raise OSError("disk")
+
+        cache = OcrResultCache(store=BrokenStore())
+
+        with self.assertLogs("gate_controller.ocr", "WARNING"):
+            self.assertIsNone(cache.get("a"))
+            cache.put("a", PlateObservation(None, 0.0))
+        self.assertEqual(cache.get("a"), PlateObservation(None, 0.0))
+
+    def test_rejects_unbounded_configuration(self):
+        for kwargs in ({"max_entries": 0}, {"max_entries": 4097}, {"ttl_seconds": nan}):
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValueError):
+                OcrResultCache(**kwargs)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,14 +6,18 @@ import sqlite3
 import stat
 import tempfile
 import unittest
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
+from io import BytesIO
 from pathlib import Path
+from threading import Event
 from unittest import mock
 
 import requests
 from PIL import Image
 
 import gate_controller.outbox as outbox_module
+from gate_controller.images import forget_frame, hold_frame
 from gate_controller.models import GateEvent
 from gate_controller.outbox import (
     CloudflareOutboxSender, EvidenceSpoolError, HttpOutboxSender, OutboxSyncError,
@@ -44,6 +48,19 @@ class FakeClient:
         return self.json_response
 
 
+class _StopOnWait(Event):
+    """Stop a worker loop the first time it waits to poll."""
+
+    def __init__(self):
+        super().__init__()
+        self.waits = []
+
+    def wait(self, timeout=None):
+        self.waits.append(timeout)
+        self.set()
+        return True
+
+
 def _telemetry():
     return EventTelemetry(
         trace_id="ae2398aa-7107-44f4-a723-290de0f8c7b2",
@@ -56,6 +73,41 @@ def _telemetry():
 
 
 class EvidenceSpoolTests(unittest.TestCase):
+    def test_stages_a_held_hot_stream_frame_that_was_never_written(self):
+        encoded = BytesIO()
+        Image.new("RGB", (64, 32), color="green").save(encoded, format="JPEG")
+        frame = encoded.getvalue()
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            held = hold_frame(
+                root / ".hot-stream" / "frame-held.jpg", frame,
+                digest=hashlib.sha256(frame).hexdigest(),
+            )
+            self.addCleanup(forget_frame, held)
+            spool = outbox_module.EvidenceSpool(root / "event-evidence")
+
+            digest = spool.stage(held)
+
+            self.assertFalse(held.exists())
+            self.assertEqual(spool.load(digest)[:3], b"\xff\xd8\xff")
+
+    def test_rejects_an_oversized_source_before_decoding_it(self):
+        encoded = BytesIO()
+        Image.new("RGB", (64, 32), color="green").save(encoded, format="JPEG")
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            source = root / "oversized.jpg"
+            source.write_bytes(encoded.getvalue())
+            spool = outbox_module.EvidenceSpool(root / "event-evidence")
+
+            with mock.patch.object(
+                outbox_module, "MAX_EVIDENCE_SOURCE_BYTES", len(encoded.getvalue()) - 1,
+            ), mock.patch("gate_controller.outbox.Image.open") as open_image:
+                with self.assertRaises(EvidenceSpoolError):
+                    spool.stage(source)
+
+            open_image.assert_not_called()
+
     def test_rejects_non_jpeg_magic_without_invoking_pillow(self):
         with tempfile.TemporaryDirectory() as directory:
             root = Path(directory)
@@ -995,5 +1047,234 @@ class OutboxWorkerTests(unittest.TestCase):
         self.assertEqual(store.pending_outbox_count(), 0)
 
 
+    def _queued_batch(self, count):
+        store, first_event_id = self._queued_store()
+        event_ids = [first_event_id] + [
+            store.record_event(GateEvent(
+                source="ocr", reason="exact_match", opened=True,
+                idempotency_key=f"event-{index}",
+                received_at=datetime(2026, 8, 13, 10, index, tzinfo=timezone.utc),
+            ))
+            for index in range(2, count + 1)
+        ]
+        item_ids = [
+            store.queue_outbox(event_id, {"controller_id": "pi-front-gate"})
+            for event_id in event_ids
+        ]
+        for index, event_id in enumerate(event_ids):
+            store.attach_event_telemetry(event_id, replace(
+                _telemetry(), trace_id=f"ae2398aa-7107-44f4-a723-{index:012d}",
+            ))
+        return store, event_ids, item_ids
+
+    def test_batch_mode_sends_one_request_and_uses_one_transaction_each_side(self):
+        store, event_ids, _ = self._queued_batch(5)
+
+        class BatchSender:
+            def __init__(self):
+                self.batches = []
+
+            def __call__(self, payload, evidence_bytes=None):
+                raise AssertionError("batch mode must not send single events")
+
+            def send_batch(self, items):
+                self.batches.append(items)
+                return [True] * len(items)
+
+        sender = BatchSender()
+        worker = OutboxWorker(store, send=sender, batch_size=3)
+
+        with mock.patch.object(
+            store, "prepare_outbox_batch", wraps=store.prepare_outbox_batch
+        ) as prepare, mock.patch.object(
+            store, "complete_outbox_batch", wraps=store.complete_outbox_batch
+        ) as complete:
+            self.assertEqual(worker.run_once(), 5)
+
+        self.assertEqual([len(batch) for batch in sender.batches], [3, 2])
+        self.assertEqual(prepare.call_count, 2)
+        self.assertEqual(complete.call_count, 2)
+        self.assertEqual(
+            [payload["event_id"] for batch in sender.batches for payload, _ in batch],
+            event_ids,
+        )
+        self.assertEqual(store.pending_outbox_count(), 0)
+        for event_id in event_ids:
+            self.assertEqual(store.event_telemetry(event_id)["delivery"], {
+                "outbox_attempt": 1,
+                "state": "delivered",
+            })
+
+    def test_batch_mode_completes_only_acknowledged_items(self):
+        store, event_ids, _ = self._queued_batch(3)
+
+        class PartialSender:
+            def __call__(self, payload, evidence_bytes=None):
+                raise AssertionError("batch mode must not send single events")
+
+            def send_batch(self, items):
+                return [True, False, True]
+
+        worker = OutboxWorker(store, send=PartialSender(), batch_size=3)
+
+        with self.assertLogs("gate_controller.outbox", level="WARNING") as logs:
+            self.assertEqual(worker.run_once(), 2)
+
+        self.assertIn("error_type=BatchItemRejected", "\n".join(logs.output))
+        self.assertEqual(
+            [payload["event_id"] for _, payload in store.pending_outbox_items()],
+            [event_ids[1]],
+        )
+        self.assertEqual(store.event_telemetry(event_ids[1])["delivery"], {
+            "outbox_attempt": 1,
+            "state": "retry_pending",
+        })
+
+    def test_failed_batch_request_leaves_every_item_queued_for_retry(self):
+        store, event_ids, _ = self._queued_batch(2)
+
+        class OfflineSender:
+            def __call__(self, payload, evidence_bytes=None):
+                raise AssertionError("batch mode must not send single events")
+
+            def send_batch(self, items):
+                raise OutboxSyncError("outbox endpoint returned HTTP 503")
+
+        worker = OutboxWorker(store, send=OfflineSender(), batch_size=2)
+
+        with self.assertLogs("gate_controller.outbox", level="WARNING"):
+            self.assertEqual(worker.run_once(), 0)
+
+        self.assertEqual(store.pending_outbox_count(), 2)
+        for event_id in event_ids:
+            self.assertEqual(
+                store.event_telemetry(event_id)["delivery"]["state"], "retry_pending"
+            )
+
+    def test_run_forever_drains_every_page_before_waiting_to_poll(self):
+        store, _event_ids, _ = self._queued_batch(45)
+
+        class BatchSender:
+            def __init__(self):
+                self.batches = []
+
+            def __call__(self, payload, evidence_bytes=None):
+                raise AssertionError("batch mode must not send single events")
+
+            def send_batch(self, items):
+                self.batches.append(items)
+                return [True] * len(items)
+
+        sender = BatchSender()
+        stop = _StopOnWait()
+        worker = OutboxWorker(store, send=sender, poll_interval=60, batch_size=5)
+
+        worker.run_forever(stop)
+
+        self.assertEqual(store.pending_outbox_count(), 0)
+        self.assertEqual(9, len(sender.batches))
+        self.assertEqual([60], stop.waits)
+
+    def test_run_forever_waits_to_poll_after_a_failed_full_page(self):
+        store, _event_ids, _ = self._queued_batch(20)
+
+        class OfflineSender:
+            def __init__(self):
+                self.batches = 0
+
+            def __call__(self, payload, evidence_bytes=None):
+                raise AssertionError("batch mode must not send single events")
+
+            def send_batch(self, items):
+                self.batches += 1
+                raise OutboxSyncError("outbox endpoint returned HTTP 503")
+
+        sender = OfflineSender()
+        stop = _StopOnWait()
+        worker = OutboxWorker(store, send=sender, poll_interval=60, batch_size=5)
+
+        with self.assertLogs("gate_controller.outbox", level="WARNING"):
+            worker.run_forever(stop)
+
+        self.assertEqual(4, sender.batches)
+        self.assertEqual([60], stop.waits)
+
+    def test_batch_size_requires_a_batch_capable_sender(self):
+        store, _ = self._queued_store()
+
+        with self.assertRaisesRegex(ValueError, "send_batch"):
+            OutboxWorker(store, send=lambda payload: None, batch_size=2)
+        for batch_size in (0, 26, True):
+            with self.subTest(batch_size=batch_size):
+                with self.assertRaisesRegex(ValueError, "batch_size"):
+                    OutboxWorker(store, send=lambda payload: None, batch_size=batch_size)
+
+    def test_http_batch_sender_posts_multipart_events_and_deduplicated_evidence(self):
+        class Response:
+            status_code = 200
+
+            def json(self):
+                return {"results": [
+                    {"eventId": 1, "inserted": True},
+                    {"error": "rejected"},
+                    {"eventId": 3, "inserted": False},
+                ]}
+
+        class Session:
+            def __init__(self):
+                self.calls = []
+
+            def post(self, url, **kwargs):
+                self.calls.append((url, kwargs))
+                return Response()
+
+        image = b"immutable-jpeg-evidence"
+        digest = hashlib.sha256(image).hexdigest()
+        session = Session()
+        sender = HttpOutboxSender(
+            "https://sync.example/events", session=session,
+            bearer_token="event-secret", controller_id="pi-front-gate",
+        )
+
+        acknowledgements = sender.send_batch([
+            ({"event_id": 1, "image_sha256": digest}, image),
+            ({"event_id": 2}, None),
+            ({"event_id": 3, "image_sha256": digest}, image),
+        ])
+
+        self.assertEqual(acknowledgements, [True, False, True])
+        url, request = session.calls[0]
+        self.assertEqual(url, "https://sync.example/events/batch")
+        self.assertEqual(request["headers"], {"Authorization": "Bearer event-secret"})
+        parts = dict(request["files"])
+        self.assertEqual(len(request["files"]), 2)
+        self.assertEqual(parts[f"image-{digest}"], (f"{digest}.jpg", image, "image/jpeg"))
+        events = json.loads(parts["events"][1])["events"]
+        self.assertEqual([event["event_id"] for event in events], [1, 2, 3])
+        self.assertEqual(
+            events[0]["idempotency_key"],
+            hashlib.sha256(b"pi-front-gate:1").hexdigest(),
+        )
+        self.assertEqual(events[0]["image"]["part"], f"image-{digest}")
+        self.assertNotIn("data_base64", events[0]["image"])
+        self.assertNotIn("image", events[1])
+
+    def test_cloudflare_batch_sender_rejects_a_mismatched_acknowledgement_count(self):
+        class BatchClient:
+            def __init__(self):
+                self.requests = []
+
+            def post_multipart(self, path, files, *, headers=None,
+                               max_response_bytes=None):
+                self.requests.append((path, max_response_bytes))
+                return {"results": [{"eventId": 7, "inserted": True}]}
+
+        client = BatchClient()
+        sender = CloudflareOutboxSender(client, "primary")
+
+        with self.assertRaisesRegex(OutboxSyncError, "did not confirm ingest"):
+            sender.send_batch([({"event_id": 7}, None), ({"event_id": 8}, None)])
+        self.assertEqual(client.requests, [("/api/controller/events/batch", 8192)])
+
 if __name__ == "__main__":
     unittest.main()
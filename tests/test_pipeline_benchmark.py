@@ -0,0 +1,185 @@
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+REPOSITORY_ROOT = Path(__file__).parents[1]
+BENCHMARK_PATH = REPOSITORY_ROOT / "scripts" / "gate-pipeline-benchmark.py"
+
+
+def load_benchmark():
+    spec = importlib.util.spec_from_file_location("gate_pipeline_benchmark", BENCHMARK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class PipelineBenchmarkTests(unittest.TestCase):
+    def test_store_benchmark_reports_connections_and_latency_for_both_modes(self):
+        benchmark = load_benchmark()
+
+        with tempfile.TemporaryDirectory() as directory:
+            summary = benchmark.benchmark_store(bursts=4, directory=Path(directory))
+
+        per_call = summary["results"]["per_call_connection"]
+        pooled = summary["results"]["pooled_wal"]
+        self.assertGreaterEqual(per_call["connections_per_burst"], 4)
+        self.assertLessEqual(pooled["connections_per_burst"], 0.25)
+        for result in (per_call, pooled):
+            self.assertGreaterEqual(result["p95_ms"], result["median_ms"])
+
+    def test_ocr_benchmark_opens_the_same_bursts_in_every_mode(self):
+        benchmark = load_benchmark()
+
+        summary = benchmark.benchmark_ocr(bursts=5, latency_ms=5)
+
+        results = summary["results"]
+        self.assertEqual(set(results), {"sequential", "speculative_2", "speculative_3"})
+        self.assertEqual({result["opened"] for result in results.values()}, {4})
+        self.assertEqual(results["speculative_3"]["ocr_requests_per_burst"], 3)
+
+    def test_frames_benchmark_reports_cpu_for_both_decode_paths(self):
+        benchmark = load_benchmark()
+
+        summary = benchmark.benchmark_frames(bursts=1, frames=2, width=160, height=90)
+
+        self.assertEqual(set(summary["results"]), {"separate_decodes", "decoded_frame"})
+        for result in summary["results"].values():
+            self.assertGreaterEqual(result["cpu"]["p95_ms"], result["cpu"]["median_ms"])
+
+    def test_ranking_benchmark_reports_cost_and_agreement_for_every_scale(self):
+        benchmark = load_benchmark()
+
+        summary = benchmark.benchmark_ranking(bursts=1, frames=3, width=640, height=360)
+
+        self.assertEqual(
+            set(summary["results"]), {"scale_1_1", "scale_1_2", "scale_1_4", "scale_1_8"},
+        )
+        self.assertEqual(summary["results"]["scale_1_1"]["matches_full_resolution"], 1.0)
+        for result in summary["results"].values():
+            self.assertGreaterEqual(result["cpu"]["p95_ms"], result["cpu"]["median_ms"])
+
+    def test_ranking_workers_benchmark_orders_every_burst_size_identically(self):
+        benchmark = load_benchmark()
+
+        summary = benchmark.benchmark_ranking_workers(
+            sizes=(2, 4), workers=2, bursts=1, width=320, height=180,
+        )
+
+        self.assertEqual({"frames_2", "frames_4"}, set(summary["results"]))
+        for result in summary["results"].values():
+            self.assertTrue(result["orders_match"])
+            self.assertGreater(result["speedup"], 0)
+
+    def test_matching_benchmark_decides_identically_in_both_modes(self):
+        benchmark = load_benchmark()
+
+        summary = benchmark.benchmark_matching(plates=300, decisions=30)
+
+        self.assertTrue(summary["decisions_match"])
+        self.assertEqual(set(summary["results"]), {"linear_scan", "plate_index"})
+        self.assertIn("build_ms", summary["results"]["plate_index"])
+
+    def test_outbox_benchmark_drains_every_backlog_in_fewer_requests(self):
+        benchmark = load_benchmark()
+
+        summary = benchmark.benchmark_outbox(
+            backlogs=(5,), batch_size=2, round_trip_ms=1,
+        )
+
+        results = summary["results"]["5"]
+        self.assertEqual(results["per_event"]["requests"], 5)
+        self.assertEqual(results["batched"]["requests"], 3)
+
+    def test_stream_benchmark_splits_the_fixture_identically_in_both_modes(self):
+        benchmark = load_benchmark()
+
+        summary = benchmark.benchmark_stream(passes=2, chunk_bytes=4096)
+
+        self.assertTrue(summary["frames_match"])
+        self.assertEqual(summary["results"]["offset_scan"]["frames"], 16)
+        self.assertGreater(summary["results"]["offset_scan"]["mb_per_second"], 0)
+
+    def test_ingress_benchmark_sees_every_upload_in_both_modes(self):
+        benchmark = load_benchmark()
+
+        summary = benchmark.benchmark_ingress(uploads=2, chunks=2, chunk_interval_ms=1)
+
+        results = summary["results"]
+        self.assertEqual(set(results), {"creation_polling", "close_write"})
+        for result in results.values():
+            self.assertEqual(2, result["completed"])
+            self.assertGreaterEqual(result["p95_ms"], result["median_ms"])
+
+    def test_quality_gate_replay_counts_saved_requests_and_changed_decisions(self):
+        benchmark = load_benchmark()
+
+        def frame(sequence, sharpness):
+            return {
+                "sequence": sequence, "digest": f"{sequence:064x}", "width": 64,
+                "height": 32, "sharpness": sharpness, "brightness": 0.5,
+                "darkness": 0.0, "highlight_clipping": 0.0, "status": "ok",
+            }
+
+        def attempt(sequence, plate, duration_ms=300):
+            return {
+                "frame_sequence": sequence, "duration_ms": duration_ms,
+                "status": "recognized" if plate else "no_plate",
+                "plate": plate, "confidence": 0.95 if plate else 0.0,
+            }
+
+        rows = [
+            {"authorised_plate": None, "telemetry": {
+                "frames": [frame(0, 0.001), frame(1, 0.05)],
+                "ocr_attempts": [attempt(0, None), attempt(1, None)],
+                "decision": {"outcome": "denied", "reason": "no_match"},
+            }},
+            {"authorised_plate": "12D3456", "telemetry": {
+                "frames": [frame(0, 0.03), frame(1, 0.05)],
+                "ocr_attempts": [attempt(0, "12D3456")],
+                "decision": {"outcome": "allowed", "reason": "exact_match"},
+            }},
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            exported = Path(directory) / "telemetry.json"
+            exported.write_text(json.dumps(rows))
+
+            summary = benchmark.replay_quality_gate(
+                telemetry=exported, min_sharpness=(0.0, 0.01, 0.04),
+            )
+
+        self.assertEqual((2, 3, 1), (
+            summary["events"], summary["ocr_requests"], summary["allowed_events"],
+        ))
+        open_gate, tuned, strict = summary["results"]
+        self.assertEqual((0, 0), (open_gate["ocr_requests_saved"], open_gate["decisions_changed"]))
+        self.assertEqual((1, 300.0, 0), (
+            tuned["ocr_requests_saved"], tuned["ocr_ms_saved"], tuned["decisions_changed"],
+        ))
+        self.assertEqual((2, 1), (strict["ocr_requests_saved"], strict["decisions_changed"]))
+
+    def test_main_writes_the_selected_benchmark_summary_atomically(self):
+        benchmark = load_benchmark()
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "store.json"
+            with mock.patch.object(
+                benchmark, "benchmark_store", return_value={"benchmark": "store"}
+            ) as run:
+                benchmark.main(["--output", str(output), "store", "--bursts", "3"])
+
+            self.assertEqual(json.loads(output.read_text()), {"benchmark": "store"})
+            self.assertEqual(run.call_args.kwargs["bursts"], 3)
+
+    def test_benchmark_rejects_nonpositive_iteration_counts(self):
+        benchmark = load_benchmark()
+
+        with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+            benchmark.parse_args(["store", "--bursts", "0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+import hashlib
+import unittest
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from pathlib import Path
+from threading import BoundedSemaphore, Event, Thread
+from time import monotonic, sleep
+
+from PIL import Image
+
+from gate_controller.images import forget_frame, frame_bytes, hold_frame
+from gate_controller.models import PlateObservation
+from gate_controller.predictive import PredictiveRecognition
+from gate_controller.reolink_events import SanitizedCameraEvent
+
+
+def jpeg(colour):
+    output = BytesIO()
+    Image.new("RGB", (64, 32), color=colour).save(output, format="JPEG")
+    return output.getvalue()
+
+
+class HotStream:
+    output_directory = Path("/var/lib/gate-controller/uploads/.hot-stream")
+
+    def __init__(self):
+        self.triggers = []
+        self.selections = 0
+
+    def trigger(self, event=None):
+        self.triggers.append(event)
+
+    def select(self, _received_at=None):
+        self.selections += 1
+        frame = jpeg((self.selections * 60, 0, 0))
+        digest = hashlib.sha256(frame).hexdigest()
+        return (hold_frame(
+            self.output_directory / f"frame-{digest[:16]}-{self.selections}.jpg",
+            frame, digest=digest,
+        ),)
+
+
+class PredictiveRecognitionTests(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime(2026, 8, 20, 10, 0, tzinfo=timezone.utc)
+        self.event = SanitizedCameraEvent(
+            event_id="event-1", event_type="line_crossing",
+            rule_id="line_crossing_inbound", received_at=self.now,
+        )
+
+    def predict(self, prediction, finished):
+        stop = Event()
+        worker = Thread(target=prediction.run_forever, args=(stop,), daemon=True)
+        worker.start()
+        self.addCleanup(worker.join, 1)
+        self.addCleanup(stop.set)
+        prediction.trigger(self.event)
+        deadline = monotonic() + 2
+        while not (self.recognised is not None and finished()) and monotonic() < deadline:
+            sleep(0.01)
+
+    @staticmethod
+    def held(path):
+        try:
+            frame_bytes(path)
+        except OSError:
+            return False
+        return True
+
+    def recognise(self, plate):
+        self.recognised = None
+
+        def recognise(path):
+            self.recognised = path
+            return PlateObservation(plate, 0.95)
+
+        return recognise
+
+    def test_allowed_prediction_is_handed_to_the_correlated_burst(self):
+        hot_stream = HotStream()
+        prediction = PredictiveRecognition(
+            hot_stream, self.recognise("12D3456"), authorised=lambda: {"12D3456"},
+        )
+
+        self.predict(prediction, lambda: prediction.status()["predictions_ready"])
+        predicted = self.recognised
+        digest = hashlib.sha256(frame_bytes(predicted)).hexdigest()
+        selected = prediction.select(self.now + timedelta(seconds=3))
+        fresh = prediction.select(self.now + timedelta(seconds=3))
+
+        self.assertEqual([self.event], hot_stream.triggers)
+        self.assertEqual((predicted,), selected)
+        self.assertEqual("12D3456", prediction.observation(digest).plate)
+        self.assertNotEqual(selected, fresh)
+        for path in selected + fresh:
+            forget_frame(path)
+
+    def test_denied_prediction_releases_its_frames_and_keeps_fresh_selection(self):
+        hot_stream = HotStream()
+        prediction = PredictiveRecognition(
+            hot_stream, self.recognise("NOPE123"), authorised=lambda: {"12D3456"},
+        )
+
+        self.predict(prediction, lambda: not self.held(self.recognised))
+        selected = prediction.select(self.now + timedelta(seconds=3))
+
+        self.assertEqual(0, prediction.status()["predictions_ready"])
+        self.assertNotEqual((self.recognised,), selected)
+        with self.assertRaises(OSError):
+            frame_bytes(self.recognised)
+        for path in selected:
+            forget_frame(path)
+
+    def test_uncorrelated_burst_does_not_take_the_prediction(self):
+        hot_stream = HotStream()
+        prediction = PredictiveRecognition(
+            hot_stream, self.recognise("12D3456"), authorised=lambda: {"12D3456"},
+        )
+
+        self.predict(prediction, lambda: prediction.status()["predictions_ready"])
+        selected = prediction.select(self.now + timedelta(seconds=30))
+
+        self.assertEqual(1, prediction.status()["predictions_ready"])
+        self.assertNotEqual((self.recognised,), selected)
+        for path in selected:
+            forget_frame(path)
+
+
+    def test_burst_claims_a_running_prediction_and_awaits_its_result(self):
+        hot_stream = HotStream()
+        started = Event()
+        release = Event()
+        calls = []
+
+        def recognise(path):
+            calls.append(path)
+            started.set()
+            release.wait(2)
+            return PlateObservation("12D3456", 0.95)
+
+        prediction = PredictiveRecognition(
+            hot_stream, recognise, authorised=lambda: {"12D3456"},
+        )
+        self.recognised = True
+        self.predict(prediction, started.is_set)
+        selected = prediction.select(self.now + timedelta(seconds=3))
+        digest = hashlib.sha256(frame_bytes(selected[0])).hexdigest()
+        self.assertIsNone(prediction.observation(digest))
+        release.set()
+        observation = prediction.observation(digest, wait=2)
+
+        self.assertEqual(calls, list(selected))
+        self.assertEqual(1, hot_stream.selections)
+        self.assertEqual("12D3456", observation.plate)
+        deadline = monotonic() + 2
+        while prediction._running is not None and monotonic() < deadline:
+            sleep(0.01)
+        self.assertEqual(0, prediction.status()["predictions_ready"])
+        self.assertTrue(self.held(selected[0]))
+        for path in selected:
+            forget_frame(path)
+
+    def test_prediction_shares_the_ocr_slot_and_cache(self):
+        hot_stream = HotStream()
+        acquired = []
+        cached = {}
+
+        class Slot:
+            def __init__(self):
+                self.semaphore = BoundedSemaphore(1)
+
+            def acquire(self, timeout):
+                acquired.append(timeout)
+                return self.semaphore.acquire(timeout=timeout)
+
+            def release(self):
+                self.semaphore.release()
+
+        class Cache:
+            def get(self, digest):
+                return cached.get(digest)
+
+            def put(self, digest, observation):
+                cached[digest] = observation
+
+        prediction = PredictiveRecognition(
+            hot_stream, self.recognise("12D3456"), authorised=lambda: {"12D3456"},
+            ocr_slot=Slot(), ocr_cache=Cache(),
+        )
+
+        self.predict(prediction, lambda: prediction.status()["predictions_ready"])
+        digest = hashlib.sha256(frame_bytes(self.recognised)).hexdigest()
+
+        self.assertEqual(1, len(acquired))
+        self.assertEqual("12D3456", cached[digest].plate)
+        for path in prediction.select(self.now + timedelta(seconds=3)):
+            forget_frame(path)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,7 @@ import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from queue import Queue as ThreadQueue
-from threading import Event, Lock, Thread
+from threading import BoundedSemaphore, Event, Lock, Thread, Timer
 from time import monotonic
 from unittest.mock import patch
 from PIL import Image
@@ -13,11 +13,13 @@ from PIL import Image
 import gate_controller.images as image_tools
 import gate_controller.processor as processor_module
 from gate_controller.models import PlateObservation, RelayResult
+from gate_controller.ocr import OcrResultCache
 from gate_controller.outbox import EvidenceSpool, OutboxWorker
 from gate_controller.processor import GateProcessor
 from gate_controller.relay import RelayController
 from gate_controller.store import LocalStore
 from gate_controller.authorisation import AuthorisedPlateCache
+from gate_controller.candidates import CandidateStream
 from gate_controller.images import rank_images
 from gate_controller.telemetry import FrameTelemetry, ProcessingTrace, TriggerTelemetry
 
@@ -1394,6 +1396,336 @@ class GateProcessorTests(unittest.TestCase):
         self.assertEqual(relay_calls, [])
         self.assertTrue(finished.wait(0.5))
 
+    def test_speculative_ocr_races_top_frames_and_abandons_after_an_allow(self):
+        slow_frame_started = Event()
+        abandoned = Event()
+        state_lock = Lock()
+
+        class RacingRecognizer:
+            def __init__(self):
+                self.calls = []
+                self.active = 0
+                self.max_active = 0
+
+            def recognise(self, path, timeout=None):
+                with state_lock:
+                    self.calls.append(path.name)
+                    self.active += 1
+                    self.max_active = max(self.max_active, self.active)
+                try:
+                    if path.name == "slow.jpg":
+                        slow_frame_started.set()
+                        abandoned.wait(2)
+                        raise RuntimeError("abandoned")
+                    slow_frame_started.wait(2)
+                    return PlateObservation("12D3456", 0.95)
+                finally:
+                    with state_lock:
+                        self.active -= 1
+
+            def abandon_in_flight(self):
+                abandoned.set()
+                return True
+
+        recognizer = RacingRecognizer()
+        relay_calls = []
+        with tempfile.TemporaryDirectory() as directory:
+            frames = (
+                self._jpeg(directory, "slow.jpg", 32),
+                self._jpeg(directory, "exact.jpg", 128),
+                self._jpeg(directory, "unused.jpg", 224),
+            )
+            result = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay(relay_calls),
+                recognizer, speculative_ocr_frames=2,
+            ).process(frames)
+
+        wire = result.telemetry.to_wire()
+        self.assertTrue(result.opened)
+        self.assertEqual(result.reason, "exact_match")
+        self.assertEqual(relay_calls, ["relay"])
+        self.assertTrue(abandoned.is_set())
+        self.assertEqual(sorted(recognizer.calls), ["exact.jpg", "slow.jpg"])
+        self.assertEqual(recognizer.max_active, 2)
+        self.assertEqual(
+            [(attempt["frame_sequence"], attempt["status"]) for attempt in wire["ocr_attempts"]],
+            [(1, "recognized")],
+        )
+        self.assertEqual([frame["sequence"] for frame in wire["frames"]], [0, 1])
+
+    def test_speculative_ocr_decides_in_frame_order_and_continues_sequentially(self):
+        recognizer = SequenceRecognizer([
+            PlateObservation("I2D3456", 0.95),
+            PlateObservation(None, 0.0),
+            PlateObservation("I2D3456", 0.95),
+        ])
+        with tempfile.TemporaryDirectory() as directory:
+            frames = tuple(
+                self._jpeg(directory, f"frame-{index}.jpg", index * 80)
+                for index in range(3)
+            )
+            result = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]),
+                recognizer, speculative_ocr_frames=2,
+            ).process(frames)
+
+        self.assertTrue(result.opened)
+        self.assertEqual(result.reason, "two_frame_ocr_confusion")
+        self.assertEqual(recognizer.calls[2], frames[2])
+        self.assertEqual(
+            sorted(attempt.frame_sequence for attempt in result.telemetry.ocr_attempts),
+            [0, 1, 2],
+        )
+
+    def test_speculative_ocr_timeout_closes_every_in_flight_attempt(self):
+        release = Event()
+
+        class HangingRecognizer:
+            def __init__(self):
+                self.abandoned = 0
+
+            def recognise(self, path, timeout=None):
+                release.wait(2)
+                return PlateObservation("12D3456", 0.99)
+
+            def abandon_in_flight(self):
+                self.abandoned += 1
+                release.set()
+                return True
+
+        recognizer = HangingRecognizer()
+        relay_calls = []
+        with tempfile.TemporaryDirectory() as directory:
+            frames = (
+                self._jpeg(directory, "first.jpg", 32),
+                self._jpeg(directory, "second.jpg", 224),
+            )
+            result = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay(relay_calls),
+                recognizer, decision_timeout=0.1, speculative_ocr_frames=2,
+            ).process(frames)
+
+        self.assertFalse(result.opened)
+        self.assertEqual(result.reason, "decision_timeout")
+        self.assertEqual(relay_calls, [])
+        self.assertEqual(recognizer.abandoned, 1)
+        self.assertEqual(
+            [attempt.status for attempt in result.telemetry.ocr_attempts],
+            ["ocr_timeout", "ocr_timeout"],
+        )
+
+    def test_repeated_frame_content_reuses_the_cached_ocr_observation(self):
+        recognizer = SequenceRecognizer([
+            PlateObservation("NOPE123", 0.95, upload_saved_ratio=0.75),
+        ])
+        with tempfile.TemporaryDirectory() as directory:
+            frame = self._jpeg(directory, "retried.jpg")
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]),
+                recognizer, ocr_cache=OcrResultCache(max_entries=4),
+            )
+
+            first = processor.process((frame,), idempotency_key="first-delivery")
+            retried = processor.process((frame,), idempotency_key="retried-delivery")
+
+        self.assertEqual(recognizer.calls, [frame])
+        self.assertEqual((first.reason, retried.reason), ("no_match", "no_match"))
+        first_wire = first.telemetry.to_wire()
+        retried_wire = retried.telemetry.to_wire()
+        self.assertEqual(first_wire["ocr_cache"], {"hits": 0, "misses": 1, "evictions": 0})
+        self.assertEqual(retried_wire["ocr_cache"], {"hits": 1, "misses": 0, "evictions": 0})
+        self.assertEqual(retried_wire["ocr_attempts"][0]["status"], "cached")
+        self.assertEqual(retried_wire["ocr_attempts"][0]["plate"], "NOPE123")
+        self.assertEqual(retried_wire["ocr_attempts"][0]["duration_ms"], 0)
+        self.assertEqual(first_wire["ocr_attempts"][0]["upload_saved_ratio"], 0.75)
+        self.assertNotIn("upload_saved_ratio", retried_wire["ocr_attempts"][0])
+
+    def test_cached_allow_skips_speculative_requests_and_reports_evictions(self):
+        recognizer = SequenceRecognizer([PlateObservation(None, 0.0)])
+        cache = OcrResultCache(max_entries=1)
+        with tempfile.TemporaryDirectory() as directory:
+            frames = (
+                self._jpeg(directory, "cached.jpg", 32),
+                self._jpeg(directory, "other.jpg", 224),
+            )
+            digest = hashlib.sha256(frames[0].read_bytes()).hexdigest()
+            cache.put(digest, PlateObservation("12D3456", 0.95))
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]),
+                recognizer, ocr_cache=cache, speculative_ocr_frames=2,
+            )
+
+            allowed = processor.process(frames)
+            denied = processor.process(frames[1:], idempotency_key="second-burst")
+
+        self.assertTrue(allowed.opened)
+        self.assertEqual(recognizer.calls, [frames[1]])
+        self.assertEqual(
+            denied.telemetry.to_wire()["ocr_cache"],
+            {"hits": 0, "misses": 1, "evictions": 1},
+        )
+
+    def test_predicted_observation_is_reused_ahead_of_the_ftp_frame(self):
+        recognizer = SequenceRecognizer([])
+        with tempfile.TemporaryDirectory() as directory:
+            frames = (
+                self._jpeg(directory, "ftp.jpg", 32),
+                self._jpeg(directory, "hot-stream.jpg", 224),
+            )
+            predicted_digest = hashlib.sha256(frames[1].read_bytes()).hexdigest()
+            predictions = {predicted_digest: PlateObservation("12D3456", 0.95)}
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]),
+                recognizer, predicted_observation=predictions.get,
+            )
+
+            result = processor.process(frames, idempotency_key="ftp-digest")
+
+        self.assertTrue(result.opened)
+        self.assertEqual(recognizer.calls, [])
+        self.assertEqual(
+            [attempt.status for attempt in result.telemetry.ocr_attempts], ["cached"],
+        )
+
+    def test_ftp_frame_is_recognised_before_an_in_flight_prediction_is_awaited(self):
+        recognizer = SequenceRecognizer([PlateObservation("NOPE123", 0.9)])
+        lookups = []
+        with tempfile.TemporaryDirectory() as directory:
+            frames = (
+                self._jpeg(directory, "ftp.jpg", 32),
+                self._jpeg(directory, "hot-stream.jpg", 224),
+            )
+            predicted_digest = hashlib.sha256(frames[1].read_bytes()).hexdigest()
+            finished = {}
+
+            def predicted_observation(digest, *, wait=0.0):
+                # The prediction for the hot-stream frame lands while awaited.
+                lookups.append((digest, wait, list(recognizer.calls)))
+                if digest == predicted_digest and wait > 0:
+                    finished[digest] = PlateObservation("12D3456", 0.95)
+                return finished.get(digest)
+
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]),
+                recognizer, predicted_observation=predicted_observation,
+            )
+
+            result = processor.process(frames, idempotency_key="ftp-digest")
+
+        self.assertTrue(result.opened)
+        self.assertEqual([frames[0]], recognizer.calls)
+        awaited = [
+            (wait, calls) for digest, wait, calls in lookups
+            if digest == predicted_digest and wait > 0
+        ]
+        self.assertEqual(1, len(awaited))
+        self.assertLessEqual(awaited[0][0], processor_module.PREDICTION_WAIT_SECONDS)
+        self.assertEqual([frames[0]], awaited[0][1])
+
+    def test_prediction_that_does_not_land_falls_back_to_ocr(self):
+        recognizer = SequenceRecognizer([
+            PlateObservation("NOPE123", 0.9), PlateObservation("12D3456", 0.95),
+        ])
+        waits = []
+        with tempfile.TemporaryDirectory() as directory:
+            frames = (
+                self._jpeg(directory, "ftp.jpg", 32),
+                self._jpeg(directory, "hot-stream.jpg", 224),
+            )
+
+            def predicted_observation(digest, *, wait=0.0):
+                waits.append(wait)
+                return None
+
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]),
+                recognizer, predicted_observation=predicted_observation,
+            )
+
+            result = processor.process(frames, idempotency_key="ftp-digest")
+
+        self.assertTrue(result.opened)
+        self.assertEqual(list(frames), recognizer.calls)
+        self.assertGreater(max(waits), 0)
+        self.assertLessEqual(max(waits), processor_module.PREDICTION_WAIT_SECONDS)
+
+    def test_shared_ocr_slot_is_waited_for_instead_of_failing_busy(self):
+        recognizer = StaticRecognizer(PlateObservation("12D3456", 0.95))
+        slot = BoundedSemaphore(1)
+        slot.acquire()
+        Timer(0.1, slot.release).start()
+        with tempfile.TemporaryDirectory() as directory:
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]),
+                recognizer, ocr_slot=slot,
+            )
+
+            result = processor.process(
+                (self._jpeg(directory, "ftp.jpg", 32),), idempotency_key="ftp-digest",
+            )
+
+        self.assertTrue(result.opened)
+        self.assertNotIn(
+            "ocr_busy", [attempt.status for attempt in result.telemetry.ocr_attempts],
+        )
+
+    def test_follow_up_burst_decides_after_the_early_burst_is_denied(self):
+        recognizer = SequenceRecognizer([
+            PlateObservation("NOPE123", 0.9), PlateObservation("12D3456", 0.95),
+        ])
+        relay_calls = []
+        with tempfile.TemporaryDirectory() as directory:
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay(relay_calls),
+                recognizer,
+            )
+
+            early = processor.process(
+                (self._jpeg(directory, "early.jpg", 32),), idempotency_key="early",
+            )
+            follow_up = processor.process(
+                (self._jpeg(directory, "late.jpg", 224),), idempotency_key="late",
+                follows="early",
+            )
+
+        self.assertFalse(early.opened)
+        self.assertEqual("no_match", early.reason)
+        self.assertTrue(follow_up.opened)
+        self.assertEqual(1, len(relay_calls))
+
+    def test_follow_up_burst_is_a_duplicate_once_the_early_burst_opens(self):
+        recognizer = SequenceRecognizer([PlateObservation("12D3456", 0.95)])
+        relay_calls = []
+        with tempfile.TemporaryDirectory() as directory:
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay(relay_calls),
+                recognizer,
+            )
+
+            early = processor.process(
+                (self._jpeg(directory, "early.jpg", 32),), idempotency_key="early",
+            )
+            follow_up = processor.process(
+                (self._jpeg(directory, "late.jpg", 224),), idempotency_key="late",
+                follows="early",
+            )
+
+        self.assertTrue(early.opened)
+        self.assertFalse(follow_up.opened)
+        self.assertEqual("duplicate_event", follow_up.reason)
+        self.assertEqual(1, len(recognizer.calls))
+        self.assertEqual(1, len(relay_calls))
+
+    def test_speculative_ocr_frames_must_fit_the_ocr_attempt_ceiling(self):
+        for frames in (0, processor_module.MAX_OCR_FRAMES + 1, 1.5, True):
+            with self.subTest(frames=frames), self.assertRaisesRegex(
+                ValueError, "speculative OCR frames"
+            ):
+                self._processor(
+                    object(), RecordingRelay([]), StaticRecognizer(),
+                    speculative_ocr_frames=frames,
+                )
+
     def test_timed_out_resettable_ocr_uses_a_fresh_generation_for_the_next_event(self):
         release_first = Event()
 
@@ -2003,6 +2335,35 @@ class GateProcessorTests(unittest.TestCase):
         self.assertEqual(result.reason, "authorisation_revoked")
         self.assertEqual(calls, [])
 
+    def test_versioned_snapshot_skips_renormalising_unless_the_generation_changes(self):
+        for revoke, expected in ((False, "exact_match"), (True, "authorisation_revoked")):
+            with self.subTest(revoke=revoke), tempfile.TemporaryDirectory() as directory:
+                csv_path = Path(directory) / "plates.csv"
+                csv_path.write_text("plate,name\n12D3456,Ada\n", encoding="utf-8")
+                cache = AuthorisedPlateCache(csv_path)
+
+                class RevokingRecognizer:
+                    def recognise(self, path):
+                        if revoke:
+                            cache.replace(["12E3456"])
+                        return PlateObservation("12D3456", 0.99)
+
+                processor = GateProcessor(
+                    recognizer=RevokingRecognizer(),
+                    store=LocalStore(Path(directory) / "gate.db"),
+                    relay=RecordingRelay([]),
+                    authorised=cache.index,
+                    clock=lambda: datetime(2026, 8, 13, 10, 0, tzinfo=timezone.utc),
+                )
+                with patch.object(
+                    processor_module, "normalise_plate",
+                    wraps=processor_module.normalise_plate,
+                ) as normalise:
+                    result = processor.process((Path("versioned.jpg"),))
+
+                self.assertEqual(result.reason, expected)
+                self.assertEqual(normalise.call_count, 1 if revoke else 0)
+
     def test_stops_after_the_first_sufficient_exact_ocr_result(self):
         with tempfile.TemporaryDirectory() as directory:
             calls = []
@@ -2020,6 +2381,211 @@ class GateProcessorTests(unittest.TestCase):
             self.assertEqual(recognizer.calls, [Path("frame-0.jpg")])
             self.assertEqual(calls, ["relay"])
 
+    def test_streamed_burst_starts_ocr_before_the_sharper_upload_arrives(self):
+        with tempfile.TemporaryDirectory() as directory:
+            calls = []
+            scores = {"first.jpg": 0.1, "blurred.jpg": 0.2, "sharp.jpg": 0.9}
+            stream = CandidateStream(
+                max_candidates=4, score=lambda path: scores[path.name],
+            )
+            first = self._jpeg(directory, "first.jpg", 40)
+            blurred = self._jpeg(directory, "blurred.jpg", 80)
+            sharp = self._jpeg(directory, "sharp.jpg", 160)
+            stream.add(first)
+
+            class ArrivingRecognizer(SequenceRecognizer):
+                def recognise(self, path):
+                    if path == first:
+                        stream.add(blurred)
+                        stream.add(sharp)
+                    return super().recognise(path)
+
+            recognizer = ArrivingRecognizer([
+                PlateObservation(None, 0.0), PlateObservation("12D3456", 0.95),
+            ])
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay(calls), recognizer,
+            )
+
+            result = processor.process(stream)
+
+            self.assertTrue(result.opened)
+            self.assertEqual([first, sharp], recognizer.calls)
+            self.assertEqual(["relay"], calls)
+
+    def test_streamed_burst_stops_waiting_when_the_collector_closes_it(self):
+        with tempfile.TemporaryDirectory() as directory:
+            stream = CandidateStream(max_candidates=4, score=lambda _path: 0.5)
+            stream.add(self._jpeg(directory, "first.jpg"))
+            stream.close()
+            recognizer = SequenceRecognizer([PlateObservation(None, 0.0)])
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]), recognizer,
+            )
+            started = monotonic()
+
+            result = processor.process(stream)
+
+            self.assertEqual("no_match", result.reason)
+            self.assertEqual(1, len(recognizer.calls))
+            self.assertLess(monotonic() - started, 1)
+
+    def test_quality_gate_skips_dark_frames_without_an_ocr_request(self):
+        with tempfile.TemporaryDirectory() as directory:
+            dark = self._jpeg(directory, "dark.jpg", 0)
+            lit = self._jpeg(directory, "lit.jpg", 128)
+            recognizer = SequenceRecognizer([PlateObservation("12D3456", 0.95)])
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]), recognizer,
+                ocr_quality_gate=image_tools.OcrQualityGate(max_darkness=0.5),
+            )
+
+            result = processor.process((dark, lit))
+
+        self.assertTrue(result.opened)
+        self.assertEqual([lit], recognizer.calls)
+        self.assertEqual(
+            [(0, "ok"), (1, "skipped_dark")],
+            [(frame["sequence"], frame["status"])
+             for frame in result.telemetry.to_wire()["frames"]],
+        )
+
+    def test_quality_gate_measures_each_frame_once_per_burst(self):
+        with tempfile.TemporaryDirectory() as directory:
+            dark = self._jpeg(directory, "dark.jpg", 0)
+            lit = self._jpeg(directory, "lit.jpg", 128)
+            recognizer = SequenceRecognizer([PlateObservation("12D3456", 0.95)])
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]), recognizer,
+                ocr_quality_gate=image_tools.OcrQualityGate(max_darkness=0.5),
+            )
+
+            with patch(
+                "gate_controller.processor.measure_frame_quality",
+                wraps=image_tools.measure_frame_quality,
+            ) as measure:
+                result = processor.process((dark, lit))
+
+        self.assertTrue(result.opened)
+        self.assertEqual(
+            [dark, lit], sorted((call.args[0] for call in measure.call_args_list), key=str),
+        )
+
+    def test_quality_gate_does_not_count_its_ocr_cache_checks_as_lookups(self):
+        with tempfile.TemporaryDirectory() as directory:
+            dark = self._jpeg(directory, "dark.jpg", 0)
+            lit = self._jpeg(directory, "lit.jpg", 128)
+            cache = OcrResultCache(max_entries=4)
+            recognizer = SequenceRecognizer([PlateObservation("12D3456", 0.95)])
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]), recognizer,
+                ocr_cache=cache,
+                ocr_quality_gate=image_tools.OcrQualityGate(max_darkness=0.5),
+            )
+
+            result = processor.process((dark, lit))
+
+        self.assertEqual(
+            {"hits": 0, "misses": 1, "evictions": 0}, result.telemetry.to_wire()["ocr_cache"],
+        )
+        self.assertEqual((0, 1), (cache.status()["hits"], cache.status()["misses"]))
+
+    def test_quality_gate_still_recognises_a_burst_with_no_passing_frame(self):
+        with tempfile.TemporaryDirectory() as directory:
+            frames = (
+                self._jpeg(directory, "first.jpg", 0), self._jpeg(directory, "second.jpg", 8),
+            )
+            recognizer = SequenceRecognizer([PlateObservation(None, 0.0)])
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]), recognizer,
+                ocr_quality_gate=image_tools.OcrQualityGate(max_darkness=0.5),
+            )
+
+            result = processor.process(frames)
+
+        self.assertEqual("no_match", result.reason)
+        self.assertEqual([frames[0]], recognizer.calls)
+
+    def test_near_duplicate_hot_frame_does_not_spend_an_ocr_attempt(self):
+        fixtures = Path(__file__).parent / "fixtures" / "ranking"
+        with tempfile.TemporaryDirectory() as directory:
+            ftp = Path(directory) / "ftp.jpg"
+            ftp.write_bytes((fixtures / "day-1-sharp.jpg").read_bytes())
+            hot = Path(directory) / "hot.jpg"
+            with Image.open(ftp) as image:
+                image.resize((640, 360)).save(hot, format="JPEG", quality=60)
+            other = Path(directory) / "other.jpg"
+            other.write_bytes((fixtures / "night-1-sharp.jpg").read_bytes())
+            recognizer = SequenceRecognizer([PlateObservation(None, 0.0)] * 2)
+            store = LocalStore(Path(directory) / "gate.db")
+            processor = self._processor(store, RecordingRelay([]), recognizer)
+
+            result = processor.process((ftp, hot, other))
+            identity_exists = store.event_exists(hashlib.sha256(ftp.read_bytes()).hexdigest())
+
+        self.assertEqual([ftp, other], recognizer.calls)
+        self.assertTrue(identity_exists)
+        self.assertEqual(
+            [(0, "ok"), (1, "ok"), (2, "skipped_near_duplicate")],
+            [(frame["sequence"], frame["status"])
+             for frame in result.telemetry.to_wire()["frames"]],
+        )
+
+    def test_near_duplicate_check_computes_each_signature_once(self):
+        fixtures = Path(__file__).parent / "fixtures" / "ranking"
+        with tempfile.TemporaryDirectory() as directory:
+            ftp = Path(directory) / "ftp.jpg"
+            ftp.write_bytes((fixtures / "day-1-sharp.jpg").read_bytes())
+            hot = Path(directory) / "hot.jpg"
+            with Image.open(ftp) as image:
+                image.resize((640, 360)).save(hot, format="JPEG", quality=60)
+            others = []
+            for name in ("night-1-sharp.jpg", "night-5-focus-3.jpg"):
+                other = Path(directory) / name
+                other.write_bytes((fixtures / name).read_bytes())
+                others.append(other)
+            recognizer = SequenceRecognizer([PlateObservation("12D3456", 0.95)])
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]), recognizer,
+            )
+
+            with patch(
+                "gate_controller.processor.perceptual_signature",
+                wraps=image_tools.perceptual_signature,
+            ) as signature:
+                result = processor.process((ftp, hot, *others))
+
+        signed = [call.args[0] for call in signature.call_args_list]
+        self.assertTrue(result.opened)
+        self.assertEqual(len(signed), len(set(signed)))
+        frames = result.telemetry.to_wire()["frames"]
+        self.assertEqual(
+            [(0, "ok"), (2, "skipped_near_duplicate"), (3, "skipped_near_duplicate")],
+            [(frame["sequence"], frame["status"]) for frame in frames],
+        )
+
+    def test_near_duplicate_cluster_keeps_its_sharpest_frame(self):
+        fixtures = Path(__file__).parent / "fixtures" / "ranking"
+        with tempfile.TemporaryDirectory() as directory:
+            blurred = Path(directory) / "blurred.jpg"
+            blurred.write_bytes((fixtures / "day-5-focus-3.jpg").read_bytes())
+            sharp = Path(directory) / "sharp.jpg"
+            sharp.write_bytes((fixtures / "day-1-sharp.jpg").read_bytes())
+            recognizer = SequenceRecognizer([PlateObservation(None, 0.0)])
+            processor = self._processor(
+                LocalStore(Path(directory) / "gate.db"), RecordingRelay([]), recognizer,
+            )
+
+            result = processor.process((blurred, sharp))
+
+        frames = result.telemetry.to_wire()["frames"]
+        self.assertEqual([sharp], recognizer.calls)
+        self.assertEqual(
+            [(0, "ok"), (1, "skipped_near_duplicate")],
+            [(frame["sequence"], frame["status"]) for frame in frames],
+        )
+        self.assertGreater(frames[0]["sharpness"], frames[1]["sharpness"])
+
     def test_limits_ocr_to_the_top_three_frames(self):
         with tempfile.TemporaryDirectory() as directory:
             calls = []
@@ -2073,7 +2639,7 @@ class GateProcessorTests(unittest.TestCase):
             processor = GateProcessor(
                 recognizer=StaticRecognizer(PlateObservation("12D3456", 0.95)),
                 store=LocalStore(root / "gate.db"), relay=RecordingRelay(calls),
-                authorised=authorised.get,
+                authorised=authorised.index,
                 cooldown=timedelta(seconds=0),
                 clock=lambda: now[0],
             )
@@ -88,6 +88,27 @@ class ReolinkWebhookTests(unittest.TestCase):
                 self.assertEqual(response.status, 202)
                 self.assertEqual(trigger.to_wire()["event_type"], "manual_test")
 
+    def test_notifies_the_listener_once_per_accepted_event(self):
+        accepted = []
+        correlator = ReolinkEventCorrelator(on_accepted=accepted.append)
+        endpoint = ReolinkWebhookEndpoint(self.secret, correlator)
+
+        self.assertEqual(self.request(endpoint, self.payload()).status, 202)
+        self.request(endpoint, self.payload())
+
+        self.assertEqual(1, len(accepted))
+        self.assertEqual("line_crossing", accepted[0].event_type)
+
+    def test_a_failing_listener_does_not_reject_the_event(self):
+        correlator = ReolinkEventCorrelator(on_accepted=Mock(side_effect=OSError("busy")))
+        endpoint = ReolinkWebhookEndpoint(self.secret, correlator)
+
+        with self.assertLogs("gate_controller.reolink_events", level="WARNING"):
+            response = self.request(endpoint, self.payload())
+
+        self.assertEqual(response.status, 202)
+        self.assertEqual(1, correlator.pending_count)
+
     def test_rejects_unauthorized_input_without_recording_or_calling_a_relay(self):
         correlator = ReolinkEventCorrelator()
         endpoint = ReolinkWebhookEndpoint(self.secret, correlator)
@@ -8,7 +8,7 @@ from threading import Barrier, Thread
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from gate_controller.models import GateEvent
+from gate_controller.models import GateEvent, PlateObservation
 from gate_controller.store import LocalStore
 from gate_controller.telemetry import (
     EventTelemetry, FrameTelemetry, StageDurations, TriggerTelemetry,
@@ -207,6 +207,55 @@ class LocalStoreTests(unittest.TestCase):
             with self.assertRaises(ValueError):
                 store.attach_event_telemetry(second, _telemetry(reason="no_match"))
 
+    def test_outbox_batch_prepares_and_completes_in_one_transaction_each(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = LocalStore(Path(directory) / "gate.db")
+            sent_at = datetime(2026, 8, 15, 10, 0, 1, tzinfo=timezone.utc)
+            event_ids = []
+            item_ids = []
+            for index, trace_id in enumerate((
+                "0c5d7f3e-9d5b-4d0c-9d6d-5d0c0b6b1a01",
+                "0c5d7f3e-9d5b-4d0c-9d6d-5d0c0b6b1a02",
+            )):
+                event_id = store.record_event(GateEvent(
+                    source="ocr", reason="no_match", opened=False,
+                    idempotency_key=f"batch-{index}",
+                    received_at=sent_at - timedelta(seconds=1),
+                ))
+                event_ids.append(event_id)
+                item_ids.append(store.queue_outbox(event_id, {
+                    "controller_id": "pi-front-gate",
+                }))
+                store.attach_event_telemetry(
+                    event_id, _telemetry(trace_id, reason="no_match")
+                )
+            store.complete_outbox_item(item_ids[0])
+            real_connect = store._connect
+            transactions = []
+
+            def counting_connect(*args, **kwargs):
+                connection = real_connect(*args, **kwargs)
+                transactions.append(connection)
+                return connection
+
+            with mock.patch.object(store, "_connect", side_effect=counting_connect):
+                prepared = store.prepare_outbox_batch(item_ids, sent_at)
+                self.assertEqual(len(transactions), 1)
+                store.complete_outbox_batch(
+                    prepared.items(), sent_at + timedelta(milliseconds=80)
+                )
+                self.assertEqual(len(transactions), 2)
+
+            self.assertEqual(list(prepared), [item_ids[1]])
+            sent = prepared[item_ids[1]]["telemetry"]
+            self.assertEqual(sent["delivery"]["state"], "sending")
+            self.assertEqual(store.pending_outbox_count(), 0)
+            persisted = store.event_telemetry(event_ids[1])
+            self.assertEqual(persisted["delivery"], {
+                "outbox_attempt": 1, "state": "delivered",
+            })
+            self.assertEqual(persisted["stage_durations"]["cloud_send_to_ack_ms"], 80)
+
     def test_attach_after_v2_completion_preserves_the_acknowledged_payload(self):
         with tempfile.TemporaryDirectory() as directory:
             store = LocalStore(Path(directory) / "gate.db")
@@ -689,6 +738,126 @@ class LocalStoreTests(unittest.TestCase):
                 datetime(2026, 8, 13, 10, 0, 11, tzinfo=timezone.utc)
             ))
 
+    def test_each_thread_reuses_one_wal_connection_across_a_burst(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = LocalStore(Path(directory) / "gate.db")
+            now = datetime(2026, 8, 14, 10, 0, tzinfo=timezone.utc)
+            original_connect = sqlite3.connect
+
+            with mock.patch(
+                "gate_controller.store.sqlite3.connect", side_effect=original_connect
+            ) as connect:
+                self.assertFalse(store.event_exists("upload-1"))
+                claim = store.claim_actuation("upload-1", now)
+                store.finalize_actuation(claim, GateEvent(
+                    source="ocr", reason="exact_match", opened=True,
+                    idempotency_key="upload-1", received_at=now, relay_activated_at=now,
+                ), outbox_payload={"event_id": None})
+                other_thread = Thread(target=store.pending_outbox_count)
+                other_thread.start()
+                other_thread.join(timeout=2)
+                self.assertEqual(store.pending_outbox_count(), 1)
+
+            self.assertEqual(connect.call_count, 1)
+            self.assertEqual(
+                store._connect().execute("PRAGMA journal_mode").fetchone()[0], "wal"
+            )
+            store.close()
+
+    def test_only_delivery_bookkeeping_relaxes_commit_durability(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = LocalStore(Path(directory) / "gate.db")
+            now = datetime(2026, 8, 14, 10, 0, tzinfo=timezone.utc)
+            event_id = store.record_event_with_outbox(GateEvent(
+                source="ocr", reason="no_match", opened=False,
+                idempotency_key="upload-1", received_at=now,
+            ), {"controller_id": "pi-front-gate"})
+
+            def synchronous():
+                return store._local.connection.execute(
+                    "PRAGMA synchronous"
+                ).fetchone()[0]
+
+            store.attach_event_telemetry(event_id, _telemetry(reason="no_match"))
+            relaxed = synchronous()
+            store.claim_actuation("upload-2", now)
+            durable = synchronous()
+
+            self.assertEqual((relaxed, durable), (1, 2))
+            store.close()
+
+    def test_close_releases_pooled_connections_and_later_calls_reopen(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = LocalStore(Path(directory) / "gate.db")
+            first = store._connect()
+
+            store.close()
+
+            with self.assertRaises(sqlite3.ProgrammingError):
+                first.execute("SELECT 1")
+            self.assertFalse(store.event_exists("upload-1"))
+            self.assertIsNot(store._connect(), first)
+            store.close()
+
+    def test_close_leaves_other_threads_connections_until_they_reconnect(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = LocalStore(Path(directory) / "gate.db")
+            opened = []
+            worker = Thread(target=lambda: opened.append(store._connect()))
+            worker.start()
+            worker.join(timeout=2)
+            other = opened[0]
+
+            store.close()
+
+            self.assertEqual(other.execute("SELECT 1").fetchone()[0], 1)
+            reconnected = []
+            worker = Thread(target=lambda: reconnected.append(store._connect()))
+            worker.start()
+            worker.join(timeout=2)
+            self.assertIsNot(reconnected[0], other)
+            store.close()
+
+    def test_close_all_closes_every_threads_connection_from_the_caller(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = LocalStore(Path(directory) / "gate.db")
+            own = store._connect()
+            opened = []
+            worker = Thread(target=lambda: opened.append(store._connect()))
+            worker.start()
+            worker.join(timeout=2)
+
+            store.close_all()
+
+            for connection in (own, opened[0]):
+                with self.assertRaises(sqlite3.ProgrammingError):
+                    connection.execute("SELECT 1")
+            self.assertFalse(store.event_exists("upload-1"))
+            store.close_all()
+
+    def test_persisted_ocr_results_are_bounded_by_count_and_age(self):
+        base = datetime(2026, 8, 13, 10, 0, tzinfo=timezone.utc)
+        with tempfile.TemporaryDirectory() as directory:
+            store = LocalStore(Path(directory) / "gate.db")
+            for index in range(4):
+                store.remember_ocr_observation(
+                    f"digest-{index}", PlateObservation(f"12D345{index}", 0.9),
+                    base + timedelta(minutes=index), max_entries=2,
+                    not_before=base - timedelta(hours=1),
+                )
+
+            kept = [
+                store.cached_ocr_observation(f"digest-{index}", base)
+                for index in range(4)
+            ]
+            fresh_only = store.cached_ocr_observation(
+                "digest-2", base + timedelta(minutes=3),
+            )
+
+        self.assertEqual([item is not None for item in kept], [False, False, True, True])
+        self.assertEqual(kept[3], PlateObservation("12D3453", 0.9))
+        self.assertIsNone(fresh_only)
+
     def test_unfinalized_actuation_claim_is_retained_across_restart(self):
         with tempfile.TemporaryDirectory() as directory:
             database = Path(directory) / "gate.db"
@@ -231,6 +231,7 @@ class TelemetryWireTests(unittest.TestCase):
                 confidence=2,
                 make="M" * 129,
                 colour="",
+                upload_saved_ratio=1.5,
             )
             for index in range(9)
         )
@@ -275,6 +276,7 @@ class TelemetryWireTests(unittest.TestCase):
             "confidence": 1.0,
             "make": "M" * 128,
             "colour": None,
+            "upload_saved_ratio": 1.0,
         })
         self.assertEqual(wire["decision"], {"outcome": "unknown", "reason": "unknown"})
         self.assertEqual(wire["actuation"], {
@@ -566,6 +568,30 @@ class ProcessingTraceTests(unittest.TestCase):
             },
         ])
 
+    def test_overlapping_ocr_attempts_count_waiting_time_once(self):
+        monotonic = iter((10.0, 10.1, 10.5, 10.7, 10.75, 11.0))
+        trace = ProcessingTrace(
+            monotonic_clock=lambda: next(monotonic),
+            wall_clock=lambda: datetime(2026, 8, 15, tzinfo=timezone.utc),
+        )
+
+        trace.mark_burst()
+        trace.add_ocr_attempt(
+            OcrAttemptTelemetry(frame_sequence=1, status="no_plate"), started_at=10.2,
+        )
+        trace.add_ocr_attempt(
+            OcrAttemptTelemetry(frame_sequence=0, status="no_plate"), started_at=10.15,
+        )
+        trace.mark_decision("denied", "no_match")
+        wire = trace.finish().to_wire()
+
+        self.assertEqual(wire["stage_durations"]["burst_to_ocr_ms"], 50)
+        self.assertEqual(wire["stage_durations"]["ocr_ms"], 550)
+        self.assertEqual(wire["stage_durations"]["decision_ms"], 50)
+        self.assertEqual(
+            [attempt["duration_ms"] for attempt in wire["ocr_attempts"]], [300, 550],
+        )
+
     def test_add_ocr_attempt_requires_an_explicit_start_mark(self):
         trace = ProcessingTrace(
             monotonic_clock=lambda: 10.0,
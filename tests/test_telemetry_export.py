@@ -15,7 +15,9 @@ from unittest import mock
 from gate_controller.models import GateEvent
 from gate_controller.store import LocalStore
 import gate_controller.telemetry_export as telemetry_export_module
-from gate_controller.telemetry import EventTelemetry, FrameTelemetry, StageDurations
+from gate_controller.telemetry import (
+    EventTelemetry, FrameTelemetry, OcrCacheTelemetry, StageDurations,
+)
 from gate_controller.telemetry_export import export_telemetry
 
 
@@ -34,11 +36,15 @@ class TelemetryExportTests(unittest.TestCase):
                 sequence=0, digest="a" * 64, width=1, height=1,
                 sharpness=0, brightness=0, darkness=0,
                 highlight_clipping=0, status="quality_unavailable",
-            ),), ocr_attempts=(),
+            ), FrameTelemetry(
+                sequence=1, digest="b" * 64, width=1, height=1,
+                sharpness=0, brightness=0, darkness=0,
+                highlight_clipping=0, status="skipped_near_duplicate",
+            )), ocr_attempts=(),
             decision_outcome="denied", decision_reason="no_match",
             actuation_claim="not_requested", actuation_attempted=False,
             relay_outcome="not_attempted", outbox_attempt=0,
-            delivery_state="pending",
+            delivery_state="pending", ocr_cache=OcrCacheTelemetry(hits=1, misses=2),
         ))
         return store, event_id
 
@@ -104,6 +110,16 @@ class TelemetryExportTests(unittest.TestCase):
             self.assertEqual(rows[0]["event_id"], str(event_id))
             self.assertEqual(rows[0]["trace_id"], "ae2398aa-7107-44f4-a723-290de0f8c7b2")
             self.assertEqual(rows[0]["end_to_end_ms"], "125")
+            self.assertEqual(
+                (rows[0]["frame_count"], rows[0]["ocr_frames_skipped"]), ("2", "1"),
+            )
+            self.assertEqual("ocr_frames_skipped", list(rows[0])[-1])
+            self.assertEqual(
+                [rows[0][key] for key in (
+                    "ocr_cache_hits", "ocr_cache_misses", "ocr_cache_evictions",
+                )],
+                ["1", "2", "0"],
+            )
             headings = set(rows[0])
             self.assertFalse(any(
                 forbidden in heading
@@ -242,7 +258,10 @@ class TelemetryExportTests(unittest.TestCase):
         with tempfile.TemporaryDirectory() as directory:
             root = Path(directory)
             store, _ = self._store_with_telemetry(root)
+            store.close()
             blocker = sqlite3.connect(store.path)
+            # WAL readers are only excluded by an exclusive locking-mode writer.
+            blocker.execute("PRAGMA locking_mode = EXCLUSIVE")
             blocker.execute("BEGIN EXCLUSIVE")
             budget_seconds = 0.250
             scheduler_tolerance_seconds = 0.030
@@ -6,15 +6,18 @@ import signal
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from threading import Event as ThreadEvent, Thread
+from time import monotonic
 from unittest.mock import patch
 from PIL import Image
+from watchdog.events import DirCreatedEvent, FileClosedEvent, FileModifiedEvent
 
 from gate_controller.worker import (
-    BoundedBurstQueue, BurstCollector, CompletedImageHandler, StartupReconciler,
+    BoundedBurstQueue, BurstCollector, BurstIdentity, CompletedImageHandler, StartupReconciler,
     reconcile_completed_images,
     start_observer_then_reconcile,
     _process_bursts,
     _install_sigterm_handler,
+    _next_wait,
     run_worker,
 )
 from gate_controller.models import ProcessingResult
@@ -309,6 +312,9 @@ class WorkerTests(unittest.TestCase):
             def flush_due(self):
                 return False
 
+            def next_due(self):
+                return None
+
         class Handler:
             def __init__(self, _collector, **kwargs):
                 configured["on_rejected"] = kwargs["on_rejected"]
@@ -316,6 +322,9 @@ class WorkerTests(unittest.TestCase):
             def retry_pending(self):
                 return 0
 
+            def next_due(self):
+                return None
+
             def schedule_candidate(self, *_args):
                 pass
 
@@ -329,7 +338,7 @@ class WorkerTests(unittest.TestCase):
             def join(self, timeout=None):
                 pass
 
-        def reject_then_stop(_interval):
+        def reject_then_stop(*_):
             configured["on_rejected"](
                 Path("oversized.jpg"), "image_too_large",
             )
@@ -351,7 +360,7 @@ class WorkerTests(unittest.TestCase):
         ), patch(
             "gate_controller.worker.current_thread_is_main", return_value=False
         ), patch(
-            "gate_controller.worker.sleep", side_effect=reject_then_stop
+            "gate_controller.worker._wait_for_work", side_effect=reject_then_stop
         ):
             run_worker(
                 Path(directory), lambda *_args, **_kwargs: None,
@@ -635,6 +644,93 @@ class WorkerTests(unittest.TestCase):
         self.assertEqual(collector.paths, [path])
         self.assertEqual(collector.received_at, [first_seen])
 
+    def test_decision_grade_first_upload_flushes_without_the_quiet_window(self):
+        clock = MutableClock()
+        emitted = []
+        collector = BurstCollector(
+            emitted.append, quiet_window=0.5, ranker=lambda paths: paths, clock=clock,
+            include_idempotency_key=True, early_flush=lambda path: path.name == "sharp.jpg",
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            sharp = Path(directory) / "sharp.jpg"
+            late = Path(directory) / "late.jpg"
+            sharp.write_bytes(b"sharp frame")
+            late.write_bytes(b"late frame")
+
+            self.assertTrue(collector.add(sharp))
+            self.assertFalse(collector.add(Path(directory) / "hot.jpg"))
+            self.assertTrue(collector.flush_due())
+            clock.value = 0.2
+            self.assertFalse(collector.add(late))
+            self.assertFalse(collector.flush_due())
+            clock.value = 0.7
+            self.assertTrue(collector.flush_due())
+
+        (early, early_identity), (follow_up, follow_up_identity) = emitted
+        self.assertEqual((sharp, Path(directory) / "hot.jpg"), early)
+        self.assertEqual((late,), follow_up)
+        self.assertEqual(hashlib.sha256(b"sharp frame").hexdigest(),
+                         early_identity.idempotency_key)
+        self.assertEqual(
+            BurstIdentity(
+                hashlib.sha256(b"late frame").hexdigest(),
+                follows=early_identity.idempotency_key,
+            ),
+            follow_up_identity,
+        )
+
+    def test_upload_after_the_follow_up_window_starts_a_new_event(self):
+        clock = MutableClock()
+        emitted = []
+        collector = BurstCollector(
+            emitted.append, quiet_window=0.5, ranker=lambda paths: paths, clock=clock,
+            include_idempotency_key=True, early_flush=lambda _path: True,
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            first = Path(directory) / "first.jpg"
+            second = Path(directory) / "second.jpg"
+            first.write_bytes(b"first vehicle")
+            second.write_bytes(b"second vehicle")
+
+            collector.add(first)
+            collector.flush_due()
+            clock.value = 0.6
+            self.assertTrue(collector.add(second))
+            self.assertTrue(collector.flush_due())
+
+        self.assertNotEqual(emitted[0][1], emitted[1][1])
+
+    def test_streamed_burst_is_emitted_on_its_first_upload_and_closed_when_quiet(self):
+        clock = MutableClock()
+        emitted = []
+        collector = BurstCollector(
+            emitted.append, quiet_window=0.5, clock=clock,
+            stream_scorer=lambda path: None if path.name == "corrupt.jpg" else 0.5,
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            first = Path(directory) / "first.jpg"
+            later = Path(directory) / "later.jpg"
+            corrupt = Path(directory) / "corrupt.jpg"
+            for path in (first, later, corrupt):
+                path.write_bytes(path.name.encode())
+
+            self.assertTrue(collector.add(first))
+            (stream,) = emitted
+            self.assertEqual((first,), stream.take_available())
+            clock.value = 0.3
+            self.assertFalse(collector.add(later))
+            self.assertFalse(collector.add(corrupt))
+            self.assertEqual(0.8, collector.next_due())
+            clock.value = 0.8
+            self.assertFalse(collector.flush_due())
+            self.assertIsNone(collector.next_due())
+            self.assertEqual(later, stream.take(1))
+            self.assertIsNone(stream.take(1))
+            self.assertFalse(corrupt.exists())
+
+        self.assertEqual([first, later], list(stream))
+        self.assertEqual(1, len(emitted))
+
     def test_add_during_flush_is_emitted_in_the_next_burst(self):
         clock = MutableClock()
         started = ThreadEvent()
@@ -701,7 +797,7 @@ class WorkerTests(unittest.TestCase):
             def __init__(self):
                 self.paths = []
 
-            def schedule_candidate(self, path, is_directory=False):
+            def schedule_candidate(self, path, is_directory=False, completed=False):
                 self.paths.append(path)
 
         with tempfile.TemporaryDirectory() as directory:
@@ -719,7 +815,7 @@ class WorkerTests(unittest.TestCase):
             def __init__(self):
                 self.paths = []
 
-            def schedule_candidate(self, path, is_directory=False):
+            def schedule_candidate(self, path, is_directory=False, completed=False):
                 self.paths.append(path)
 
         with tempfile.TemporaryDirectory() as directory:
@@ -739,7 +835,7 @@ class WorkerTests(unittest.TestCase):
             def __init__(self):
                 self.paths = []
 
-            def schedule_candidate(self, path, is_directory=False):
+            def schedule_candidate(self, path, is_directory=False, completed=False):
                 self.paths.append(path)
 
         with tempfile.TemporaryDirectory() as directory:
@@ -756,10 +852,12 @@ class WorkerTests(unittest.TestCase):
 
     def test_run_worker_observes_nested_camera_directories(self):
         scheduled = []
+        filters = []
 
         class Observer:
-            def schedule(self, handler, path, recursive=False):
+            def schedule(self, handler, path, recursive=False, event_filter=None):
                 scheduled.append((path, recursive))
+                filters.append(event_filter)
 
             def start(self):
                 pass
@@ -787,11 +885,59 @@ class WorkerTests(unittest.TestCase):
         ), patch(
             "gate_controller.worker.current_thread_is_main", return_value=False
         ), patch(
-            "gate_controller.worker.sleep", side_effect=KeyboardInterrupt
+            "gate_controller.worker._wait_for_work", side_effect=KeyboardInterrupt
         ):
             run_worker(Path(directory), lambda *_: None)
 
         self.assertEqual(scheduled, [(directory, True)])
+        self.assertIn(DirCreatedEvent, filters[0])
+        self.assertIn(FileClosedEvent, filters[0])
+        self.assertNotIn(FileModifiedEvent, filters[0])
+
+    def test_run_worker_shares_and_shuts_down_one_ranking_pool(self):
+        executors = []
+
+        class Executor:
+            def __init__(self, max_workers, thread_name_prefix):
+                self.max_workers = max_workers
+                self.shutdown_calls = []
+                executors.append(self)
+
+            def map(self, function, items):
+                return map(function, items)
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                self.shutdown_calls.append((wait, cancel_futures))
+
+        class WorkerThread:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def start(self):
+                pass
+
+            def join(self, timeout=None):
+                pass
+
+        with tempfile.TemporaryDirectory() as directory, patch(
+            "gate_controller.worker.Observer", return_value=PassiveObserver()
+        ), patch(
+            "gate_controller.worker.Thread", WorkerThread
+        ), patch(
+            "gate_controller.worker.ThreadPoolExecutor", Executor
+        ), patch(
+            "gate_controller.worker.current_thread_is_main", return_value=False
+        ), patch(
+            "gate_controller.worker._wait_for_work", side_effect=KeyboardInterrupt
+        ):
+            run_worker(Path(directory), lambda *_: None, ranking_workers=3)
+            run_worker(Path(directory), lambda *_: None)
+            with self.assertRaisesRegex(ValueError, "ranking workers"):
+                run_worker(Path(directory), lambda *_: None, ranking_workers=0)
+
+        (executor,) = executors
+        self.assertEqual(3, executor.max_workers)
+        self.assertEqual([(True, True)], executor.shutdown_calls)
 
     def test_future_dated_startup_upload_is_rejected_after_clock_rollback(self):
         skipped = []
@@ -917,6 +1063,9 @@ class WorkerTests(unittest.TestCase):
             def flush_due(self):
                 return False
 
+            def next_due(self):
+                return None
+
         class Handler:
             def __init__(self, collector, **kwargs):
                 configured["handler"] = kwargs
@@ -924,6 +1073,9 @@ class WorkerTests(unittest.TestCase):
             def retry_pending(self):
                 return 0
 
+            def next_due(self):
+                return None
+
             def schedule_candidate(self, *args):
                 pass
 
@@ -948,7 +1100,7 @@ class WorkerTests(unittest.TestCase):
         ), patch(
             "gate_controller.worker.current_thread_is_main", return_value=False
         ), patch(
-            "gate_controller.worker.sleep", side_effect=KeyboardInterrupt
+            "gate_controller.worker._wait_for_work", side_effect=KeyboardInterrupt
         ):
             run_worker(
                 Path(directory), lambda *_: None,
@@ -976,6 +1128,9 @@ class WorkerTests(unittest.TestCase):
             def flush_due(self):
                 return False
 
+            def next_due(self):
+                return None
+
         class Handler:
             def __init__(self, collector, **kwargs):
                 pass
@@ -983,6 +1138,9 @@ class WorkerTests(unittest.TestCase):
             def retry_pending(self):
                 return 0
 
+            def next_due(self):
+                return None
+
             def schedule_candidate(self, *args):
                 pass
 
@@ -996,7 +1154,7 @@ class WorkerTests(unittest.TestCase):
             def join(self, timeout=None):
                 pass
 
-        def enqueue_then_stop(_):
+        def enqueue_then_stop(*_):
             configured["emit"](((Path("first.jpg"),), received_at, 12.5,
                                  processing_started_at))
             configured["emit"](((Path("second.jpg"),), received_at, 13.0,
@@ -1014,7 +1172,7 @@ class WorkerTests(unittest.TestCase):
         ), patch(
             "gate_controller.worker.current_thread_is_main", return_value=False
         ), patch(
-            "gate_controller.worker.sleep", side_effect=enqueue_then_stop
+            "gate_controller.worker._wait_for_work", side_effect=enqueue_then_stop
         ):
             run_worker(
                 Path(directory), lambda *_: None, max_pending_bursts=1,
@@ -1037,7 +1195,7 @@ class WorkerTests(unittest.TestCase):
 
         sleep_calls = []
 
-        def wait_then_stop(_):
+        def wait_then_stop(*_):
             sleep_calls.append(1)
             if len(sleep_calls) == 1:
                 started.wait(timeout=1)
@@ -1051,7 +1209,7 @@ class WorkerTests(unittest.TestCase):
         ), patch(
             "gate_controller.worker._process_bursts", side_effect=fail_image_worker
         ), patch(
-            "gate_controller.worker.sleep", side_effect=wait_then_stop
+            "gate_controller.worker._wait_for_work", side_effect=wait_then_stop
         ):
             with self.assertRaisesRegex(RuntimeError, "GateBurstProcessor.*image worker stopped"):
                 run_worker(Path(directory), lambda *_: None)
@@ -1066,7 +1224,7 @@ class WorkerTests(unittest.TestCase):
         ), patch(
             "gate_controller.worker.current_thread_is_main", return_value=False
         ), patch(
-            "gate_controller.worker.sleep", side_effect=KeyboardInterrupt
+            "gate_controller.worker._wait_for_work", side_effect=KeyboardInterrupt
         ):
             with self.assertRaisesRegex(RuntimeError, "watchdog Observer exited unexpectedly"):
                 run_worker(Path(directory), lambda *_: None)
@@ -1080,7 +1238,7 @@ class WorkerTests(unittest.TestCase):
 
         sleep_calls = []
 
-        def wait_then_stop(_):
+        def wait_then_stop(*_):
             sleep_calls.append(1)
             if len(sleep_calls) == 1:
                 returned.wait(timeout=1)
@@ -1092,7 +1250,7 @@ class WorkerTests(unittest.TestCase):
         ), patch(
             "gate_controller.worker.current_thread_is_main", return_value=False
         ), patch(
-            "gate_controller.worker.sleep", side_effect=wait_then_stop
+            "gate_controller.worker._wait_for_work", side_effect=wait_then_stop
         ):
             with self.assertRaisesRegex(RuntimeError, "ReturningWorker.*exited unexpectedly"):
                 run_worker(
@@ -1100,20 +1258,42 @@ class WorkerTests(unittest.TestCase):
                     background_workers=(ReturningWorker(),),
                 )
 
+    def test_failing_background_worker_stops_the_service_promptly(self):
+        class FailingWorker:
+            def run_forever(self, stop_event):
+                stop_event.wait(0.2)
+                raise RuntimeError("hot stream stopped")
+
+        with tempfile.TemporaryDirectory() as directory, patch(
+            "gate_controller.worker.Observer", return_value=PassiveObserver()
+        ), patch(
+            "gate_controller.worker.current_thread_is_main", return_value=False
+        ):
+            started = monotonic()
+            with self.assertRaisesRegex(RuntimeError, "FailingWorker.*hot stream stopped"):
+                run_worker(
+                    Path(directory), lambda *_: None,
+                    background_workers=(FailingWorker(),), poll_interval=5.0,
+                )
+
+        self.assertLess(monotonic() - started, 2.0)
+
     def test_sigterm_handler_requests_orderly_shutdown(self):
         stop = ThreadEvent()
+        wake = ThreadEvent()
         installed = {}
 
         with patch("gate_controller.worker.signal.getsignal", return_value="previous"), patch(
             "gate_controller.worker.signal.signal",
             side_effect=lambda number, handler: installed.update(number=number, handler=handler),
         ):
-            previous = _install_sigterm_handler(stop)
+            previous = _install_sigterm_handler(stop, wake)
             installed["handler"](signal.SIGTERM, None)
 
         self.assertEqual(previous, "previous")
         self.assertEqual(installed["number"], signal.SIGTERM)
         self.assertTrue(stop.is_set())
+        self.assertTrue(wake.is_set())
 
     def test_sigterm_handler_is_installed_before_any_runtime_component_starts(self):
         calls = []
@@ -1149,12 +1329,12 @@ class WorkerTests(unittest.TestCase):
             "gate_controller.worker.current_thread_is_main", return_value=True
         ), patch(
             "gate_controller.worker._install_sigterm_handler",
-            side_effect=lambda _: calls.append("sigterm_install") or "previous",
+            side_effect=lambda *_: calls.append("sigterm_install") or "previous",
         ), patch(
             "gate_controller.worker.signal.signal",
             side_effect=lambda *_: calls.append("sigterm_restore"),
         ), patch(
-            "gate_controller.worker.sleep", side_effect=KeyboardInterrupt
+            "gate_controller.worker._wait_for_work", side_effect=KeyboardInterrupt
         ):
             run_worker(Path(directory), lambda *_: None)
 
@@ -1185,7 +1365,7 @@ class WorkerTests(unittest.TestCase):
             "gate_controller.worker.current_thread_is_main", return_value=True
         ), patch(
             "gate_controller.worker._install_sigterm_handler",
-            side_effect=lambda _: calls.append("sigterm_install") or "previous",
+            side_effect=lambda *_: calls.append("sigterm_install") or "previous",
         ), patch(
             "gate_controller.worker.signal.signal",
             side_effect=lambda *_: calls.append("sigterm_restore"),
@@ -1233,7 +1413,7 @@ class WorkerTests(unittest.TestCase):
         ), patch(
             "gate_controller.worker.current_thread_is_main", return_value=False
         ), patch(
-            "gate_controller.worker.sleep", side_effect=KeyboardInterrupt
+            "gate_controller.worker._wait_for_work", side_effect=KeyboardInterrupt
         ):
             run_worker(
                 Path(directory), lambda *_: None,
@@ -1267,6 +1447,66 @@ class WorkerTests(unittest.TestCase):
         self.assertEqual(handler.pending_count, 0)
         self.assertEqual(rejected, [(path, "upload_incomplete")])
 
+    def test_scheduling_wakes_the_loop_and_reports_the_next_retry(self):
+        woken = []
+        clock = MutableClock()
+        handler = CompletedImageHandler(
+            RecordingCollector(), retry_interval=0.25, clock=clock,
+            on_scheduled=lambda: woken.append(True),
+        )
+        self.assertIsNone(handler.next_due())
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "pending.jpg"
+            path.write_bytes(b"partial")
+            handler.on_created(Event(path))
+            self.assertEqual([True], woken)
+            self.assertEqual(0.0, handler.next_due())
+
+            clock.value = 0.1
+            with patch("gate_controller.worker.wait_until_readable", return_value=False):
+                handler.retry_pending()
+            self.assertAlmostEqual(0.35, handler.next_due())
+
+    def test_collector_reports_its_quiet_window_deadline(self):
+        clock = MutableClock()
+        collector = BurstCollector(lambda _: None, quiet_window=0.5, clock=clock)
+        self.assertIsNone(collector.next_due())
+
+        collector.add(Path("first.jpg"))
+        clock.value = 0.2
+        collector.add(Path("second.jpg"))
+
+        self.assertAlmostEqual(0.7, collector.next_due())
+
+    def test_loop_waits_until_the_earliest_deadline_within_the_idle_bound(self):
+        self.assertEqual(1.0, _next_wait(1.0, None, None))
+        with patch("gate_controller.worker.monotonic", return_value=10.0):
+            self.assertAlmostEqual(0.25, _next_wait(1.0, 10.25, 12.0))
+            self.assertEqual(0.0, _next_wait(1.0, 9.0, None))
+            self.assertEqual(1.0, _next_wait(1.0, None, 30.0))
+
+    def test_close_after_write_checks_a_deferred_upload_at_once(self):
+        collector = RecordingCollector()
+        clock = MutableClock()
+        handler = CompletedImageHandler(
+            collector, retry_interval=0.25, clock=clock, close_events=True,
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "upload.jpg"
+            path.write_bytes(b"partial")
+            handler.on_created(Event(path))
+            self.assertEqual(0.25, handler.next_due())
+
+            Image.new("RGB", (32, 16)).save(path, format="JPEG")
+            clock.value = 0.01
+            handler.on_closed(Event(path))
+            self.assertEqual(0.01, handler.next_due())
+            handler.retry_pending()
+
+        self.assertEqual([path], collector.paths)
+        self.assertIsNone(handler.next_due())
+
     def test_startup_window_upload_is_seen_after_observer_starts(self):
         class Observer:
             def __init__(self, path):